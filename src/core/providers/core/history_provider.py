@@ -1,11 +1,13 @@
 from __future__ import annotations
+from asyncio import gather, run
 from datetime import datetime, timezone
+from logging import getLogger
 from typing import Any, TYPE_CHECKING
 
 import numpy as np
 
 from src.infrastructure.exchanges.models import Interval
-from src.infrastructure.storage import db_manager
+from src.infrastructure.storage import db_manager, kline_store
 from src.shared.utils import (
     has_first_historical_kline,
     has_realtime_kline
@@ -17,10 +19,13 @@ if TYPE_CHECKING:
     from ..common.models import MarketData, FeedsData
 
 
+logger = getLogger(__name__)
+
+
 class HistoryProvider():
     """
     Provides historical market data from exchanges
-    with local database caching functionality.
+    with local kline store caching functionality.
     """
 
     def get_market_data(
@@ -140,14 +145,18 @@ class HistoryProvider():
         end: str
     ) -> np.ndarray:
         """
-        Smart klines fetcher with local database management.
+        Smart klines fetcher with local kline store management.
 
         Implements:
-        - Database caching
-        - Automatic gap filling
+        - Columnar file caching
+        - Incremental gap filling (head, tail and interior holes)
         - Real-time kline validation
         - Date range filtering
 
+        Only the missing sub-ranges are requested from the exchange
+        and merged into the store. The number of bars served
+        from the cache and from the network is logged.
+
         Args:
             client: Exchange API client for data fetching
             symbol: Trading symbol (e.g., BTCUSDT)
@@ -162,122 +171,305 @@ class HistoryProvider():
             ValueError: If no klines available for requested period
         """
 
-        db_name = f'{client.exchange_name.lower()}.db'
+        store_name = client.exchange_name.lower()
         table_name = f'{symbol}_{interval.name}'.lower()
 
         start_ms = self._to_ms(start)
         end_ms = self._to_ms(end)
-        request_required = False
-        start_req, end_req = start_ms, end_ms
 
-        raw_klines = db_manager.fetch_all(db_name, table_name)
+        # Another provider may be filling the same table concurrently
+        with kline_store.lock(store_name, table_name):
+            fetched_count = self._update_klines(
+                client=client,
+                symbol=symbol,
+                interval=interval,
+                start_ms=start_ms,
+                end_ms=end_ms
+            )
+
+        result = kline_store.read(store_name, table_name, start_ms, end_ms)
+        logger.info(
+            f'Klines {table_name} | '
+            f'{result.shape[0] - min(fetched_count, result.shape[0])} '
+            f'from cache | {fetched_count} from network'
+        )
+        return result
+
+    def _update_klines(
+        self,
+        client: BaseExchangeClient,
+        symbol: str,
+        interval: Interval,
+        start_ms: int,
+        end_ms: int
+    ) -> int:
+        """
+        Download klines of [start_ms, end_ms] missing from the store
+        and merge them into it.
+
+        Must be called with the lock of the table held.
+
+        Args:
+            client: Exchange API client for data fetching
+            symbol: Trading symbol (e.g., BTCUSDT)
+            interval: Kline interval from Interval enum
+            start_ms: Start timestamp in milliseconds
+            end_ms: End timestamp in milliseconds
+
+        Returns:
+            int: Number of klines added to the store
+        """
+
+        db_name = f'{client.exchange_name.lower()}.db'
+        store_name = client.exchange_name.lower()
+        table_name = f'{symbol}_{interval.name}'.lower()
+        kline_ms = client.market.get_interval_duration(interval)
+        now_ms = int(datetime.now().timestamp() * 1000)
+        end_req = min(end_ms, now_ms - kline_ms)
+
+        klines = kline_store.read(store_name, table_name)
+
+        if klines.shape[0] < 2:
+            klines = self._import_db_klines(db_name, store_name, table_name)
+
+        if klines.shape[0] < 2:
+            missing = [(start_ms, end_ms, 'head')]
+        else:
+            missing = self._find_missing_ranges(
+                db_name=db_name,
+                table_name=table_name,
+                klines=klines,
+                kline_ms=kline_ms,
+                start=start_ms,
+                end=end_req
+            )
+
+        downloads = []
+
+        if missing:
+            downloads = run(
+                self._get_klines_from_exchange(
+                    client=client,
+                    symbol=symbol,
+                    interval=interval,
+                    ranges=[missing_range[:2] for missing_range in missing]
+                )
+            )
+
+        fetched_parts: list[np.ndarray] = []
+        for (range_start, range_end, kind), raw_klines in zip(
+            missing, downloads
+        ):
+            if kind == 'head' and len(raw_klines) > 1:
+                if has_first_historical_kline(raw_klines, start_ms):
+                    self._set_first_kline_meta(db_name, table_name)
+
+            if kind == 'hole' and not any(
+                range_start < kline[0] < range_end for kline in raw_klines
+            ):
+                self._add_known_gap(
+                    db_name, table_name, range_start, range_end
+                )
+
+            if not raw_klines:
+                continue
+
+            part = np.array(raw_klines)[:, :6].astype(float)
+
+            if part.shape[0] > 1 and has_realtime_kline(part):
+                part = part[:-1]
+
+            fetched_parts.append(part)
+
+        fetched_count = 0
+
+        if fetched_parts:
+            fetched = np.vstack(fetched_parts)
+            cached_count = klines.shape[0]
+
+            if klines.shape[0] and fetched[:, 0].min() >= klines[-1, 0]:
+                fetched_count = kline_store.append(
+                    store_name, table_name, fetched
+                )
+            else:
+                kline_store.write(
+                    store_name, table_name, np.vstack([klines, fetched])
+                )
+                fetched_count = (
+                    kline_store.read(store_name, table_name).shape[0]
+                    - cached_count
+                )
+
+        return fetched_count
+
+    def _find_missing_ranges(
+        self,
+        db_name: str,
+        table_name: str,
+        klines: np.ndarray,
+        kline_ms: int,
+        start: int,
+        end: int
+    ) -> list[tuple[int, int, str]]:
+        """
+        Compute sub-ranges of [start, end] absent from the cache.
 
-        if not raw_klines or len(raw_klines) < 2:
-            request_required = True
-        elif start_ms < raw_klines[0][0]:
+        Each range is bounded by existing klines (or the requested
+        limits), so boundary bars are re-downloaded and deduplicated
+        on merge. The head is skipped when
+        the first exchange kline is known to be cached, and interior
+        holes previously confirmed empty on the exchange are skipped.
+
+        Args:
+            db_name: Name of the SQLite database file
+            table_name: Name of the klines table
+            klines: Cached klines
+            kline_ms: Interval duration in milliseconds
+            start: Requested start timestamp in milliseconds
+            end: Last closed kline timestamp to cover
+
+        Returns:
+            list: (start, end, kind) ranges to download,
+                  where kind is 'head', 'hole' or 'tail'
+        """
+
+        ranges: list[tuple[int, int, str]] = []
+        first_ms, last_ms = int(klines[0, 0]), int(klines[-1, 0])
+
+        if start < first_ms:
             first_meta = db_manager.fetch_one(
                 database_name=db_name,
                 table_name='klines_metadata',
                 key_column='table_name',
-                key_value=table_name.lower()
+                key_value=table_name
             )
 
             if not first_meta:
-                end_req = max(end_ms, raw_klines[-1][0])
-                request_required = True
+                ranges.append((start, first_ms, 'head'))
 
-        if not request_required and end_ms > raw_klines[-1][0]:
-            kline_ms = raw_klines[1][0] - raw_klines[0][0]
-            now_ms = int(datetime.now().timestamp() * 1000)
-            end_req = min(end_ms, now_ms - kline_ms)
+        times = klines[:, 0]
+        lo = np.searchsorted(times, start, 'left')
+        hi = np.searchsorted(times, end, 'right')
+        window = times[max(lo - 1, 0):hi + 1]
+        hole_idx = np.flatnonzero(np.diff(window) > kline_ms)
 
-            if bool((end_req - raw_klines[-1][0]) // kline_ms):
-                start_req = min(start_ms, raw_klines[0][0])
-                request_required = True
+        if hole_idx.size:
+            known_gaps = {
+                (row[2], row[3])
+                for row in db_manager.fetch_all(db_name, 'klines_gaps')
+                if row[1] == table_name
+            }
 
-        if request_required:
-            raw_klines = self._get_klines_from_exchange(
-                client=client,
-                symbol=symbol,
-                interval=interval,
-                start=start_req,
-                end=end_req
-            )
+            for idx in hole_idx:
+                hole = (int(window[idx]), int(window[idx + 1]))
 
-            if not raw_klines:
-                return np.array([])
-            
-            klines = np.array(raw_klines)[:, :6].astype(float)
+                if hole not in known_gaps:
+                    ranges.append((*hole, 'hole'))
 
-            if has_realtime_kline(klines):
-                klines = klines[:-1]
+        if (end - last_ms) // kline_ms > 0:
+            ranges.append((last_ms, end, 'tail'))
 
-            db_manager.insert_many(
-                database_name=db_name,
-                table_name=table_name,
-                columns={
-                    'time': 'INTEGER PRIMARY KEY',
-                    'open': 'REAL',
-                    'high': 'REAL',
-                    'low': 'REAL',
-                    'close': 'REAL',
-                    'volume': 'REAL'
-                },
-                rows=klines,
-                drop=True
-            )
+        return ranges
 
-            if has_first_historical_kline(raw_klines, start_ms):
-                db_manager.insert_one(
-                    database_name=db_name,
-                    table_name='klines_metadata',
-                    columns={
-                        'table_name': 'TEXT PRIMARY KEY',
-                        'has_first_kline': 'BOOLEAN'
-                    },
-                    row=(table_name, True),
-                    replace=True
-                )
-        else:
-            klines = np.array(raw_klines)
-        
-        return klines[(klines[:, 0] >= start_ms) & (klines[:, 0] <= end_ms)]
+    def _set_first_kline_meta(self, db_name: str, table_name: str) -> None:
+        """Record that the first exchange kline of a table is cached."""
 
-    def _get_klines_from_exchange(
+        db_manager.insert_one(
+            database_name=db_name,
+            table_name='klines_metadata',
+            columns={
+                'table_name': 'TEXT PRIMARY KEY',
+                'has_first_kline': 'BOOLEAN'
+            },
+            row=(table_name, True),
+            replace=True
+        )
+
+    def _add_known_gap(
+        self,
+        db_name: str,
+        table_name: str,
+        start: int,
+        end: int
+    ) -> None:
+        """Record an interior hole for which the exchange has no klines."""
+
+        db_manager.insert_one(
+            database_name=db_name,
+            table_name='klines_gaps',
+            columns={
+                'gap_key': 'TEXT PRIMARY KEY',
+                'table_name': 'TEXT',
+                'start': 'INTEGER',
+                'end': 'INTEGER'
+            },
+            row=(f'{table_name}:{start}', table_name, start, end),
+            replace=True
+        )
+
+    def _import_db_klines(
+        self,
+        db_name: str,
+        store_name: str,
+        table_name: str
+    ) -> np.ndarray:
+        """
+        Move klines cached by earlier versions in SQLite
+        into the kline store.
+
+        Args:
+            db_name: Name of the SQLite database file
+            store_name: Name of the kline store
+            table_name: Name of the klines table
+
+        Returns:
+            np.ndarray: Imported klines, or an empty array
+        """
+
+        raw_klines = db_manager.fetch_all(db_name, table_name)
+
+        if not raw_klines:
+            return kline_store.read(store_name, table_name)
+
+        kline_store.write(store_name, table_name, np.array(raw_klines))
+        return kline_store.read(store_name, table_name)
+
+    async def _get_klines_from_exchange(
         self,
         client: BaseExchangeClient,
         symbol: str,
         interval: Interval,
-        start: int,
-        end: int
-    ) -> list[list[float]]:
+        ranges: list[tuple[int, int]]
+    ) -> list[list[list[float]]]:
         """
-        Direct exchange API call for klines data with timestamp conversion.
+        Direct exchange API calls for klines data with timestamp conversion.
+
+        All ranges are downloaded concurrently on one event loop,
+        sharing the exchange rate limiter.
         
         Args:
             client: Exchange API client for data fetching
             symbol: Trading symbol (e.g., BTCUSDT)
             interval: Kline interval from Interval enum
-            start: Start timestamp in milliseconds
-            end: End timestamp in milliseconds
+            ranges: (start, end) timestamps in milliseconds
             
         Returns:
-            list: Raw klines data from exchange
+            list: Raw klines data from exchange for every range
         """
 
-        klines = client.market.get_historical_klines(
-            symbol=symbol,
-            interval=interval,
-            start=start,
-            end=end
-        )
+        downloads = await gather(*(
+            client.market.get_historical_klines_async(
+                symbol=symbol,
+                interval=interval,
+                start=start,
+                end=end
+            )
+            for start, end in ranges
+        ))
 
-        if not klines:
-            return []
-        
         return [
-            [float(value) for value in kline[:6]]
-            for kline in klines
+            [[float(value) for value in kline[:6]] for kline in klines or []]
+            for klines in downloads
         ]
 
     def _get_feeds_data(
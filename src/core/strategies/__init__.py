@@ -10,7 +10,9 @@ from .core import (
     BaseStrategy,
     colors,
     quanta,
-    log
+    cutoff,
+    log,
+    scratch
 )
 
 
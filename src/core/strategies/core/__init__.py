@@ -1,4 +1,4 @@
 from .base import BaseStrategy
 from . import quanta
 from .constants import colors
-from .utils import log
\ No newline at end of file
+from .utils import cutoff, log, scratch
\ No newline at end of file
@@ -5,21 +5,27 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
-from .utils import cache
+from .utils import cache, log
 
 if TYPE_CHECKING:
     from src.core.providers.common.models import MarketData
     from src.infrastructure.exchanges import BaseExchangeClient
     from .models import (
+        Cutoff,
         ParamDict,
         OptParamDict,
         ParamLabelDict,
         IndicatorOptionsDict,
         IndicatorDict,
+        IndicatorTable,
         FeedsConfig
     )
 
 
+KLINE_COLUMNS = ('time', 'open', 'high', 'low', 'close', 'volume')
+"""Columns of market data klines."""
+
+
 class BaseStrategy(ABC):
     """
     Abstract base class for all trading strategies.
@@ -121,6 +127,9 @@ class BaseStrategy(ABC):
     # Visualization Data
     indicators: IndicatorDict = {}
 
+    # Indicators precomputed over parameter axes for optimization
+    indicator_tables: list[IndicatorTable] = []
+
     def __init__(self, params: dict | None = None) -> None:
         """
         Initialize the trading strategy with parameters.
@@ -137,7 +146,12 @@ class BaseStrategy(ABC):
         if params is not None:
             self.params.update(params)
     
-    def __calculate__(self, market_data: MarketData) -> None:
+    def __calculate__(
+        self,
+        market_data: MarketData,
+        cutoff: Cutoff | None = None,
+        resume: bool = False
+    ) -> None:
         """
         Internal method that handles initialization
         and calls user's calculate method.
@@ -145,21 +159,28 @@ class BaseStrategy(ABC):
         This method is called by the framework and automatically:
         1. Initializes all necessary variables from market data
         2. Calls the user-defined calculate() method
+        3. Trims the completed deals buffer to its filled rows
+
+        The optional cutoff is exposed as self.min_equity and
+        self.max_drawdown. Strategies that support early termination
+        pass them to their loop, stop once cutoff.exceeded() returns
+        True and set self.aborted; the deals of an aborted run are
+        incomplete.
+
+        With resume set (live contexts), resume() is called with the
+        first bar appended since the last calculation. Strategies that
+        override it only process the appended bars, continuing from
+        their saved loop state. A full calculation runs instead
+        whenever the processed bars are no longer a prefix of
+        the market data (e.g. the window was trimmed at its start).
         
         Args:
             market_data: Market data package
+            cutoff: Early-termination bounds (optimization only)
+            resume: Whether to continue from the last processed bar
         """
 
-        # Deal logs
-        self.completed_deals_log = np.empty((0, 13), dtype=np.float64)
-        self.open_deals_log = np.full((1, 5), np.nan)
-
-        # Position tracking
-        self.position_type = np.nan
-        self.order_signal = np.nan
-        self.order_price = np.nan
-        self.order_date = np.nan
-        self.order_size = np.nan
+        start = self._get_resume_start(market_data) if resume else 0
 
         # Market identity
         self.symbol = market_data['symbol']
@@ -192,11 +213,88 @@ class BaseStrategy(ABC):
                     'volume': feed_data[:, 5]
                 }
 
+        if start:
+            # Continue the saved loop state with the appended bars
+            self.resume(start)
+        else:
+            self._reset_state(cutoff)
+
+            # Call user's calculate method
+            self.calculate()
+
+        # Expose only filled rows of buffered deal logs
+        self.completed_deals_log = log.trim(self.completed_deals_log)
+
+    def _reset_state(self, cutoff: Cutoff | None = None) -> None:
+        """
+        Reset deal logs, position and equity before a full calculation.
+
+        Args:
+            cutoff: Early-termination bounds (optimization only)
+        """
+
+        # Deal logs
+        self.completed_deals_log = np.empty((0, 13), dtype=np.float64)
+        self.open_deals_log = np.full((1, 5), np.nan)
+
+        # Position tracking
+        self.position_type = np.nan
+        self.order_signal = np.nan
+        self.order_price = np.nan
+        self.order_date = np.nan
+        self.order_size = np.nan
+
         # Strategy parameters
         self.equity = self.params['initial_capital']
 
-        # Call user's calculate method
-        self.calculate()
+        # Early termination
+        cutoff = cutoff or {}
+        self.min_equity = cutoff.get('min_equity', -np.inf)
+        self.max_drawdown = cutoff.get('max_drawdown', np.inf)
+        self.aborted = False
+
+    def _get_resume_start(self, market_data: MarketData) -> int:
+        """
+        Find the first bar a resumed calculation has to process.
+
+        Args:
+            market_data: Market data package
+
+        Returns:
+            int: Number of bars processed by the last calculation
+                 (0 if the strategy has to be calculated from scratch)
+        """
+
+        if not hasattr(self, 'time') or self.aborted:
+            return 0
+
+        klines = market_data['klines']
+        start = self.time.shape[0]
+
+        if (
+            not 0 < start < klines.shape[0] or
+            klines[0, 0] != self.time[0] or
+            klines[start - 1, 0] != self.time[-1]
+        ):
+            return 0
+
+        # Feeds are resampled on every update,
+        # so their processed part has to be unchanged too
+        feeds = market_data['feeds']['klines'] if market_data['feeds'] else {}
+
+        if feeds.keys() != self.feeds_data['klines'].keys():
+            return 0
+
+        for feed_name, feed_data in feeds.items():
+            processed = self.feeds_data['klines'][feed_name]
+
+            for i, column in enumerate(KLINE_COLUMNS):
+                if not np.array_equal(
+                    feed_data[:start, i], processed[column], equal_nan=True
+                ):
+                    return 0
+
+        return start
 
     def __trade__(self, client: BaseExchangeClient) -> None:
         """
@@ -241,6 +339,25 @@ class BaseStrategy(ABC):
         """Execute trading logic based on calculated signals."""
         pass
 
+    def resume(self, start: int) -> None:
+        """
+        Continue calculations after new bars were appended.
+
+        Called instead of calculate() in live contexts once market data
+        attributes cover the appended bars. The default recalculates
+        all bars. Overrides extend their indicators and per-bar arrays
+        to the new length and run their loop over bars start..n-1 from
+        the state saved by the previous calculation (position, order
+        prices, exit levels, deal logs, equity), so that results equal
+        those of a full calculation.
+
+        Args:
+            start: Index of the first bar that hasn't been processed
+        """
+
+        self._reset_state()
+        self.calculate()
+
     @classmethod
     def get_params(cls) -> dict[str, bool | int | float]:
         """Return a copy of all strategy parameters."""
@@ -86,6 +86,44 @@ IndicatorDict = dict[str, IndicatorData]
 """Dictionary of all indicators to render."""
 
 
+# --- Backtest Cutoff Types ---
+
+class Cutoff(TypedDict, total=False):
+    """
+    Early-termination bounds of a backtest.
+
+    Missing fields disable the corresponding check.
+    """
+
+    min_equity: float
+    """Equity (USDT) at or below which the run is aborted"""
+
+    max_drawdown: float
+    """Drawdown from peak equity (%) above which the run is aborted"""
+
+
+# --- Indicator Table Types ---
+
+class IndicatorTable(TypedDict):
+    """
+    Quanta indicator precomputed for whole parameter axes
+    during optimization (see quanta.multi).
+
+    The strategy must call the indicator with the kline series
+    of the market data and the parameters as keyword arguments,
+    e.g. quanta.ema(source=self.volume, length=self.params['length']).
+    """
+
+    indicator: str
+    """Name of the quanta function"""
+
+    series: dict[str, str]
+    """Mapping of function arguments to kline columns ('close', ...)"""
+
+    params: dict[str, str]
+    """Mapping of function arguments to strategy parameters"""
+
+
 # --- Feed Configuration Types ---
 
 FeedsConfig = dict[str, dict[str, list[Any]]]
@@ -35,4 +35,13 @@ from .utils import pivotlow
 from .volatility import atr
 from .volatility import bb
 from .volatility import bbw
-from .volatility import tr
\ No newline at end of file
+from .volatility import tr
+
+# Streaming counterparts
+from . import streaming
+
+# Multi-length counterparts
+from . import multi
+
+# Buffer-writing counterparts
+from . import into
\ No newline at end of file
@@ -4,6 +4,43 @@ import numpy as np
 import numba as nb
 
 
+@nb.njit(
+    nb.boolean[:](nb.float64[:], nb.float64[:], nb.boolean[:]),
+    cache=True,
+    nogil=True
+)
+def cross_into(
+    source1: np.ndarray,
+    source2: np.ndarray,
+    out: np.ndarray
+) -> np.ndarray:
+    """
+    Detect cross() points into a caller-supplied buffer.
+
+    Args:
+        source1: First input data series
+        source2: Second input data series
+        out: Boolean output buffer of the series length
+
+    Returns:
+        np.ndarray[bool]: The output buffer
+    """
+
+    n = source1.shape[0]
+
+    if source2.shape[0] != n or out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    prev = np.nan
+
+    for i in range(n):
+        d = source1[i] - source2[i]
+        out[i] = (d > 0 and prev <= 0) or (d < 0 and prev >= 0)
+        prev = d
+
+    return out
+
+
 @nb.njit(nb.boolean[:](nb.float64[:], nb.float64[:]), cache=True, nogil=True)
 def cross(source1: np.ndarray, source2: np.ndarray) -> np.ndarray:
     """
@@ -21,6 +58,8 @@ def cross(source1: np.ndarray, source2: np.ndarray) -> np.ndarray:
         np.ndarray[bool]: Boolean array with True values at crossover points
     """
 
-    diff = source1 - source2
-    prev_diff = np.concatenate((np.full(1, np.nan), diff[: -1]))
-    return ((diff > 0) & (prev_diff <= 0)) | ((diff < 0) & (prev_diff >= 0))
\ No newline at end of file
+    return cross_into(
+        source1,
+        source2,
+        np.empty(source1.shape[0], dtype=np.bool_)
+    )
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Buffer-writing counterparts of the quanta functions.
+
+Each function takes the arguments of the allocating function followed
+by its output buffers (one per returned array) and, for composite
+indicators, a 2D work buffer for intermediates. Results are written
+in place, bit-identical to the allocating function, and the output
+buffers are returned:
+
+    upper, lower = dst(high, low, close, 2.0, 14, upper, lower, work)
+    # == quanta.dst(high, low, close, 2.0, 14)
+
+Buffers don't need to be initialized. Work buffers have one row of
+the series length for hma, pivothigh, pivotlow, rsi, stoch, wpr, bbw
+and dst, and two rows for supertrend. Buffers are usually borrowed
+from the scratch arena of the strategy utilities so that steady-state
+evaluations allocate nothing.
+"""
+
+# Filters
+from ..filters.cross import cross_into as cross
+from ..filters.crossover import crossover_into as crossover
+from ..filters.crossunder import crossunder_into as crossunder
+
+# Math operations
+from ..math.change import change_into as change
+from ..math.cum import cum_into as cum
+from ..math.ema import ema_into as ema
+from ..math.hma import hma_into as hma
+from ..math.rma import rma_into as rma
+from ..math.sma import sma_into as sma
+from ..math.stdev import stdev_into as stdev
+from ..math.vwap import vwap_into as vwap
+from ..math.wma import wma_into as wma
+
+# Momentum indicators
+from ..momentum.rsi import rsi_into as rsi
+from ..momentum.stoch import stoch_into as stoch
+from ..momentum.wpr import wpr_into as wpr
+
+# Trend indicators
+from ..trend.dmi import dmi_into as dmi
+from ..trend.donchian import donchian_into as donchian
+from ..trend.dst import dst_into as dst
+from ..trend.supertrend import supertrend_into as supertrend
+
+# Utility functions
+from ..utils.highest import highest_into as highest
+from ..utils.lowest import lowest_into as lowest
+from ..utils.pivothigh import pivothigh_into as pivothigh
+from ..utils.pivotlow import pivotlow_into as pivotlow
+
+# Volatility indicators
+from ..volatility.atr import atr_into as atr
+from ..volatility.bb import bb_into as bb
+from ..volatility.bbw import bbw_into as bbw
+from ..volatility.tr import tr_into as tr
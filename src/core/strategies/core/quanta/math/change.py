@@ -4,6 +4,42 @@ import numpy as np
 import numba as nb
 
 
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def change_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate change() into a caller-supplied buffer.
+
+    Args:
+        source: Input data series
+        length: Number of periods to look back or calculating the difference
+        out: Output buffer of the series length
+
+    Returns:
+        np.ndarray: The output buffer
+    """
+
+    n = source.shape[0]
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    for i in range(min(length, n)):
+        out[i] = np.nan
+
+    for i in range(length, n):
+        out[i] = source[i] - source[i - length]
+
+    return out
+
+
 @nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
 def change(source: np.ndarray, length: np.int16) -> np.ndarray:
     """
@@ -19,13 +55,6 @@ def change(source: np.ndarray, length: np.int16) -> np.ndarray:
                     where the first `length` elements are NaN
     """
 
-    n = source.shape[0]
-    result = np.empty(n, dtype=np.float64)
-
-    for i in range(length):
-        result[i] = np.nan
-
-    for i in range(length, n):
-        result[i] = source[i] - source[i - length]
-
-    return result
\ No newline at end of file
+    return change_into(
+        source, length, np.empty(source.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
@@ -4,6 +4,34 @@ import numpy as np
 import numba as nb
 
 
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def cum_into(source: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Calculate cum() into a caller-supplied buffer.
+
+    Args:
+        source: Input data series
+        out: Output buffer of the series length (may be the source)
+
+    Returns:
+        np.ndarray: The output buffer
+    """
+
+    if out.shape[0] != source.shape[0]:
+        raise ValueError('Invalid output length')
+
+    total = 0.0
+    for i in range(source.shape[0]):
+        total += source[i]
+        out[i] = total
+
+    return out
+
+
 @nb.njit(nb.float64[:](nb.float64[:],), cache=True, nogil=True)
 def cum(source: np.ndarray) -> np.ndarray:
     """
@@ -16,4 +44,4 @@ def cum(source: np.ndarray) -> np.ndarray:
         np.ndarray: Array containing the cumulative sum of the input elements
     """
 
-    return source.cumsum()
\ No newline at end of file
+    return cum_into(source, np.empty(source.shape[0], dtype=np.float64))
\ No newline at end of file
@@ -3,44 +3,58 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from .wma import wma
-
-
-@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
-def hma(source: np.ndarray, length: np.int16) -> np.ndarray:
+from .wma import wma_into
+
+
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:], nb.float64[:, :]),
+    cache=True,
+    nogil=True
+)
+def hma_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray,
+    work: np.ndarray
+) -> np.ndarray:
     """
-    Calculate HMA (Hull Moving Average).
-
-    The HMA is calculated in three steps:
-    1. Compute WMA of the source with half the given length (length // 2).
-    2. Compute WMA of the source with the full given length.
-    3. Compute a raw HMA as: 2 * WMA(half_length) - WMA(full_length).
-    4. Apply WMA to the raw HMA with period sqrt(length) to get the final HMA.
+    Calculate hma() into a caller-supplied buffer.
 
     Args:
         source: Input series (leading NaNs are skipped)
         length: HMA period length
+        out: Output buffer of the series length
+        work: Scratch buffer with 1 row of the series length
 
     Returns:
-        np.ndarray: HMA values array
+        np.ndarray: The output buffer
     """
 
     n = source.shape[0]
-    wma_half = wma(source, length // 2)
-    wma_full = wma(source, length)
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    if work.shape[0] < 1 or work.shape[1] != n:
+        raise ValueError('Invalid workspace shape')
+
+    raw_hma = work[0]
+    wma_into(source, length // 2, raw_hma)
+    wma_into(source, length, out)
 
     # raw_hma = 2 * wma_half - wma_full
-    raw_hma = np.full(n, np.nan, dtype=np.float64)
     for i in range(n):
-        val1 = wma_half[i]
-        val2 = wma_full[i]
+        val1 = raw_hma[i]
+        val2 = out[i]
 
         if not np.isnan(val1) and not np.isnan(val2):
             raw_hma[i] = 2.0 * val1 - val2
+        else:
+            raw_hma[i] = np.nan
 
     hma_length = int(length ** 0.5)
     weight_sum = hma_length * (hma_length + 1) / 2.0
-    result = np.full(n, np.nan, dtype=np.float64)
+    out[:] = np.nan
 
     for i in range(hma_length - 1, n):
         weighted_sum = 0.0
@@ -55,6 +69,35 @@ def hma(source: np.ndarray, length: np.int16) -> np.ndarray:
             weighted_sum += val * (j + 1)
 
         if valid:
-            result[i] = weighted_sum / weight_sum
+            out[i] = weighted_sum / weight_sum
+
+    return out
+
+
+@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
+def hma(source: np.ndarray, length: np.int16) -> np.ndarray:
+    """
+    Calculate HMA (Hull Moving Average).
+
+    The HMA is calculated in three steps:
+    1. Compute WMA of the source with half the given length (length // 2).
+    2. Compute WMA of the source with the full given length.
+    3. Compute a raw HMA as: 2 * WMA(half_length) - WMA(full_length).
+    4. Apply WMA to the raw HMA with period sqrt(length) to get the final HMA.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: HMA period length
+
+    Returns:
+        np.ndarray: HMA values array
+    """
+
+    n = source.shape[0]
 
-    return result
\ No newline at end of file
+    return hma_into(
+        source,
+        length,
+        np.empty(n, dtype=np.float64),
+        np.empty((1, n), dtype=np.float64)
+    )
\ No newline at end of file
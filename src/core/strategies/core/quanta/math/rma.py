@@ -4,25 +4,33 @@ import numpy as np
 import numba as nb
 
 
-@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
-def rma(source: np.ndarray, length: np.int16) -> np.ndarray:
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def rma_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray
+) -> np.ndarray:
     """
-    Calculate Wilder's RMA (Rolling Moving Average) used in RSI.
-
-    The RMA is a special smoothing average where alpha = 1 / length.
-    First value is simple moving average (SMA) of first 'length' periods.
+    Calculate rma() into a caller-supplied buffer.
 
     Args:
         source: Input series (leading NaNs are skipped)
         length: RMA period length
+        out: Output buffer of the series length (may be the source)
 
     Returns:
-        np.ndarray: RMA values array
+        np.ndarray: The output buffer
     """
 
     n = source.shape[0]
     alpha = 1 / length
-    result = np.empty(n, dtype=np.float64)
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
 
     na_sum = 0
     for i in range(n):
@@ -31,17 +39,40 @@ def rma(source: np.ndarray, length: np.int16) -> np.ndarray:
         else:
             break
 
-    for i in range(length + na_sum - 1):
-        result[i] = np.nan
-
+    # The seed is summed before any output is written,
+    # so the source may be smoothed in place
     sum_ = 0.0
     for i in range(na_sum, na_sum + length):
         sum_ += source[i]
 
+    for i in range(length + na_sum - 1):
+        out[i] = np.nan
+
     start = length + na_sum - 1
-    result[start] = sum_ / length
+    out[start] = sum_ / length
 
     for i in range(start + 1, n):
-        result[i] = alpha * source[i] + (1 - alpha) * result[i - 1]
+        out[i] = alpha * source[i] + (1 - alpha) * out[i - 1]
+
+    return out
+
+
+@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
+def rma(source: np.ndarray, length: np.int16) -> np.ndarray:
+    """
+    Calculate Wilder's RMA (Rolling Moving Average) used in RSI.
+
+    The RMA is a special smoothing average where alpha = 1 / length.
+    First value is simple moving average (SMA) of first 'length' periods.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: RMA period length
+
+    Returns:
+        np.ndarray: RMA values array
+    """
 
-    return result
\ No newline at end of file
+    return rma_into(
+        source, length, np.empty(source.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
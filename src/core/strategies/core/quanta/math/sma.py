@@ -4,44 +4,75 @@ import numpy as np
 import numba as nb
 
 
-@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
-def sma(source: np.ndarray, length: np.int16) -> np.ndarray:
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def sma_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray
+) -> np.ndarray:
     """
-    Calculate SMA (Simple Moving Average) of a data series.
+    Calculate sma() into a caller-supplied buffer.
 
     Args:
         source: Input series (leading NaNs are skipped)
         length: SMA period length
+        out: Output buffer of the series length
 
     Returns:
-        np.ndarray: SMA values array
+        np.ndarray: The output buffer
     """
 
     n = source.shape[0]
-    result = np.full(n, np.nan)
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    out[:] = np.nan
 
     if n < length:
-        return result
+        return out
 
     start = 0
     while start < n and np.isnan(source[start]):
         start += 1
 
     if n - start < length:
-        return result
+        return out
 
     window_sum = 0.0
     for i in range(start, start + length):
         if np.isnan(source[i]):
-            return result
+            return out
 
         window_sum += source[i]
 
     idx = start + length - 1
-    result[idx] = window_sum / length
+    out[idx] = window_sum / length
 
     for i in range(idx + 1, n):
         window_sum += source[i] - source[i - length]
-        result[i] = window_sum / length
+        out[i] = window_sum / length
+
+    return out
+
+
+@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
+def sma(source: np.ndarray, length: np.int16) -> np.ndarray:
+    """
+    Calculate SMA (Simple Moving Average) of a data series.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: SMA period length
+
+    Returns:
+        np.ndarray: SMA values array
+    """
 
-    return result
\ No newline at end of file
+    return sma_into(
+        source, length, np.empty(source.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
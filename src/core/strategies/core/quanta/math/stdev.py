@@ -4,42 +4,116 @@ import numpy as np
 import numba as nb
 
 
-@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
-def stdev(source: np.ndarray, length: np.int16) -> np.ndarray:
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def stdev_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray
+) -> np.ndarray:
     """
-    Calculate rolling standard deviation over a specified window length.
+    Calculate stdev() into a caller-supplied buffer.
 
     Args:
         source: Input series (leading NaNs are skipped)
         length: Window size for standard deviation calculation
+        out: Output buffer of the series length
 
     Returns:
-        np.ndarray: Array of standard deviation values
+        np.ndarray: The output buffer
     """
 
     n = source.shape[0]
-    result = np.full(n, np.nan, dtype=np.float64)
 
-    for i in range(length - 1, n):
-        sum_ = 0.0
-        sum_sq = 0.0
-        count = 0
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
 
-        for j in range(i - length + 1, i + 1):
-            val = source[j]
+    out[:] = np.nan
 
-            if not np.isnan(val):
-                sum_ += val
-                sum_sq += val * val
-                count += 1
+    if length < 1:
+        return out
+
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    since_sync = 0
+    last_nan = -1
+    last_inf = -length - 1
+
+    for i in range(n):
+        val = source[i]
+
+        if np.isnan(val) or np.isinf(val):
+            if np.isnan(val):
+                last_nan = i
             else:
-                count = -1
+                last_inf = i
 
-        if count == length:
-            mean = sum_ / length
-            var = (sum_sq / length) - (mean * mean)
-            result[i] = np.sqrt(var) if var > 0 else 0.0
+            mean = 0.0
+            m2 = 0.0
+            count = 0
+            since_sync = 0
+        elif count < length:
+            count += 1
+            delta = val - mean
+            mean += delta / count
+            m2 += delta * (val - mean)
         else:
-            result[i] = np.nan
+            old = source[i - length]
+            new_mean = mean + (val - old) / length
+            m2 += (val - old) * (val - new_mean + old - mean)
+            mean = new_mean
+            since_sync += 1
+
+            if since_sync >= length:
+                since_sync = 0
+                mean = 0.0
+
+                for j in range(i - length + 1, i + 1):
+                    mean += source[j]
+
+                mean /= length
+                m2 = 0.0
+
+                for j in range(i - length + 1, i + 1):
+                    m2 += (source[j] - mean) * (source[j] - mean)
+
+        if i - last_nan < length:
+            continue
+
+        if i - last_inf < length:
+            out[i] = 0.0
+        else:
+            var = m2 / length
+            out[i] = np.sqrt(var) if var > 0 else 0.0
+
+    return out
+
+
+@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
+def stdev(source: np.ndarray, length: np.int16) -> np.ndarray:
+    """
+    Calculate rolling standard deviation over a specified window length.
+
+    Runs in O(n) regardless of the window length: the window mean and
+    sum of squared deviations are updated as values enter and leave
+    the window (sliding Welford update) and recomputed exactly once per
+    window length to keep rounding errors from accumulating.
+    Windows containing NaN yield NaN and windows containing infinite
+    values yield 0.0, as with a plain sum-of-squares scan; accumulation
+    restarts after such values.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: Window size for standard deviation calculation
+
+    Returns:
+        np.ndarray: Array of standard deviation values
+    """
 
-    return result
\ No newline at end of file
+    return stdev_into(
+        source, length, np.empty(source.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
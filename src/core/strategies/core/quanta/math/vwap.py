@@ -10,37 +10,40 @@ import numba as nb
         nb.float64[:],
         nb.float64[:],
         nb.float64[:],
+        nb.float64[:],
         nb.float64[:]
     ),
-    cache=True, nogil=True
+    cache=True,
+    nogil=True
 )
-def vwap(time: np.ndarray,
-         high: np.ndarray,
-         low: np.ndarray,
-         close: np.ndarray,
-         volume: np.ndarray) -> np.ndarray:
+def vwap_into(
+    time: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    out: np.ndarray
+) -> np.ndarray:
     """
-    Calculate VWAP (Volume-Weighted Average Price) on a daily basis.
-
-    The VWAP is computed as cumulative typical price multiplied by volume,
-    divided by cumulative volume, resetting at each new trading day.
-    Typical price is calculated as (high + low + close) / 3 for each period.
+    Calculate vwap() into a caller-supplied buffer.
 
     Args:
         time: Timestamps in milliseconds
-        settings: High prices for each period
+        high: High prices for each period
         low: Low prices for each period
         close: Close prices for each period
         volume: Trading volume for each period
+        out: Output buffer of the series length
 
     Returns:
-        np.ndarray: VWAP values array
+        np.ndarray: The output buffer
     """
 
     n = time.shape[0]
-    result = np.empty(n, dtype=np.float64)
 
-    typical_price = (high + low + close) / 3.0
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
     cum_volume = 0.0
     cum_volume_price = 0.0
     prev_day = int(time[0] // 86400000)
@@ -54,14 +57,57 @@ def vwap(time: np.ndarray,
             prev_day = current_day
 
         vol = volume[i]
-        price = typical_price[i]
+        price = (high[i] + low[i] + close[i]) / 3.0
 
         cum_volume += vol
         cum_volume_price += price * vol
 
         if cum_volume > 0.0:
-            result[i] = cum_volume_price / cum_volume
+            out[i] = cum_volume_price / cum_volume
         else:
-            result[i] = 0.0
+            out[i] = 0.0
+
+    return out
+
+
+@nb.njit(
+    nb.float64[:](
+        nb.float64[:],
+        nb.float64[:],
+        nb.float64[:],
+        nb.float64[:],
+        nb.float64[:]
+    ),
+    cache=True, nogil=True
+)
+def vwap(time: np.ndarray,
+         high: np.ndarray,
+         low: np.ndarray,
+         close: np.ndarray,
+         volume: np.ndarray) -> np.ndarray:
+    """
+    Calculate VWAP (Volume-Weighted Average Price) on a daily basis.
+
+    The VWAP is computed as cumulative typical price multiplied by volume,
+    divided by cumulative volume, resetting at each new trading day.
+    Typical price is calculated as (high + low + close) / 3 for each period.
+
+    Args:
+        time: Timestamps in milliseconds
+        settings: High prices for each period
+        low: Low prices for each period
+        close: Close prices for each period
+        volume: Trading volume for each period
+
+    Returns:
+        np.ndarray: VWAP values array
+    """
 
-    return result
\ No newline at end of file
+    return vwap_into(
+        time,
+        high,
+        low,
+        close,
+        volume,
+        np.empty(time.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
@@ -4,26 +4,37 @@ import numpy as np
 import numba as nb
 
 
-@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
-def wma(source: np.ndarray, length: np.int16) -> np.ndarray:
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def wma_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray
+) -> np.ndarray:
     """
-    Calculate WMA (Weighted Moving Average) with linear weights.
+    Calculate wma() into a caller-supplied buffer.
 
     Args:
         source: Input series (leading NaNs are skipped)
         length: WMA period length
+        out: Output buffer of the series length
 
     Returns:
-        np.ndarray: WMA values array
+        np.ndarray: The output buffer
     """
 
     n = source.shape[0]
-    result = np.empty(n, dtype=np.float64)
     weight_sum = length * (length + 1) / 2.0
 
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
     for i in range(n):
         if i < length - 1 or np.isnan(source[i]):
-            result[i] = np.nan
+            out[i] = np.nan
             continue
 
         weighted_sum = 0.0
@@ -38,8 +49,26 @@ def wma(source: np.ndarray, length: np.int16) -> np.ndarray:
             weighted_sum += val * weight
 
         if not np.isnan(weighted_sum):
-            result[i] = weighted_sum / weight_sum
+            out[i] = weighted_sum / weight_sum
         else:
-            result[i] = np.nan
+            out[i] = np.nan
+
+    return out
+
+
+@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
+def wma(source: np.ndarray, length: np.int16) -> np.ndarray:
+    """
+    Calculate WMA (Weighted Moving Average) with linear weights.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: WMA period length
+
+    Returns:
+        np.ndarray: WMA values array
+    """
 
-    return result
\ No newline at end of file
+    return wma_into(
+        source, length, np.empty(source.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,7 +3,66 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..math import rma
+from ..math.rma import rma_into
+
+
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:], nb.float64[:, :]),
+    cache=True,
+    nogil=True,
+    error_model='numpy'
+)
+def rsi_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray,
+    work: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate rsi() into a caller-supplied buffer.
+
+    Upward changes are smoothed in the scratch row,
+    downward changes in the output buffer.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: RSI period length
+        out: Output buffer of the series length
+        work: Scratch buffer with 1 row of the series length
+
+    Returns:
+        np.ndarray: The output buffer
+    """
+
+    n = source.shape[0]
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    if work.shape[0] < 1 or work.shape[1] != n:
+        raise ValueError('Invalid workspace shape')
+
+    u = work[0]
+    d = out
+
+    for i in range(n):
+        prev = source[i - 1] if i > 0 else np.nan
+        u[i] = source[i] - prev
+        d[i] = prev - source[i]
+
+        if u[i] < 0:
+            u[i] = 0
+
+        if d[i] < 0:
+            d[i] = 0
+
+    rma_u = rma_into(u, length, u)
+    rma_d = rma_into(d, length, d)
+
+    for i in range(n):
+        out[i] = 100 - 100 / (1 + rma_u[i] / rma_d[i])
+
+    return out
 
 
 @nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
@@ -19,11 +78,11 @@ def rsi(source: np.ndarray, length: np.int16) -> np.ndarray:
         np.ndarray: RSI values array
     """
 
-    u = source - np.concatenate((np.full(1, np.nan), source[: -1]))
-    d = np.concatenate((np.full(1, np.nan), source[: -1])) - source
-    u[u < 0] = 0
-    d[d < 0] = 0
+    n = source.shape[0]
 
-    rma_u = rma(u, length)
-    rma_d = rma(d, length)
-    return 100 - 100 / (1 + rma_u / rma_d)
\ No newline at end of file
+    return rsi_into(
+        source,
+        length,
+        np.empty(n, dtype=np.float64),
+        np.empty((1, n), dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,41 +3,51 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..utils import highest, lowest
+from ..utils.highest import highest_into
+from ..utils.lowest import lowest_into
 
 
 @nb.njit(
-    nb.float64[:](nb.float64[:], nb.float64[:], nb.float64[:], nb.int16),
+    nb.float64[:](
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.int16,
+        nb.float64[:], nb.float64[:, :]
+    ),
     cache=True,
     nogil=True
 )
-def stoch(
+def stoch_into(
     source: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
-    length: np.int16
+    length: np.int16,
+    out: np.ndarray,
+    work: np.ndarray
 ) -> np.ndarray:
     """
-    Calculate stochastic oscillator values for the input series.
+    Calculate stoch() into a caller-supplied buffer.
 
-    The function computes the percentage of current closing price relative to
-    the high-low range over the specified period (0-100 scale).
+    Lowest values are kept in the output buffer
+    until they are replaced by the result.
 
     Args:
         source: Closing price series
-        settings: High price series
+        high: High price series
         low: Low price series
         length: Lookback period for high/low calculation
+        out: Output buffer of the series length
+        work: Scratch buffer with 1 row of the series length
 
     Returns:
-        np.ndarray: Stochastic oscillator values (0-100), NaN where invalid
+        np.ndarray: The output buffer
     """
 
     n = source.shape[0]
-    result = np.full(n, np.nan, dtype=np.float64)
 
-    highest_values = highest(high, length)
-    lowest_values = lowest(low, length)
+    if work.shape[0] < 1 or work.shape[1] != n:
+        raise ValueError('Invalid workspace shape')
+
+    highest_values = highest_into(high, length, work[0])
+    lowest_values = lowest_into(low, length, out)
 
     for i in range(n):
         hi = highest_values[i]
@@ -45,12 +55,13 @@ def stoch(
         val = source[i]
 
         if np.isnan(hi) or np.isnan(lo) or np.isnan(val):
+            out[i] = np.nan
             continue
 
         denom = hi - lo
 
         if denom == 0:
-            result[i] = 0.0
+            out[i] = 0.0
         else:
             r = 100.0 * (val - lo) / denom
 
@@ -59,6 +70,45 @@ def stoch(
             elif r < 0.0:
                 r = 0.0
 
-            result[i] = r
+            out[i] = r
+
+    return out
+
+
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.float64[:], nb.float64[:], nb.int16),
+    cache=True,
+    nogil=True
+)
+def stoch(
+    source: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    length: np.int16
+) -> np.ndarray:
+    """
+    Calculate stochastic oscillator values for the input series.
+
+    The function computes the percentage of current closing price relative to
+    the high-low range over the specified period (0-100 scale).
+
+    Args:
+        source: Closing price series
+        settings: High price series
+        low: Low price series
+        length: Lookback period for high/low calculation
+
+    Returns:
+        np.ndarray: Stochastic oscillator values (0-100), NaN where invalid
+    """
+
+    n = source.shape[0]
 
-    return result
\ No newline at end of file
+    return stoch_into(
+        source,
+        high,
+        low,
+        length,
+        np.empty(n, dtype=np.float64),
+        np.empty((1, n), dtype=np.float64)
+    )
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Multi-length counterparts of the quanta functions for parameter sweeps.
+
+Every argument that the single-length function takes as a period
+(or factor) is an array here, one entry per output row, and results
+are 2D arrays of shape (rows, bars). Row k is bit-identical to the
+single-length function called with the k-th entries, while work that
+doesn't depend on them (true range, directional movement, seed sums)
+is done once for all rows:
+
+    emas = ema(close, np.array([10, 20, 50], dtype=np.int16))
+    # emas[1] == quanta.ema(close, 20)
+
+Rows whose period doesn't fit the series (no complete warm-up
+window) are NaN throughout.
+"""
+
+# Math operations
+from .math import ema
+from .math import rma
+from .math import sma
+
+# Trend indicators
+from .trend import dmi
+from .trend import dst
+from .trend import supertrend
+
+# Volatility indicators
+from .volatility import atr
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import numpy as np
+import numba as nb
+
+
+@nb.njit(
+    nb.float64[:, :](nb.float64[:], nb.int16[:], nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def _smooth(
+    source: np.ndarray,
+    length: np.ndarray,
+    alpha: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate exponentially smoothed rows seeded with the SMA
+    of the first `length` values after leading NaNs.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: Period length of every row
+        alpha: Smoothing factor of every row
+
+    Returns:
+        np.ndarray: Smoothed values, one row per length
+    """
+
+    n = source.shape[0]
+    result = np.empty((length.shape[0], n), dtype=np.float64)
+
+    na_sum = 0
+    for i in range(n):
+        if np.isnan(source[i]):
+            na_sum += 1
+        else:
+            break
+
+    # Running sums from the first value are the seed sums of all rows
+    seed_sums = np.empty(n, dtype=np.float64)
+    sum_ = 0.0
+    for i in range(na_sum, n):
+        sum_ += source[i]
+        seed_sums[i] = sum_
+
+    for k in range(length.shape[0]):
+        row = result[k]
+        start = length[k] + na_sum - 1
+
+        if length[k] < 1 or start >= n:
+            row[:] = np.nan
+            continue
+
+        row[:start] = np.nan
+        row[start] = seed_sums[start] / length[k]
+
+        for i in range(start + 1, n):
+            row[i] = alpha[k] * source[i] + (1 - alpha[k]) * row[i - 1]
+
+    return result
+
+
+@nb.njit(nb.float64[:, :](nb.float64[:], nb.int16[:]), cache=True, nogil=True)
+def ema(source: np.ndarray, length: np.ndarray) -> np.ndarray:
+    """
+    Calculate the EMA of a data series for several period lengths.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: EMA period lengths
+
+    Returns:
+        np.ndarray: EMA values, one row per length
+    """
+
+    return _smooth(source, length, 2.0 / (length + 1))
+
+
+@nb.njit(nb.float64[:, :](nb.float64[:], nb.int16[:]), cache=True, nogil=True)
+def rma(source: np.ndarray, length: np.ndarray) -> np.ndarray:
+    """
+    Calculate Wilder's RMA of a data series for several period lengths.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: RMA period lengths
+
+    Returns:
+        np.ndarray: RMA values, one row per length
+    """
+
+    return _smooth(source, length, 1 / length)
+
+
+@nb.njit(nb.float64[:, :](nb.float64[:], nb.int16[:]), cache=True, nogil=True)
+def sma(source: np.ndarray, length: np.ndarray) -> np.ndarray:
+    """
+    Calculate the SMA of a data series for several period lengths.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: SMA period lengths
+
+    Returns:
+        np.ndarray: SMA values, one row per length
+    """
+
+    n = source.shape[0]
+    result = np.empty((length.shape[0], n), dtype=np.float64)
+
+    start = 0
+    while start < n and np.isnan(source[start]):
+        start += 1
+
+    # Running sums up to the first NaN are the first window sums
+    window_sums = np.empty(n, dtype=np.float64)
+    end = start
+    window_sum = 0.0
+    while end < n and not np.isnan(source[end]):
+        window_sum += source[end]
+        window_sums[end] = window_sum
+        end += 1
+
+    for k in range(length.shape[0]):
+        row = result[k]
+
+        if length[k] < 1 or end - start < length[k]:
+            row[:] = np.nan
+            continue
+
+        idx = start + length[k] - 1
+        row[:idx] = np.nan
+        window_sum = window_sums[idx]
+        row[idx] = window_sum / length[k]
+
+        for i in range(idx + 1, n):
+            window_sum += source[i] - source[i - length[k]]
+            row[i] = window_sum / length[k]
+
+    return result
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import numpy as np
+import numba as nb
+
+from ..volatility import tr
+from .math import rma
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:, :], nb.float64[:, :], nb.float64[:, :]))(
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.int16[:], nb.int16[:]
+    ),
+    cache=True,
+    nogil=True
+)
+def dmi(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    di_length: np.ndarray,
+    adx_length: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate DMI indicators for several pairs of period lengths.
+
+    Directional movement and true range are computed once, +DI/-DI
+    once per distinct DI length.
+
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        di_length: Period for DI calculations of every row
+        adx_length: Smoothing period for ADX calculation of every row
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Three 2D arrays
+        with one row per length pair:
+            - +DI values
+            - -DI values
+            - ADX values
+    """
+
+    n = high.shape[0]
+    rows = di_length.shape[0]
+
+    tr_values = tr(high, low, close, False)
+
+    plus_dm = np.empty(n, dtype=np.float64)
+    minus_dm = np.empty(n, dtype=np.float64)
+    plus_dm[0] = np.nan
+    minus_dm[0] = np.nan
+
+    for i in range(1, n):
+        change_high = high[i] - high[i - 1]
+        change_low = low[i - 1] - low[i]
+
+        if change_high > change_low and change_high > 0:
+            plus_dm[i] = change_high
+        else:
+            plus_dm[i] = 0.0
+
+        if change_low > change_high and change_low > 0:
+            minus_dm[i] = change_low
+        else:
+            minus_dm[i] = 0.0
+
+    di_lengths = np.unique(di_length)
+    rma_tr = rma(tr_values, di_lengths)
+    rma_plus_dm = rma(plus_dm, di_lengths)
+    rma_minus_dm = rma(minus_dm, di_lengths)
+
+    plus = np.empty((rows, n), dtype=np.float64)
+    minus = np.empty((rows, n), dtype=np.float64)
+    adx = np.empty((rows, n), dtype=np.float64)
+
+    for u in range(di_lengths.shape[0]):
+        plus_row = 100 * rma_plus_dm[u] / rma_tr[u]
+        minus_row = 100 * rma_minus_dm[u] / rma_tr[u]
+        dx = np.abs(plus_row - minus_row) / (plus_row + minus_row)
+
+        for i in range(n):
+            if plus_row[i] + minus_row[i] == 0:
+                dx[i] = np.nan
+
+        indices = np.nonzero(di_length == di_lengths[u])[0]
+        adx_rows = rma(dx, adx_length[indices])
+
+        for m in range(indices.shape[0]):
+            plus[indices[m]] = plus_row
+            minus[indices[m]] = minus_row
+            adx[indices[m]] = 100 * adx_rows[m]
+
+    return plus, minus, adx
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:, :], nb.float64[:, :]))(
+        nb.float64[:], nb.float64[:], nb.float64[:],
+        nb.float32[:], nb.int16[:]
+    ),
+    cache=True,
+    nogil=True
+)
+def dst(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    factor: np.ndarray,
+    atr_length: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate Double SuperTrend bands for several factor
+    and ATR length pairs.
+
+    True range is computed once, ATR once per distinct length.
+
+    Args:
+        high: High price series
+        low: Low price series
+        close: Close price series
+        factor: Multiplier for ATR band width of every row
+        atr_length: Period length for ATR calculation of every row
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Two 2D arrays with one row
+        per pair:
+            - First array: Upper band values
+            - Second array: Lower band values
+    """
+
+    n = high.shape[0]
+    rows = factor.shape[0]
+
+    atr_lengths = np.unique(atr_length)
+    atr_table = rma(tr(high, low, close, True), atr_lengths)
+    hl2 = 0.5 * (high + low)
+
+    upper = np.empty((rows, n), dtype=np.float64)
+    lower = np.empty((rows, n), dtype=np.float64)
+
+    for k in range(rows):
+        atr_values = atr_table[np.searchsorted(atr_lengths, atr_length[k])]
+        upper_band = upper[k]
+        lower_band = lower[k]
+        upper_band[:] = hl2 + factor[k] * atr_values
+        lower_band[:] = hl2 - factor[k] * atr_values
+
+        for i in range(1, n):
+            if np.isnan(atr_values[i]) or np.isnan(atr_values[i - 1]):
+                continue
+
+            if (
+                upper_band[i] >= upper_band[i - 1] and
+                close[i - 1] <= upper_band[i - 1]
+            ):
+                upper_band[i] = upper_band[i - 1]
+
+            if (
+                lower_band[i] <= lower_band[i - 1] and
+                close[i - 1] >= lower_band[i - 1]
+            ):
+                lower_band[i] = lower_band[i - 1]
+
+    return upper, lower
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:, :], nb.float64[:, :]))(
+        nb.float64[:], nb.float64[:], nb.float64[:],
+        nb.float32[:], nb.int16[:]
+    ),
+    cache=True,
+    nogil=True
+)
+def supertrend(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    factor: np.ndarray,
+    atr_length: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate SuperTrend values and direction for several factor
+    and ATR length pairs.
+
+    True range is computed once, ATR once per distinct length.
+
+    Args:
+        high: High price series
+        low: Low price series
+        close: Close price series
+        factor: Multiplier for ATR band width of every row
+        atr_length: Period length for ATR calculation of every row
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Two 2D arrays with one row
+        per pair:
+            - First array: SuperTrend indicator values
+            - Second array: Direction (-1 for uptrend, 1 for downtrend)
+    """
+
+    n = high.shape[0]
+    rows = factor.shape[0]
+
+    atr_lengths = np.unique(atr_length)
+    atr_table = rma(tr(high, low, close, True), atr_lengths)
+    hl2 = (high + low) * 0.5
+
+    indicator = np.full((rows, n), np.nan)
+    direction = np.full((rows, n), np.nan)
+
+    for k in range(rows):
+        atr_values = atr_table[np.searchsorted(atr_lengths, atr_length[k])]
+        upper_band = hl2 + factor[k] * atr_values
+        lower_band = hl2 - factor[k] * atr_values
+        values = indicator[k]
+        signs = direction[k]
+
+        for i in range(1, n):
+            if np.isnan(atr_values[i]):
+                continue
+
+            if not np.isnan(values[i - 1]):
+                if (
+                    upper_band[i] >= upper_band[i - 1] and
+                    close[i - 1] <= upper_band[i - 1]
+                ):
+                    upper_band[i] = upper_band[i - 1]
+                if (
+                    lower_band[i] <= lower_band[i - 1] and
+                    close[i - 1] >= lower_band[i - 1]
+                ):
+                    lower_band[i] = lower_band[i - 1]
+
+            if np.isnan(values[i - 1]):
+                signs[i] = 1
+                values[i] = upper_band[i]
+            elif values[i - 1] == upper_band[i - 1]:
+                if close[i] > upper_band[i]:
+                    signs[i] = -1
+                    values[i] = lower_band[i]
+                else:
+                    signs[i] = 1
+                    values[i] = upper_band[i]
+            else:
+                if close[i] < lower_band[i]:
+                    signs[i] = 1
+                    values[i] = upper_band[i]
+                else:
+                    signs[i] = -1
+                    values[i] = lower_band[i]
+
+    return indicator, direction
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import numpy as np
+import numba as nb
+
+from ..volatility import tr
+from .math import rma
+
+
+@nb.njit(
+    nb.float64[:, :](
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.int16[:]
+    ),
+    cache=True,
+    nogil=True
+)
+def atr(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    length: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the ATR for several period lengths
+    from a single true range series.
+
+    Args:
+        high: High price series
+        low: Low price series
+        close: Close price series
+        length: Period lengths for smoothing
+
+    Returns:
+        np.ndarray: ATR values, one row per length
+    """
+
+    return rma(tr(high, low, close, True), length)
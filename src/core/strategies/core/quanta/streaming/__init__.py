@@ -0,0 +1,52 @@
+"""
+Streaming counterparts of the quanta functions for live trading.
+
+Each indicator is seeded once with the history through seed() and
+then advanced with update() as bars arrive, reproducing the batch
+function's value for every bar without recomputing the series:
+
+    ema = Ema(20)
+    ema.seed(close[:-1])
+    value = ema.update(close[-1])  # == quanta.ema(close, 20)[-1]
+"""
+
+from .base import StreamingIndicator
+
+# Filters
+from .filters import Cross
+from .filters import Crossover
+from .filters import Crossunder
+
+# Math operations
+from .math import Change
+from .math import Cum
+from .math import Ema
+from .math import Hma
+from .math import Rma
+from .math import Sma
+from .math import Stdev
+from .math import Vwap
+from .math import Wma
+
+# Momentum indicators
+from .momentum import Rsi
+from .momentum import Stoch
+from .momentum import Wpr
+
+# Trend indicators
+from .trend import Dmi
+from .trend import Donchian
+from .trend import Dst
+from .trend import Supertrend
+
+# Utility functions
+from .utils import Highest
+from .utils import Lowest
+from .utils import Pivothigh
+from .utils import Pivotlow
+
+# Volatility indicators
+from .volatility import Atr
+from .volatility import Bb
+from .volatility import Bbw
+from .volatility import Tr
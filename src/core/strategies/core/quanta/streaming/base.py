@@ -0,0 +1,64 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+
+
+class StreamingIndicator(ABC):
+    """
+    Stateful counterpart of a quanta function.
+
+    The indicator is seeded once with the history and then advanced
+    with update() one bar at a time, so live contexts pay O(1) per
+    new bar instead of recomputing the whole series. Every output is
+    bit-identical to the value the batch function returns for
+    the same bar, as long as all bars since the start of the series
+    are fed in order.
+    """
+
+    def seed(self, *series: np.ndarray) -> Any:
+        """
+        Feed historical bars.
+
+        Args:
+            series: Input series in the order of update() arguments
+
+        Returns:
+            Any: Output for the last bar (None if series are empty)
+        """
+
+        result = None
+
+        for values in zip(*(s.tolist() for s in series)):
+            result = self.update(*values)
+
+        return result
+
+    @abstractmethod
+    def update(self, *values: float) -> Any:
+        """
+        Advance the indicator by one bar.
+
+        Args:
+            values: Input values of the new bar
+
+        Returns:
+            Any: Indicator output for the new bar
+        """
+
+        pass
+
+
+def divide(a: float, b: float) -> float:
+    """
+    Divide with NumPy semantics for zero divisors (±inf or NaN
+    instead of ZeroDivisionError), as array expressions of
+    the batch functions do.
+    """
+
+    if b == 0.0:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return float(np.float64(a) / b)
+
+    return a / b
@@ -0,0 +1,73 @@
+from __future__ import annotations
+from math import nan
+
+from .base import StreamingIndicator
+
+
+class _Difference(StreamingIndicator):
+    """Tracks the difference of two series and its previous value."""
+
+    def __init__(self) -> None:
+        self._diff = nan
+
+    def _advance(
+        self,
+        source1: float,
+        source2: float
+    ) -> tuple[float, float]:
+        """Store the new difference, returning it with the previous."""
+
+        prev_diff = self._diff
+        self._diff = source1 - source2
+        return self._diff, prev_diff
+
+
+class Cross(_Difference):
+    """Streaming counterpart of quanta.cross()."""
+
+    def update(self, source1: float, source2: float) -> bool:
+        """
+        Args:
+            source1: New value of the first series
+            source2: New value of the second series
+
+        Returns:
+            bool: Whether the series cross on the new bar
+        """
+
+        diff, prev_diff = self._advance(source1, source2)
+        return diff > 0 and prev_diff <= 0 or diff < 0 and prev_diff >= 0
+
+
+class Crossover(_Difference):
+    """Streaming counterpart of quanta.crossover()."""
+
+    def update(self, source1: float, source2: float) -> bool:
+        """
+        Args:
+            source1: New value of the first series
+            source2: New value of the second series
+
+        Returns:
+            bool: Whether source1 crosses above source2 on the new bar
+        """
+
+        diff, prev_diff = self._advance(source1, source2)
+        return diff > 0 and prev_diff <= 0
+
+
+class Crossunder(_Difference):
+    """Streaming counterpart of quanta.crossunder()."""
+
+    def update(self, source1: float, source2: float) -> bool:
+        """
+        Args:
+            source1: New value of the first series
+            source2: New value of the second series
+
+        Returns:
+            bool: Whether source1 crosses below source2 on the new bar
+        """
+
+        diff, prev_diff = self._advance(source1, source2)
+        return diff < 0 and prev_diff >= 0
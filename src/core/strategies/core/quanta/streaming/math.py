@@ -0,0 +1,407 @@
+from __future__ import annotations
+from collections import deque
+from math import isinf, isnan, nan, sqrt
+
+from .base import StreamingIndicator
+
+
+def check_length(length: int, minimum: int = 1) -> None:
+    """Reject window lengths the batch function would divide by zero."""
+
+    if length < minimum:
+        raise ValueError(f'Invalid length: {length}')
+
+
+class Change(StreamingIndicator):
+    """Streaming counterpart of quanta.change()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Number of periods to look back
+        """
+
+        self._length = length
+        self._window: deque[float] = deque(maxlen=length + 1)
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Difference to the value `length` bars back
+        """
+
+        self._window.append(value)
+
+        if len(self._window) <= self._length:
+            return nan
+
+        return value - self._window[0]
+
+
+class Cum(StreamingIndicator):
+    """Streaming counterpart of quanta.cum()."""
+
+    def __init__(self) -> None:
+        self._total: float | None = None
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Cumulative sum including the new value
+        """
+
+        if self._total is None:
+            self._total = value
+        else:
+            self._total += value
+
+        return self._total
+
+
+class _ExponentialAverage(StreamingIndicator):
+    """
+    Exponential smoothing seeded with the SMA of the first `length`
+    values after leading NaNs, as in quanta.ema() and quanta.rma().
+    """
+
+    def __init__(self, length: int, alpha: float) -> None:
+        self._length = length
+        self._alpha = alpha
+        self._count = 0
+        self._sum = 0.0
+        self._value = nan
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Smoothed value (NaN during warm-up)
+        """
+
+        if self._count < self._length:
+            if self._count == 0 and isnan(value):
+                return nan
+
+            self._count += 1
+            self._sum += value
+
+            if self._count < self._length:
+                return nan
+
+            self._value = self._sum / self._length
+        else:
+            self._value = (
+                self._alpha * value + (1 - self._alpha) * self._value
+            )
+
+        return self._value
+
+
+class Ema(_ExponentialAverage):
+    """Streaming counterpart of quanta.ema()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: EMA period length
+        """
+
+        check_length(length)
+        super().__init__(length, 2.0 / (length + 1))
+
+
+class Rma(_ExponentialAverage):
+    """Streaming counterpart of quanta.rma()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: RMA period length
+        """
+
+        check_length(length)
+        super().__init__(length, 1 / length)
+
+
+class Sma(StreamingIndicator):
+    """Streaming counterpart of quanta.sma()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: SMA period length
+        """
+
+        check_length(length)
+
+        self._length = length
+        self._window: deque[float] = deque(maxlen=length)
+        self._sum = 0.0
+        self._invalid = False
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Moving average (NaN during warm-up and for good
+                   if the first window has a NaN)
+        """
+
+        window = self._window
+
+        if len(window) < self._length:
+            if self._invalid or not window and isnan(value):
+                return nan
+
+            if isnan(value):
+                self._invalid = True
+                return nan
+
+            window.append(value)
+            self._sum += value
+
+            if len(window) < self._length:
+                return nan
+        else:
+            self._sum += value - window[0]
+            window.append(value)
+
+        return self._sum / self._length
+
+
+class Stdev(StreamingIndicator):
+    """
+    Streaming counterpart of quanta.stdev().
+
+    Replays the sliding Welford update of the batch function,
+    including its resynchronization once per window length,
+    which keeps the update amortized O(1).
+    """
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Window size for standard deviation calculation
+        """
+
+        self._length = length
+        self._window: deque[float] = deque(maxlen=max(length, 0))
+        self._index = -1
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._count = 0
+        self._since_sync = 0
+        self._last_nan = -1
+        self._last_inf = -length - 1
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Standard deviation of the window ending at
+                   the new value
+        """
+
+        length = self._length
+
+        if length < 1:
+            return nan
+
+        self._index += 1
+        i = self._index
+        window = self._window
+
+        if isnan(value) or isinf(value):
+            if isnan(value):
+                self._last_nan = i
+            else:
+                self._last_inf = i
+
+            self._mean = 0.0
+            self._m2 = 0.0
+            self._count = 0
+            self._since_sync = 0
+            window.append(value)
+        elif self._count < length:
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+            window.append(value)
+        else:
+            old = window[0]
+            mean = self._mean
+            new_mean = mean + (value - old) / length
+            self._m2 += (value - old) * (value - new_mean + old - mean)
+            self._mean = new_mean
+            self._since_sync += 1
+            window.append(value)
+
+            if self._since_sync >= length:
+                self._since_sync = 0
+                mean = 0.0
+
+                for val in window:
+                    mean += val
+
+                mean /= length
+                m2 = 0.0
+
+                for val in window:
+                    m2 += (val - mean) * (val - mean)
+
+                self._mean = mean
+                self._m2 = m2
+
+        if i - self._last_nan < length:
+            return nan
+
+        if i - self._last_inf < length:
+            return 0.0
+
+        var = self._m2 / length
+        return sqrt(var) if var > 0 else 0.0
+
+
+class Vwap(StreamingIndicator):
+    """Streaming counterpart of quanta.vwap()."""
+
+    def __init__(self) -> None:
+        self._day: int | None = None
+        self._volume = 0.0
+        self._volume_price = 0.0
+
+    def update(
+        self,
+        time: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> float:
+        """
+        Args:
+            time: Timestamp in milliseconds
+            high: High price
+            low: Low price
+            close: Close price
+            volume: Trading volume
+
+        Returns:
+            float: VWAP since the start of the bar's day
+        """
+
+        day = int(time // 86400000)
+
+        if day != self._day:
+            if self._day is not None:
+                self._volume = 0.0
+                self._volume_price = 0.0
+
+            self._day = day
+
+        self._volume += volume
+        self._volume_price += (high + low + close) / 3.0 * volume
+
+        if self._volume > 0.0:
+            return self._volume_price / self._volume
+
+        return 0.0
+
+
+class Wma(StreamingIndicator):
+    """
+    Streaming counterpart of quanta.wma().
+
+    The weighted sum is rebuilt over the window on every bar, as in
+    the batch function, so each update costs O(length) and does not
+    depend on the history length.
+    """
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: WMA period length
+        """
+
+        check_length(length)
+
+        self._length = length
+        self._window: deque[float] = deque(maxlen=length)
+        self._weight_sum = length * (length + 1) / 2.0
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Weighted average of the window ending at
+                   the new value
+        """
+
+        window = self._window
+        window.append(value)
+
+        if len(window) < self._length or isnan(value):
+            return nan
+
+        weighted_sum = 0.0
+
+        for weight, val in enumerate(window, 1):
+            if isnan(val):
+                return nan
+
+            weighted_sum += val * weight
+
+        if isnan(weighted_sum):
+            return nan
+
+        return weighted_sum / self._weight_sum
+
+
+class Hma(StreamingIndicator):
+    """Streaming counterpart of quanta.hma()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: HMA period length
+        """
+
+        check_length(length, 2)
+
+        self._wma_half = Wma(length // 2)
+        self._wma_full = Wma(length)
+        self._wma_raw = Wma(int(length ** 0.5))
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Hull moving average
+        """
+
+        half = self._wma_half.update(value)
+        full = self._wma_full.update(value)
+
+        if isnan(half) or isnan(full):
+            raw = nan
+        else:
+            raw = 2.0 * half - full
+
+        return self._wma_raw.update(raw)
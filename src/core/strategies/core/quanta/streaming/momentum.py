@@ -0,0 +1,139 @@
+from __future__ import annotations
+from math import isnan, nan
+
+from .base import StreamingIndicator, divide
+from .math import Rma
+from .utils import Highest, Lowest
+
+
+class Rsi(StreamingIndicator):
+    """Streaming counterpart of quanta.rsi()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: RSI period length
+        """
+
+        self._rma_u = Rma(length)
+        self._rma_d = Rma(length)
+        self._prev = nan
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Relative strength index
+        """
+
+        u = value - self._prev
+        d = self._prev - value
+        self._prev = value
+
+        if u < 0:
+            u = 0.0
+
+        if d < 0:
+            d = 0.0
+
+        rs = divide(self._rma_u.update(u), self._rma_d.update(d))
+        return 100 - divide(100, 1 + rs)
+
+
+class _Range(StreamingIndicator):
+    """Position of a price within the high-low range of a window."""
+
+    def __init__(self, length: int) -> None:
+        self._highest = Highest(length)
+        self._lowest = Lowest(length)
+
+    def _range(self, high: float, low: float) -> tuple[float, float]:
+        """Advance the window, returning its highest high and lowest low."""
+
+        return self._highest.update(high), self._lowest.update(low)
+
+
+class Stoch(_Range):
+    """Streaming counterpart of quanta.stoch()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Lookback period for high/low calculation
+        """
+
+        super().__init__(length)
+
+    def update(self, source: float, high: float, low: float) -> float:
+        """
+        Args:
+            source: Close price
+            high: High price
+            low: Low price
+
+        Returns:
+            float: Stochastic oscillator value (0-100), NaN if invalid
+        """
+
+        hi, lo = self._range(high, low)
+
+        if isnan(hi) or isnan(lo) or isnan(source):
+            return nan
+
+        denom = hi - lo
+
+        if denom == 0:
+            return 0.0
+
+        r = 100.0 * (source - lo) / denom
+
+        if r > 100.0:
+            r = 100.0
+        elif r < 0.0:
+            r = 0.0
+
+        return r
+
+
+class Wpr(_Range):
+    """Streaming counterpart of quanta.wpr()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Lookback period for high/low calculation
+        """
+
+        super().__init__(length)
+
+    def update(self, close: float, high: float, low: float) -> float:
+        """
+        Args:
+            close: Close price
+            high: High price
+            low: Low price
+
+        Returns:
+            float: WPR value (-100 to 0), NaN if invalid
+        """
+
+        hi, lo = self._range(high, low)
+
+        if isnan(hi) or isnan(lo) or isnan(close):
+            return nan
+
+        denom = hi - lo
+
+        if denom == 0:
+            return 0.0
+
+        r = -100.0 * (hi - close) / denom
+
+        if r < -100.0:
+            r = -100.0
+        elif r > 0.0:
+            r = 0.0
+
+        return r
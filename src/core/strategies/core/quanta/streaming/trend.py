@@ -0,0 +1,240 @@
+from __future__ import annotations
+from math import isnan, nan
+
+import numpy as np
+
+from .base import StreamingIndicator, divide
+from .math import Rma
+from .utils import Highest, Lowest
+from .volatility import Atr, Tr
+
+
+class Dmi(StreamingIndicator):
+    """Streaming counterpart of quanta.dmi()."""
+
+    def __init__(self, di_length: int, adx_length: int) -> None:
+        """
+        Args:
+            di_length: Period for DI calculations
+            adx_length: Smoothing period for ADX calculation
+        """
+
+        self._tr = Tr(False)
+        self._rma_tr = Rma(di_length)
+        self._rma_plus_dm = Rma(di_length)
+        self._rma_minus_dm = Rma(di_length)
+        self._rma_dx = Rma(adx_length)
+        self._high: float | None = None
+        self._low = nan
+
+    def update(
+        self,
+        high: float,
+        low: float,
+        close: float
+    ) -> tuple[float, float, float]:
+        """
+        Args:
+            high: High price
+            low: Low price
+            close: Close price
+
+        Returns:
+            tuple[float, float, float]: +DI, -DI and ADX values
+        """
+
+        tr = self._tr.update(high, low, close)
+
+        if self._high is None:
+            plus_dm = nan
+            minus_dm = nan
+        else:
+            change_high = high - self._high
+            change_low = self._low - low
+
+            if change_high > change_low and change_high > 0:
+                plus_dm = change_high
+            else:
+                plus_dm = 0.0
+
+            if change_low > change_high and change_low > 0:
+                minus_dm = change_low
+            else:
+                minus_dm = 0.0
+
+        self._high = high
+        self._low = low
+
+        rma_tr = self._rma_tr.update(tr)
+        plus = divide(100 * self._rma_plus_dm.update(plus_dm), rma_tr)
+        minus = divide(100 * self._rma_minus_dm.update(minus_dm), rma_tr)
+
+        if plus + minus == 0:
+            dx = nan
+        else:
+            dx = abs(plus - minus) / (plus + minus)
+
+        return plus, minus, 100 * self._rma_dx.update(dx)
+
+
+class Donchian(StreamingIndicator):
+    """Streaming counterpart of quanta.donchian()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Lookback period for calculations
+        """
+
+        self._highest = Highest(length)
+        self._lowest = Lowest(length)
+
+    def update(
+        self,
+        high: float,
+        low: float
+    ) -> tuple[float, float, float]:
+        """
+        Args:
+            high: High price
+            low: Low price
+
+        Returns:
+            tuple[float, float, float]: Upper, lower and middle bands
+        """
+
+        upper = self._highest.update(high)
+        lower = self._lowest.update(low)
+        return upper, lower, (upper + lower) / 2
+
+
+class Dst(StreamingIndicator):
+    """Streaming counterpart of quanta.dst()."""
+
+    def __init__(self, factor: float, atr_length: int) -> None:
+        """
+        Args:
+            factor: Multiplier for ATR band width
+                    (rounded to float32 like the batch argument)
+            atr_length: Period length for ATR calculation
+        """
+
+        self._atr = Atr(atr_length)
+        self._factor = float(np.float32(factor))
+        self._atr_value = nan
+        self._upper = nan
+        self._lower = nan
+        self._close = nan
+
+    def update(
+        self,
+        high: float,
+        low: float,
+        close: float
+    ) -> tuple[float, float]:
+        """
+        Args:
+            high: High price
+            low: Low price
+            close: Close price
+
+        Returns:
+            tuple[float, float]: Upper and lower band values
+        """
+
+        atr = self._atr.update(high, low, close)
+        hl2 = 0.5 * (high + low)
+        upper = hl2 + self._factor * atr
+        lower = hl2 - self._factor * atr
+
+        if not isnan(atr) and not isnan(self._atr_value):
+            if upper >= self._upper and self._close <= self._upper:
+                upper = self._upper
+
+            if lower <= self._lower and self._close >= self._lower:
+                lower = self._lower
+
+        self._atr_value = atr
+        self._upper = upper
+        self._lower = lower
+        self._close = close
+        return upper, lower
+
+
+class Supertrend(StreamingIndicator):
+    """Streaming counterpart of quanta.supertrend()."""
+
+    def __init__(self, factor: float, atr_length: int) -> None:
+        """
+        Args:
+            factor: Multiplier for ATR band width
+                    (rounded to float32 like the batch argument)
+            atr_length: Period length for ATR calculation
+        """
+
+        self._atr = Atr(atr_length)
+        self._factor = float(np.float32(factor))
+        self._started = False
+        self._upper = nan
+        self._lower = nan
+        self._indicator = nan
+        self._close = nan
+
+    def update(
+        self,
+        high: float,
+        low: float,
+        close: float
+    ) -> tuple[float, float]:
+        """
+        Args:
+            high: High price
+            low: Low price
+            close: Close price
+
+        Returns:
+            tuple[float, float]: SuperTrend value and direction
+                                 (-1 for uptrend, 1 for downtrend)
+        """
+
+        atr = self._atr.update(high, low, close)
+        hl2 = (high + low) * 0.5
+        upper = hl2 + self._factor * atr
+        lower = hl2 - self._factor * atr
+        indicator = nan
+        direction = nan
+
+        if self._started and not isnan(atr):
+            prev_indicator = self._indicator
+
+            if not isnan(prev_indicator):
+                if upper >= self._upper and self._close <= self._upper:
+                    upper = self._upper
+
+                if lower <= self._lower and self._close >= self._lower:
+                    lower = self._lower
+
+            if isnan(prev_indicator):
+                direction = 1.0
+                indicator = upper
+            elif prev_indicator == self._upper:
+                if close > upper:
+                    direction = -1.0
+                    indicator = lower
+                else:
+                    direction = 1.0
+                    indicator = upper
+            else:
+                if close < lower:
+                    direction = 1.0
+                    indicator = upper
+                else:
+                    direction = -1.0
+                    indicator = lower
+
+        self._started = True
+        self._upper = upper
+        self._lower = lower
+        self._indicator = indicator
+        self._close = close
+        return indicator, direction
@@ -0,0 +1,183 @@
+from __future__ import annotations
+from abc import abstractmethod
+from collections import deque
+from math import isnan, nan
+
+from .base import StreamingIndicator
+
+
+class _WindowExtreme(StreamingIndicator):
+    """
+    Monotonic deque of (index, value) pairs over the last `length`
+    bars, as in quanta.highest() and quanta.lowest(). Each value is
+    pushed and popped at most once, so updates are amortized O(1).
+    """
+
+    def __init__(self, length: int) -> None:
+        self._length = length
+        self._deque: deque[tuple[int, float]] = deque()
+        self._index = -1
+
+    @abstractmethod
+    def _dominates(self, value: float, other: float) -> bool:
+        """Whether value evicts an older window value."""
+
+        pass
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Window extreme (NaN if the window has no values)
+        """
+
+        if self._length < 1:
+            return nan
+
+        self._index += 1
+        window = self._deque
+
+        if not isnan(value):
+            while window and self._dominates(value, window[-1][1]):
+                window.pop()
+
+            window.append((self._index, value))
+
+        while window and window[0][0] <= self._index - self._length:
+            window.popleft()
+
+        if self._index >= self._length - 1 and window:
+            return window[0][1]
+
+        return nan
+
+
+class Highest(_WindowExtreme):
+    """Streaming counterpart of quanta.highest()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Lookback window length
+        """
+
+        super().__init__(length)
+
+    def _dominates(self, value: float, other: float) -> bool:
+        return other < value
+
+
+class Lowest(_WindowExtreme):
+    """Streaming counterpart of quanta.lowest()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Lookback window length
+        """
+
+        super().__init__(length)
+
+    def _dominates(self, value: float, other: float) -> bool:
+        return other > value
+
+
+class _Pivot(StreamingIndicator):
+    """
+    Pivot detection of quanta.pivothigh() and quanta.pivotlow().
+
+    A pivot is reported `rightbars` bars after its center. The left
+    window extreme is tracked by a window stream fed with values
+    as they leave the right window, the right window extreme by one
+    fed with every new value.
+    """
+
+    def __init__(
+        self,
+        leftbars: int,
+        rightbars: int,
+        extreme: type[_WindowExtreme]
+    ) -> None:
+        self._leftbars = leftbars
+        self._rightbars = rightbars
+        self._window: deque[float] = deque(maxlen=rightbars + 1)
+        self._left = extreme(leftbars)
+        self._right = extreme(rightbars)
+        self._index = -1
+
+    @abstractmethod
+    def _rejects(self, extreme: float, center: float, left: bool) -> bool:
+        """Whether a window extreme disqualifies the center."""
+
+        pass
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Center value if it is a pivot, NaN otherwise
+        """
+
+        self._index += 1
+        window = self._window
+        left = nan
+
+        if len(window) == window.maxlen:
+            left = self._left.update(window[0])
+
+        window.append(value)
+        right = self._right.update(value)
+
+        if self._index < self._leftbars + self._rightbars:
+            return nan
+
+        center = window[0]
+
+        if isnan(center):
+            return nan
+
+        if self._leftbars > 0 and self._rejects(left, center, True):
+            return nan
+
+        if self._rightbars > 0 and self._rejects(right, center, False):
+            return nan
+
+        return center
+
+
+class Pivothigh(_Pivot):
+    """Streaming counterpart of quanta.pivothigh()."""
+
+    def __init__(self, leftbars: int, rightbars: int) -> None:
+        """
+        Args:
+            leftbars: Number of bars to look back (left window size)
+            rightbars: Number of bars to look forward
+                       (right window size)
+        """
+
+        super().__init__(leftbars, rightbars, Highest)
+
+    def _rejects(self, extreme: float, center: float, left: bool) -> bool:
+        return extreme >= center if left else extreme > center
+
+
+class Pivotlow(_Pivot):
+    """Streaming counterpart of quanta.pivotlow()."""
+
+    def __init__(self, leftbars: int, rightbars: int) -> None:
+        """
+        Args:
+            leftbars: Number of bars to look back (left window size)
+            rightbars: Number of bars to look forward
+                       (right window size)
+        """
+
+        super().__init__(leftbars, rightbars, Lowest)
+
+    def _rejects(self, extreme: float, center: float, left: bool) -> bool:
+        return extreme <= center if left else extreme < center
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from math import nan
+
+import numpy as np
+
+from .base import StreamingIndicator, divide
+from .math import Rma, Sma, Stdev
+
+
+class Tr(StreamingIndicator):
+    """Streaming counterpart of quanta.tr()."""
+
+    def __init__(self, handle_nan: bool) -> None:
+        """
+        Args:
+            handle_nan: If True, computes first bar TR using current
+                        close, if False, returns NaN for first bar
+        """
+
+        self._handle_nan = handle_nan
+        self._close: float | None = None
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """
+        Args:
+            high: High price
+            low: Low price
+            close: Close price
+
+        Returns:
+            float: True range of the new bar
+        """
+
+        prev_close = self._close
+        self._close = close
+
+        if prev_close is None:
+            if not self._handle_nan:
+                return nan
+
+            prev_close = close
+
+        return max(
+            high - low,
+            abs(high - prev_close),
+            abs(low - prev_close)
+        )
+
+
+class Atr(StreamingIndicator):
+    """Streaming counterpart of quanta.atr()."""
+
+    def __init__(self, length: int) -> None:
+        """
+        Args:
+            length: Period length for smoothing
+        """
+
+        self._tr = Tr(True)
+        self._rma = Rma(length)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """
+        Args:
+            high: High price
+            low: Low price
+            close: Close price
+
+        Returns:
+            float: Average true range
+        """
+
+        return self._rma.update(self._tr.update(high, low, close))
+
+
+class Bb(StreamingIndicator):
+    """Streaming counterpart of quanta.bb()."""
+
+    def __init__(self, length: int, mult: float) -> None:
+        """
+        Args:
+            length: Period length for moving average and
+                    standard deviation
+            mult: Multiplier for standard deviation bands width
+                  (rounded to float32 like the batch argument)
+        """
+
+        self._sma = Sma(length)
+        self._stdev = Stdev(length)
+        self._mult = float(np.float32(mult))
+
+    def update(self, value: float) -> tuple[float, float, float]:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            tuple[float, float, float]: Middle, upper and lower bands
+        """
+
+        mean = self._sma.update(value)
+        width = self._mult * self._stdev.update(value)
+        return mean, mean + width, mean - width
+
+
+class Bbw(StreamingIndicator):
+    """Streaming counterpart of quanta.bbw()."""
+
+    def __init__(self, length: int, mult: float) -> None:
+        """
+        Args:
+            length: Period length for moving average and
+                    standard deviation
+            mult: Multiplier for standard deviation bands width
+                  (rounded to float32 like the batch argument)
+        """
+
+        self._bb = Bb(length, mult)
+
+    def update(self, value: float) -> float:
+        """
+        Args:
+            value: New source value
+
+        Returns:
+            float: Band width relative to the middle band
+        """
+
+        mean, upper, lower = self._bb.update(value)
+        return divide(upper - lower, mean)
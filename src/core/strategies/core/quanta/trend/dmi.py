@@ -3,8 +3,96 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..math import rma
-from ..volatility import tr
+from ..math.rma import rma_into
+from ..volatility.tr import tr_into
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:], nb.float64[:], nb.float64[:]))(
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.int16, nb.int16,
+        nb.float64[:], nb.float64[:], nb.float64[:]
+    ),
+    cache=True,
+    nogil=True,
+    error_model='numpy'
+)
+def dmi_into(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    di_length: np.int16,
+    adx_length: np.int16,
+    plus: np.ndarray,
+    minus: np.ndarray,
+    adx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate dmi() into caller-supplied buffers.
+
+    Directional movements are smoothed in the +DI/-DI buffers
+    and the true range in the ADX buffer, so no scratch space
+    is needed.
+
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        di_length: Period for DI calculations
+        adx_length: Smoothing period for ADX calculation
+        plus: Output buffer for +DI values
+        minus: Output buffer for -DI values
+        adx: Output buffer for ADX values
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The output buffers
+    """
+
+    n = high.shape[0]
+
+    if plus.shape[0] != n or minus.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    if n > 0:
+        plus[0] = np.nan
+        minus[0] = np.nan
+
+    for i in range(1, n):
+        change_high = high[i] - high[i - 1]
+        change_low = low[i - 1] - low[i]
+
+        if change_high > change_low and change_high > 0:
+            plus[i] = change_high
+        else:
+            plus[i] = 0.0
+
+        if change_low > change_high and change_low > 0:
+            minus[i] = change_low
+        else:
+            minus[i] = 0.0
+
+    rma_tr = rma_into(
+        tr_into(high, low, close, False, adx), di_length, adx
+    )
+    rma_into(plus, di_length, plus)
+    rma_into(minus, di_length, minus)
+
+    for i in range(n):
+        p = 100 * plus[i] / rma_tr[i]
+        m = 100 * minus[i] / rma_tr[i]
+        plus[i] = p
+        minus[i] = m
+
+        if p + m == 0:
+            adx[i] = np.nan
+        else:
+            adx[i] = np.abs(p - m) / (p + m)
+
+    rma_into(adx, adx_length, adx)
+
+    for i in range(n):
+        adx[i] = 100 * adx[i]
+
+    return plus, minus, adx
 
 
 @nb.njit(
@@ -45,46 +133,13 @@ def dmi(
 
     n = high.shape[0]
 
-    change_high = np.empty(n, dtype=np.float64)
-    change_low = np.empty(n, dtype=np.float64)
-    change_high[0] = np.nan
-    change_low[0] = np.nan
-
-    for i in range(1, n):
-        change_high[i] = high[i] - high[i - 1]
-        change_low[i] = low[i - 1] - low[i]
-
-    tr_values = tr(high, low, close, handle_nan=False)
-
-    plus_dm = np.empty(n, dtype=np.float64)
-    plus_dm[0] = np.nan
-
-    for i in range(1, n):
-        if change_high[i] > change_low[i] and change_high[i] > 0:
-            plus_dm[i] = change_high[i]
-        else:
-            plus_dm[i] = 0.0
-
-    minus_dm = np.empty(n, dtype=np.float64)
-    minus_dm[0] = np.nan
-
-    for i in range(1, n):
-        if change_low[i] > change_high[i] and change_low[i] > 0:
-            minus_dm[i] = change_low[i]
-        else:
-            minus_dm[i] = 0.0
-
-    rma_tr = rma(tr_values, di_length)
-    rma_plus_dm = rma(plus_dm, di_length)
-    rma_minus_dm = rma(minus_dm, di_length)
-
-    plus = 100 * rma_plus_dm / rma_tr
-    minus = 100 * rma_minus_dm / rma_tr
-    dx = np.abs(plus - minus) / (plus + minus)
-
-    for i in range(dx.shape[0]):
-        if plus[i] + minus[i] == 0:
-            dx[i] = np.nan
-
-    adx = 100 * rma(dx, adx_length)
-    return plus, minus, adx
\ No newline at end of file
+    return dmi_into(
+        high,
+        low,
+        close,
+        di_length,
+        adx_length,
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64)
+    )
\ No newline at end of file
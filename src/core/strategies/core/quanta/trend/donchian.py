@@ -3,7 +3,53 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..utils import highest, lowest
+from ..utils.highest import highest_into
+from ..utils.lowest import lowest_into
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:], nb.float64[:], nb.float64[:]))(
+        nb.float64[:], nb.float64[:], nb.int16,
+        nb.float64[:], nb.float64[:], nb.float64[:]
+    ),
+    cache=True,
+    nogil=True
+)
+def donchian_into(
+    high: np.ndarray,
+    low: np.ndarray,
+    length: np.int16,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    middle: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate donchian() into caller-supplied buffers.
+
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        length: Lookback period for calculations
+        upper: Output buffer for the upper band
+        lower: Output buffer for the lower band
+        middle: Output buffer for the middle band
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The output buffers
+    """
+
+    n = high.shape[0]
+
+    if middle.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    highest_into(high, length, upper)
+    lowest_into(low, length, lower)
+
+    for i in range(n):
+        middle[i] = (upper[i] + lower[i]) / 2
+
+    return upper, lower, middle
 
 
 @nb.njit(
@@ -33,8 +79,13 @@ def donchian(
             - Middle band values
     """
 
-    upper = highest(high, length)
-    lower = lowest(low, length)
-    middle = (upper + lower) / 2
+    n = high.shape[0]
 
-    return upper, lower, middle
\ No newline at end of file
+    return donchian_into(
+        high,
+        low,
+        length,
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,7 +3,78 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..volatility import atr
+from ..volatility.atr import atr_into
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:], nb.float64[:]))(
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.float32, nb.int16,
+        nb.float64[:], nb.float64[:], nb.float64[:, :]
+    ),
+    cache=True,
+    nogil=True
+)
+def dst_into(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    factor: np.float32,
+    atr_length: np.int16,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    work: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate dst() into caller-supplied buffers.
+
+    Args:
+        high: High price series
+        low: Low price series
+        close: Close price series
+        factor: Multiplier for ATR band width
+        atr_length: Period length for ATR calculation
+        upper: Output buffer for the upper band
+        lower: Output buffer for the lower band
+        work: Scratch buffer with 1 row of the series length
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The output buffers
+    """
+
+    n = high.shape[0]
+
+    if upper.shape[0] != n or lower.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    if work.shape[0] < 1 or work.shape[1] != n:
+        raise ValueError('Invalid workspace shape')
+
+    atr_values = atr_into(high, low, close, atr_length, work[0])
+
+    for i in range(n):
+        hl2 = 0.5 * (high[i] + low[i])
+        # ATR term first: where both terms are NaN, the result keeps
+        # the NaN of the ATR warm-up, as the array expression did
+        upper[i] = factor * atr_values[i] + hl2
+        lower[i] = hl2 - factor * atr_values[i]
+
+    for i in range(1, n):
+        if np.isnan(atr_values[i]) or np.isnan(atr_values[i - 1]):
+            continue
+
+        if (
+            upper[i] >= upper[i - 1] and
+            close[i - 1] <= upper[i - 1]
+        ):
+            upper[i] = upper[i - 1]
+
+        if (
+            lower[i] <= lower[i - 1] and
+            close[i - 1] >= lower[i - 1]
+        ):
+            lower[i] = lower[i - 1]
+
+    return upper, lower
 
 
 @nb.njit(
@@ -41,26 +112,14 @@ def dst(
     """
 
     n = high.shape[0]
-    atr_values = atr(high, low, close, atr_length)
-    
-    hl2 = 0.5 * (high + low)
-    upper_band = hl2 + factor * atr_values
-    lower_band = hl2 - factor * atr_values
-
-    for i in range(1, n):
-        if np.isnan(atr_values[i]) or np.isnan(atr_values[i - 1]):
-            continue
-
-        if (
-            upper_band[i] >= upper_band[i - 1] and
-            close[i - 1] <= upper_band[i - 1]
-        ):
-            upper_band[i] = upper_band[i - 1]
-
-        if (
-            lower_band[i] <= lower_band[i - 1] and
-            close[i - 1] >= lower_band[i - 1]
-        ):
-            lower_band[i] = lower_band[i - 1]
 
-    return upper_band, lower_band
\ No newline at end of file
+    return dst_into(
+        high,
+        low,
+        close,
+        factor,
+        atr_length,
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64),
+        np.empty((1, n), dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,55 +3,72 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..volatility import atr
+from ..volatility.atr import atr_into
 
 
 @nb.njit(
     nb.types.Tuple((nb.float64[:], nb.float64[:]))(
-        nb.float64[:], nb.float64[:], nb.float64[:], nb.float32, nb.int16
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.float32, nb.int16,
+        nb.float64[:], nb.float64[:], nb.float64[:, :]
     ),
     cache=True,
     nogil=True
 )
-def supertrend(
+def supertrend_into(
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
     factor: np.float32,
-    atr_length: np.int16
+    atr_length: np.int16,
+    indicator: np.ndarray,
+    direction: np.ndarray,
+    work: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray]:
     """
-    Calculate SuperTrend indicator values and direction.
+    Calculate supertrend() into caller-supplied buffers.
 
-    The function computes the SuperTrend indicator using ATR-based bands
-    around the midpoint of high-low prices. Tracks trend direction
-    with band switches.
+    ATR values are kept in the indicator buffer and each bar
+    is overwritten with the SuperTrend value once processed.
 
     Args:
-        settings: High price series
+        high: High price series
         low: Low price series
         close: Close price series
         factor: Multiplier for ATR band width
         atr_length: Period length for ATR calculation
+        indicator: Output buffer for SuperTrend values
+        direction: Output buffer for the direction
+        work: Scratch buffer with 2 rows of the series length
 
     Returns:
-        Tuple[np.ndarray, np.ndarray]:
-            - First array: SuperTrend indicator values
-            - Second array: Direction (-1 for uptrend, 1 for downtrend)
+        Tuple[np.ndarray, np.ndarray]: The output buffers
     """
 
     n = high.shape[0]
-    atr_values = atr(high, low, close, atr_length)
-    
-    hl2 = (high + low) * 0.5
-    upper_band = hl2 + factor * atr_values
-    lower_band = hl2 - factor * atr_values
 
-    indicator = np.full(n, np.nan)
-    direction = np.full(n, np.nan)
+    if direction.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    if work.shape[0] < 2 or work.shape[1] != n:
+        raise ValueError('Invalid workspace shape')
+
+    atr_values = atr_into(high, low, close, atr_length, indicator)
+    upper_band = work[0]
+    lower_band = work[1]
+
+    for i in range(n):
+        hl2 = (high[i] + low[i]) * 0.5
+        upper_band[i] = hl2 + factor * atr_values[i]
+        lower_band[i] = hl2 - factor * atr_values[i]
+
+    direction[:] = np.nan
+
+    if n > 0:
+        indicator[0] = np.nan
 
     for i in range(1, n):
         if np.isnan(atr_values[i]):
+            indicator[i] = np.nan
             continue
 
         if not np.isnan(indicator[i - 1]):
@@ -84,4 +101,52 @@ def supertrend(
                 direction[i] = -1
                 indicator[i] = lower_band[i]
 
-    return indicator, direction
\ No newline at end of file
+    return indicator, direction
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:], nb.float64[:]))(
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.float32, nb.int16
+    ),
+    cache=True,
+    nogil=True
+)
+def supertrend(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    factor: np.float32,
+    atr_length: np.int16
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate SuperTrend indicator values and direction.
+
+    The function computes the SuperTrend indicator using ATR-based bands
+    around the midpoint of high-low prices. Tracks trend direction
+    with band switches.
+
+    Args:
+        settings: High price series
+        low: Low price series
+        close: Close price series
+        factor: Multiplier for ATR band width
+        atr_length: Period length for ATR calculation
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            - First array: SuperTrend indicator values
+            - Second array: Direction (-1 for uptrend, 1 for downtrend)
+    """
+
+    n = high.shape[0]
+
+    return supertrend_into(
+        high,
+        low,
+        close,
+        factor,
+        atr_length,
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64),
+        np.empty((2, n), dtype=np.float64)
+    )
\ No newline at end of file
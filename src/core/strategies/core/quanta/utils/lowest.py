@@ -4,41 +4,104 @@ import numpy as np
 import numba as nb
 
 
-@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
-def lowest(source: np.ndarray, length: np.int16) -> np.ndarray:
+@nb.njit(
+    nb.float64[:](nb.float64[:], nb.int16, nb.float64[:]),
+    cache=True,
+    nogil=True
+)
+def lowest_into(
+    source: np.ndarray,
+    length: np.int16,
+    out: np.ndarray
+) -> np.ndarray:
     """
-    Calculate the lowest value over a sliding window.
+    Calculate lowest() into a caller-supplied buffer.
 
-    The function computes the minimum value for each position in the array
-    looking back over the specified number of periods.
+    The deque is a ring buffer of the window length, so memory
+    use beyond the output doesn't grow with the series.
 
     Args:
         source: Input series (leading NaNs are skipped)
         length: Lookback window length
+        out: Output buffer of the series length
 
     Returns:
-        np.ndarray: Array of lowest values
+        np.ndarray: The output buffer
     """
 
     n = source.shape[0]
-    result = np.empty(n, dtype=np.float64)
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    out[:] = np.nan
+
+    if length < 1:
+        return out
+
+    # At most `length` indices of the previous window
+    # plus the current one are queued
+    capacity = min(length, n) + 1
+    deque = np.empty(capacity, dtype=np.int64)
+    head = 0
+    size = 0
 
     for i in range(n):
-        if i < length - 1:
-            result[i] = np.nan
-        else:
-            min_val = np.inf
-            has_valid = False
+        val = source[i]
+
+        if not np.isnan(val):
+            while size > 0:
+                back = head + size - 1
+                if back >= capacity:
+                    back -= capacity
+
+                if source[deque[back]] > val:
+                    size -= 1
+                else:
+                    break
+
+            tail = head + size
+            if tail >= capacity:
+                tail -= capacity
+
+            deque[tail] = i
+            size += 1
+
+        while size > 0 and deque[head] <= i - length:
+            head += 1
+            size -= 1
+
+            if head == capacity:
+                head = 0
 
-            for j in range(i - length + 1, i + 1):
-                val = source[j]
+        if i >= length - 1 and size > 0:
+            out[i] = source[deque[head]]
 
-                if not np.isnan(val):
-                    has_valid = True
+    return out
 
-                    if val < min_val:
-                        min_val = val
 
-            result[i] = min_val if has_valid else np.nan
+@nb.njit(nb.float64[:](nb.float64[:], nb.int16), cache=True, nogil=True)
+def lowest(source: np.ndarray, length: np.int16) -> np.ndarray:
+    """
+    Calculate the lowest value over a sliding window.
+
+    The function computes the minimum value for each position in the array
+    looking back over the specified number of periods.
+
+    Runs in O(n) regardless of the window length: a monotonic deque
+    keeps indices of window values in increasing order, so the front
+    is the window minimum. Ties keep the earliest index, which matches
+    the value a full scan of the window would return.
+
+    Args:
+        source: Input series (leading NaNs are skipped)
+        length: Lookback window length
+
+    Returns:
+        np.ndarray: Array of lowest values
+                    (NaN if the window has no valid values)
+    """
 
-    return result
\ No newline at end of file
+    return lowest_into(
+        source, length, np.empty(source.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,6 +3,70 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
+from .lowest import lowest_into
+
+
+@nb.njit(
+    nb.float64[:](
+        nb.float64[:], nb.int16, nb.int16, nb.float64[:], nb.float64[:, :]
+    ),
+    cache=True,
+    nogil=True
+)
+def pivotlow_into(
+    source: np.ndarray,
+    leftbars: np.int16,
+    rightbars: np.int16,
+    out: np.ndarray,
+    work: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate pivotlow() into a caller-supplied buffer.
+
+    Args:
+        source: Input price series (leading and trailing NaNs are skipped)
+        leftbars: Number of bars to look back (left window size)
+        rightbars: Number of bars to look forward (right window size)
+        out: Output buffer of the series length
+        work: Scratch buffer with 1 row of the series length
+
+    Returns:
+        np.ndarray: The output buffer
+    """
+
+    n = source.shape[0]
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    if work.shape[0] < 1 or work.shape[1] != n:
+        raise ValueError('Invalid workspace shape')
+
+    # Extremes of the left window ending at i - 1 and
+    # of the right window ending at i + rightbars (NaN if no values);
+    # the right extremes are replaced by the result as they are read
+    left = lowest_into(source, leftbars, work[0])
+    right = lowest_into(source, rightbars, out)
+    out[:min(leftbars + rightbars, n)] = np.nan
+
+    for i in range(leftbars, n - rightbars):
+        center = source[i]
+        right_extreme = right[i + rightbars]
+        out[i + rightbars] = np.nan
+
+        if np.isnan(center):
+            continue
+
+        if leftbars > 0 and left[i - 1] <= center:
+            continue
+
+        if rightbars > 0 and right_extreme < center:
+            continue
+
+        out[i + rightbars] = center
+
+    return out
+
 
 @nb.njit(
     nb.float64[:](nb.float64[:], nb.int16, nb.int16),
@@ -22,6 +86,9 @@ def pivotlow(
     where the center value is lower than all values within the left and right
     windows. The pivot low is marked at the right edge of the right window.
 
+    Runs in O(n): window extremes come from two passes of lowest()
+    instead of rescanning both windows at every bar.
+
     Args:
         source: Input price series (leading and trailing NaNs are skipped)
         leftbars: Number of bars to look back (left window size)
@@ -34,32 +101,11 @@ def pivotlow(
     """
 
     n = source.shape[0]
-    result = np.full(n, np.nan, dtype=np.float64)
-
-    for i in range(leftbars, n - rightbars):
-        center_idx = i
-        pivot_idx = i + rightbars
-        center = source[center_idx]
-
-        if np.isnan(center):
-            continue
-
-        is_pivot = True
-
-        for j in range(i - leftbars, i):
-            if not np.isnan(source[j]) and source[j] <= center:
-                is_pivot = False
-                break
-
-        if not is_pivot:
-            continue
-
-        for j in range(i + 1, i + rightbars + 1):
-            if not np.isnan(source[j]) and source[j] < center:
-                is_pivot = False
-                break
-
-        if is_pivot:
-            result[pivot_idx] = center
 
-    return result
\ No newline at end of file
+    return pivotlow_into(
+        source,
+        leftbars,
+        rightbars,
+        np.empty(n, dtype=np.float64),
+        np.empty((1, n), dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,8 +3,43 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from .tr import tr
-from ..math import rma
+from .tr import tr_into
+from ..math.rma import rma_into
+
+
+@nb.njit(
+    nb.float64[:](
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.int16,
+        nb.float64[:]
+    ),
+    cache=True,
+    nogil=True
+)
+def atr_into(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    length: np.int16,
+    out: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate atr() into a caller-supplied buffer.
+
+    True range is smoothed in place, no other memory is used.
+
+    Args:
+        high: High price series
+        low: Low price series
+        close: Close price series
+        length: Period length for smoothing
+        out: Output buffer of the series length
+
+    Returns:
+        np.ndarray: The output buffer
+    """
+
+    tr_into(high, low, close, True, out)
+    return rma_into(out, length, out)
 
 
 @nb.njit(
@@ -36,5 +71,6 @@ def atr(
         np.ndarray: ATR values array
     """
 
-    tr_values = tr(high, low, close, True)
-    return rma(tr_values, length)
\ No newline at end of file
+    return atr_into(
+        high, low, close, length, np.empty(high.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,7 +3,57 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..math import sma, stdev
+from ..math.sma import sma_into
+from ..math.stdev import stdev_into
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:], nb.float64[:], nb.float64[:]))(
+        nb.float64[:], nb.int16, nb.float32,
+        nb.float64[:], nb.float64[:], nb.float64[:]
+    ),
+    cache=True,
+    nogil=True
+)
+def bb_into(
+    source: np.ndarray,
+    length: np.int16,
+    mult: np.float32,
+    middle: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate bb() into caller-supplied buffers.
+
+    The standard deviation is kept in the lower band buffer
+    until the bands are formed, no other memory is used.
+
+    Args:
+        source: Input price series
+        length: Period length for moving average and standard deviation
+        mult: Multiplier for standard deviation bands width
+        middle: Output buffer of the middle band
+        upper: Output buffer of the upper band
+        lower: Output buffer of the lower band
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The output buffers
+    """
+
+    n = source.shape[0]
+
+    if upper.shape[0] != n or lower.shape[0] != n:
+        raise ValueError('Invalid output length')
+
+    mean = sma_into(source, length, middle)
+    std = stdev_into(source, length, lower)
+
+    for i in range(n):
+        upper[i] = mean[i] + mult * std[i]
+        lower[i] = mean[i] - mult * std[i]
+
+    return mean, upper, lower
 
 
 @nb.njit(
@@ -37,10 +87,13 @@ def bb(
             - Lower band
     """
 
-    mean = sma(source, length)
-    std = stdev(source, length)
-
-    upper = mean + mult * std
-    lower = mean - mult * std
+    n = source.shape[0]
 
-    return mean, upper, lower
\ No newline at end of file
+    return bb_into(
+        source,
+        length,
+        mult,
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64)
+    )
\ No newline at end of file
@@ -3,7 +3,53 @@ from __future__ import annotations
 import numpy as np
 import numba as nb
 
-from ..math import sma, stdev
+from ..math.sma import sma_into
+from ..math.stdev import stdev_into
+
+
+@nb.njit(
+    nb.float64[:](
+        nb.float64[:], nb.int16, nb.float32, nb.float64[:], nb.float64[:, :]
+    ),
+    cache=True,
+    nogil=True,
+    error_model='numpy'
+)
+def bbw_into(
+    source: np.ndarray,
+    length: np.int16,
+    mult: np.float32,
+    out: np.ndarray,
+    work: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate bbw() into a caller-supplied buffer.
+
+    Args:
+        source: Input price series
+        length: Period length for moving average and standard deviation
+        mult: Multiplier for standard deviation bands width
+        out: Output buffer of the series length
+        work: Scratch buffer with 1 row of the series length
+
+    Returns:
+        np.ndarray: The output buffer
+    """
+
+    n = source.shape[0]
+
+    if work.shape[0] < 1 or work.shape[1] != n:
+        raise ValueError('Invalid workspace shape')
+
+    mean = sma_into(source, length, work[0])
+    std = stdev_into(source, length, out)
+
+    for i in range(n):
+        upper = mean[i] + mult * std[i]
+        lower = mean[i] - mult * std[i]
+        out[i] = (upper - lower) / mean[i]
+
+    return out
 
 
 @nb.njit(
@@ -31,10 +77,12 @@ def bbw(
         np.ndarray: Array containing Bollinger Bands Width values
     """
 
-    mean = sma(source, length)
-    std = stdev(source, length)
-
-    upper = mean + mult * std
-    lower = mean - mult * std
+    n = source.shape[0]
 
-    return (upper - lower) / mean
\ No newline at end of file
+    return bbw_into(
+        source,
+        length,
+        mult,
+        np.empty(n, dtype=np.float64),
+        np.empty((1, n), dtype=np.float64)
+    )
\ No newline at end of file
@@ -6,33 +6,38 @@ import numba as nb
 
 @nb.njit(
     nb.float64[:](
-        nb.float64[:], nb.float64[:], nb.float64[:], nb.boolean
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.boolean,
+        nb.float64[:]
     ),
     cache=True,
     nogil=True
 )
-def tr(
+def tr_into(
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
-    handle_nan: np.bool_
+    handle_nan: np.bool_,
+    out: np.ndarray
 ) -> np.ndarray:
     """
-    Calculate True Range (TR) values from price series.
+    Calculate tr() into a caller-supplied buffer.
 
     Args:
-        settings: High price series
+        high: High price series
         low: Low price series
         close: Close price series
         handle_nan: If True, computes first bar TR using current close,
                     if False, returns NaN for first bar
+        out: Output buffer of the series length
 
     Returns:
-        np.ndarray: True Range values array, NaN where invalid
+        np.ndarray: The output buffer
     """
 
     n = high.shape[0]
-    result = np.full(n, np.nan, dtype=np.float64)
+
+    if out.shape[0] != n:
+        raise ValueError('Invalid output length')
 
     for i in range(n):
         hl = high[i] - low[i]
@@ -42,12 +47,44 @@ def tr(
                 hc = abs(high[i] - close[i])
                 lc = abs(low[i] - close[i])
             else:
-                result[i] = np.nan
+                out[i] = np.nan
                 continue
         else:
             hc = abs(high[i] - close[i - 1])
             lc = abs(low[i] - close[i - 1])
 
-        result[i] = max(hl, hc, lc)
+        out[i] = max(hl, hc, lc)
+
+    return out
+
+
+@nb.njit(
+    nb.float64[:](
+        nb.float64[:], nb.float64[:], nb.float64[:], nb.boolean
+    ),
+    cache=True,
+    nogil=True
+)
+def tr(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    handle_nan: np.bool_
+) -> np.ndarray:
+    """
+    Calculate True Range (TR) values from price series.
+
+    Args:
+        settings: High price series
+        low: Low price series
+        close: Close price series
+        handle_nan: If True, computes first bar TR using current close,
+                    if False, returns NaN for first bar
+
+    Returns:
+        np.ndarray: True Range values array, NaN where invalid
+    """
 
-    return result
\ No newline at end of file
+    return tr_into(
+        high, low, close, handle_nan, np.empty(high.shape[0], dtype=np.float64)
+    )
\ No newline at end of file
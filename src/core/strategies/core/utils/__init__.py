@@ -1,2 +1,4 @@
 from . import cache
-from . import log
\ No newline at end of file
+from . import cutoff
+from . import log
+from . import scratch
\ No newline at end of file
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+import numba as nb
+
+
+@nb.njit(
+    nb.boolean(nb.float64, nb.float64, nb.float64, nb.float64),
+    cache=True,
+    nogil=True
+)
+def exceeded(
+    equity: float,
+    peak_equity: float,
+    min_equity: float,
+    max_drawdown: float
+) -> bool:
+    """
+    Checks whether a backtest has crossed its early-termination cutoff.
+
+    Strategy loops call this once per bar with the equity of closed
+    deals. When it returns True the loop may stop and report
+    the run as aborted: the result is then only known to be worse
+    than the cutoff and must not be used as a regular backtest.
+    
+    Args:
+        equity: Current equity (USDT)
+        peak_equity: Highest equity reached so far (USDT)
+        min_equity: Equity at or below which the run is aborted
+        max_drawdown: Drawdown from peak equity (%)
+                      above which the run is aborted
+        
+    Returns:
+        bool: True if the run should be aborted
+    """
+
+    if equity <= min_equity:
+        return True
+
+    if peak_equity > 0 and np.isfinite(max_drawdown):
+        return (peak_equity - equity) / peak_equity * 100 > max_drawdown
+
+    return False
@@ -78,8 +78,69 @@ def open(
 
 
 @nb.njit(
-    nb.types.Tuple((nb.float64[:, :], nb.float64))(
+    nb.float64[:, :](
         nb.float64[:, :],
+        nb.float64,
+        nb.float64,
+        nb.float64,
+        nb.float64,
+        nb.float64
+    ),
+    cache=True,
+    nogil=True
+)
+def open_buffered(
+    open_deals_log: np.ndarray,
+    position_type: float,
+    order_signal: float,
+    order_date: float,
+    order_price: float,
+    order_size: float
+) -> np.ndarray:
+    """
+    Drop-in replacement for open() that doubles the log on overflow.
+
+    Free (all NaN) rows are reused exactly as in open(); the extra
+    capacity is made of NaN rows, so the log schema is unchanged.
+
+    Args:
+        open_deals_log: Current open deals log array [n,5]
+        position_type: Type of deal (0 for long, 1 for short)
+        order_signal: Signal value at entry
+        order_date: Timestamp of entry
+        order_price: Price at entry
+        order_size: Size of the order
+
+    Returns:
+        np.ndarray: Updated open deals log with the same fields as open()
+    """
+
+    for i in range(open_deals_log.shape[0]):
+        if np.isnan(open_deals_log[i, 0]):
+            open_deals_log[i, 0] = position_type
+            open_deals_log[i, 1] = order_signal
+            open_deals_log[i, 2] = order_date
+            open_deals_log[i, 3] = order_price
+            open_deals_log[i, 4] = order_size
+            return open_deals_log
+
+    n = open_deals_log.shape[0]
+    new_log = np.full((max(2 * n, 1), 5), np.nan, dtype=np.float64)
+    new_log[:n] = open_deals_log
+
+    new_log[n, 0] = position_type
+    new_log[n, 1] = order_signal
+    new_log[n, 2] = order_date
+    new_log[n, 3] = order_price
+    new_log[n, 4] = order_size
+
+    return new_log
+
+
+@nb.njit(
+    nb.float64(
+        nb.float64[:],
+        nb.float64, nb.boolean,
         nb.float64, nb.float64, nb.float64,
         nb.float64, nb.float64, nb.float64,
         nb.float64, nb.float64, nb.float64,
@@ -88,8 +149,10 @@ def open(
     cache=True,
     nogil=True
 )
-def close(
-    completed_deals_log: np.ndarray,
+def _fill_deal(
+    log_entry: np.ndarray,
+    last_cum_pnl: float,
+    is_first: bool,
     commission: float,
     position_type: float,
     order_signal: float,
@@ -100,45 +163,18 @@ def close(
     exit_price: float,
     order_size: float,
     initial_capital: float
-) -> tuple:
+) -> float:
     """
-    Creates and appends a new deal record to completed deals log.
-    Returns updated log and calculated PnL.
+    Fills a completed deal row and returns its PnL.
 
     Args:
-        completed_deals_log: Existing log array [n,13] or empty [0,13]
-        commission (float64): Broker commission rate in percent
-        position_type (float64): Type of deal (0 for long, 1 for short)
-        order_signal (float64): Signal value at entry
-        exit_signal (float64): Signal value at exit
-        order_date (float64): Timestamp of entry
-        exit_date (float64): Timestamp of exit
-        order_price (float64): Price at entry
-        exit_price (float64): Price at exit
-        order_size (float64): Size of the order
-        initial_capital (float64): Initial capital for PnL calculations
+        log_entry: Row to fill [13]
+        last_cum_pnl: Cumulative PnL of the previous deal
+        is_first: Whether this is the first completed deal
+        (other args): See close()
 
     Returns:
-        tuple: (updated_log, pnl) where:
-            updated_log: New log array [n+1,13] with fields:
-                [:, 0] - position_type (0=long, 1=short)
-                [:, 1] - order_signal (signal code)
-                [:, 2] - exit_signal (signal code)
-                [:, 3] - order_date (timestamp)
-                [:, 4] - exit_date (timestamp)
-                [:, 5] - order_price (USDT)
-                [:, 6] - exit_price (USDT)
-                [:, 7] - order_size (units)
-                [:, 8] - pnl (absolute USDT)
-                [:, 9] - pnl (percentage)
-                [:,10] - cumulative_pnl (USDT)
-                [:,11] - cumulative_pnl (%)
-                [:,12] - total_commission (USDT)
-            pnl: Calculated profit/loss for this deal in USDT
-
-    Notes:
-        - For empty order_size returns original log and 0 pnl
-        - All monetary values rounded to 2 decimal places
+        float: Calculated profit/loss for this deal in USDT
     """
 
     total_commission = round(
@@ -147,9 +183,6 @@ def close(
         2
     )
 
-    if order_size == 0.0:
-        return completed_deals_log, 0.0
-
     if position_type == 0.0:
         pnl = round(
             (exit_price - order_price) * order_size - total_commission,
@@ -167,18 +200,16 @@ def close(
         2
     )
 
-
-    if completed_deals_log.shape[0] == 0:
+    if is_first:
         cum_pnl = round(pnl, 2)
         cum_pnl_per = round(pnl / (initial_capital + pnl) * 100.0, 2)
     else:
-        cum_pnl = round(pnl + completed_deals_log[-1, 10], 2)
+        cum_pnl = round(pnl + last_cum_pnl, 2)
         cum_pnl_per = round(
-            pnl / (initial_capital + completed_deals_log[-1, 10]) * 100.0,
+            pnl / (initial_capital + last_cum_pnl) * 100.0,
             2
         )
 
-    log_entry = np.empty(13, dtype=np.float64)
     log_entry[0] = position_type
     log_entry[1] = order_signal
     log_entry[2] = exit_signal
@@ -192,6 +223,93 @@ def close(
     log_entry[10] = cum_pnl
     log_entry[11] = cum_pnl_per
     log_entry[12] = total_commission
+    return pnl
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:, :], nb.float64))(
+        nb.float64[:, :],
+        nb.float64, nb.float64, nb.float64,
+        nb.float64, nb.float64, nb.float64,
+        nb.float64, nb.float64, nb.float64,
+        nb.float64
+    ),
+    cache=True,
+    nogil=True
+)
+def close(
+    completed_deals_log: np.ndarray,
+    commission: float,
+    position_type: float,
+    order_signal: float,
+    exit_signal: float,
+    order_date: float,
+    exit_date: float,
+    order_price: float,
+    exit_price: float,
+    order_size: float,
+    initial_capital: float
+) -> tuple:
+    """
+    Creates and appends a new deal record to completed deals log.
+    Returns updated log and calculated PnL.
+
+    Args:
+        completed_deals_log: Existing log array [n,13] or empty [0,13]
+        commission (float64): Broker commission rate in percent
+        position_type (float64): Type of deal (0 for long, 1 for short)
+        order_signal (float64): Signal value at entry
+        exit_signal (float64): Signal value at exit
+        order_date (float64): Timestamp of entry
+        exit_date (float64): Timestamp of exit
+        order_price (float64): Price at entry
+        exit_price (float64): Price at exit
+        order_size (float64): Size of the order
+        initial_capital (float64): Initial capital for PnL calculations
+
+    Returns:
+        tuple: (updated_log, pnl) where:
+            updated_log: New log array [n+1,13] with fields:
+                [:, 0] - position_type (0=long, 1=short)
+                [:, 1] - order_signal (signal code)
+                [:, 2] - exit_signal (signal code)
+                [:, 3] - order_date (timestamp)
+                [:, 4] - exit_date (timestamp)
+                [:, 5] - order_price (USDT)
+                [:, 6] - exit_price (USDT)
+                [:, 7] - order_size (units)
+                [:, 8] - pnl (absolute USDT)
+                [:, 9] - pnl (percentage)
+                [:,10] - cumulative_pnl (USDT)
+                [:,11] - cumulative_pnl (%)
+                [:,12] - total_commission (USDT)
+            pnl: Calculated profit/loss for this deal in USDT
+
+    Notes:
+        - For empty order_size returns original log and 0 pnl
+        - All monetary values rounded to 2 decimal places
+    """
+
+    if order_size == 0.0:
+        return completed_deals_log, 0.0
+
+    deals_count = completed_deals_log.shape[0]
+    log_entry = np.empty(13, dtype=np.float64)
+    pnl = _fill_deal(
+        log_entry,
+        completed_deals_log[deals_count - 1, 10] if deals_count else 0.0,
+        deals_count == 0,
+        commission,
+        position_type,
+        order_signal,
+        exit_signal,
+        order_date,
+        exit_date,
+        order_price,
+        exit_price,
+        order_size,
+        initial_capital
+    )
 
     if completed_deals_log.shape[0] == 0:
         updated_log = log_entry.reshape(1, -1)
@@ -206,6 +324,141 @@ def close(
     return updated_log, pnl
 
 
+@nb.njit(nb.int64(nb.float64[:, :]), cache=True, nogil=True)
+def filled_count(completed_deals_log: np.ndarray) -> int:
+    """
+    Counts filled rows of a completed deals buffer in O(log n).
+
+    Relies on two invariants of buffers built with close_buffered():
+    filled rows form a prefix of the buffer (rows are only appended),
+    and the position type column of a filled row is never NaN. So the
+    first free row is found by binary search on that column.
+
+    Args:
+        completed_deals_log: Completed deals log or buffer [n,13]
+
+    Returns:
+        int: Number of filled rows
+    """
+
+    lo = 0
+    hi = completed_deals_log.shape[0]
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+
+        if np.isnan(completed_deals_log[mid, 0]):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    return lo
+
+
+@nb.njit(
+    nb.types.Tuple((nb.float64[:, :], nb.float64))(
+        nb.float64[:, :],
+        nb.float64, nb.float64, nb.float64,
+        nb.float64, nb.float64, nb.float64,
+        nb.float64, nb.float64, nb.float64,
+        nb.float64
+    ),
+    cache=True,
+    nogil=True
+)
+def close_buffered(
+    completed_deals_log: np.ndarray,
+    commission: float,
+    position_type: float,
+    order_signal: float,
+    exit_signal: float,
+    order_date: float,
+    exit_date: float,
+    order_price: float,
+    exit_price: float,
+    order_size: float,
+    initial_capital: float
+) -> tuple:
+    """
+    Drop-in replacement for close() with O(log n) appends.
+
+    The log is treated as a buffer: trailing all-NaN rows are free
+    capacity, the deal is written into the first of them and
+    the buffer doubles when it is full. Locating the first free row
+    is a binary search (see filled_count()), copies on growth are
+    amortized O(1), versus the O(n) copy of every close() call.
+    Call trim() after the loop to get only the filled rows
+    (BaseStrategy does this automatically).
+
+    The position type must not be NaN, otherwise the deal's row
+    reads as free capacity.
+
+    Args:
+        completed_deals_log: Deals buffer [capacity,13]
+        commission (float64): Broker commission rate in percent
+        position_type (float64): Type of deal (0 for long, 1 for short)
+        order_signal (float64): Signal value at entry
+        exit_signal (float64): Signal value at exit
+        order_date (float64): Timestamp of entry
+        exit_date (float64): Timestamp of exit
+        order_price (float64): Price at entry
+        exit_price (float64): Price at exit
+        order_size (float64): Size of the order
+        initial_capital (float64): Initial capital for PnL calculations
+
+    Returns:
+        tuple: (updated_log, pnl) with the same fields as close()
+    """
+
+    if order_size == 0.0:
+        return completed_deals_log, 0.0
+
+    deals_count = filled_count(completed_deals_log)
+
+    if deals_count == completed_deals_log.shape[0]:
+        new_log = np.full(
+            (max(2 * deals_count, 16), 13),
+            np.nan,
+            dtype=np.float64
+        )
+        new_log[:deals_count] = completed_deals_log
+        completed_deals_log = new_log
+
+    pnl = _fill_deal(
+        completed_deals_log[deals_count],
+        completed_deals_log[deals_count - 1, 10] if deals_count else 0.0,
+        deals_count == 0,
+        commission,
+        position_type,
+        order_signal,
+        exit_signal,
+        order_date,
+        exit_date,
+        order_price,
+        exit_price,
+        order_size,
+        initial_capital
+    )
+    return completed_deals_log, pnl
+
+
+@nb.njit(nb.float64[:, :](nb.float64[:, :]), cache=True, nogil=True)
+def trim(completed_deals_log: np.ndarray) -> np.ndarray:
+    """
+    Returns the filled rows of a completed deals buffer.
+
+    Logs built with close() are returned unchanged.
+
+    Args:
+        completed_deals_log: Completed deals log or buffer [n,13]
+
+    Returns:
+        np.ndarray: View of the filled rows [count,13]
+    """
+
+    return completed_deals_log[:filled_count(completed_deals_log)]
+
+
 @nb.njit(
     nb.float64[:, :](nb.float64[:, :], nb.int64),
     cache=True,
@@ -0,0 +1,133 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from threading import local
+from typing import Iterator
+
+import numpy as np
+
+
+class _Arena(local):
+    """Buffers of the calling thread."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.free: dict[tuple, list[np.ndarray]] = {}
+        self.borrowed: list[np.ndarray] = []
+        self.ranges: list[tuple[int, int]] = []
+
+
+_arena = _Arena()
+
+
+@contextmanager
+def scope() -> Iterator[None]:
+    """
+    Lend arena buffers for the duration of the block.
+
+    Buffers borrowed with empty() or full() inside the block
+    return to the arena of the calling thread when the outermost
+    scope exits and are handed out again by later scopes, so
+    repeated evaluations of the same shapes (e.g. backtests of one
+    data window) allocate nothing after the first one.
+
+    Arrays borrowed inside a scope must not be used after it exits.
+    Scopes are per thread, nested scopes share the outermost one.
+
+    Yields:
+        None
+    """
+
+    _arena.depth += 1
+
+    try:
+        yield
+    finally:
+        _arena.depth -= 1
+
+        if _arena.depth == 0:
+            for buffer in _arena.borrowed:
+                key = (buffer.shape, buffer.dtype.str)
+                _arena.free.setdefault(key, []).append(buffer)
+
+            _arena.borrowed.clear()
+
+
+def empty(
+    shape: int | tuple[int, ...],
+    dtype: np.dtype | type = np.float64
+) -> np.ndarray:
+    """
+    Borrow an uninitialized buffer.
+
+    Outside of a scope this is a plain np.empty() call,
+    so code using the arena also works without one.
+
+    Args:
+        shape: Buffer shape
+        dtype: Buffer data type
+
+    Returns:
+        np.ndarray: Buffer with undefined contents
+    """
+
+    if _arena.depth == 0:
+        return np.empty(shape, dtype=dtype)
+
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    dtype = np.dtype(dtype)
+    pool = _arena.free.get((shape, dtype.str))
+
+    if pool:
+        buffer = pool.pop()
+    else:
+        buffer = np.empty(shape, dtype=dtype)
+        start = buffer.__array_interface__['data'][0]
+        _arena.ranges.append((start, start + buffer.nbytes))
+
+    _arena.borrowed.append(buffer)
+    return buffer
+
+
+def full(
+    shape: int | tuple[int, ...],
+    fill_value: float | bool,
+    dtype: np.dtype | type = np.float64
+) -> np.ndarray:
+    """
+    Borrow a buffer filled with a value.
+
+    Args:
+        shape: Buffer shape
+        fill_value: Value of every element
+        dtype: Buffer data type
+
+    Returns:
+        np.ndarray: Filled buffer
+    """
+
+    buffer = empty(shape, dtype)
+    buffer.fill(fill_value)
+    return buffer
+
+
+def owns(array: np.ndarray) -> bool:
+    """
+    Check whether an array is (a view of) a buffer of the arena
+    of the calling thread.
+
+    The contents of such arrays change between scopes,
+    so they must not be used to identify data (e.g. in memo keys).
+
+    Args:
+        array: Array to check
+
+    Returns:
+        bool: True if the array points into an arena buffer
+    """
+
+    if not _arena.ranges:
+        return False
+
+    address = array.__array_interface__['data'][0]
+
+    return any(start <= address < end for start, end in _arena.ranges)
\ No newline at end of file
@@ -6,7 +6,9 @@ from . import (
     adjust,
     colors,
     quanta,
-    log
+    cutoff,
+    log,
+    scratch
 )
 
 
@@ -62,6 +64,15 @@ class ExampleV1(BaseStrategy):
         'adx_short_lower_limit': [float(i) for i in range(1, 69)],
     }
 
+    # Indicators precomputed over parameter axes for optimization
+    indicator_tables = [
+        {
+            'indicator': 'dmi',
+            'series': {'high': 'high', 'low': 'low', 'close': 'close'},
+            'params': {'di_length': 'di_length', 'adx_length': 'adx_length'},
+        },
+    ]
+
     # --- UI/UX Configuration ---
     # Human-readable labels for frontend parameter display
     param_labels = {
@@ -134,15 +145,11 @@ class ExampleV1(BaseStrategy):
     }
 
     def calculate(self) -> None:
+        n = self.time.shape[0]
+
         # Exit price levels
-        self.stop_price = np.full(self.time.shape[0], np.nan)
-        self.take_prices = np.array(
-            [
-                np.full(self.time.shape[0], np.nan),
-                np.full(self.time.shape[0], np.nan),
-                np.full(self.time.shape[0], np.nan)
-            ]
-        )
+        self.stop_price = scratch.full(n, np.nan)
+        self.take_prices = scratch.full((3, n), np.nan)
         self.take_percents = np.array([
             self.params['take_percent_1'],
             self.params['take_percent_2'],
@@ -160,28 +167,36 @@ class ExampleV1(BaseStrategy):
         self.take_quantities = np.full(5, np.nan)
 
         # Technical indicators
-        self.dst = quanta.dst(
+        self.dst = quanta.into.dst(
             high=self.high,
             low=self.low,
             close=self.close,
             factor=self.params['st_factor'],
-            atr_length=self.params['st_atr_period']
+            atr_length=self.params['st_atr_period'],
+            upper=scratch.empty(n),
+            lower=scratch.empty(n),
+            work=scratch.empty((1, n))
         )
-        self.upper_band_change = quanta.change(
+        self.upper_band_change = quanta.into.change(
             source=self.dst[0],
-            length=1
+            length=1,
+            out=scratch.empty(n)
         )
-        self.lower_band_change = quanta.change(
+        self.lower_band_change = quanta.into.change(
             source=self.dst[1],
-            length=1
+            length=1,
+            out=scratch.empty(n)
         )
 
-        self.dmi = quanta.dmi(
+        self.dmi = quanta.into.dmi(
             high=self.high,
             low=self.low,
             close=self.close,
             di_length=self.params['di_length'],
-            adx_length=self.params['adx_length']
+            adx_length=self.params['adx_length'],
+            plus=scratch.empty(n),
+            minus=scratch.empty(n),
+            adx=scratch.empty(n)
         )
         self.adx = self.dmi[2]
 
@@ -192,6 +207,90 @@ class ExampleV1(BaseStrategy):
         self.alert_long_new_stop = False
         self.alert_short_new_stop = False
 
+        # Streaming indicators (seeded by the first resume)
+        self.streams = None
+
+        self._run_loop(1)
+        self._set_indicators()
+
+    def resume(self, start: int) -> None:
+        n = self.time.shape[0]
+
+        if self.streams is None:
+            self.streams = {
+                'dst': quanta.streaming.Dst(
+                    factor=self.params['st_factor'],
+                    atr_length=self.params['st_atr_period']
+                ),
+                'upper_band_change': quanta.streaming.Change(length=1),
+                'lower_band_change': quanta.streaming.Change(length=1),
+                'dmi': quanta.streaming.Dmi(
+                    di_length=self.params['di_length'],
+                    adx_length=self.params['adx_length']
+                ),
+            }
+            self.streams['dst'].seed(
+                self.high[:start], self.low[:start], self.close[:start]
+            )
+            self.streams['upper_band_change'].seed(self.dst[0])
+            self.streams['lower_band_change'].seed(self.dst[1])
+            self.streams['dmi'].seed(
+                self.high[:start], self.low[:start], self.close[:start]
+            )
+
+        # Technical indicators of the appended bars
+        dst = []
+        band_change = []
+        dmi = []
+
+        for high, low, close in zip(
+            self.high[start:].tolist(),
+            self.low[start:].tolist(),
+            self.close[start:].tolist()
+        ):
+            upper_band, lower_band = self.streams['dst'].update(
+                high, low, close
+            )
+            dst.append((upper_band, lower_band))
+            band_change.append((
+                self.streams['upper_band_change'].update(upper_band),
+                self.streams['lower_band_change'].update(lower_band)
+            ))
+            dmi.append(self.streams['dmi'].update(high, low, close))
+
+        upper_band, lower_band = zip(*dst)
+        upper_band_change, lower_band_change = zip(*band_change)
+        plus, minus, adx = zip(*dmi)
+
+        self.dst = (
+            np.concatenate((self.dst[0], upper_band)),
+            np.concatenate((self.dst[1], lower_band))
+        )
+        self.upper_band_change = np.concatenate(
+            (self.upper_band_change, upper_band_change)
+        )
+        self.lower_band_change = np.concatenate(
+            (self.lower_band_change, lower_band_change)
+        )
+        self.dmi = (
+            np.concatenate((self.dmi[0], plus)),
+            np.concatenate((self.dmi[1], minus)),
+            np.concatenate((self.dmi[2], adx))
+        )
+        self.adx = self.dmi[2]
+
+        # Exit price levels of the appended bars
+        self.stop_price = np.concatenate(
+            (self.stop_price, np.full(n - start, np.nan))
+        )
+        self.take_prices = np.hstack(
+            (self.take_prices, np.full((3, n - start), np.nan))
+        )
+
+        self._run_loop(start)
+        self._set_indicators()
+
+    def _run_loop(self, start: int) -> None:
         (
             self.completed_deals_log,
             self.open_deals_log,
@@ -201,8 +300,18 @@ class ExampleV1(BaseStrategy):
             self.alert_open_long,
             self.alert_open_short,
             self.alert_long_new_stop,
-            self.alert_short_new_stop
+            self.alert_short_new_stop,
+            self.aborted,
+            self.equity,
+            self.position_type,
+            self.order_signal,
+            self.order_price,
+            self.order_date,
+            self.order_size,
+            self.liquidation_price,
+            self.stop_moved
         ) = self._calculate_loop(
+            start,
             self.params['direction'],
             self.params['initial_capital'],
             self.params['min_capital'],
@@ -228,6 +337,8 @@ class ExampleV1(BaseStrategy):
             self.low,
             self.close,
             self.equity,
+            self.min_equity,
+            self.max_drawdown,
             self.completed_deals_log,
             self.open_deals_log,
             self.position_type,
@@ -254,6 +365,7 @@ class ExampleV1(BaseStrategy):
             self.alert_short_new_stop
         )
 
+    def _set_indicators(self) -> None:
         # Visualization indicators
         self.indicators = {
             'SL': {
@@ -289,6 +401,7 @@ class ExampleV1(BaseStrategy):
     @staticmethod
     @nb.njit(cache=True, nogil=True)
     def _calculate_loop(
+        start: int,
         direction: int,
         initial_capital: float,
         min_capital: float,
@@ -314,6 +427,8 @@ class ExampleV1(BaseStrategy):
         low: np.ndarray,
         close: np.ndarray,
         equity: float,
+        min_equity: float,
+        max_drawdown: float,
         completed_deals_log: np.ndarray,
         open_deals_log: np.ndarray,
         position_type: float,
@@ -339,7 +454,17 @@ class ExampleV1(BaseStrategy):
         alert_long_new_stop: bool,
         alert_short_new_stop: bool
     ) -> tuple:
-        for i in range(1, time.shape[0]):
+        peak_equity = equity
+        aborted = False
+
+        for i in range(start, time.shape[0]):
+            # Early termination (optimization cutoff)
+            peak_equity = max(peak_equity, equity)
+
+            if cutoff.exceeded(equity, peak_equity, min_equity, max_drawdown):
+                aborted = True
+                break
+
             stop_price[i] = stop_price[i - 1]
             take_prices[:, i] = take_prices[:, i - 1]
 
@@ -352,7 +477,7 @@ class ExampleV1(BaseStrategy):
 
             # Check of liquidation
             if (position_type == 0 and low[i] <= liquidation_price):
-                completed_deals_log, pnl = log.close(
+                completed_deals_log, pnl = log.close_buffered(
                     completed_deals_log,
                     commission,
                     position_type,
@@ -382,7 +507,7 @@ class ExampleV1(BaseStrategy):
                 alert_cancel = True
 
             if (position_type == 1 and high[i] >= liquidation_price):
-                completed_deals_log, pnl = log.close(
+                completed_deals_log, pnl = log.close_buffered(
                     completed_deals_log,
                     commission,
                     position_type,
@@ -415,7 +540,7 @@ class ExampleV1(BaseStrategy):
                 # Stop loss check
                 if low[i] <= stop_price[i]:
                     # Close position and log deal
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -476,7 +601,7 @@ class ExampleV1(BaseStrategy):
                     not np.isnan(take_prices[0, i]) and
                     high[i] >= take_prices[0, i]
                 ):
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -502,7 +627,7 @@ class ExampleV1(BaseStrategy):
                     not np.isnan(take_prices[1, i]) and
                     high[i] >= take_prices[1, i]
                 ):
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -528,7 +653,7 @@ class ExampleV1(BaseStrategy):
                     not np.isnan(take_prices[2, i]) and
                     high[i] >= take_prices[2, i]
                 ):
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -619,7 +744,7 @@ class ExampleV1(BaseStrategy):
                     order_size * take_volumes[2] / 100, q_precision
                 )
 
-                open_deals_log = log.open(
+                open_deals_log = log.open_buffered(
                     open_deals_log,
                     position_type,
                     order_signal,
@@ -633,7 +758,7 @@ class ExampleV1(BaseStrategy):
             # Short position management
             if position_type == 1:
                 if high[i] >= stop_price[i]:
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -693,7 +818,7 @@ class ExampleV1(BaseStrategy):
                     not np.isnan(take_prices[0, i]) and
                     low[i] <= take_prices[0, i]
                 ):
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -719,7 +844,7 @@ class ExampleV1(BaseStrategy):
                     not np.isnan(take_prices[1, i]) and
                     low[i] <= take_prices[1, i]
                 ):
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -745,7 +870,7 @@ class ExampleV1(BaseStrategy):
                     not np.isnan(take_prices[2, i]) and
                     low[i] <= take_prices[2, i]
                 ):
-                    completed_deals_log, pnl = log.close(
+                    completed_deals_log, pnl = log.close_buffered(
                         completed_deals_log,
                         commission,
                         position_type,
@@ -834,7 +959,7 @@ class ExampleV1(BaseStrategy):
                     order_size * take_volumes[2] / 100, q_precision
                 )
                 
-                open_deals_log = log.open(
+                open_deals_log = log.open_buffered(
                     open_deals_log,
                     position_type,
                     order_signal,
@@ -854,7 +979,16 @@ class ExampleV1(BaseStrategy):
             alert_open_long,
             alert_open_short,
             alert_long_new_stop,
-            alert_short_new_stop
+            alert_short_new_stop,
+            aborted,
+            equity,
+            position_type,
+            order_signal,
+            order_price,
+            order_date,
+            order_size,
+            liquidation_price,
+            stop_moved
         )
 
     def trade(self) -> None:
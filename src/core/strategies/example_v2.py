@@ -7,7 +7,9 @@ from . import (
     adjust,
     colors,
     quanta,
-    log
+    cutoff,
+    log,
+    scratch
 )
 
 
@@ -45,6 +47,15 @@ class ExampleV2(BaseStrategy):
         'volume_ema_length': [i for i in range(5, 101)],
     }
 
+    # Indicators precomputed over parameter axes for optimization
+    indicator_tables = [
+        {
+            'indicator': 'ema',
+            'series': {'source': 'volume'},
+            'params': {'length': 'volume_ema_length'},
+        },
+    ]
+
     # --- UI/UX Configuration ---
     # Human-readable labels for frontend parameter display
     param_labels = {
@@ -115,13 +126,15 @@ class ExampleV2(BaseStrategy):
     volume_color_2 = colors.RED_500
 
     def calculate(self) -> None:
+        n = self.time.shape[0]
+
         # Entry price levels
-        self.entry_price_2 = np.full(self.time.shape[0], np.nan)
-        self.entry_price_3 = np.full(self.time.shape[0], np.nan)
-        self.entry_price_4 = np.full(self.time.shape[0], np.nan)
+        self.entry_price_2 = scratch.full(n, np.nan)
+        self.entry_price_3 = scratch.full(n, np.nan)
+        self.entry_price_4 = scratch.full(n, np.nan)
 
         # Exit price levels
-        self.take_price = np.full(self.time.shape[0], np.nan)
+        self.take_price = scratch.full(n, np.nan)
         self.liquidation_price = np.nan
 
         # Quantity management
@@ -134,13 +147,22 @@ class ExampleV2(BaseStrategy):
         self.qty_entry = np.full(4, np.nan)
 
         # Technical indicators
-        self.lowest = quanta.lowest(
-            source=np.roll(self.low, 1),
-            length=self.params['lookback']
+        # The first previous low wraps around to the last bar, so early
+        # bars change whenever a bar is appended; live updates use
+        # the default resume(), a full recalculation
+        previous_low = scratch.empty(n)
+        previous_low[:1] = self.low[-1:]
+        previous_low[1:] = self.low[:-1]
+
+        self.lowest = quanta.into.lowest(
+            source=previous_low,
+            length=self.params['lookback'],
+            out=scratch.empty(n)
         )
-        self.sma = quanta.sma(
-            source=(self.high - self.low), 
-            length=self.params['ma_length']
+        self.sma = quanta.into.sma(
+            source=np.subtract(self.high, self.low, out=scratch.empty(n)),
+            length=self.params['ma_length'],
+            out=scratch.empty(n)
         )
         self.volume_ema = quanta.ema(
             source=self.volume,
@@ -148,7 +170,7 @@ class ExampleV2(BaseStrategy):
         )
 
         # Additional market data
-        self.htf_close = np.full(self.time.shape[0], np.nan)
+        self.htf_close = scratch.full(n, np.nan)
 
         if len(self.feeds_data['klines']['HTF']['close'].shape) == 1:
             self.htf_close = self.feeds_data['klines']['HTF']['close']
@@ -166,7 +188,8 @@ class ExampleV2(BaseStrategy):
             self.entry_price_4,
             self.take_price,
             self.alert_open_long,
-            self.alert_close_long
+            self.alert_close_long,
+            self.aborted
         ) = self._calculate_loop(
             self.params['initial_capital'],
             self.params['commission'],
@@ -188,6 +211,8 @@ class ExampleV2(BaseStrategy):
             self.close,
             self.volume,
             self.equity,
+            self.min_equity,
+            self.max_drawdown,
             self.completed_deals_log,
             self.open_deals_log,
             self.order_signal,
@@ -270,6 +295,8 @@ class ExampleV2(BaseStrategy):
         close: np.ndarray,
         volume: np.ndarray,
         equity: float,
+        min_equity: float,
+        max_drawdown: float,
         completed_deals_log: np.ndarray,
         open_deals_log: np.ndarray,
         order_signal: float,
@@ -291,7 +318,17 @@ class ExampleV2(BaseStrategy):
         alert_open_long: bool,
         alert_close_long: bool
     ) -> tuple:
+        peak_equity = equity
+        aborted = False
+
         for i in range(1, time.shape[0]):
+            # Early termination (optimization cutoff)
+            peak_equity = max(peak_equity, equity)
+
+            if cutoff.exceeded(equity, peak_equity, min_equity, max_drawdown):
+                aborted = True
+                break
+
             take_price[i] = take_price[i - 1]
             entry_price_2[i] = entry_price_2[i - 1]
             entry_price_3[i] = entry_price_3[i - 1]
@@ -305,7 +342,7 @@ class ExampleV2(BaseStrategy):
             if position_type == 0 and low[i] <= liquidation_price:
                 for idx in range(open_deals_log.shape[0]):
                     if not np.isnan(open_deals_log[idx, 0]):
-                        completed_deals_log, pnl = log.close(
+                        completed_deals_log, pnl = log.close_buffered(
                             completed_deals_log,
                             commission,
                             open_deals_log[idx, 0],
@@ -342,7 +379,7 @@ class ExampleV2(BaseStrategy):
                     ):
                         for idx in range(open_deals_log.shape[0]):
                             if not np.isnan(open_deals_log[idx, 0]):
-                                completed_deals_log, pnl = log.close(
+                                completed_deals_log, pnl = log.close_buffered(
                                     completed_deals_log,
                                     commission,
                                     open_deals_log[idx, 0],
@@ -378,7 +415,7 @@ class ExampleV2(BaseStrategy):
                     order_price = entry_price_2[i]
                     order_date = time[i]
 
-                    open_deals_log = log.open(
+                    open_deals_log = log.open_buffered(
                         open_deals_log,
                         position_type,
                         order_signal,
@@ -408,7 +445,7 @@ class ExampleV2(BaseStrategy):
                     order_price = entry_price_3[i]
                     order_date = time[i]
 
-                    open_deals_log = log.open(
+                    open_deals_log = log.open_buffered(
                         open_deals_log,
                         position_type,
                         order_signal,
@@ -438,7 +475,7 @@ class ExampleV2(BaseStrategy):
                     order_price = entry_price_4[i]
                     order_date = time[i]
 
-                    open_deals_log = log.open(
+                    open_deals_log = log.open_buffered(
                         open_deals_log,
                         position_type,
                         order_signal,
@@ -467,7 +504,7 @@ class ExampleV2(BaseStrategy):
                     ):
                         for idx in range(open_deals_log.shape[0]):
                             if not np.isnan(open_deals_log[idx, 0]):
-                                completed_deals_log, pnl = log.close(
+                                completed_deals_log, pnl = log.close_buffered(
                                     completed_deals_log,
                                     commission,
                                     open_deals_log[idx, 0],
@@ -564,7 +601,7 @@ class ExampleV2(BaseStrategy):
                 if np.any(qty_entry == 0):
                     break
 
-                open_deals_log = log.open(
+                open_deals_log = log.open_buffered(
                     open_deals_log,
                     position_type,
                     order_signal,
@@ -583,7 +620,8 @@ class ExampleV2(BaseStrategy):
             entry_price_4,
             take_price,
             alert_open_long,
-            alert_close_long
+            alert_close_long,
+            aborted
         )
     
     def trade(self) -> None:
@@ -136,7 +136,9 @@ class ExecutionDaemon:
 
         strategy = context['strategy']
 
-        metrics = self._strategy_tester.test(strategy, context['market_data'])
+        metrics = self._strategy_tester.test(
+            strategy, context['market_data'], resume=True
+        )
         context['metrics'] = metrics
 
         for client in  context['clients']:
@@ -22,7 +22,8 @@ class StrategyTester:
     def test(
         self,
         strategy: BaseStrategy,
-        market_data: MarketData
+        market_data: MarketData,
+        resume: bool = False
     ) -> StrategyMetrics:
         """
         Run full strategy backtest and compute metrics.
@@ -30,6 +31,9 @@ class StrategyTester:
         Args:
             strategy: Strategy instance to evaluate
             market_data: Market data package
+            resume: Whether the strategy may continue from its last
+                    processed bar instead of recalculating all bars
+                    (see BaseStrategy.__calculate__)
 
         Returns:
             StrategyMetrics: Complete performance metrics set
@@ -38,7 +42,7 @@ class StrategyTester:
         if market_data['klines'].size == 0:
             return self._get_empty_metrics_structure()
 
-        strategy.__calculate__(market_data)
+        strategy.__calculate__(market_data, resume=resume)
 
         all_metrics = self._calculate_all_metrics(
             initial_capital=strategy.params['initial_capital'],
@@ -1,4 +1,25 @@
+from threading import Lock
+
 from .service import OptimizationService
 
 
-optimization_service = OptimizationService()
\ No newline at end of file
+_service_lock = Lock()
+
+
+def __getattr__(name: str) -> OptimizationService:
+    """
+    Create the optimization service on first access.
+
+    Remote worker processes import this package for the optimizer
+    only, they must not start a service of their own (which would
+    also resume pending contexts).
+    """
+
+    if name != 'optimization_service':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    with _service_lock:
+        if 'optimization_service' not in globals():
+            globals()['optimization_service'] = OptimizationService()
+
+    return globals()['optimization_service']
\ No newline at end of file
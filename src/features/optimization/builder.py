@@ -1,4 +1,5 @@
 from __future__ import annotations
+from json import dumps
 from logging import getLogger
 from typing import TYPE_CHECKING
 
@@ -7,15 +8,27 @@ from src.core.strategies import strategy_registry
 from src.infrastructure.exchanges import BinanceClient, BybitClient
 from src.infrastructure.exchanges.models import Exchange, Interval
 
+from .datasets import DatasetRegistry
+from .engines import engine_registry
+from .optimizer import DEFAULT_ENGINE
+
 if TYPE_CHECKING:
     from src.core.providers import MarketData
     from src.core.strategies import BaseStrategy
     from src.infrastructure.exchanges import BaseExchangeClient
-    from .models import ContextConfig, StrategyContext
+    from .models import ContextConfig, StoppingCriteria, StrategyContext
 
 
 logger = getLogger(__name__)
 
+STOPPING_CRITERIA = {
+    'stall_iterations': int,
+    'min_diversity': float,
+    'time_budget': float,
+    'evaluation_budget': int,
+}
+"""Stopping criteria a context config may override."""
+
 
 class OptimizationContextBuilder:
     """
@@ -25,12 +38,23 @@ class OptimizationContextBuilder:
       - Strategy instances
       - Market data providers
       - Exchange clients
+
+    Market data is shared between contexts through a dataset
+    registry: contexts of different strategies on the same dataset
+    hold one market data package, which is loaded once.
+    Every created context must be passed to release() when
+    it is discarded.
+
+    Multi-market contexts (config with 'symbols') hold the market
+    data of every symbol in 'markets', the first symbol's data is
+    also the context's 'market_data'.
     """
     
     def __init__(self) -> None:
         """Initialize the builder with required dependencies."""
 
         self._history_provider = HistoryProvider()
+        self._datasets = DatasetRegistry()
         self._binance_client = BinanceClient()
         self._bybit_client = BybitClient()
         
@@ -52,18 +76,71 @@ class OptimizationContextBuilder:
 
         strategy_class = self._get_strategy_class(config['strategy'])
         client = self._get_exchange_client(config['exchange'])
-        market_data = self._get_market_data(config, strategy_class, client)
 
-        if market_data['klines'].size == 0:
-            raise ValueError('No klines available for optimization')
+        folds = int(config.get('folds', 1))
+        if folds < 1:
+            raise ValueError(f'Invalid number of folds: {folds}')
+
+        engine = config.get('engine', DEFAULT_ENGINE)
+        if engine not in engine_registry:
+            raise ValueError(f'Unknown optimization engine: {engine}')
+
+        stopping = self._get_stopping_criteria(config)
+
+        # The primary symbol comes first, duplicates are dropped
+        symbols = list(dict.fromkeys(
+            [config['symbol'], *config.get('symbols', [])]
+        ))
+        markets: list[MarketData] = []
+
+        try:
+            for symbol in symbols:
+                markets.append(
+                    self._get_market_data(
+                        config, symbol, strategy_class, client
+                    )
+                )
+
+                if markets[-1]['klines'].size == 0:
+                    raise ValueError(
+                        f'No klines available for optimization '
+                        f'of {symbol}'
+                    )
+        except Exception:
+            for market_data in markets:
+                self._datasets.release(market_data)
+
+            raise
 
-        return {
+        context: StrategyContext = {
             'name': config['strategy'],
             'exchange': config['exchange'],
-            'market_data': market_data,
+            'market_data': markets[0],
             'strategy_class': strategy_class,
             'optimized_params': None,
+            'folds': folds,
+            'anchored': bool(config.get('anchored', False)),
+            'engine': engine,
         }
+
+        if len(markets) > 1:
+            context['markets'] = markets
+
+        if stopping:
+            context['stopping'] = stopping
+
+        return context
+
+    def release(self, context: StrategyContext) -> None:
+        """
+        Release the market data held by a discarded context.
+
+        Args:
+            context: Context returned by create()
+        """
+
+        for market_data in context.get('markets', [context['market_data']]):
+            self._datasets.release(market_data)
    
     def _get_strategy_class(self, strategy: str) -> type[BaseStrategy]:
         """
@@ -103,17 +180,51 @@ class OptimizationContextBuilder:
         
         return self._exchange_clients[exchange]
     
+    def _get_stopping_criteria(
+        self,
+        config: ContextConfig
+    ) -> StoppingCriteria:
+        """
+        Get the stopping criteria overridden by a context config.
+
+        Args:
+            config: Context configuration package
+
+        Returns:
+            StoppingCriteria: Overrides present in the config
+
+        Raises:
+            ValueError: If a criterion is not a non-negative number
+        """
+
+        stopping: StoppingCriteria = {}
+
+        for name, converter in STOPPING_CRITERIA.items():
+            if name not in config:
+                continue
+
+            value = converter(config[name])
+            if value < 0:
+                raise ValueError(f'Invalid {name}: {value}')
+
+            stopping[name] = value
+
+        return stopping
+
     def _get_market_data(
         self,
         config: ContextConfig,
+        symbol: str,
         strategy_class: type[BaseStrategy],
         client: BaseExchangeClient,
     ) -> MarketData:
         """
-        Get historical data market data.
-        
+        Get historical market data from the dataset registry,
+        loading it on the first request.
+
         Args:
             config: Context configuration package
+            symbol: Symbol to load (one of the context's markets)
             strategy_class: Strategy class
             client: Exchange client for data retrieval
         
@@ -121,11 +232,23 @@ class OptimizationContextBuilder:
             MarketData: Market data package
         """
 
-        return self._history_provider.get_market_data(
-            client=client,
-            symbol=config['symbol'],
-            interval=Interval(config['interval']),
-            start=config['start'],
-            end=config['end'],
-            feeds=strategy_class.feeds
+        key = (
+            config['exchange'],
+            symbol,
+            config['interval'],
+            config['start'],
+            config['end'],
+            dumps(strategy_class.feeds, sort_keys=True, default=str),
+        )
+
+        return self._datasets.acquire(
+            key,
+            lambda: self._history_provider.get_market_data(
+                client=client,
+                symbol=symbol,
+                interval=Interval(config['interval']),
+                start=config['start'],
+                end=config['end'],
+                feeds=strategy_class.feeds
+            )
         )
\ No newline at end of file
@@ -0,0 +1,163 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Hashable
+
+if TYPE_CHECKING:
+    from .models import CacheStats
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache of fitness scores for a single optimization.
+
+    Keys combine the data window (train/test) with the canonical
+    parameter tuple, so a parameter set is evaluated at most once
+    per window while it stays in the cache.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of stored scores (0 disables caching)
+        """
+
+        self._max_size = max_size
+        self._scores: OrderedDict[Hashable, float] = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, bypass: bool = False) -> float | None:
+        """
+        Look up a cached score and mark it as recently used.
+
+        Args:
+            key: Cache key built by make_key()
+            bypass: Count a miss without looking the key up,
+                    for scores the caller must recompute
+
+        Returns:
+            float | None: Cached score, or None on a miss
+        """
+
+        with self._lock:
+            score = None if bypass else self._scores.get(key)
+
+            if score is None:
+                self.misses += 1
+                return None
+
+            self._scores.move_to_end(key)
+            self.hits += 1
+            return score
+
+    def put(self, key: Hashable, score: float) -> None:
+        """
+        Store a score, evicting the least recently used entries.
+
+        Args:
+            key: Cache key built by make_key()
+            score: Fitness score to store
+        """
+
+        if self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._scores[key] = score
+            self._scores.move_to_end(key)
+
+            while len(self._scores) > self._max_size:
+                self._scores.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached scores and reset the counters."""
+
+        with self._lock:
+            self._scores.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> CacheStats:
+        """Return hit/miss counters and current cache size."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._scores),
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    def state(self) -> dict:
+        """Return a picklable snapshot of the scores and counters."""
+
+        with self._lock:
+            return {
+                'scores': list(self._scores.items()),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def restore(self, state: dict) -> None:
+        """
+        Replace the cache contents with a saved snapshot.
+
+        Scores beyond the size limit are dropped
+        (least recently used first).
+
+        Args:
+            state: Snapshot returned by state()
+        """
+
+        with self._lock:
+            self._scores.clear()
+            self.hits = state['hits']
+            self.misses = state['misses']
+
+        for key, score in state['scores']:
+            self.put(key, score)
+
+    @staticmethod
+    def merge_stats(stats: list[CacheStats]) -> CacheStats:
+        """
+        Combine counters of several caches (e.g. walk-forward folds).
+
+        Args:
+            stats: Counters returned by stats()
+
+        Returns:
+            CacheStats: Summed counters with the overall hit rate
+        """
+
+        hits = sum(item['hits'] for item in stats)
+        misses = sum(item['misses'] for item in stats)
+        lookups = hits + misses
+
+        return {
+            'hits': hits,
+            'misses': misses,
+            'size': sum(item['size'] for item in stats),
+            'hit_rate': hits / lookups if lookups else 0.0,
+        }
+
+    @staticmethod
+    def make_key(window: str, params: tuple) -> tuple:
+        """
+        Build a cache key for a parameter tuple on a data window.
+
+        Args:
+            window: Data window name ('train' or 'test')
+            params: Parameter values in canonical (opt_params) order
+
+        Returns:
+            tuple: Hashable cache key
+        """
+
+        return (window, params)
@@ -6,6 +6,17 @@ class OptimizationConfig:
     # Optimization parameters
     iterations: int = 1000
     optimization_runs: int = 3
+
+    # TPE engine parameters
+    tpe_startup: int = 20
+    tpe_iterations: int = 400
+    tpe_candidates: int = 24
+    tpe_gamma: float = 0.1
+    tpe_max_good: int = 25
+
+    # Parallel evaluation parameters (0 threads = one per CPU core)
+    batch_size: int = 16
+    threads: int = 0
     
     # Population parameters
     population_size: float = 200
@@ -15,5 +26,38 @@ class OptimizationConfig:
     train_window: float = 0.7
     test_window: float = 0.3
 
+    # Fitness cache parameters
+    cache_size: int = 20000
+
+    # Indicator memo parameters (0 MB = disabled)
+    indicator_cache_mb: int = 0
+
+    # Early abort of losing backtests (0 = disabled): runs are stopped
+    # once equity is wiped out or drawdown exceeds this multiple of
+    # the largest drawdown of a completed run
+    abort_drawdown_factor: float = 2.0
+
+    # Seconds between optimizer checkpoints (0 = disabled),
+    # checkpoints are also saved after every optimization run
+    checkpoint_interval: float = 300.0
+
+    # Seconds between progress reports of a running optimization
+    progress_interval: float = 1.0
+
+    # Stopping criteria of a run (0 = disabled): stop after
+    # stall_iterations iterations without a better training fitness
+    # or once the share of unique samples drops below min_diversity
+    stall_iterations: int = 0
+    min_diversity: float = 0.0
+
+    # Budgets of an optimization (0 = unlimited): wall-clock seconds
+    # and fitness evaluations, shared evenly by its remaining runs
+    time_budget: float = 0.0
+    evaluation_budget: int = 0
+
+    # Aggregate fitness of multi-market contexts over their markets
+    # ('mean', 'median' or 'min')
+    market_aggregation: str = 'mean'
+
 
 CONFIG = OptimizationConfig()
\ No newline at end of file
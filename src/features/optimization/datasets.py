@@ -0,0 +1,122 @@
+from __future__ import annotations
+from concurrent.futures import Future
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Hashable
+
+if TYPE_CHECKING:
+    from src.core.providers import MarketData
+
+
+class DatasetRegistry:
+    """
+    Reference-counted in-process registry of loaded market data.
+
+    Contexts requesting the same dataset (exchange, symbol, interval,
+    date range and feeds) share one market data package instead of
+    loading and converting the same klines again. A cold load is
+    performed once: concurrent requests for a dataset that is still
+    loading wait for it and receive the same package. A dataset is
+    dropped when the last context holding it releases it.
+
+    Shared packages and their arrays must be treated as immutable.
+    Sharing the same array objects also lets SharedMemoryRegistry
+    publish them to workers once for all contexts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+
+        self._datasets: dict[Hashable, MarketData] = {}
+        self._refcounts: dict[Hashable, int] = {}
+        self._keys_by_data: dict[int, Hashable] = {}
+        self._loading: dict[Hashable, tuple[Future, list[int]]] = {}
+        self._lock = Lock()
+
+    def acquire(
+        self,
+        key: Hashable,
+        loader: Callable[[], MarketData]
+    ) -> MarketData:
+        """
+        Get a dataset, loading it if no context holds it yet.
+
+        Every successful call must be paired with release().
+
+        Args:
+            key: Dataset identity
+            loader: Function loading the dataset on a cold request
+
+        Returns:
+            MarketData: Shared market data package
+
+        Raises:
+            Exception: Any exception raised by the loader
+                       (also re-raised in waiting callers)
+        """
+
+        with self._lock:
+            market_data = self._datasets.get(key)
+
+            if market_data is not None:
+                self._refcounts[key] += 1
+                return market_data
+
+            loading = self._loading.get(key)
+
+            if loading is not None:
+                # Waiters are counted by the loader once it finishes
+                loading[1][0] += 1
+                future = loading[0]
+            else:
+                future = Future()
+                self._loading[key] = (future, [0])
+
+        if loading is not None:
+            return future.result()
+
+        try:
+            market_data = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            _, waiters = self._loading.pop(key)
+            self._datasets[key] = market_data
+            self._refcounts[key] = 1 + waiters[0]
+            self._keys_by_data[id(market_data)] = key
+
+        future.set_result(market_data)
+        return market_data
+
+    def release(self, market_data: MarketData) -> None:
+        """
+        Drop one reference to a dataset and forget it when unused.
+
+        Args:
+            market_data: Package returned by acquire()
+        """
+
+        with self._lock:
+            key = self._keys_by_data.get(id(market_data))
+
+            if key is None:
+                return
+
+            self._refcounts[key] -= 1
+
+            if self._refcounts[key] > 0:
+                return
+
+            del self._refcounts[key]
+            del self._datasets[key]
+            del self._keys_by_data[id(market_data)]
+
+    def __len__(self) -> int:
+        """Return the number of loaded datasets."""
+
+        with self._lock:
+            return len(self._datasets)
@@ -0,0 +1,3 @@
+from .coordinator import Coordinator
+from .protocol import parse_address
+from .worker import RemoteWorker, run_worker
\ No newline at end of file
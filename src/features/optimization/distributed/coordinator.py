@@ -0,0 +1,499 @@
+from __future__ import annotations
+from collections import deque
+from itertools import count
+from logging import getLogger
+from queue import Queue
+from socket import create_server
+from threading import RLock, Thread
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..shared_memory import attach_market_data, detach_segments
+from .protocol import HEARTBEAT_TIMEOUT, Channel, market_data_key
+
+if TYPE_CHECKING:
+    from mmap import mmap
+    from socket import socket
+    from src.core.providers import MarketData
+    from ..models import OptimizationTask
+
+
+logger = getLogger(__name__)
+
+
+class Coordinator:
+    """
+    TCP coordinator distributing optimization tasks to remote workers.
+
+    A drop-in replacement for WorkerPool: tasks are submitted and
+    cancelled by id, results and progress are reported through
+    the same callbacks. Remote workers (see RemoteWorker) connect to
+    the coordinator, announce their number of slots and receive up to
+    slots + prefetch tasks at a time.
+
+    - Market data of a task is shipped to a worker once and cached
+      there until no unfinished task references it.
+    - Workers send heartbeats; a worker that falls silent for
+      heartbeat_timeout seconds or disconnects is dropped and
+      its unfinished tasks are re-queued at the front.
+    - Workers with free slots steal prefetched tasks that other
+      workers haven't started yet when the queue runs dry.
+
+    Tasks must carry market data published to shared memory in this
+    process (SharedMarketData), the coordinator reads the arrays from
+    there when shipping them. Every market of a multi-market task
+    is shipped and cached as a separate dataset.
+
+    Workers must pass the token handshake (Channel.authenticate())
+    before any of their messages is unpickled.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        on_result: Callable[[str, Any, str | None], None],
+        on_progress: Callable[[str, Any], None] | None = None,
+        token: str = '',
+        prefetch: int = 1,
+        heartbeat_timeout: float = HEARTBEAT_TIMEOUT
+    ) -> None:
+        """
+        Start listening for remote workers.
+
+        Args:
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            on_result: Callback invoked as on_result(task_id, result,
+                       error) when a task finishes or fails
+            on_progress: Optional callback invoked as
+                         on_progress(task_id, progress)
+            token: Shared secret that workers must present
+            prefetch: Tasks sent to a worker beyond its free slots
+            heartbeat_timeout: Seconds of silence before a worker
+                               is considered lost
+
+        Raises:
+            ValueError: If the token is empty
+        """
+
+        if not token:
+            raise ValueError('Coordinator token must not be empty')
+
+        self._on_result = on_result
+        self._on_progress = on_progress
+        self._token = token
+        self._prefetch = max(prefetch, 0)
+        self._heartbeat_timeout = heartbeat_timeout
+
+        self._tasks: dict[str, tuple[dict, list[tuple[str, ...]]]] = {}
+        self._pending: deque[str] = deque()
+        self._owners: dict[str, _WorkerHandle] = {}
+        self._stealing: set[str] = set()
+        self._workers: dict[int, _WorkerHandle] = {}
+        self._datasets: dict[
+            tuple[str, ...], tuple[MarketData, list[mmap]]
+        ] = {}
+        self._dataset_refs: dict[tuple[str, ...], int] = {}
+        self._worker_ids = count()
+        self._lock = RLock()
+
+        self._server = create_server((host, port))
+        self.address: tuple[str, int] = self._server.getsockname()[:2]
+
+        Thread(target=self._accept, daemon=True).start()
+        Thread(target=self._monitor, daemon=True).start()
+
+    @property
+    def size(self) -> int:
+        """Return the total number of slots of connected workers."""
+
+        with self._lock:
+            return sum(worker.slots for worker in self._workers.values())
+
+    def submit(self, task_id: str, task: OptimizationTask) -> None:
+        """
+        Queue a task for the next worker with a free slot.
+
+        Unlike WorkerPool.submit(), this never blocks.
+
+        Args:
+            task_id: Unique task identifier
+            task: Task with market data published to shared memory
+        """
+
+        markets = task.get('markets', [task['market_data']])
+        keys = [market_data_key(shared_data) for shared_data in markets]
+
+        # Workers resolve the keys to their local copies
+        message = {**task, 'market_data': keys[0]}
+        if 'markets' in task:
+            message['markets'] = keys
+
+        with self._lock:
+            for key, shared_data in zip(keys, markets):
+                if key not in self._datasets:
+                    self._datasets[key] = attach_market_data(shared_data)
+                    self._dataset_refs[key] = 0
+
+                self._dataset_refs[key] += 1
+
+            self._tasks[task_id] = (message, keys)
+            self._pending.append(task_id)
+            self._dispatch()
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a queued or running task.
+
+        The result of a cancelled task is never reported.
+
+        Args:
+            task_id: Task identifier passed to submit()
+
+        Returns:
+            bool: True if the task was known, False otherwise
+        """
+
+        with self._lock:
+            if task_id not in self._tasks:
+                return False
+
+            owner = self._owners.get(task_id)
+
+            if owner is None:
+                self._pending.remove(task_id)
+            else:
+                owner.outbox.put(('cancel', task_id))
+
+            self._forget(task_id)
+            self._dispatch()
+
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue length and per-worker load."""
+
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'workers': {
+                    worker.name: {
+                        'slots': worker.slots,
+                        'tasks': len(worker.tasks),
+                        'started': sum(worker.tasks.values()),
+                        'datasets': len(worker.datasets),
+                    }
+                    for worker in self._workers.values()
+                },
+            }
+
+    def close(self) -> None:
+        """Stop accepting workers and disconnect the connected ones."""
+
+        self._server.close()
+
+        with self._lock:
+            workers = list(self._workers.values())
+
+        for worker in workers:
+            worker.channel.close()
+
+    def _accept(self) -> None:
+        """Accept worker connections and start serving them."""
+
+        while True:
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return
+
+            Thread(
+                target=self._serve, args=(sock,), daemon=True
+            ).start()
+
+    def _serve(self, sock: socket) -> None:
+        """Authenticate a worker and process its messages."""
+
+        channel = Channel(sock)
+
+        try:
+            sock.settimeout(self._heartbeat_timeout)
+            channel.authenticate(self._token, server=True)
+            kind, info = channel.recv()
+            sock.settimeout(None)
+
+            if kind != 'hello':
+                raise ValueError(f'Unexpected message: {kind}')
+        except Exception as e:
+            logger.warning(
+                f'Rejected remote worker: invalid handshake '
+                f'({type(e).__name__} - {e})'
+            )
+            channel.close()
+            return
+
+        worker = _WorkerHandle(
+            worker_id=next(self._worker_ids),
+            name=str(info.get('name', 'worker')),
+            slots=max(int(info.get('slots', 1)), 1),
+            channel=channel
+        )
+        Thread(target=self._write, args=(worker,), daemon=True).start()
+
+        with self._lock:
+            self._workers[worker.worker_id] = worker
+            self._dispatch()
+
+        logger.info(
+            f'Remote worker {worker.name} connected '
+            f'with {worker.slots} slots'
+        )
+
+        try:
+            while True:
+                message = channel.recv()
+                worker.last_seen = monotonic()
+                self._handle(worker, message)
+        except Exception as e:
+            logger.warning(
+                f'Remote worker {worker.name} disconnected: '
+                f'{type(e).__name__} - {e}'
+            )
+        finally:
+            self._drop(worker)
+
+    def _handle(self, worker: _WorkerHandle, message: tuple) -> None:
+        """Process a message received from a worker."""
+
+        kind = message[0]
+
+        if kind == 'heartbeat':
+            return
+
+        if kind == 'progress':
+            _, task_id, progress = message
+
+            with self._lock:
+                running = self._owners.get(task_id) is worker
+
+            if running and self._on_progress is not None:
+                try:
+                    self._on_progress(task_id, progress)
+                except Exception:
+                    logger.exception(
+                        f'Failed to handle progress for {task_id}'
+                    )
+            return
+
+        if kind == 'result':
+            _, task_id, result, error = message
+
+            with self._lock:
+                if self._owners.get(task_id) is not worker:
+                    return
+
+                self._forget(task_id)
+                self._dispatch()
+
+            try:
+                self._on_result(task_id, result, error)
+            except Exception:
+                logger.exception(f'Failed to handle result for {task_id}')
+            return
+
+        with self._lock:
+            task_id = message[1]
+
+            if kind == 'started':
+                if task_id in worker.tasks:
+                    worker.tasks[task_id] = True
+            elif kind == 'stolen':
+                self._stealing.discard(task_id)
+
+                if self._owners.get(task_id) is worker:
+                    del worker.tasks[task_id]
+                    del self._owners[task_id]
+                    self._pending.appendleft(task_id)
+            elif kind == 'steal_failed':
+                self._stealing.discard(task_id)
+
+                if task_id in worker.tasks:
+                    worker.tasks[task_id] = True
+
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """
+        Assign queued tasks to the least loaded workers with free
+        capacity, then let workers with free slots steal prefetched
+        tasks that haven't started yet. Must be called with the lock.
+        """
+
+        while self._pending:
+            candidates = [
+                worker for worker in self._workers.values()
+                if len(worker.tasks) < worker.slots + self._prefetch
+            ]
+
+            if not candidates:
+                break
+
+            worker = min(
+                candidates, key=lambda item: len(item.tasks) / item.slots
+            )
+            task_id = self._pending.popleft()
+            message, keys = self._tasks[task_id]
+
+            for key in keys:
+                if key not in worker.datasets:
+                    market_data = self._datasets[key][0]
+                    worker.outbox.put(('data', key, market_data))
+                    worker.datasets.add(key)
+
+            worker.outbox.put(('task', task_id, message))
+            worker.tasks[task_id] = False
+            self._owners[task_id] = worker
+
+        if self._pending:
+            return
+
+        free_slots = sum(
+            max(worker.slots - len(worker.tasks), 0)
+            for worker in self._workers.values()
+        )
+
+        for victim in sorted(
+            self._workers.values(),
+            key=lambda item: len(item.tasks) - item.slots,
+            reverse=True
+        ):
+            for task_id in reversed(list(victim.tasks)):
+                if len(self._stealing) >= free_slots:
+                    return
+
+                if victim.tasks[task_id] or task_id in self._stealing:
+                    continue
+
+                # Only steal for other workers
+                if not any(
+                    len(worker.tasks) < worker.slots
+                    for worker in self._workers.values()
+                    if worker is not victim
+                ):
+                    break
+
+                self._stealing.add(task_id)
+                victim.outbox.put(('steal', task_id))
+
+    def _forget(self, task_id: str) -> None:
+        """
+        Remove a task and release its datasets, telling workers
+        to drop datasets no longer used. Must be called with the lock.
+        """
+
+        _, keys = self._tasks.pop(task_id)
+        owner = self._owners.pop(task_id, None)
+        self._stealing.discard(task_id)
+
+        if owner is not None:
+            owner.tasks.pop(task_id, None)
+
+        for key in keys:
+            self._dataset_refs[key] -= 1
+
+            if self._dataset_refs[key] > 0:
+                continue
+
+            del self._dataset_refs[key]
+            market_data, segments = self._datasets.pop(key)
+
+            for worker in self._workers.values():
+                if key in worker.datasets:
+                    worker.datasets.discard(key)
+                    worker.outbox.put(('drop', key))
+
+            # Drop array views before closing the attached segments
+            market_data = None
+            detach_segments(segments)
+
+    def _drop(self, worker: _WorkerHandle) -> None:
+        """Disconnect a worker and re-queue its unfinished tasks."""
+
+        with self._lock:
+            if self._workers.pop(worker.worker_id, None) is None:
+                return
+
+            for task_id in reversed(list(worker.tasks)):
+                self._owners.pop(task_id, None)
+                self._stealing.discard(task_id)
+                self._pending.appendleft(task_id)
+
+            if worker.tasks:
+                logger.warning(
+                    f'Re-queued {len(worker.tasks)} tasks '
+                    f'of remote worker {worker.name}'
+                )
+
+            worker.tasks.clear()
+            self._dispatch()
+
+        worker.outbox.put(None)
+        worker.channel.close()
+
+    def _write(self, worker: _WorkerHandle) -> None:
+        """Send queued messages to a worker in order."""
+
+        while True:
+            message = worker.outbox.get()
+
+            if message is None:
+                return
+
+            try:
+                worker.channel.send(message)
+            except Exception:
+                # The reader notices the broken connection and drops it
+                worker.channel.close()
+                return
+
+    def _monitor(self) -> None:
+        """Disconnect workers whose heartbeats have stopped."""
+
+        while True:
+            sleep(min(self._heartbeat_timeout / 4, 1.0))
+            deadline = monotonic() - self._heartbeat_timeout
+
+            with self._lock:
+                silent = [
+                    worker for worker in self._workers.values()
+                    if worker.last_seen < deadline
+                ]
+
+            for worker in silent:
+                logger.warning(
+                    f'Remote worker {worker.name} missed heartbeats'
+                )
+                self._drop(worker)
+
+
+class _WorkerHandle:
+    """Coordinator-side state of a connected remote worker."""
+
+    def __init__(
+        self,
+        worker_id: int,
+        name: str,
+        slots: int,
+        channel: Channel
+    ) -> None:
+        self.worker_id = worker_id
+        self.name = name
+        self.slots = slots
+        self.channel = channel
+
+        # Assigned task ids in assignment order -> started flag
+        self.tasks: dict[str, bool] = {}
+        self.datasets: set[tuple[str, ...]] = set()
+        self.outbox: Queue[tuple | None] = Queue()
+        self.last_seen = monotonic()
@@ -0,0 +1,236 @@
+from __future__ import annotations
+from hashlib import sha256
+from hmac import compare_digest, new as hmac_new
+from os import urandom
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from socket import SHUT_RDWR, socket
+from struct import Struct
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..models import SharedMarketData
+
+
+HEADER = Struct('!Q')
+"""Frame header: payload length as an unsigned 64-bit integer."""
+
+HEARTBEAT_INTERVAL = 2.0
+"""Seconds between heartbeats sent by remote workers."""
+
+HEARTBEAT_TIMEOUT = 10.0
+"""Seconds of silence after which a remote worker is considered lost."""
+
+NONCE_SIZE = 32
+"""Size of authentication challenges in bytes."""
+
+WELCOME = b'#WELCOME#'
+FAILURE = b'#FAILURE#'
+
+
+class AuthenticationError(ConnectionError):
+    """Raised when a peer fails the shared token handshake."""
+
+
+class Channel:
+    """
+    Message channel over a connected TCP socket.
+
+    Messages are tuples (kind, *payload) pickled into length-prefixed
+    frames. Sends are serialized, so several threads may send through
+    one channel; a single thread is expected to receive.
+
+    Unpickling a frame can run arbitrary code, so both peers must
+    prove knowledge of the shared token with an HMAC challenge
+    over raw frames (authenticate()) before any message is received.
+    """
+
+    def __init__(self, sock: socket) -> None:
+        """
+        Wrap a connected socket.
+
+        Args:
+            sock: Connected TCP socket
+        """
+
+        self._sock = sock
+        self._send_lock = Lock()
+        self._authenticated = False
+
+    def authenticate(self, token: str, server: bool) -> None:
+        """
+        Run a mutual challenge/response handshake with the peer.
+
+        Each side sends a random nonce and expects its HMAC-SHA256
+        keyed with the token back. The server challenges first.
+        Handshake frames are raw bytes of bounded size, nothing
+        the peer sends is unpickled before both sides succeeded.
+
+        Args:
+            token: Shared secret (must not be empty)
+            server: True on the accepting side
+
+        Raises:
+            AuthenticationError: If the peer doesn't know the token
+            OSError: If the connection is broken
+        """
+
+        if not token:
+            raise AuthenticationError('Empty token')
+
+        key = token.encode()
+
+        if server:
+            self._deliver_challenge(key)
+            self._answer_challenge(key)
+        else:
+            self._answer_challenge(key)
+            self._deliver_challenge(key)
+
+        self._authenticated = True
+
+    def send(self, message: tuple) -> None:
+        """
+        Send a message.
+
+        Args:
+            message: Picklable tuple (kind, *payload)
+
+        Raises:
+            OSError: If the connection is broken
+        """
+
+        self._send_bytes(dumps(message, protocol=HIGHEST_PROTOCOL))
+
+    def recv(self) -> tuple:
+        """
+        Receive the next message, blocking until it arrives.
+
+        Returns:
+            tuple: Message (kind, *payload)
+
+        Raises:
+            AuthenticationError: If the channel isn't authenticated
+            ConnectionError: If the peer closed the connection
+            OSError: If the connection is broken
+        """
+
+        if not self._authenticated:
+            raise AuthenticationError('Channel is not authenticated')
+
+        (size,) = HEADER.unpack(self._recv_exactly(HEADER.size))
+        return loads(self._recv_exactly(size))
+
+    def close(self) -> None:
+        """Shut the connection down, unblocking a pending recv()."""
+
+        try:
+            self._sock.shutdown(SHUT_RDWR)
+        except OSError:
+            pass
+
+        self._sock.close()
+
+    def _deliver_challenge(self, key: bytes) -> None:
+        """Challenge the peer and verify its response."""
+
+        nonce = urandom(NONCE_SIZE)
+        self._send_bytes(nonce)
+        response = self._recv_bytes(sha256().digest_size)
+        expected = hmac_new(key, nonce, sha256).digest()
+
+        if not compare_digest(response, expected):
+            self._send_bytes(FAILURE)
+            raise AuthenticationError('Invalid challenge response')
+
+        self._send_bytes(WELCOME)
+
+    def _answer_challenge(self, key: bytes) -> None:
+        """Answer the peer's challenge and check that it was accepted."""
+
+        nonce = self._recv_bytes(NONCE_SIZE)
+        self._send_bytes(hmac_new(key, nonce, sha256).digest())
+
+        if self._recv_bytes(len(WELCOME)) != WELCOME:
+            raise AuthenticationError('Challenge response rejected')
+
+    def _send_bytes(self, payload: bytes) -> None:
+        """Send a raw length-prefixed frame."""
+
+        with self._send_lock:
+            self._sock.sendall(HEADER.pack(len(payload)))
+            self._sock.sendall(payload)
+
+    def _recv_bytes(self, limit: int) -> bytes:
+        """Receive a raw frame of at most limit bytes."""
+
+        (size,) = HEADER.unpack(self._recv_exactly(HEADER.size))
+
+        if size > limit:
+            raise AuthenticationError('Unexpected handshake frame')
+
+        return bytes(self._recv_exactly(size))
+
+    def _recv_exactly(self, size: int) -> bytearray:
+        """Read exactly size bytes from the socket."""
+
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+
+        while received < size:
+            count = self._sock.recv_into(view[received:])
+
+            if count == 0:
+                raise ConnectionError('Connection closed by peer')
+
+            received += count
+
+        return buffer
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """
+    Split a 'host:port' address.
+
+    Args:
+        address: Address string (e.g. '127.0.0.1:9100')
+
+    Returns:
+        tuple: (host, port)
+
+    Raises:
+        ValueError: If the address has no valid port
+    """
+
+    host, _, port = address.strip().rpartition(':')
+
+    if not port.isdigit():
+        raise ValueError(f'Invalid address: {address}')
+
+    return host or '127.0.0.1', int(port)
+
+
+def market_data_key(shared_data: SharedMarketData) -> tuple[str, ...]:
+    """
+    Build the dataset key of a shared market data package.
+
+    Segment names are unique while the package is published,
+    so tasks sharing the same package share the same key.
+
+    Args:
+        shared_data: Package produced by SharedMemoryRegistry
+
+    Returns:
+        tuple[str, ...]: Names of all segments of the package
+    """
+
+    names = [shared_data['klines']['name']]
+
+    if shared_data['feeds']:
+        names.extend(
+            handle['name']
+            for _, handle in sorted(shared_data['feeds']['klines'].items())
+        )
+
+    return tuple(names)
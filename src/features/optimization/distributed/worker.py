@@ -0,0 +1,342 @@
+from __future__ import annotations
+from collections import deque
+from logging import getLogger
+from os import cpu_count, getpid
+from socket import create_connection, gethostname
+from threading import Condition, Event, Thread
+from time import sleep
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..optimizer import optimize_worker, warm_up_worker
+from ..pool import WorkerPool
+from ..shared_memory import SharedMemoryRegistry
+from .protocol import HEARTBEAT_INTERVAL, Channel
+
+if TYPE_CHECKING:
+    from src.core.providers import MarketData
+    from ..models import SharedMarketData
+
+
+logger = getLogger(__name__)
+
+
+class RemoteWorker:
+    """
+    Remote worker node executing tasks of a Coordinator.
+
+    Tasks run in a local pool of warm worker processes, one task per
+    slot. Market data shipped by the coordinator is published to local
+    shared memory once and reused by all tasks on the same dataset
+    until the coordinator drops it. Tasks received beyond the free
+    slots wait in a local backlog, from which the coordinator may
+    steal them for idle workers.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        slots: int | None = None,
+        token: str = '',
+        handler: Callable[[str, Any], Any] = optimize_worker,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL
+    ) -> None:
+        """
+        Initialize the worker without connecting.
+
+        Args:
+            host: Coordinator host
+            port: Coordinator port
+            slots: Number of concurrent tasks (one per CPU core
+                   by default)
+            token: Shared secret expected by the coordinator
+            handler: Picklable task function executed in pool
+                     processes as handler(task_id, task)
+            heartbeat_interval: Seconds between heartbeats
+
+        Raises:
+            ValueError: If the token is empty
+        """
+
+        if not token:
+            raise ValueError('Coordinator token must not be empty')
+
+        self._host = host
+        self._port = port
+        self._slots = max(slots or cpu_count() or 1, 1)
+        self._token = token
+        self._heartbeat_interval = heartbeat_interval
+
+        self._pool = WorkerPool(
+            size=self._slots,
+            handler=handler,
+            on_result=self._handle_result,
+            initializer=warm_up_worker,
+            on_progress=self._handle_progress
+        )
+        self._shared_memory = SharedMemoryRegistry()
+        self._datasets: dict[tuple[str, ...], SharedMarketData] = {}
+
+        self._backlog: deque[tuple[str, dict]] = deque()
+        self._running: set[str] = set()
+        self._condition = Condition()
+        self._channel: Channel | None = None
+        self._stopped = Event()
+
+    def run(self) -> None:
+        """
+        Connect to the coordinator and execute tasks until
+        the connection is closed or stop() is called.
+
+        Raises:
+            OSError: If the coordinator is unreachable
+                     or rejects the token
+        """
+
+        self._stopped.clear()
+        channel = Channel(create_connection((self._host, self._port)))
+
+        try:
+            channel.authenticate(self._token, server=False)
+        except OSError:
+            channel.close()
+            raise
+
+        channel.send(('hello', {
+            'slots': self._slots,
+            'name': f'{gethostname()}:{getpid()}',
+        }))
+        self._channel = channel
+
+        Thread(target=self._heartbeat, args=(channel,), daemon=True).start()
+        Thread(target=self._dispatch, args=(channel,), daemon=True).start()
+
+        try:
+            while True:
+                self._handle(channel.recv())
+        except Exception as e:
+            if not self._stopped.is_set():
+                logger.warning(
+                    f'Disconnected from coordinator: '
+                    f'{type(e).__name__} - {e}'
+                )
+        finally:
+            self._stopped.set()
+            self._reset()
+            channel.close()
+
+    def stop(self) -> None:
+        """Disconnect from the coordinator and cancel all tasks."""
+
+        self._stopped.set()
+
+        with self._condition:
+            self._condition.notify_all()
+
+        if self._channel is not None:
+            self._channel.close()
+
+    def close(self) -> None:
+        """Stop the worker and its pool processes for good."""
+
+        self.stop()
+        self._pool.close()
+
+    def _handle(self, message: tuple) -> None:
+        """Process a message received from the coordinator."""
+
+        kind = message[0]
+
+        if kind == 'data':
+            _, key, market_data = message
+            self._publish(key, market_data)
+        elif kind == 'drop':
+            shared_data = self._datasets.pop(message[1], None)
+
+            if shared_data is not None:
+                self._shared_memory.release_market_data(shared_data)
+        elif kind == 'task':
+            _, task_id, task = message
+
+            with self._condition:
+                self._backlog.append((task_id, task))
+                self._condition.notify_all()
+        elif kind == 'cancel':
+            task_id = message[1]
+
+            with self._condition:
+                queued = self._remove_queued(task_id)
+                running = task_id in self._running
+                self._running.discard(task_id)
+                self._condition.notify_all()
+
+            if not queued and running:
+                self._pool.cancel(task_id)
+        elif kind == 'steal':
+            task_id = message[1]
+
+            with self._condition:
+                stolen = self._remove_queued(task_id)
+
+            self._send(('stolen' if stolen else 'steal_failed', task_id))
+
+    def _publish(
+        self,
+        key: tuple[str, ...],
+        market_data: MarketData
+    ) -> None:
+        """Publish shipped market data to local shared memory."""
+
+        previous = self._datasets.pop(key, None)
+
+        if previous is not None:
+            self._shared_memory.release_market_data(previous)
+
+        self._datasets[key] = self._shared_memory.publish_market_data(
+            market_data
+        )
+
+    def _dispatch(self, channel: Channel) -> None:
+        """Submit backlog tasks to the process pool as slots free up."""
+
+        while True:
+            with self._condition:
+                while not self._stopped.is_set() and (
+                    not self._backlog or len(self._running) >= self._slots
+                ):
+                    self._condition.wait()
+
+                if self._stopped.is_set():
+                    return
+
+                task_id, task = self._backlog.popleft()
+                self._running.add(task_id)
+
+            try:
+                channel.send(('started', task_id))
+                task = {
+                    **task,
+                    'market_data': self._datasets[task['market_data']],
+                }
+
+                if 'markets' in task:
+                    task['markets'] = [
+                        self._datasets[key] for key in task['markets']
+                    ]
+
+                self._pool.submit(task_id, task)
+            except KeyError:
+                self._handle_result(
+                    task_id, None, 'Market data was not shipped'
+                )
+            except (OSError, RuntimeError):
+                # Disconnected or closed worker
+                return
+
+    def _handle_result(
+        self,
+        task_id: str,
+        result: Any,
+        error: str | None
+    ) -> None:
+        """Report a finished task and free its slot."""
+
+        with self._condition:
+            if task_id not in self._running:
+                return
+
+            self._running.discard(task_id)
+            self._condition.notify_all()
+
+        self._send(('result', task_id, result, error))
+
+    def _handle_progress(self, task_id: str, progress: Any) -> None:
+        """Forward progress of a running task."""
+
+        self._send(('progress', task_id, progress))
+
+    def _heartbeat(self, channel: Channel) -> None:
+        """Send heartbeats until the worker stops."""
+
+        while not self._stopped.wait(self._heartbeat_interval):
+            try:
+                channel.send(('heartbeat',))
+            except OSError:
+                return
+
+    def _send(self, message: tuple) -> None:
+        """Send a message, ignoring a broken connection."""
+
+        channel = self._channel
+
+        if channel is None:
+            return
+
+        try:
+            channel.send(message)
+        except OSError:
+            pass
+
+    def _remove_queued(self, task_id: str) -> bool:
+        """Remove a task from the backlog. Must hold the condition."""
+
+        for item in self._backlog:
+            if item[0] == task_id:
+                self._backlog.remove(item)
+                return True
+
+        return False
+
+    def _reset(self) -> None:
+        """Cancel all tasks and release datasets after a disconnect."""
+
+        with self._condition:
+            running = list(self._running)
+            self._running.clear()
+            self._backlog.clear()
+            self._condition.notify_all()
+
+        for task_id in running:
+            self._pool.cancel(task_id)
+
+        for shared_data in self._datasets.values():
+            self._shared_memory.release_market_data(shared_data)
+
+        self._datasets.clear()
+        self._channel = None
+
+
+def run_worker(
+    host: str,
+    port: int,
+    slots: int | None = None,
+    token: str = '',
+    reconnect_delay: float = 5.0
+) -> None:
+    """
+    Run a remote worker forever, reconnecting after connection loss.
+
+    Args:
+        host: Coordinator host
+        port: Coordinator port
+        slots: Number of concurrent tasks (one per CPU core
+               by default)
+        token: Shared secret expected by the coordinator
+        reconnect_delay: Seconds to wait before reconnecting
+    """
+
+    worker = RemoteWorker(host, port, slots=slots, token=token)
+
+    try:
+        while True:
+            try:
+                worker.run()
+            except OSError as e:
+                logger.warning(
+                    f'Failed to connect to coordinator {host}:{port}: '
+                    f'{type(e).__name__} - {e}'
+                )
+
+            sleep(reconnect_delay)
+    finally:
+        worker.close()
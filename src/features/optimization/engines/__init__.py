@@ -0,0 +1,9 @@
+from .base import OptimizationEngine
+from .genetic import GeneticEngine
+from .tpe import TPEEngine
+
+
+engine_registry: dict[str, type[OptimizationEngine]] = {
+    'genetic': GeneticEngine,
+    'tpe': TPEEngine,
+}
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..optimizer import StrategyOptimizer
+
+
+class OptimizationEngine(ABC):
+    """
+    Abstract base class for parameter search engines.
+
+    An engine explores the discrete opt_params grid of a strategy
+    for a single optimization run. The optimizer owns everything
+    around the search: data windows, parameter encoding, cached and
+    concurrent evaluation, early abort and the final selection
+    of the best sample from the population.
+
+    Individuals are parameter value indices (np.ndarray of int64),
+    see StrategyOptimizer.encode() and decode().
+    """
+
+    def __init__(self, optimizer: StrategyOptimizer) -> None:
+        """
+        Initialize the engine for an initialized optimizer.
+
+        Args:
+            optimizer: Optimizer with data windows and encoding tables
+        """
+
+        self.optimizer = optimizer
+        self.config = optimizer.config
+        self.population = optimizer.population
+
+        self.param_keys = optimizer.param_keys
+        self.param_values = optimizer.param_values
+        self.value_indices = optimizer.value_indices
+
+    @property
+    @abstractmethod
+    def iterations(self) -> int:
+        """Return the number of evaluations of a run after seeding."""
+
+    @abstractmethod
+    def run(self, state: dict | None = None) -> None:
+        """
+        Search the parameter space for one optimization run.
+
+        The engine must start with optimizer.seed_population() and
+        leave the candidates for final selection in the population.
+
+        After every evaluation batch the engine passes its progress
+        ({'remaining': evaluations left}) to optimizer.end_batch()
+        and ends the run if it returns True. A run resumed from
+        a checkpoint receives that progress back as state, with
+        the population and random generators already restored,
+        and continues without seeding.
+
+        Args:
+            state: Progress of an interrupted run, or None
+        """
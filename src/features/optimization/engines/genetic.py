@@ -0,0 +1,287 @@
+from __future__ import annotations
+from random import choice, randint, sample
+
+import numpy as np
+
+from .base import OptimizationEngine
+from ..utils import latin_hypercube_sampling
+
+
+class GeneticEngine(OptimizationEngine):
+    """
+    Genetic algorithm search engine.
+
+    Implements a genetic algorithm with selection, recombination, mutation,
+    and population management to find optimal parameter sets for strategies.
+    """
+
+    @property
+    def iterations(self) -> int:
+        """Return the number of offspring bred in a run."""
+
+        return self.config.iterations
+
+    def run(self, state: dict | None = None) -> None:
+        """
+        Run the genetic algorithm cycle: population creation, selection,
+        recombination, mutation and population management.
+
+        Each step breeds a batch of offspring from the current population
+        and evaluates it concurrently in the optimizer's thread pool
+        (strategy kernels release the GIL). The total number of offspring
+        equals the configured iteration count regardless of the batch size,
+        unless the optimizer's stopping criteria end the run earlier.
+
+        Args:
+            state: Progress of an interrupted run, or None
+        """
+
+        if state is None:
+            self._create_population()
+            remaining = self.iterations
+        else:
+            remaining = state['remaining']
+
+        max_batch_size = max(self.config.batch_size, 1)
+
+        while remaining > 0:
+            batch_size = min(max_batch_size, remaining)
+            remaining -= batch_size
+
+            self.diversity_ratio = self.population.diversity()
+            self.offspring: list[np.ndarray] = []
+
+            for _ in range(batch_size):
+                self._select()
+                self._recombine()
+                self._mutate()
+                self.offspring.append(self.child)
+
+            self._expand()
+            self._kill()
+
+            if self.optimizer.end_batch({'remaining': remaining}):
+                break
+
+    def _create_population(self) -> None:
+        """
+        Create initial population of candidate parameter sets
+        using multiple sampling methods.
+
+        Uses a diversified approach:
+        - Latin Hypercube Sampling (50%): Space-filling statistical sampling
+        - Random sampling (30%): Random selection from parameter ranges
+        - Extreme values (20%): Boundary parameter values
+
+        The initial population is always backtested in full,
+        it sets the drawdown baseline for early abort.
+        """
+
+        individuals: list[np.ndarray] = []
+        opt_params = self.optimizer.strategy_class.opt_params
+
+        # Latin Hypercube Sampling (50%)
+        lhs_count = int(self.config.population_size * 0.5)
+        for individual in latin_hypercube_sampling(opt_params, lhs_count):
+            individuals.append(self.optimizer.encode(individual))
+
+        # Random sampling (30%)
+        random_count = int(self.config.population_size * 0.3)
+        for _ in range(random_count):
+            individuals.append(np.array(
+                [randint(0, len(values) - 1) for values in self.param_values],
+                dtype=np.int64
+            ))
+
+        # Extreme values (20%)
+        extreme_count = int(self.config.population_size * 0.2)
+        for _ in range(extreme_count):
+            individuals.append(np.array(
+                [choice([0, len(values) - 1]) for values in self.param_values],
+                dtype=np.int64
+            ))
+
+        # Evaluate and add to population
+        self.optimizer.seed_population(individuals)
+
+    def _select(self) -> None:
+        """
+        Select two parent samples using adaptive tournament selection.
+
+        Implements efficient tournament selection with adaptive pressure:
+        - Tournament size adapts to population diversity
+        - Elite bias decreases over iterations to maintain exploration
+        """
+        
+        # Adaptive tournament size (2-4 based on diversity)
+        if self.diversity_ratio > 0.7:
+            tournament_size = 2
+        elif self.diversity_ratio > 0.4:
+            tournament_size = 3
+        else:
+            tournament_size = 4
+        
+        self.parents: list[np.ndarray] = []
+        fitness = self.population.fitness
+        available_individuals = list(range(len(self.population)))
+        
+        for _ in range(2):
+            if len(available_individuals) < tournament_size:
+                tournament_pool = available_individuals.copy()
+            else:
+                tournament_pool = sample(
+                    available_individuals, tournament_size
+                )
+            
+            if randint(1, 100) <= 80:
+                winner = max(tournament_pool, key=lambda idx: fitness[idx])
+            else:
+                winner = choice(tournament_pool)
+            
+            self.parents.append(self.population.genes[winner].copy())
+            
+            available_individuals.remove(winner)
+
+    def _recombine(self) -> None:
+        """
+        Create offspring through balanced crossover of selected parents.
+
+        Implements three crossover strategies:
+        - Uniform crossover (50%): Parameter-wise random inheritance
+        - Single-point crossover (30%): Classic split-point crossover
+        - Arithmetic crossover (20%): Blend for numerical parameters
+        """
+        
+        param_count = len(self.param_keys)
+        crossover_type = randint(1, 100)
+        
+        self.child = np.empty(param_count, dtype=np.int64)
+        
+        if crossover_type <= 50:
+            # Uniform crossover - each parameter from random parent
+            for i in range(param_count):
+                parent_idx = randint(0, 1)
+                self.child[i] = self.parents[parent_idx][i]
+                
+        elif crossover_type <= 80:
+            # Single-point crossover
+            delimiter = randint(1, param_count - 1)
+            self.child[:delimiter] = self.parents[0][:delimiter]
+            self.child[delimiter:] = self.parents[1][delimiter:]
+        else:
+            # Arithmetic crossover for numerical, random for boolean
+            for i, param_values in enumerate(self.param_values):
+                parent_1_idx = self.parents[0][i]
+                parent_2_idx = self.parents[1][i]
+                parent_1_val = param_values[parent_1_idx]
+                parent_2_val = param_values[parent_2_idx]
+                
+                if isinstance(parent_1_val, bool):
+                    self.child[i] = choice([parent_1_idx, parent_2_idx])
+                else:
+                    alpha = randint(30, 70) / 100.0
+                    blended = (
+                        alpha * parent_1_val + (1 - alpha) * parent_2_val
+                    )
+                    
+                    # Find closest valid parameter value
+                    self.child[i] = min(
+                        range(len(param_values)),
+                        key=lambda idx: abs(param_values[idx] - blended)
+                    )
+
+    def _mutate(self) -> None:
+        """
+        Apply mutation to the offspring.
+
+        Implements mutation strategies:
+        - Overall mutation applied probabilistically based on population diversity
+        - Each selected parameter mutates with 20% chance
+        - Ensures at least one parameter is mutated
+        - Gaussian-style mutation for numerical parameters
+        - Boundary exploration for all parameter types
+        - Simple discrete mutation for small sets of values
+        """
+        
+        # Adaptive mutation rate based on population diversity
+        base_rate = 0.5
+        adaptive_rate = base_rate * (2.0 - self.diversity_ratio)
+        
+        if randint(1, 100) > int(adaptive_rate * 100):
+            return
+        
+        param_count = len(self.param_keys)
+        
+        # Select parameters to mutate with decreasing probability
+        params_to_mutate = [
+            i for i in range(param_count) if randint(1, 100) <= 20
+        ]
+        
+        # Ensure at least one parameter is mutated
+        if not params_to_mutate:
+            params_to_mutate = [randint(0, param_count - 1)]
+        
+        for i in params_to_mutate:
+            param_values = self.param_values[i]
+            current_idx = int(self.child[i])
+            current_value = param_values[current_idx]
+            
+            if isinstance(current_value, bool):
+                self.child[i] = self.value_indices[i].get(
+                    not current_value, current_idx
+                )
+                
+            elif len(param_values) <= 3:
+                available_indices = [
+                    idx for idx, val in enumerate(param_values)
+                    if val != current_value
+                ]
+                if available_indices:
+                    self.child[i] = choice(available_indices)
+            else:
+                mutation_type = randint(1, 100)
+                
+                if mutation_type <= 25:
+                    # Boundary mutation
+                    self.child[i] = choice([0, len(param_values) - 1])
+                elif mutation_type <= 60:
+                    # Gaussian-style neighbor mutation
+                    max_offset = max(1, len(param_values) // 8)
+                    offset = randint(-max_offset, max_offset)
+                    self.child[i] = max(0, min(
+                        len(param_values) - 1, current_idx + offset
+                    ))
+                else:
+                    # Random mutation
+                    self.child[i] = randint(0, len(param_values) - 1)
+
+    def _expand(self) -> None:
+        """
+        Add mutated offspring to population.
+
+        Evaluates fitness of the offspring batch on training data
+        concurrently and appends it to the population storage.
+        """
+
+        scores = self.optimizer.evaluate_many(self.offspring, 'train')
+        for genes, fitness in zip(self.offspring, scores):
+            self.population.add(fitness, genes)
+
+    def _kill(self) -> None:
+        """
+        Remove worst individuals to maintain population size.
+        
+        With 1% probability performs catastrophic reduction (40-60%)
+        to prevent premature convergence.
+        """
+
+        # Catastrophic reduction (0.5% probability)
+        if randint(1, 1000) <= 5:
+            destruction_ratio = randint(40, 60) / 100.0
+            target_size = int(len(self.population) * (1 - destruction_ratio))
+        else:
+            # Standard population size control
+            target_size = int(self.config.max_population_size)
+        
+        # Remove worst individuals
+        self.population.cull(target_size)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .base import OptimizationEngine
+from ..utils import latin_hypercube_sampling
+
+
+class TPEEngine(OptimizationEngine):
+    """
+    Tree-structured Parzen Estimator search engine.
+
+    Models training fitness with two Parzen densities per parameter
+    over its value indices: l(x) fitted on the best gamma share
+    of evaluated samples (at most tpe_max_good) and g(x) on the rest.
+    Candidates are drawn from l(x) and those maximizing l(x) / g(x)
+    are backtested next, so the search concentrates on promising
+    regions after a few dozen backtests instead of thousands.
+
+    Numeric parameters use a Gaussian kernel over neighbouring value
+    indices; booleans and parameters with up to 3 values are treated
+    as categories.
+    """
+
+    @property
+    def iterations(self) -> int:
+        """Return the number of TPE-guided evaluations in a run."""
+
+        return self.config.tpe_iterations
+
+    def run(self, state: dict | None = None) -> None:
+        """
+        Run random startup sampling followed by batched TPE steps.
+
+        Each step suggests a batch of distinct, not yet evaluated
+        samples, which the optimizer backtests concurrently.
+        The run ends after the configured number of TPE evaluations,
+        when the grid is exhausted or when the optimizer's stopping
+        criteria are met.
+
+        Args:
+            state: Progress of an interrupted run, or None
+        """
+
+        if state is None:
+            opt_params = self.optimizer.strategy_class.opt_params
+            startup = latin_hypercube_sampling(
+                opt_params, max(self.config.tpe_startup, 2)
+            )
+            self.optimizer.seed_population(
+                [self.optimizer.encode(individual) for individual in startup]
+            )
+            remaining = self.iterations
+        else:
+            remaining = state['remaining']
+
+        seen = {
+            tuple(genes.tolist())
+            for genes in self.population.genes[:len(self.population)]
+        }
+        max_batch_size = max(self.config.batch_size, 1)
+
+        while remaining > 0:
+            batch = self._suggest(min(max_batch_size, remaining), seen)
+
+            if not batch:
+                break
+
+            remaining -= len(batch)
+            scores = self.optimizer.evaluate_many(batch, 'train')
+
+            for genes, fitness in zip(batch, scores):
+                self.population.add(fitness, genes)
+                seen.add(tuple(genes.tolist()))
+
+            if self.optimizer.end_batch({'remaining': remaining}):
+                break
+
+        self.population.cull(int(self.config.max_population_size))
+
+    def _suggest(
+        self,
+        batch_size: int,
+        seen: set[tuple]
+    ) -> list[np.ndarray]:
+        """
+        Suggest new samples with the highest expected improvement.
+
+        Args:
+            batch_size: Number of samples to suggest
+            seen: Already evaluated samples
+
+        Returns:
+            list[np.ndarray]: Distinct unseen samples (may be shorter
+                              than batch_size if the grid is exhausted)
+        """
+
+        size = len(self.population)
+        genes = self.population.genes[:size]
+        fitness = np.nan_to_num(
+            self.population.fitness[:size],
+            nan=-np.inf,
+            posinf=np.inf,
+            neginf=-np.inf
+        )
+
+        order = np.argsort(-fitness, kind='stable')
+        n_good = min(
+            max(1, int(np.ceil(self.config.tpe_gamma * size))),
+            self.config.tpe_max_good,
+            size
+        )
+        good = genes[order[:n_good]]
+        bad = genes[order[n_good:]]
+
+        n_candidates = max(self.config.tpe_candidates, 1) * batch_size
+        candidates = np.empty(
+            (n_candidates, len(self.param_values)), dtype=np.int64
+        )
+        scores = np.zeros(n_candidates)
+
+        for i, values in enumerate(self.param_values):
+            categorical = len(values) <= 3 or isinstance(values[0], bool)
+            l_density = self._density(good[:, i], len(values), categorical)
+            g_density = self._density(bad[:, i], len(values), categorical)
+
+            candidates[:, i] = np.random.choice(
+                len(values), size=n_candidates, p=l_density
+            )
+            scores += (
+                np.log(l_density[candidates[:, i]])
+                - np.log(g_density[candidates[:, i]])
+            )
+
+        batch: list[np.ndarray] = []
+        suggested: set[tuple] = set()
+
+        for idx in np.argsort(-scores, kind='stable'):
+            key = tuple(candidates[idx].tolist())
+
+            if key in seen or key in suggested:
+                continue
+
+            batch.append(candidates[idx].copy())
+            suggested.add(key)
+
+            if len(batch) == batch_size:
+                return batch
+
+        # Densities collapsed onto evaluated samples: explore randomly
+        for _ in range(n_candidates):
+            genes = np.array(
+                [
+                    np.random.randint(len(values))
+                    for values in self.param_values
+                ],
+                dtype=np.int64
+            )
+            key = tuple(genes.tolist())
+
+            if key in seen or key in suggested:
+                continue
+
+            batch.append(genes)
+            suggested.add(key)
+
+            if len(batch) == batch_size:
+                break
+
+        return batch
+
+    @staticmethod
+    def _density(
+        observed: np.ndarray,
+        n_values: int,
+        categorical: bool
+    ) -> np.ndarray:
+        """
+        Estimate a Parzen density over the value indices of a parameter.
+
+        A uniform prior with the weight of one observation keeps every
+        value reachable.
+
+        Args:
+            observed: Value indices of the observed samples
+            n_values: Number of values of the parameter
+            categorical: Whether indices have no order
+
+        Returns:
+            np.ndarray: Probability of every value index
+        """
+
+        weights = np.full(n_values, 1.0 / n_values)
+
+        if observed.shape[0] > 0:
+            if categorical:
+                weights += np.bincount(observed, minlength=n_values)
+            else:
+                bandwidth = max(
+                    1.0, 0.1 * n_values * observed.shape[0] ** -0.2
+                )
+                distance = (
+                    np.arange(n_values)[:, None] - observed[None, :]
+                ) / bandwidth
+                kernels = np.exp(-0.5 * distance ** 2)
+                weights += (kernels / kernels.sum(axis=0)).sum(axis=1)
+
+        return weights / weights.sum()
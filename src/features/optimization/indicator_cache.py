@@ -0,0 +1,423 @@
+from __future__ import annotations
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from inspect import signature
+from itertools import product
+from threading import Lock
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterator
+
+import numpy as np
+from numba.np.numpy_support import as_dtype
+
+from src.core.strategies.core.utils import scratch
+
+if TYPE_CHECKING:
+    from .models import IndicatorCacheStats
+
+
+class IndicatorCache:
+    """
+    Bounded LRU memo of indicator results for a single optimization.
+
+    Keys combine the indicator name with the identity of every input
+    series (buffer address, shape, strides and dtype) and the values
+    of scalar arguments, so parameter sets sharing an indicator
+    configuration reuse one computed series instead of recomputing it.
+
+    Input series of a cached entry are kept alive with the entry,
+    which guarantees that their buffer addresses are not reused by
+    other arrays while the key exists. Series are assumed to be
+    immutable after creation: market data windows and indicator
+    outputs are never written to by strategies, and memoized results
+    are shared between all callers, so they must not be modified.
+    Buffers of the scratch arena are the exception: they are rewritten
+    by every backtest, so calls with such inputs bypass the cache.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory cap for cached series in bytes
+                       (0 disables caching)
+        """
+
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, tuple, int]] = (
+            OrderedDict()
+        )
+        self._nbytes = 0
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache stores any results."""
+
+        return self._max_bytes > 0
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """
+        Wrap an indicator function with memoization.
+
+        Calls with arguments that cannot be keyed
+        (e.g. lists or other unhashable objects) bypass the cache.
+
+        Args:
+            name: Unique indicator name used in keys
+            func: Indicator function (Numba dispatcher or plain function)
+
+        Returns:
+            Callable: Memoizing wrapper with the same call signature
+        """
+
+        sig = signature(getattr(func, 'py_func', func))
+
+        @wraps(getattr(func, 'py_func', func))
+        def wrapper(*args, **kwargs):
+            try:
+                bound = sig.bind(*args, **kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+
+            bound.apply_defaults()
+            key, inputs = self._make_key(name, bound.arguments)
+
+            if key is None:
+                return func(*args, **kwargs)
+
+            result = self.get(key)
+
+            if result is not None:
+                return result
+
+            result = func(*args, **kwargs)
+            self.put(key, result, inputs)
+            return result
+
+        return wrapper
+
+    def wrap_into(
+        self,
+        name: str,
+        func: Callable,
+        allocating: Callable
+    ) -> Callable:
+        """
+        Wrap a buffer-writing indicator function with memoization.
+
+        Calls share entries with the allocating function: the key
+        is built from the leading arguments of the allocating
+        signature, cached results are copied into the output buffers
+        and results of misses are stored as copies, since the buffers
+        are usually reused by the caller.
+
+        Args:
+            name: Unique indicator name used in keys
+            func: Buffer-writing function (e.g. quanta.into.sma)
+            allocating: Allocating function (e.g. quanta.sma)
+
+        Returns:
+            Callable: Memoizing wrapper with the same call signature
+        """
+
+        sig = signature(getattr(func, 'py_func', func))
+        params = len(
+            signature(getattr(allocating, 'py_func', allocating)).parameters
+        )
+
+        @wraps(getattr(func, 'py_func', func))
+        def wrapper(*args, **kwargs):
+            try:
+                bound = sig.bind(*args, **kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+
+            arguments = list(bound.arguments.items())
+            outputs = [value for _, value in arguments[params:]]
+            key, inputs = self._make_key(name, dict(arguments[:params]))
+
+            if key is None:
+                return func(*args, **kwargs)
+
+            result = self.get(key)
+
+            if result is None:
+                result = func(*args, **kwargs)
+
+                if isinstance(result, tuple):
+                    stored = tuple(array.copy() for array in result)
+                else:
+                    stored = result.copy()
+
+                self.put(key, stored, inputs)
+                return result
+
+            if isinstance(result, tuple):
+                for output, array in zip(outputs, result):
+                    output[:] = array
+
+                return tuple(outputs[:len(result)])
+
+            outputs[0][:] = result
+            return outputs[0]
+
+        return wrapper
+
+    @contextmanager
+    def install(self, module: ModuleType) -> Iterator[IndicatorCache]:
+        """
+        Temporarily replace public functions of a module
+        with memoizing wrappers.
+
+        Code that looks functions up on the module at call time
+        (e.g. quanta.sma(...)) goes through the cache inside
+        the scope, as do the buffer-writing counterparts of
+        module.into (e.g. quanta.into.sma(...)) if the module has
+        them. Original functions are restored on exit.
+
+        Args:
+            module: Indicator module (e.g. quanta)
+
+        Yields:
+            IndicatorCache: This cache
+        """
+
+        if not self.enabled:
+            yield self
+            return
+
+        originals = {
+            name: func for name, func in vars(module).items()
+            if not name.startswith('_') and callable(func)
+            and not isinstance(func, (type, ModuleType))
+        }
+
+        into = getattr(module, 'into', None)
+        originals_into = {}
+
+        if isinstance(into, ModuleType):
+            originals_into = {
+                name: func for name, func in vars(into).items()
+                if name in originals
+            }
+
+        for name, func in originals.items():
+            setattr(module, name, self.wrap(name, func))
+
+        for name, func in originals_into.items():
+            setattr(
+                into, name, self.wrap_into(name, func, originals[name])
+            )
+
+        try:
+            yield self
+        finally:
+            for name, func in originals.items():
+                setattr(module, name, func)
+
+            for name, func in originals_into.items():
+                setattr(into, name, func)
+
+    def prefill(
+        self,
+        module: ModuleType,
+        name: str,
+        arguments: dict[str, Any],
+        axes: dict[str, list]
+    ) -> int:
+        """
+        Store the results of an indicator for every combination
+        of parameter values computed by one call of its multi-length
+        counterpart (module.multi), so that later calls with any
+        of the combinations are cache hits.
+
+        Entries are keyed like calls of the memoizing wrapper with
+        keyword arguments, parameter values must have the types
+        strategies pass (e.g. the values of opt_params). Tables that
+        would exceed the memory cap are skipped. Rows share the memory
+        of their table, which is freed once all of them are evicted.
+
+        Args:
+            module: Indicator module (e.g. quanta)
+            name: Indicator name (a function of module and module.multi)
+            arguments: Fixed arguments (e.g. input series)
+            axes: Values of every parameter spanning the table
+
+        Returns:
+            int: Number of stored entries (0 if the table was skipped)
+        """
+
+        func = vars(module)[name]
+        batched = getattr(module.multi, name, None)
+
+        if not self.enabled or batched is None:
+            return 0
+
+        sig = signature(getattr(func, 'py_func', func))
+        combinations = list(product(*axes.values()))
+        sample = func(**arguments, **dict(zip(axes, combinations[0])))
+
+        if _nbytes(sample) * len(combinations) > self._max_bytes:
+            return 0
+
+        arg_types = dict(zip(
+            signature(batched.py_func).parameters,
+            batched.signatures[0]
+        ))
+        tables = batched(**arguments, **{
+            param: np.array(
+                [values[i] for values in combinations],
+                dtype=as_dtype(arg_types[param].dtype)
+            )
+            for i, param in enumerate(axes)
+        })
+
+        for k, values in enumerate(combinations):
+            bound = sig.bind(**arguments, **dict(zip(axes, values)))
+            bound.apply_defaults()
+            key, inputs = self._make_key(name, bound.arguments)
+
+            if isinstance(tables, tuple):
+                self.put(key, tuple(table[k] for table in tables), inputs)
+            else:
+                self.put(key, tables[k], inputs)
+
+        return len(combinations)
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Look up a cached result and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Any | None: Cached result, or None on a miss
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, result: Any, inputs: tuple) -> None:
+        """
+        Store a result, evicting the least recently used entries
+        until the memory cap is met.
+
+        Args:
+            key: Cache key
+            result: Indicator result (array or tuple of arrays)
+            inputs: Input series pinned for the lifetime of the entry
+        """
+
+        if self._max_bytes <= 0:
+            return
+
+        nbytes = _nbytes(result) + sum(
+            array.nbytes for array in inputs if array.flags.owndata
+        )
+
+        if nbytes > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+
+            if previous is not None:
+                self._nbytes -= previous[2]
+
+            self._entries[key] = (result, inputs, nbytes)
+            self._nbytes += nbytes
+
+            while self._nbytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._nbytes -= evicted[2]
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> IndicatorCacheStats:
+        """Return hit/miss counters and current memory usage."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'nbytes': self._nbytes,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+    @staticmethod
+    def _make_key(
+        name: str,
+        arguments: dict[str, Any]
+    ) -> tuple[tuple | None, tuple]:
+        """
+        Build a cache key from bound call arguments.
+
+        Args:
+            name: Indicator name
+            arguments: Bound arguments in signature order
+
+        Returns:
+            tuple: (key, input_series), key is None if an argument
+                   cannot be keyed or is a scratch arena buffer
+        """
+
+        parts: list[Hashable] = [name]
+        inputs: list[np.ndarray] = []
+
+        for value in arguments.values():
+            if isinstance(value, np.ndarray):
+                if scratch.owns(value):
+                    return None, ()
+
+                parts.append((
+                    value.__array_interface__['data'][0],
+                    value.shape,
+                    value.strides,
+                    value.dtype.str
+                ))
+                inputs.append(value)
+            elif isinstance(value, (bool, int, float, str, np.generic)):
+                parts.append((type(value).__name__, value))
+            elif value is None:
+                parts.append(None)
+            else:
+                return None, ()
+
+        return tuple(parts), tuple(inputs)
+
+
+def _nbytes(result: Any) -> int:
+    """Return the memory size of an array or a tuple of arrays."""
+
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+
+    if isinstance(result, tuple):
+        return sum(_nbytes(item) for item in result)
+
+    return 0
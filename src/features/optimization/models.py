@@ -1,10 +1,11 @@
 from __future__ import annotations
 from enum import Enum
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, NotRequired, TypedDict
 
 if TYPE_CHECKING:
     from src.core.providers import MarketData
     from src.core.strategies import BaseStrategy
+    from src.infrastructure.exchanges.models import Interval
 
 
 class ContextStatus(Enum):
@@ -16,6 +17,69 @@ class ContextStatus(Enum):
     FAILED = 'FAILED'
 
 
+class StopReason(Enum):
+    """Reason an optimization run stopped."""
+
+    COMPLETED = 'COMPLETED'
+    STALLED = 'STALLED'
+    CONVERGED = 'CONVERGED'
+    TIME_BUDGET = 'TIME_BUDGET'
+    EVALUATION_BUDGET = 'EVALUATION_BUDGET'
+
+
+class CacheStats(TypedDict):
+    """Fitness cache counters of a finished optimization."""
+
+    hits: int
+    misses: int
+    size: int
+    hit_rate: float
+
+
+class IndicatorCacheStats(TypedDict):
+    """Indicator memo counters of an optimization."""
+
+    hits: int
+    misses: int
+    size: int
+    nbytes: int
+    hit_rate: float
+
+
+class OptimizationProgress(TypedDict):
+    """Progress of a running optimization task reported by a worker."""
+
+    run: int
+    runs: int
+    iteration: int
+    iterations: int
+    evaluations: int
+    evaluations_per_sec: float
+    cache_hit_rate: float
+    best_train_fitness: float | None
+    elapsed: float
+
+
+class ContextProgress(TypedDict):
+    """Progress of a running context aggregated over its folds."""
+
+    completion: float
+    evaluations: int
+    evaluations_per_sec: float
+    cache_hit_rate: float
+    best_train_fitness: float | None
+    folds: list[OptimizationProgress | None]
+
+
+class StoppingCriteria(TypedDict):
+    """Per-context overrides of the optimization stopping criteria."""
+
+    stall_iterations: NotRequired[int]
+    min_diversity: NotRequired[float]
+    time_budget: NotRequired[float]
+    evaluation_budget: NotRequired[int]
+
+
 class ContextConfig(TypedDict):
     """Configuration schema for strategy optimization context."""
 
@@ -26,6 +90,30 @@ class ContextConfig(TypedDict):
     start: str
     end: str
 
+    symbols: NotRequired[list[str]]
+    folds: NotRequired[int]
+    anchored: NotRequired[bool]
+    engine: NotRequired[str]
+    stall_iterations: NotRequired[int]
+    min_diversity: NotRequired[float]
+    time_budget: NotRequired[float]
+    evaluation_budget: NotRequired[int]
+
+
+class FoldResult(TypedDict):
+    """Optimization result of a single walk-forward fold."""
+
+    window: dict[str, int]
+    params: list[dict[str, bool | int | float]]
+    test_fitness: list[float]
+    stop_reasons: list[str]
+
+
+class OptimizationResult(FoldResult):
+    """Result of an optimization task reported by a worker."""
+
+    cache: CacheStats
+
 
 class StrategyContext(TypedDict):
     """Complete strategy optimization context."""
@@ -34,4 +122,56 @@ class StrategyContext(TypedDict):
     exchange: str
     market_data: MarketData
     strategy_class: type[BaseStrategy]
-    optimized_params: list[dict[str, bool | int | float]]
\ No newline at end of file
+    optimized_params: list[dict[str, bool | int | float]]
+
+    markets: NotRequired[list[MarketData]]
+    folds: NotRequired[int]
+    anchored: NotRequired[bool]
+    engine: NotRequired[str]
+    stopping: NotRequired[StoppingCriteria]
+    fold_results: NotRequired[list[FoldResult]]
+    stop_reasons: NotRequired[list[str]]
+
+
+class SharedArray(TypedDict):
+    """Handle of a numpy array published to shared memory."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedFeedsData(TypedDict):
+    """Feeds data with arrays published to shared memory."""
+
+    klines: dict[str, SharedArray]
+
+
+class SharedMarketData(TypedDict):
+    """Market data package with arrays published to shared memory."""
+
+    symbol: str
+    interval: Interval
+    p_precision: float
+    q_precision: float
+    klines: SharedArray
+
+    feeds: NotRequired[SharedFeedsData]
+    start: NotRequired[str]
+    end: NotRequired[str]
+
+
+class OptimizationTask(TypedDict):
+    """Strategy optimization context as shipped to a worker process."""
+
+    name: str
+    exchange: str
+    strategy_class: type[BaseStrategy]
+    market_data: SharedMarketData
+
+    markets: NotRequired[list[SharedMarketData]]
+    folds: NotRequired[int]
+    anchored: NotRequired[bool]
+    engine: NotRequired[str]
+    stopping: NotRequired[StoppingCriteria]
+    fold: NotRequired[int]
\ No newline at end of file
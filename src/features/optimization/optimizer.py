@@ -1,29 +1,70 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from hashlib import sha256
 from math import exp
-from os import getenv
-from random import choice, randint, sample
-from typing import TYPE_CHECKING
+from os import cpu_count, getenv
+from random import getstate, setstate
+from threading import RLock
+from time import monotonic
+from typing import TYPE_CHECKING, Callable
 
+import numpy as np
+
+from src.core.strategies.core import quanta
+from src.core.strategies.core.base import KLINE_COLUMNS
+from src.core.strategies.core.utils import scratch
+from src.infrastructure.storage import checkpoint_store
+
+from .cache import FitnessCache
 from .config import OptimizationConfig
+from .engines import engine_registry
+from .indicator_cache import IndicatorCache
+from .models import StopReason
+from .pool import report_progress
+from .population import Population
+from .shared_memory import attach_market_data, detach_segments
 from .utils import (
-    create_train_test_windows,
+    create_walk_forward_windows,
     create_window_data,
-    latin_hypercube_sampling
+    max_drawdown
 )
 
 if TYPE_CHECKING:
-    from multiprocessing import Queue
-    from src.core.providers import MarketData
-    from src.core.strategies.core.models import ParamDict
-    from .models import StrategyContext
+    from src.core.strategies.core.models import Cutoff, ParamDict
+    from .models import (
+        OptimizationProgress,
+        OptimizationResult,
+        OptimizationTask,
+        StrategyContext
+    )
+
+
+ABORTED_FITNESS = float('-inf')
+"""Fitness sentinel of backtests aborted by the cutoff."""
+
+DEFAULT_ENGINE = 'genetic'
+"""Search engine of contexts that don't specify one."""
+
+CHECKPOINT_NAMESPACE = 'optimization'
+"""Checkpoint store namespace of optimizer snapshots."""
+
+MARKET_AGGREGATIONS: dict[str, Callable[[list[float]], float]] = {
+    'mean': np.mean,
+    'median': np.median,
+    'min': min,
+}
+"""Aggregate fitness functions of multi-market contexts."""
 
 
 class StrategyOptimizer:
     """
-    Genetic algorithm optimizer for trading strategy optimization.
-    
-    Implements a genetic algorithm with selection, recombination, mutation,
-    and population management to find optimal parameter sets for strategies.
+    Optimizer of trading strategy parameters.
+
+    Owns data windows, parameter encoding, cached concurrent
+    evaluation with early abort and the final selection of the best
+    sample. The search itself is delegated to a pluggable engine
+    (see engines.engine_registry).
     """
 
     def __init__(self) -> None:
@@ -36,38 +77,106 @@ class StrategyOptimizer:
         
         Supported environment variables:
         - OPTIMIZATION_ITERATIONS: Number of genetic algorithm iterations
+        - TPE_STARTUP: Random samples before TPE modelling starts
+        - TPE_ITERATIONS: Number of TPE-guided evaluations
         - OPTIMIZATION_RUNS: Number of independent optimization runs
         - POPULATION_SIZE: Initial population size
         - MAX_POPULATION_SIZE: Maximum allowed population size
         - TRAIN_WINDOW: Training data window size
         - TEST_WINDOW: Test data window size
+        - FITNESS_CACHE_SIZE: Maximum number of cached fitness scores
+        - OPTIMIZATION_BATCH_SIZE: Offspring produced per iteration step
+        - OPTIMIZATION_THREADS: Threads evaluating offspring concurrently
+        - INDICATOR_CACHE_MB: Memory cap of the indicator memo
+        - ABORT_DRAWDOWN_FACTOR: Drawdown multiple for early abort
+        - CHECKPOINT_INTERVAL: Seconds between optimizer checkpoints
+        - PROGRESS_INTERVAL: Seconds between progress reports
+        - MARKET_AGGREGATION: Aggregate fitness of multi-market contexts
+        - STALL_ITERATIONS: Iterations without improvement to stop a run
+        - MIN_DIVERSITY: Population diversity below which a run stops
+        - TIME_BUDGET: Wall-clock seconds of an optimization
+        - EVALUATION_BUDGET: Fitness evaluations of an optimization
         """
 
         self.config = OptimizationConfig()
         
         env_mapping = {
             'OPTIMIZATION_ITERATIONS': ('iterations', int),
+            'TPE_STARTUP': ('tpe_startup', int),
+            'TPE_ITERATIONS': ('tpe_iterations', int),
             'OPTIMIZATION_RUNS': ('optimization_runs', int),
             'POPULATION_SIZE': ('population_size', int),
             'MAX_POPULATION_SIZE': ('max_population_size', int),
             'TRAIN_WINDOW': ('train_window', float),
             'TEST_WINDOW': ('test_window', float),
+            'FITNESS_CACHE_SIZE': ('cache_size', int),
+            'OPTIMIZATION_BATCH_SIZE': ('batch_size', int),
+            'OPTIMIZATION_THREADS': ('threads', int),
+            'INDICATOR_CACHE_MB': ('indicator_cache_mb', int),
+            'ABORT_DRAWDOWN_FACTOR': ('abort_drawdown_factor', float),
+            'CHECKPOINT_INTERVAL': ('checkpoint_interval', float),
+            'PROGRESS_INTERVAL': ('progress_interval', float),
+            'MARKET_AGGREGATION': ('market_aggregation', str),
+            'STALL_ITERATIONS': ('stall_iterations', int),
+            'MIN_DIVERSITY': ('min_diversity', float),
+            'TIME_BUDGET': ('time_budget', float),
+            'EVALUATION_BUDGET': ('evaluation_budget', int),
         }
         
         for env_var, (attr_name, converter) in env_mapping.items():
             if value := getenv(env_var):
                 setattr(self.config, attr_name, converter(value))
 
-    def optimize(self, context: StrategyContext) -> list[ParamDict]:
+    def optimize(
+        self,
+        context: StrategyContext,
+        checkpoint_id: str | None = None,
+        on_progress: Callable[[OptimizationProgress], None] | None = None
+    ) -> list[ParamDict]:
         """
-        Optimize parameters for a single strategy using genetic algorithm.
-
-        Executes genetic algorithm optimization cycle consisting of:
-        population creation, selection, recombination, mutation, and 
-        population management over multiple iterations and runs.
+        Optimize parameters for a single strategy.
+
+        Executes several independent runs of the context's search
+        engine (genetic algorithm by default) and selects the best
+        sample of every run on the test window.
+
+        Engines evaluate batches of samples concurrently in a thread
+        pool (strategy kernels release the GIL).
+
+        If INDICATOR_CACHE_MB is set, quanta indicators are memoized
+        for the duration of the optimization, so parameter sets sharing
+        an indicator configuration reuse the computed series.
+        Indicator tables declared by the strategy are precomputed
+        for their whole parameter axes up front (see
+        _prefill_indicators).
+
+        With a checkpoint_id, the optimizer state is saved to the
+        checkpoint store every CHECKPOINT_INTERVAL seconds and after
+        every run. An optimization of the same context started with
+        the same checkpoint_id continues from the saved state instead
+        of starting over; the checkpoint is deleted once it finishes.
+
+        With on_progress, progress is reported every PROGRESS_INTERVAL
+        seconds between evaluation batches.
+
+        Multi-market contexts evolve one population for all of their
+        markets: every sample is backtested on each market
+        concurrently and scored by the aggregate fitness
+        (MARKET_AGGREGATION), so the selected parameters are those
+        that hold up across the markets rather than on a single one.
+
+        A run ends early once its best training fitness hasn't
+        improved for STALL_ITERATIONS iterations, its population
+        diversity drops below MIN_DIVERSITY or its share of
+        the TIME_BUDGET / EVALUATION_BUDGET of the optimization is
+        spent (see the context's stopping overrides). Criteria are
+        checked between evaluation batches; the reason every run
+        stopped is recorded in stop_reasons.
 
         Args:
             context: Strategy context package
+            checkpoint_id: Identifier of the optimization checkpoint
+            on_progress: Callback receiving progress reports
 
         Returns:
             list: Best parameters found during optimization
@@ -75,326 +184,695 @@ class StrategyOptimizer:
 
         self._init_optimization(context)
 
-        for _ in range(self.config.optimization_runs):
-            self._create_population()
+        if self.config.checkpoint_interval <= 0:
+            checkpoint_id = None
+
+        self._checkpoint_id = checkpoint_id
+        self._checkpoint_time = monotonic()
+        self._fingerprint = self._make_fingerprint(context)
+
+        self._on_progress = on_progress
+        self._start_time = self._progress_time = monotonic()
+        self._elapsed_offset = 0.0
+
+        threads = self.config.threads or cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=threads)
 
-            for _ in range(self.config.iterations):
-                self._select()
-                self._recombine()
-                self._mutate()
-                self._expand()
-                self._kill()
+        self._prefill_indicators()
 
-            self.best_params.append(self._get_best_sample())
-            self.population.clear()
+        with self.indicator_cache.install(quanta):
+            self._run_optimization()
+
+        if checkpoint_id is not None:
+            checkpoint_store.delete(CHECKPOINT_NAMESPACE, checkpoint_id)
 
         return self.best_params
 
+    def _prefill_indicators(self) -> None:
+        """
+        Fill the indicator cache with the strategy's indicator tables
+        on the training window of every market.
+
+        Every table is computed by a single call of the multi-length
+        quanta kernel over all combinations of its parameter values
+        (the opt_params range, or the default of parameters that
+        aren't optimized), so backtests only look their rows up.
+        """
+
+        opt_params = self.strategy_class.opt_params
+        defaults = self.strategy_class.params
+
+        for table in self.strategy_class.indicator_tables:
+            axes = {
+                arg: opt_params.get(param, [defaults[param]])
+                for arg, param in table['params'].items()
+            }
+
+            for market_data in self.train_data:
+                klines = market_data['klines']
+                series = {
+                    arg: klines[:, KLINE_COLUMNS.index(column)]
+                    for arg, column in table['series'].items()
+                }
+                self.indicator_cache.prefill(
+                    quanta, table['indicator'], series, axes
+                )
+
+    def _run_optimization(self) -> None:
+        """Run all optimization runs and collect their best samples."""
+
+        engine_state = self._restore_checkpoint()
+        self._start_evaluations = self._progress_evaluations = (
+            self.cache.misses
+        )
+
+        try:
+            while len(self.best_params) < self.config.optimization_runs:
+                if engine_state is None:
+                    self._start_run()
+
+                self._stop_reason = StopReason.COMPLETED
+                self.engine.run(engine_state)
+                engine_state = None
+
+                best_sample, test_fitness = self._get_best_sample()
+                self.best_params.append(best_sample)
+                self.best_test_fitness.append(test_fitness)
+                self.stop_reasons.append(self._stop_reason.value)
+                self.population.clear()
+
+                if len(self.best_params) < self.config.optimization_runs:
+                    self.save_checkpoint(None, force=True)
+        finally:
+            self._executor.shutdown()
+
+    def _start_run(self) -> None:
+        """
+        Reset the stopping state for a new run and give it an even
+        share of the budgets left to the remaining runs.
+        """
+
+        runs_left = self.config.optimization_runs - len(self.best_params)
+        elapsed = self._elapsed()
+        evaluations = self.cache.misses
+
+        time_budget = self.config.time_budget
+        evaluation_budget = self.config.evaluation_budget
+
+        self._stopping = {
+            'best_fitness': float('-inf'),
+            'best_iteration': 0,
+            'time_limit': (
+                elapsed + max(time_budget - elapsed, 0.0) / runs_left
+                if time_budget > 0 else None
+            ),
+            'evaluation_limit': (
+                evaluations
+                + max(evaluation_budget - evaluations, 0) / runs_left
+                if evaluation_budget > 0 else None
+            ),
+        }
+
+    def end_batch(self, engine_state: dict) -> bool:
+        """
+        Check the stopping criteria, then save a checkpoint
+        and report progress, if due.
+
+        Engines call this after every evaluation batch and end
+        the run when it returns True.
+
+        Args:
+            engine_state: Progress of the current run
+                          ({'remaining': evaluations left})
+
+        Returns:
+            bool: True if the run must stop
+        """
+
+        reason = self._check_stop(engine_state['remaining'])
+
+        if reason is not None:
+            self._stop_reason = reason
+        else:
+            self.save_checkpoint(engine_state)
+
+        self._report_progress(engine_state['remaining'])
+        return reason is not None
+
+    def _check_stop(self, remaining: int) -> StopReason | None:
+        """
+        Return the reason the current run must stop, if any.
+
+        Improvement is measured on the best training fitness
+        in the population, iterations are engine evaluations.
+        """
+
+        config = self.config
+        stopping = self._stopping
+
+        if config.stall_iterations > 0:
+            iteration = self.engine.iterations - remaining
+            fitness = self.population.fitness[:len(self.population)]
+            fitness = fitness[np.isfinite(fitness)]
+
+            if (
+                fitness.shape[0]
+                and fitness.max() > stopping['best_fitness']
+            ):
+                stopping['best_fitness'] = float(fitness.max())
+                stopping['best_iteration'] = iteration
+            elif (
+                iteration - stopping['best_iteration']
+                >= config.stall_iterations
+            ):
+                return StopReason.STALLED
+
+        if (
+            config.min_diversity > 0
+            and self.population.diversity() < config.min_diversity
+        ):
+            return StopReason.CONVERGED
+
+        if (
+            stopping['time_limit'] is not None
+            and self._elapsed() >= stopping['time_limit']
+        ):
+            return StopReason.TIME_BUDGET
+
+        if (
+            stopping['evaluation_limit'] is not None
+            and self.cache.misses >= stopping['evaluation_limit']
+        ):
+            return StopReason.EVALUATION_BUDGET
+
+        return None
+
+    def _elapsed(self) -> float:
+        """Return seconds spent on the optimization, across resumes."""
+
+        return self._elapsed_offset + monotonic() - self._start_time
+
+    def _report_progress(self, remaining: int) -> None:
+        """
+        Send a progress report if the progress interval has passed.
+
+        Throughput is measured since the previous report, so JIT
+        warm-up and earlier runs don't skew it.
+        """
+
+        now = monotonic()
+        interval = now - self._progress_time
+
+        if (
+            self._on_progress is None
+            or interval < self.config.progress_interval
+        ):
+            return
+
+        misses = self.cache.misses
+        recent = misses - self._progress_evaluations
+        self._progress_time = now
+        self._progress_evaluations = misses
+
+        fitness = self.population.fitness[:len(self.population)]
+        fitness = fitness[np.isfinite(fitness)]
+
+        self._on_progress({
+            'run': len(self.best_params) + 1,
+            'runs': self.config.optimization_runs,
+            'iteration': self.engine.iterations - remaining,
+            'iterations': self.engine.iterations,
+            'evaluations': misses - self._start_evaluations,
+            'evaluations_per_sec': recent / interval if interval else 0.0,
+            'cache_hit_rate': self.cache.stats()['hit_rate'],
+            'best_train_fitness': (
+                float(fitness.max()) if fitness.shape[0] else None
+            ),
+            'elapsed': self._elapsed(),
+        })
+
+    def save_checkpoint(
+        self,
+        engine_state: dict | None,
+        force: bool = False
+    ) -> None:
+        """
+        Save the optimizer state if a checkpoint is due.
+
+        Called between evaluation batches, when no backtest
+        is running. The snapshot holds the run index (number of
+        finished runs) with their results, the population, random
+        generator states, the fitness cache, the early-abort state
+        and the stopping state with the time spent so far.
+
+        Args:
+            engine_state: Progress of the current run returned to
+                          the engine on resume (None between runs)
+            force: Save regardless of the checkpoint interval
+        """
+
+        if self._checkpoint_id is None:
+            return
+
+        if (
+            not force
+            and monotonic() - self._checkpoint_time
+            < self.config.checkpoint_interval
+        ):
+            return
+
+        checkpoint_store.save(CHECKPOINT_NAMESPACE, self._checkpoint_id, {
+            'fingerprint': self._fingerprint,
+            'run': len(self.best_params),
+            'best_params': self.best_params,
+            'best_test_fitness': self.best_test_fitness,
+            'stop_reasons': self.stop_reasons,
+            'engine': engine_state,
+            'population': (
+                self.population.state() if engine_state is not None
+                else None
+            ),
+            'random': getstate(),
+            'numpy_random': np.random.get_state(),
+            'cache': self.cache.state(),
+            'cutoff': self.cutoff,
+            'peak_drawdown': self._peak_drawdown,
+            'aborted_runs': self.aborted_runs,
+            'stopping': (
+                self._stopping if engine_state is not None else None
+            ),
+            'elapsed': self._elapsed(),
+        })
+        self._checkpoint_time = monotonic()
+
+    def _restore_checkpoint(self) -> dict | None:
+        """
+        Restore the optimizer state from a matching checkpoint.
+
+        Checkpoints of a different context, data or configuration
+        are ignored.
+
+        Returns:
+            dict | None: Engine state of the interrupted run,
+                         or None if the next run starts from scratch
+        """
+
+        if self._checkpoint_id is None:
+            return None
+
+        state = checkpoint_store.load(
+            CHECKPOINT_NAMESPACE, self._checkpoint_id
+        )
+
+        if state is None or state['fingerprint'] != self._fingerprint:
+            return None
+
+        self.best_params = state['best_params']
+        self.best_test_fitness = state['best_test_fitness']
+        self.stop_reasons = state['stop_reasons']
+        self._elapsed_offset = state['elapsed']
+        setstate(state['random'])
+        np.random.set_state(state['numpy_random'])
+        self.cache.restore(state['cache'])
+
+        with self._cutoff_lock:
+            self.cutoff = state['cutoff']
+            self._peak_drawdown = state['peak_drawdown']
+            self.aborted_runs = state['aborted_runs']
+
+        if state['engine'] is not None:
+            self.population.restore(state['population'])
+            self._stopping = state['stopping']
+
+        return state['engine']
+
+    def _make_fingerprint(self, context: StrategyContext) -> str:
+        """
+        Hash everything that determines the optimization outcome:
+        strategy, parameter grid, data and fold windows of all markets,
+        engine and configuration with the context's stopping overrides
+        (except the checkpoint interval).
+        """
+
+        config = asdict(self.config)
+        config.pop('checkpoint_interval')
+
+        markets = tuple(
+            (
+                market_data['symbol'],
+                str(market_data['interval']),
+                market_data['klines'].shape,
+                (
+                    market_data['klines'][[0, -1]].tolist()
+                    if market_data['klines'].shape[0] else None
+                ),
+                window,
+            )
+            for market_data, window in zip(
+                context.get('markets', [context['market_data']]),
+                self.windows
+            )
+        )
+
+        parts = (
+            self.strategy_class.__module__,
+            self.strategy_class.__qualname__,
+            self.strategy_class.params,
+            self.param_keys,
+            self.param_values,
+            markets,
+            context.get('engine', DEFAULT_ENGINE),
+            config,
+        )
+        return sha256(repr(parts).encode()).hexdigest()
+
     def _init_optimization(self, context: StrategyContext) -> None:
         """
         Initialize optimization variables for a strategy context.
 
-        Sets up strategy class, training/test data windows,
-        and population dictionary.
+        Sets up strategy class, stopping overrides of the context,
+        training/test data windows of every
+        market (of the task's walk-forward fold, if any),
+        parameter encoding tables, population storage, fitness cache
+        and the search engine.
 
         Args:
             context: Strategy context package
+
+        Raises:
+            ValueError: If the market aggregation is unknown
         """
 
         self.strategy_class = context['strategy_class']
 
-        windows = create_train_test_windows(
-            market_data=context['market_data'],
-            config=self.config
-        )
+        for name, value in context.get('stopping', {}).items():
+            setattr(self.config, name, value)
+
+        aggregation = self.config.market_aggregation
+        if aggregation not in MARKET_AGGREGATIONS:
+            raise ValueError(f'Unknown market aggregation: {aggregation}')
+
+        self._aggregate = MARKET_AGGREGATIONS[aggregation]
+
+        # Every market is split on its own klines, the first market's
+        # window is the one reported in results
+        markets = context.get('markets', [context['market_data']])
+        self.windows = [
+            create_walk_forward_windows(
+                market_data=market_data,
+                config=self.config,
+                folds=context.get('folds', 1),
+                anchored=context.get('anchored', False)
+            )[context.get('fold', 0)]
+            for market_data in markets
+        ]
+        self.window = self.windows[0]
 
-        self.train_data = create_window_data(
-            market_data=context['market_data'],
-            window=windows,
-            data_type='train'
+        self.train_data = [
+            create_window_data(
+                market_data=market_data,
+                window=window,
+                data_type='train'
+            )
+            for market_data, window in zip(markets, self.windows)
+        ]
+        self.test_data = [
+            create_window_data(
+                market_data=market_data,
+                window=window,
+                data_type='test'
+            )
+            for market_data, window in zip(markets, self.windows)
+        ]
+
+        opt_params = self.strategy_class.opt_params
+        self.param_keys = list(opt_params.keys())
+        self.param_values = [opt_params[name] for name in self.param_keys]
+        self.value_indices = [
+            {value: idx for idx, value in enumerate(values)}
+            for values in self.param_values
+        ]
+
+        self.population = Population(
+            n_params=len(self.param_keys),
+            capacity=int(self.config.max_population_size) + 1
         )
-        self.test_data = create_window_data(
-            market_data=context['market_data'],
-            window=windows,
-            data_type='test'
+        self.best_params: list[ParamDict] = []
+        self.best_test_fitness: list[float] = []
+        self.stop_reasons: list[str] = []
+        self.cache = FitnessCache(self.config.cache_size)
+        self.indicator_cache = IndicatorCache(
+            self.config.indicator_cache_mb * 1024 * 1024
         )
 
-        self.population: dict[float, ParamDict] = {}
-        self.best_params: list[ParamDict] = []
+        self.cutoff: Cutoff | None = None
+        self.aborted_runs = 0
+        self._peak_drawdown = 0.0
+        self._cutoff_lock = RLock()
+
+        self.engine = engine_registry[
+            context.get('engine', DEFAULT_ENGINE)
+        ](self)
 
-    def _create_population(self) -> None:
+    def seed_population(self, individuals: list[np.ndarray]) -> None:
         """
-        Create initial population of candidate parameter sets
-        using multiple sampling methods.
+        Evaluate the initial sample of a run and add it to the population.
 
-        Uses a diversified approach:
-        - Latin Hypercube Sampling (50%): Space-filling statistical sampling
-        - Random sampling (30%): Random selection from parameter ranges
-        - Extreme values (20%): Boundary parameter values
+        The initial sample is always backtested in full, bypassing
+        the fitness cache, it sets the drawdown baseline for early
+        abort of later backtests.
+
+        Args:
+            individuals: Encoded parameter sets (value indices)
         """
 
-        population: list[ParamDict] = []
-        opt_params = self.strategy_class.opt_params
+        with self._cutoff_lock:
+            self.cutoff = None
+            self._peak_drawdown = 0.0
 
-        # Latin Hypercube Sampling (50%)
-        lhs_count = int(self.config.population_size * 0.5)
-        individuals = latin_hypercube_sampling(opt_params, lhs_count)
-        population.extend(individuals)
-
-        # Random sampling (30%)
-        random_count = int(self.config.population_size * 0.3)
-        for _ in range(random_count):
-            individual = {
-                param_name: choice(param_values)
-                for param_name, param_values in opt_params.items()
-            }
-            population.append(individual)
-
-        # Extreme values (20%)
-        extreme_count = int(self.config.population_size * 0.2)
-        for _ in range(extreme_count):
-            individual = {
-                param_name: choice([param_values[0], param_values[-1]])
-                for param_name, param_values in opt_params.items()
-            }
-            population.append(individual)
+        scores = self.evaluate_many(individuals, 'train', cached=False)
+        for genes, fitness in zip(individuals, scores):
+            self.population.add(fitness, genes)
 
-        # Evaluate and add to population
-        for individual in population:
-            fitness = self._evaluate(individual, self.train_data)
-            self.population[fitness] = individual
+        self._update_cutoff()
 
-    def _evaluate(
+    def _backtest(
         self,
-        sample_dict: ParamDict,
-        market_data: MarketData
+        genes: np.ndarray,
+        window: str,
+        market: int,
+        cutoff: Cutoff | None = None
     ) -> float:
         """
-        Evaluate strategy performance with given parameters.
+        Backtest strategy with given parameters on one market.
+
+        Runs that the strategy aborts early under the cutoff score
+        ABORTED_FITNESS. Strategies borrow their buffers from
+        the scratch arena of the worker thread, so the strategy
+        must not outlive the backtest.
 
         Args:
-            sample_dict: Dictionary of strategy parameters to test
-            market_data: Market data package
+            genes: Encoded parameter set (value indices)
+            window: Data window to backtest on ('train' or 'test')
+            market: Index of the market in the context's markets
+            cutoff: Early-abort bounds (None backtests in full)
 
         Returns:
-            float: Fitness score based on sum of completed deals profit/loss
+            float: Sum of completed deals profit/loss
         """
 
-        strategy = self.strategy_class(sample_dict)
-        strategy.__calculate__(market_data)
+        if window == 'train':
+            market_data = self.train_data[market]
+        else:
+            market_data = self.test_data[market]
+
+        strategy = self.strategy_class(self.decode(genes))
+
+        with scratch.scope():
+            strategy.__calculate__(market_data, cutoff)
 
-        score = strategy.completed_deals_log[:, 8].sum()
-        return score
+            if strategy.aborted:
+                with self._cutoff_lock:
+                    self.aborted_runs += 1
 
-    def _select(self) -> None:
+                return ABORTED_FITNESS
+
+            if window == 'train':
+                self._track_drawdown(
+                    max_drawdown(
+                        strategy.completed_deals_log,
+                        strategy.params['initial_capital']
+                    )
+                )
+
+            return strategy.completed_deals_log[:, 8].sum()
+
+    def _track_drawdown(self, drawdown: float) -> None:
         """
-        Select two parent samples using adaptive tournament selection.
+        Record the drawdown of a completed training backtest.
 
-        Implements efficient tournament selection with adaptive pressure:
-        - Tournament size adapts to population diversity
-        - Elite bias decreases over iterations to maintain exploration
+        The cutoff follows the peak drawdown only between batches
+        (see evaluate_many()), so which backtests are aborted doesn't
+        depend on the order in which concurrent backtests finish.
         """
-        
-        # Calculate adaptive tournament parameters
-        population_size = len(self.population)
-        unique_samples = len(set(
-            tuple(params.items()) for params in self.population.values()
-        ))
-        diversity_ratio = unique_samples / population_size
-        
-        # Adaptive tournament size (2-4 based on diversity)
-        if diversity_ratio > 0.7:
-            tournament_size = 2
-        elif diversity_ratio > 0.4:
-            tournament_size = 3
-        else:
-            tournament_size = 4
-        
-        self.parents: list[ParamDict] = []
-        available_individuals = list(self.population.items())
-        
-        for _ in range(2):
-            if len(available_individuals) < tournament_size:
-                tournament_pool = available_individuals.copy()
-            else:
-                tournament_pool = sample(
-                    available_individuals, tournament_size
-                )
-            
-            if randint(1, 100) <= 80:
-                winner_fitness, winner_params = max(
-                    tournament_pool, key=lambda x: x[0]
-                )
-            else:
-                winner_fitness, winner_params = choice(tournament_pool)
-            
-            self.parents.append(winner_params)
-            
-            available_individuals.remove((winner_fitness, winner_params))
 
-    def _recombine(self) -> None:
+        with self._cutoff_lock:
+            self._peak_drawdown = max(self._peak_drawdown, drawdown)
+
+    def _update_cutoff(self) -> None:
         """
-        Create offspring through balanced crossover of selected parents.
+        Set early-abort bounds for training backtests.
 
-        Implements three crossover strategies:
-        - Uniform crossover (50%): Parameter-wise random inheritance
-        - Single-point crossover (30%): Classic split-point crossover
-        - Arithmetic crossover (20%): Blend for numerical parameters
+        A run is aborted once its equity is wiped out or its drawdown
+        exceeds the configured multiple of the largest drawdown
+        of a completed run, so only clear losers are cut short.
         """
-        
-        param_keys = list(self.strategy_class.opt_params.keys())
-        param_count = len(param_keys)
-        crossover_type = randint(1, 100)
-        
-        self.child: ParamDict = {}
-        
-        if crossover_type <= 50:
-            # Uniform crossover - each parameter from random parent
-            for param_name in param_keys:
-                parent_idx = randint(0, 1)
-                self.child[param_name] = self.parents[parent_idx][param_name]
-                
-        elif crossover_type <= 80:
-            # Single-point crossover
-            delimiter = randint(1, param_count - 1)
-            
-            for i, param_name in enumerate(param_keys):
-                if i < delimiter:
-                    self.child[param_name] = self.parents[0][param_name]
-                else:
-                    self.child[param_name] = self.parents[1][param_name]
-        else:
-            # Arithmetic crossover for numerical, random for boolean
-            for param_name in param_keys:
-                parent_1_val = self.parents[0][param_name]
-                parent_2_val = self.parents[1][param_name]
-                
-                if isinstance(parent_1_val, bool):
-                    self.child[param_name] = choice(
-                        [parent_1_val, parent_2_val]
-                    )
-                else:
-                    param_values = self.strategy_class.opt_params[param_name]
-                    alpha = randint(30, 70) / 100.0
-                    blended = (
-                        alpha * parent_1_val + (1 - alpha) * parent_2_val
-                    )
-                    
-                    # Find closest valid parameter value
-                    closest_value = min(
-                        param_values, key=lambda x: abs(x - blended)
-                    )
-                    self.child[param_name] = closest_value
 
-    def _mutate(self) -> None:
+        factor = self.config.abort_drawdown_factor
+
+        with self._cutoff_lock:
+            if factor <= 0:
+                self.cutoff = None
+                return
+
+            cutoff: Cutoff = {'min_equity': 0.0}
+
+            if self._peak_drawdown > 0:
+                cutoff['max_drawdown'] = factor * self._peak_drawdown
+
+            self.cutoff = cutoff
+
+    def evaluate_many(
+        self,
+        individuals: list[np.ndarray],
+        window: str,
+        cached: bool = True
+    ) -> list[float]:
         """
-        Apply mutation to the offspring.
+        Evaluate several parameter sets concurrently.
 
-        Implements mutation strategies:
-        - Overall mutation applied probabilistically based on population diversity
-        - Each selected parameter mutates with 20% chance
-        - Ensures at least one parameter is mutated
-        - Gaussian-style mutation for numerical parameters
-        - Boundary exploration for all parameter types
-        - Simple discrete mutation for small sets of values
+        Duplicate parameter sets inside the batch are evaluated once.
+        Scores are memoized per data window, so parameter sets that
+        the algorithm produces again are not backtested twice.
+        Aborted scores are not memoized: they only hold under
+        the cutoff they were aborted by.
+
+        Backtests of every parameter set on every market run
+        concurrently in the thread pool. A set that is aborted on any
+        market scores ABORTED_FITNESS, otherwise its fitness is
+        the aggregate of its market scores (the plain score of
+        single-market contexts).
+
+        Training backtests of a batch all run under the cutoff in
+        force when the batch starts, the cutoff is updated with
+        their drawdowns once the batch is complete.
+
+        Args:
+            individuals: Encoded parameter sets (value indices)
+            window: Data window to evaluate on ('train' or 'test')
+            cached: Look scores up in the fitness cache
+                    (False backtests every parameter set)
+
+        Returns:
+            list[float]: Fitness scores in the order of individuals
         """
-        
-        # Calculate adaptive mutation rate based on population diversity
-        unique_samples = len(set(
-            tuple(params.items()) for params in self.population.values()
-        ))
-        population_diversity = unique_samples / len(self.population)
-        
-        base_rate = 0.5
-        adaptive_rate = base_rate * (2.0 - population_diversity)
-        
-        if randint(1, 100) > int(adaptive_rate * 100):
-            return
-        
-        param_keys = list(self.strategy_class.opt_params.keys())
-        
-        # Select parameters to mutate with decreasing probability
-        params_to_mutate = [
-            param_name for param_name in param_keys if randint(1, 100) <= 20
+
+        unique: dict[tuple, np.ndarray] = {}
+        for genes in individuals:
+            unique.setdefault(tuple(genes.tolist()), genes)
+
+        scores: dict[tuple, float] = {}
+        missing: dict[tuple, np.ndarray] = {}
+
+        for values, genes in unique.items():
+            score = self.cache.get(
+                FitnessCache.make_key(window, values), bypass=not cached
+            )
+
+            if score is None:
+                missing[values] = genes
+            else:
+                scores[values] = score
+
+        cutoff = self.cutoff if window == 'train' else None
+        markets = range(len(self.train_data))
+        backtests = [
+            (genes, market)
+            for genes in missing.values()
+            for market in markets
         ]
-        
-        # Ensure at least one parameter is mutated
-        if not params_to_mutate:
-            params_to_mutate = [choice(param_keys)]
-        
-        for param_name in params_to_mutate:
-            param_values = self.strategy_class.opt_params[param_name]
-            current_value = self.child[param_name]
-            
-            if isinstance(current_value, bool):
-                self.child[param_name] = not current_value
-                
-            elif len(param_values) <= 3:
-                available_values = [
-                    val for val in param_values if val != current_value
-                ]
-                if available_values:
-                    self.child[param_name] = choice(available_values)
+        results = iter(self._executor.map(
+            lambda item: self._backtest(item[0], window, item[1], cutoff),
+            backtests
+        ))
+
+        for values in missing:
+            market_scores = [next(results) for _ in markets]
+
+            if ABORTED_FITNESS in market_scores:
+                score = ABORTED_FITNESS
+            elif len(market_scores) == 1:
+                score = market_scores[0]
             else:
-                mutation_type = randint(1, 100)
-                
-                if mutation_type <= 25:
-                    # Boundary mutation
-                    self.child[param_name] = choice([
-                        param_values[0], param_values[-1]
-                    ])
-                elif mutation_type <= 60:
-                    # Gaussian-style neighbor mutation
-                    current_idx = param_values.index(current_value)
-                    max_offset = max(1, len(param_values) // 8)
-                    offset = randint(-max_offset, max_offset)
-                    new_idx = max(0, min(
-                        len(param_values) - 1, current_idx + offset
-                    ))
-                    self.child[param_name] = param_values[new_idx]
-                else:
-                    # Random mutation
-                    self.child[param_name] = choice(param_values)
-
-    def _expand(self) -> None:
-        """
-        Add mutated offspring to population.
-
-        Evaluates fitness of the child on training data and
-        adds it to the population dictionary.
-        """
-
-        fitness = self._evaluate(self.child, self.train_data)
-        self.population[fitness] = self.child
-
-    def _kill(self) -> None:
-        """
-        Remove worst individuals to maintain population size.
-        
-        With 1% probability performs catastrophic reduction (40-60%)
-        to prevent premature convergence.
+                score = self._aggregate(market_scores)
+
+            if score != ABORTED_FITNESS:
+                self.cache.put(FitnessCache.make_key(window, values), score)
+
+            scores[values] = score
+
+        if cutoff is not None:
+            self._update_cutoff()
+
+        return [scores[tuple(genes.tolist())] for genes in individuals]
+
+    def encode(self, sample_dict: ParamDict) -> np.ndarray:
         """
+        Convert a parameter dictionary into value indices.
 
-        # Catastrophic reduction (0.5% probability)
-        if randint(1, 1000) <= 5:
-            destruction_ratio = randint(40, 60) / 100.0
-            target_size = int(len(self.population) * (1 - destruction_ratio))
-        else:
-            # Standard population size control
-            target_size = self.config.max_population_size
-        
-        # Remove worst individuals
-        while len(self.population) > target_size:
-            self.population.pop(min(self.population))
+        Args:
+            sample_dict: Dictionary of strategy parameters
 
-    def _get_best_sample(self) -> ParamDict:
+        Returns:
+            np.ndarray: Index of every parameter value in opt_params
+        """
+
+        return np.array(
+            [
+                self.value_indices[i][sample_dict[name]]
+                for i, name in enumerate(self.param_keys)
+            ],
+            dtype=np.int64
+        )
+
+    def decode(self, genes: np.ndarray) -> ParamDict:
+        """
+        Convert value indices back into a parameter dictionary.
+
+        Args:
+            genes: Encoded parameter set (value indices)
+
+        Returns:
+            ParamDict: Dictionary of strategy parameters
+        """
+
+        return {
+            name: self.param_values[i][genes[i]]
+            for i, name in enumerate(self.param_keys)
+        }
+
+    def _get_best_sample(self) -> tuple[ParamDict | None, float]:
         """
         Select best parameter set using validation-dominant score
         with exponential overfitting penalty.
+
+        Returns:
+            tuple: (best_params, test_fitness) of the selected sample
         """
 
         best_score = float('-inf')
         best_sample = None
+        best_test_fitness = float('nan')
 
         # Scoring hyperparameters
         alpha = 1.3   # validation dominance (exponent)
@@ -402,8 +880,12 @@ class StrategyOptimizer:
         gamma = 1.5   # gap penalty severity
         eps = 1e-8    # division-by-zero protection
 
-        for train_fitness, sample_params in self.population.items():
-            test_fitness = self._evaluate(sample_params, self.test_data)
+        individuals = list(self.population.genes[:len(self.population)])
+        test_scores = self.evaluate_many(individuals, 'test')
+
+        for i, genes in enumerate(individuals):
+            train_fitness = self.population.fitness[i]
+            test_fitness = test_scores[i]
 
             gap = abs(train_fitness - test_fitness)
 
@@ -415,31 +897,86 @@ class StrategyOptimizer:
 
             if score > best_score:
                 best_score = score
-                best_sample = sample_params
+                best_sample = genes
+                best_test_fitness = float(test_fitness)
+
+        if best_sample is None:
+            return None, best_test_fitness
+
+        return self.decode(best_sample), best_test_fitness
+
+
+def warm_up_worker() -> None:
+    """
+    Prepare a pool worker process for optimization tasks.
+
+    Imports the strategy registry so that strategy modules and
+    their cached JIT kernels are loaded once per worker
+    rather than once per task.
+    """
+
+    import src.core.strategies  # noqa: F401
 
-        return best_sample
 
 def optimize_worker(
-    context_id: str,
-    context: StrategyContext,
-    results_queue: Queue[tuple[str, list[ParamDict] | None, str | None]]
-) -> None:
+    task_id: str,
+    task: OptimizationTask
+) -> OptimizationResult:
     """
-    Optimize trading strategy in separate worker process.
+    Optimize trading strategy in a pool worker process.
+
+    Attaches market data (of every market of multi-market contexts)
+    published to shared memory and runs strategy optimization
+    for given context (or for one of its walk-forward folds).
+    Exceptions propagate to the worker pool, which reports them
+    to the main process.
 
-    Runs strategy optimization for given context and puts results
-    into queue for main process. Handles exceptions and returns
-    error information if optimization fails.
+    The task identifier doubles as the optimization checkpoint id,
+    so a task resubmitted after a restart continues where it stopped.
+    Progress is streamed to the pool while the task runs.
 
     Args:
-        context_id: Unique context identifier
-        context: Strategy optimization context
-        results_queue: Multiprocessing queue
+        task_id: Unique task identifier
+        task: Strategy optimization context with shared market data
+
+    Returns:
+        OptimizationResult: Best parameters, their test fitness,
+                            stop reasons of the runs, fold window
+                            and fitness cache counters
     """
     
+    segments = []
+    markets = []
+
     try:
+        for shared_data in task.get('markets', [task['market_data']]):
+            market_data, market_segments = attach_market_data(shared_data)
+            markets.append(market_data)
+            segments.extend(market_segments)
+
+        context: StrategyContext = {
+            **task,
+            'market_data': markets[0],
+            'optimized_params': None,
+        }
+
+        if 'markets' in task:
+            context['markets'] = markets
+
         optimizer = StrategyOptimizer()
-        params = optimizer.optimize(context)
-        results_queue.put((context_id, params, None))
-    except Exception as e:
-        results_queue.put((context_id, None, f'{type(e).__name__}: {e}'))
\ No newline at end of file
+        params = optimizer.optimize(
+            context,
+            checkpoint_id=task_id,
+            on_progress=report_progress
+        )
+        return {
+            'window': optimizer.window,
+            'params': params,
+            'test_fitness': optimizer.best_test_fitness,
+            'stop_reasons': optimizer.stop_reasons,
+            'cache': optimizer.cache.stats(),
+        }
+    finally:
+        # Drop array views before closing the shared segments
+        context = market_data = markets = optimizer = None
+        detach_segments(segments)
@@ -0,0 +1,435 @@
+from __future__ import annotations
+from logging import getLogger
+from multiprocessing import Pipe, Process, Queue as MPQueue
+from multiprocessing.connection import Connection, wait
+from threading import Condition, Lock, RLock, Thread
+from time import monotonic
+from typing import Any, Callable
+
+
+logger = getLogger(__name__)
+
+_channel: Connection | None = None
+_channel_lock = Lock()
+_current_task_id: str | None = None
+
+
+class WorkerPool:
+    """
+    Long-lived pool of warm worker processes.
+
+    Workers are started once (on first use) and keep running between
+    tasks, so imports and loaded JIT kernels are reused. Each worker
+    owns a private inbox, which lets the pool dispatch a task to a
+    specific idle worker and cancel it by restarting that worker.
+    A supervisor thread respawns workers that die and reports
+    the task they were running as failed, until the pool is closed.
+
+    Tasks may stream progress with report_progress(). Every worker
+    sends its progress and results through a private pipe, so
+    a worker terminated mid-send can't corrupt or block the channels
+    of other workers.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        handler: Callable[[str, Any], Any],
+        on_result: Callable[[str, Any, str | None], None],
+        initializer: Callable[[], None] | None = None,
+        on_progress: Callable[[str, Any], None] | None = None
+    ) -> None:
+        """
+        Initialize the pool without starting any processes.
+
+        Args:
+            size: Number of worker processes
+            handler: Picklable function executed in workers
+                     as handler(task_id, task)
+            on_result: Callback invoked in the parent process
+                       as on_result(task_id, result, error)
+            initializer: Optional picklable function executed once
+                         in every worker after it starts
+            on_progress: Optional callback invoked in the parent
+                         process as on_progress(task_id, progress)
+                         for progress of running tasks
+        """
+
+        self._size = max(size, 1)
+        self._handler = handler
+        self._on_result = on_result
+        self._initializer = initializer
+        self._on_progress = on_progress
+
+        self._procs: list[Process | None] = [None] * self._size
+        self._inboxes: list[MPQueue | None] = [None] * self._size
+        self._channels: list[Connection | None] = [None] * self._size
+        self._retired: dict[Connection, int] = {}
+        self._idle: set[int] = set()
+
+        self._task_by_slot: dict[int, str] = {}
+        self._slot_by_task: dict[str, int] = {}
+        self._lock = RLock()
+        self._idle_changed = Condition(self._lock)
+
+        # Wake up service threads to pick up respawned workers
+        self._listener_wakeup = Pipe(duplex=False)
+        self._supervisor_wakeup = Pipe(duplex=False)
+        self._started = False
+        self._stopping = False
+
+    @property
+    def size(self) -> int:
+        """Return the number of worker processes."""
+
+        return self._size
+
+    def submit(self, task_id: str, task: Any) -> None:
+        """
+        Send a task to the next idle worker.
+
+        Blocks until a worker becomes idle. Starts the pool
+        on the first call.
+
+        Args:
+            task_id: Unique task identifier
+            task: Picklable task payload passed to the handler
+
+        Raises:
+            RuntimeError: If the pool is closed, also while waiting
+                          for an idle worker
+        """
+
+        self._ensure_started()
+
+        with self._idle_changed:
+            while not self._idle and not self._stopping:
+                self._idle_changed.wait()
+
+            if self._stopping:
+                raise RuntimeError('Worker pool is closed')
+
+            slot = self._idle.pop()
+            self._task_by_slot[slot] = task_id
+            self._slot_by_task[task_id] = slot
+            self._inboxes[slot].put((task_id, task))
+
+    def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a running task by restarting the worker executing it.
+
+        The result of a cancelled task is never reported.
+
+        Args:
+            task_id: Task identifier passed to submit()
+
+        Returns:
+            bool: True if the task was running, False otherwise
+        """
+
+        with self._lock:
+            slot = self._slot_by_task.pop(task_id, None)
+
+            if slot is None:
+                return False
+
+            self._task_by_slot.pop(slot, None)
+            proc = self._procs[slot]
+
+        if proc is not None and proc.is_alive():
+            try:
+                proc.terminate()
+            except Exception:
+                logger.exception(f'Failed to terminate worker for {task_id}')
+
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Stop the workers and the service threads of the pool.
+
+        Idle workers exit on a None sentinel; workers that are still
+        busy after the timeout are terminated. Results of running
+        tasks are not reported, and dead workers aren't respawned.
+
+        Args:
+            timeout: Seconds to wait for workers to exit
+        """
+
+        with self._lock:
+            if self._stopping:
+                return
+
+            self._stopping = True
+            self._idle_changed.notify_all()
+
+            procs = [proc for proc in self._procs if proc is not None]
+            inboxes = [inbox for inbox in self._inboxes if inbox]
+
+            if self._started:
+                self._listener_wakeup[1].send_bytes(b'\0')
+                self._supervisor_wakeup[1].send_bytes(b'\0')
+
+        for inbox in inboxes:
+            inbox.put(None)
+
+        deadline = monotonic() + timeout
+
+        for proc in procs:
+            proc.join(timeout=max(deadline - monotonic(), 0.0))
+
+        for proc in procs:
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=1.0)
+
+        for inbox in inboxes:
+            inbox.close()
+            inbox.join_thread()
+
+    def _ensure_started(self) -> None:
+        """Start worker processes and service threads once."""
+
+        with self._lock:
+            if self._stopping:
+                raise RuntimeError('Worker pool is closed')
+
+            if self._started:
+                return
+
+            for slot in range(self._size):
+                self._spawn(slot)
+
+            Thread(target=self._listen, daemon=True).start()
+            Thread(target=self._supervise, daemon=True).start()
+            self._started = True
+
+    def _spawn(self, slot: int) -> None:
+        """
+        Start a fresh worker process in the given slot
+        and mark the slot idle.
+
+        Does nothing once the pool is closing. Must be called
+        with the pool lock held.
+        """
+
+        if self._stopping:
+            return
+
+        inbox: MPQueue[tuple[str, Any] | None] = MPQueue()
+        reader, writer = Pipe(duplex=False)
+        proc = Process(
+            target=_worker_main,
+            args=(self._handler, self._initializer, inbox, writer),
+            daemon=True
+        )
+        proc.start()
+        writer.close()
+
+        # The pipe of the previous worker is closed once drained
+        if self._channels[slot] is not None:
+            self._retired[self._channels[slot]] = slot
+
+        self._procs[slot] = proc
+        self._inboxes[slot] = inbox
+        self._channels[slot] = reader
+
+        # A set, so a worker that died while idle isn't handed out twice
+        self._idle.add(slot)
+        self._idle_changed.notify()
+
+        if self._started:
+            self._listener_wakeup[1].send_bytes(b'\0')
+            self._supervisor_wakeup[1].send_bytes(b'\0')
+
+    def _listen(self) -> None:
+        """
+        Forward results and progress of workers, returning workers
+        that completed their task to the idle set.
+        """
+
+        wakeup_reader = self._listener_wakeup[0]
+
+        while not self._stopping:
+            with self._lock:
+                readers = {
+                    reader: slot
+                    for slot, reader in enumerate(self._channels)
+                    if reader is not None
+                }
+                readers.update(self._retired)
+
+            for reader in wait([*readers, wakeup_reader]):
+                if reader is wakeup_reader:
+                    wakeup_reader.recv_bytes()
+                    continue
+
+                slot = readers[reader]
+
+                try:
+                    kind, task_id, *payload = reader.recv()
+                except Exception:
+                    # Worker exited, its pipe is replaced on respawn
+                    with self._lock:
+                        if self._channels[slot] is reader:
+                            self._channels[slot] = None
+
+                        self._retired.pop(reader, None)
+
+                    reader.close()
+                    continue
+
+                if kind == 'progress':
+                    self._forward_progress(task_id, *payload)
+                    continue
+
+                with self._lock:
+                    if (
+                        self._stopping
+                        or self._task_by_slot.get(slot) != task_id
+                    ):
+                        # Closed pool, cancelled task
+                        # or task of a replaced worker
+                        continue
+
+                    self._task_by_slot.pop(slot)
+                    self._slot_by_task.pop(task_id, None)
+                    self._idle.add(slot)
+                    self._idle_changed.notify()
+
+                self._report(task_id, *payload)
+
+    def _forward_progress(self, task_id: str, progress: Any) -> None:
+        """Invoke the progress callback for a running task."""
+
+        with self._lock:
+            running = task_id in self._slot_by_task
+
+        if running and self._on_progress is not None:
+            try:
+                self._on_progress(task_id, progress)
+            except Exception:
+                logger.exception(f'Failed to handle progress for {task_id}')
+
+    def _supervise(self) -> None:
+        """Respawn dead workers and fail the tasks they were running."""
+
+        wakeup_reader = self._supervisor_wakeup[0]
+
+        while not self._stopping:
+            with self._lock:
+                sentinels = {
+                    proc.sentinel: slot
+                    for slot, proc in enumerate(self._procs)
+                    if proc is not None
+                }
+
+            ready = wait([*sentinels, wakeup_reader])
+
+            for handle in ready:
+                if handle is wakeup_reader:
+                    wakeup_reader.recv_bytes()
+                    continue
+
+                slot = sentinels[handle]
+
+                with self._lock:
+                    if self._stopping:
+                        # Workers exit on close, nothing to respawn
+                        return
+
+                    proc = self._procs[slot]
+                    proc.join(timeout=1.0)
+                    task_id = self._task_by_slot.pop(slot, None)
+
+                    if task_id is not None:
+                        self._slot_by_task.pop(task_id, None)
+
+                    self._spawn(slot)
+
+                if task_id is not None:
+                    self._report(
+                        task_id,
+                        None,
+                        f'Worker process exited with code {proc.exitcode}'
+                    )
+
+    def _report(self, task_id: str, result: Any, error: str | None) -> None:
+        """Invoke the result callback, logging its failures."""
+
+        try:
+            self._on_result(task_id, result, error)
+        except Exception:
+            logger.exception(f'Failed to handle result for {task_id}')
+
+
+def _worker_main(
+    handler: Callable[[str, Any], Any],
+    initializer: Callable[[], None] | None,
+    inbox: MPQueue[tuple[str, Any] | None],
+    channel: Connection
+) -> None:
+    """
+    Worker process loop: run tasks from the inbox until None arrives.
+
+    Args:
+        handler: Function executed for every task
+        initializer: Optional function executed once at startup
+        inbox: Private task queue of this worker
+        channel: Private pipe for results and progress of this worker
+    """
+
+    global _channel, _current_task_id
+    _channel = channel
+
+    if initializer is not None:
+        initializer()
+
+    while True:
+        message = inbox.get()
+
+        if message is None:
+            break
+
+        task_id, task = message
+        _current_task_id = task_id
+
+        try:
+            message = ('result', task_id, handler(task_id, task), None)
+        except Exception as e:
+            message = ('result', task_id, None, f'{type(e).__name__}: {e}')
+        finally:
+            _current_task_id = None
+
+        try:
+            _send(message)
+        except Exception as e:
+            # E.g. an unpicklable result, report it instead
+            _send(('result', task_id, None, f'{type(e).__name__}: {e}'))
+
+
+def _send(message: tuple) -> None:
+    """Send a message to the parent process through the worker pipe."""
+
+    with _channel_lock:
+        _channel.send(message)
+
+
+def report_progress(progress: Any) -> None:
+    """
+    Send progress of the running task to the parent process.
+
+    Does nothing outside of pool workers, so handlers can report
+    progress unconditionally.
+
+    Args:
+        progress: Picklable progress payload
+    """
+
+    if _channel is None or _current_task_id is None:
+        return
+
+    try:
+        _send(('progress', _current_task_id, progress))
+    except (BrokenPipeError, OSError):
+        pass
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class Population:
+    """
+    Array-backed population of encoded parameter sets.
+
+    Each individual is stored as a row of parameter value indices
+    (positions inside the opt_params lists) next to its fitness score.
+    Individuals with equal fitness coexist, culling is partition-based
+    and diversity is computed on the whole gene matrix at once.
+    """
+
+    def __init__(self, n_params: int, capacity: int = 256) -> None:
+        """
+        Initialize an empty population.
+
+        Args:
+            n_params: Number of optimized parameters (gene length)
+            capacity: Initial number of preallocated rows
+        """
+
+        self.fitness = np.empty(max(capacity, 1), dtype=np.float64)
+        self.genes = np.empty((max(capacity, 1), n_params), dtype=np.int64)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, fitness: float, genes: np.ndarray) -> None:
+        """
+        Append an individual, doubling the storage when it is full.
+
+        Args:
+            fitness: Fitness score of the individual
+            genes: Parameter value indices of the individual
+        """
+
+        if self.size == self.fitness.shape[0]:
+            self._grow()
+
+        self.fitness[self.size] = fitness
+        self.genes[self.size] = genes
+        self.size += 1
+
+    def cull(self, target_size: int) -> None:
+        """
+        Keep only the target_size fittest individuals.
+
+        NaN scores are treated as the worst possible fitness.
+
+        Args:
+            target_size: Number of individuals to keep
+        """
+
+        if self.size <= target_size:
+            return
+
+        if target_size <= 0:
+            self.size = 0
+            return
+
+        order = np.argpartition(-self.fitness[:self.size], target_size - 1)
+        keep = order[:target_size]
+
+        self.fitness[:target_size] = self.fitness[keep]
+        self.genes[:target_size] = self.genes[keep]
+        self.size = target_size
+
+    def clear(self) -> None:
+        """Remove all individuals while keeping the allocated storage."""
+
+        self.size = 0
+
+    def diversity(self) -> float:
+        """
+        Return the share of unique parameter sets in the population.
+
+        Returns:
+            float: Unique individuals divided by population size
+        """
+
+        if self.size == 0:
+            return 0.0
+
+        unique_count = np.unique(self.genes[:self.size], axis=0).shape[0]
+        return unique_count / self.size
+
+    def state(self) -> dict[str, np.ndarray]:
+        """Return copies of the fitness scores and genes in use."""
+
+        return {
+            'fitness': self.fitness[:self.size].copy(),
+            'genes': self.genes[:self.size].copy(),
+        }
+
+    def restore(self, state: dict[str, np.ndarray]) -> None:
+        """
+        Replace the individuals with a saved state.
+
+        Args:
+            state: Snapshot returned by state()
+        """
+
+        self.clear()
+
+        for fitness, genes in zip(state['fitness'], state['genes']):
+            self.add(float(fitness), genes)
+
+    def _grow(self) -> None:
+        """Double the capacity of the fitness and gene arrays."""
+
+        capacity = self.fitness.shape[0] * 2
+
+        fitness = np.empty(capacity, dtype=np.float64)
+        fitness[:self.size] = self.fitness[:self.size]
+
+        genes = np.empty((capacity, self.genes.shape[1]), dtype=np.int64)
+        genes[:self.size] = self.genes[:self.size]
+
+        self.fitness = fitness
+        self.genes = genes
@@ -1,21 +1,38 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 from os import cpu_count, getenv
 from queue import Queue, Empty
 from threading import Event, RLock, Thread
 from typing import TYPE_CHECKING
-from multiprocessing import Process, Queue as MPQueue
+
+from src.infrastructure.storage import checkpoint_store
 
 from .builder import OptimizationContextBuilder
+from .cache import FitnessCache
+from .distributed import Coordinator, parse_address
 from .models import ContextStatus
-from .optimizer import optimize_worker
+from .optimizer import CHECKPOINT_NAMESPACE, optimize_worker, warm_up_worker
+from .pool import WorkerPool
+from .shared_memory import SharedMemoryRegistry
 
 if TYPE_CHECKING:
-    from .models import ContextConfig, StrategyContext
+    from .models import (
+        CacheStats,
+        ContextConfig,
+        ContextProgress,
+        OptimizationProgress,
+        OptimizationResult,
+        SharedMarketData,
+        StrategyContext
+    )
 
 
 logger = getLogger(__name__)
 
+CONTEXT_NAMESPACE = 'optimization_contexts'
+"""Checkpoint store namespace of unfinished context configs."""
+
 
 class OptimizationService:
     """
@@ -23,7 +40,32 @@ class OptimizationService:
     
     Handles context creation, optimization execution via genetic algorithms,
     and result collection. Uses multi-threading for queue processing and 
-    multi-processing for CPU-intensive optimization tasks.
+    a persistent pool of warm worker processes for CPU-intensive
+    optimization tasks.
+
+    Walk-forward contexts are split into one task per fold. All folds
+    share the same published market data and run in parallel on the
+    pool; the context becomes READY once every fold has reported.
+
+    Multi-market contexts publish the market data of all of their
+    symbols; every fold task optimizes one parameter population
+    on all markets at once.
+
+    Configs of unfinished contexts are persisted until the context
+    becomes READY, FAILED or is deleted. After a restart they are
+    queued again, and their fold tasks continue from the latest
+    optimizer checkpoints instead of starting over.
+
+    Workers stream progress of running folds, which is aggregated
+    per context until the optimization finishes.
+
+    Contexts are built concurrently (up to MAX_CONTEXT_BUILDERS at
+    a time); contexts on the same dataset share one loaded copy
+    of the market data.
+
+    If COORDINATOR_ADDRESS is set, fold tasks are farmed out to
+    remote workers connected over TCP (see distributed.Coordinator)
+    instead of the local process pool.
     """
 
     def __init__(self) -> None:
@@ -31,6 +73,7 @@ class OptimizationService:
 
         self._contexts: dict[str, StrategyContext] = {}
         self._context_statuses: dict[str, ContextStatus] = {}
+        self._context_stats: dict[str, CacheStats] = {}
 
         self._contexts_lock = RLock()
         self._statuses_lock = RLock()
@@ -42,19 +85,56 @@ class OptimizationService:
 
         self._config_event = Event()
         self._opt_event = Event()
-        self._proc_event = Event()
-
-        self._mp_results_queue: MPQueue[
-            tuple[str, list[dict] | None, str | None]
-        ] = MPQueue()
-        self._active_procs: dict[str, Process] = {}
+        self._stop_event = Event()
         self._active_lock = RLock()
 
+        self._shared_memory = SharedMemoryRegistry()
+        self._shared_data: dict[str, list[SharedMarketData]] = {}
+        self._fold_results: dict[
+            str, list[OptimizationResult | None]
+        ] = {}
+        self._fold_progress: dict[
+            str, list[OptimizationProgress | None]
+        ] = {}
+
         max_processes_env = getenv('MAX_PROCESSES')
         if max_processes_env and max_processes_env.strip():
             self._max_processes = int(max_processes_env)
         else:
-            self._max_processes = cpu_count()
+            self._max_processes = cpu_count() or 1
+
+        max_builders_env = getenv('MAX_CONTEXT_BUILDERS')
+        if max_builders_env and max_builders_env.strip():
+            self._max_builders = int(max_builders_env)
+        else:
+            self._max_builders = 4
+
+        self._builder_executor = ThreadPoolExecutor(
+            max_workers=max(self._max_builders, 1)
+        )
+
+        coordinator_address = getenv('COORDINATOR_ADDRESS')
+        if coordinator_address and coordinator_address.strip():
+            host, port = parse_address(coordinator_address)
+            self._worker_pool = Coordinator(
+                host=host,
+                port=port,
+                on_result=self._handle_result,
+                on_progress=self._handle_progress,
+                token=getenv('COORDINATOR_TOKEN', '')
+            )
+            logger.info(
+                f'Waiting for remote optimization workers '
+                f'on {host}:{port}'
+            )
+        else:
+            self._worker_pool = WorkerPool(
+                size=self._max_processes,
+                handler=optimize_worker,
+                on_result=self._handle_result,
+                initializer=warm_up_worker,
+                on_progress=self._handle_progress
+            )
 
         self._config_thread = Thread(
             target=self._run_monitor_config_queue,
@@ -68,11 +148,7 @@ class OptimizationService:
         )
         self._opt_thread.start()
 
-        self._results_thread = Thread(
-            target=self._listen_results,
-            daemon=True
-        )
-        self._results_thread.start()
+        self._resume_contexts()
     
     @property
     def contexts(self) -> dict[str, StrategyContext]:
@@ -92,7 +168,8 @@ class OptimizationService:
         """
         Add new strategy contexts to the processing queue.
 
-        - Skips contexts that already exist in contexts or statuses.
+        - Skips contexts that already exist in contexts or statuses,
+          except contexts whose creation failed, which are retried.
         - Marks accepted contexts as QUEUED.
         - Returns identifiers of successfully queued contexts.
 
@@ -110,13 +187,19 @@ class OptimizationService:
         added: list[str] = []
         for context_id, config in configs.items():
             with self._contexts_lock, self._statuses_lock:
-                if context_id in self._contexts:
+                status = self._context_statuses.get(context_id)
+
+                if context_id in self._contexts or (
+                    status is not None and status != ContextStatus.FAILED
+                ):
                     continue
 
                 self._context_statuses[context_id] = ContextStatus.QUEUED
                 self._config_queue.put((context_id, config))
                 added.append(context_id)
 
+            checkpoint_store.save(CONTEXT_NAMESPACE, context_id, config)
+
         if added:
             self._config_event.set()
 
@@ -144,7 +227,12 @@ class OptimizationService:
     
     def delete_context(self, context_id: str) -> None:
         """
-        Delete a strategy context and terminate associated processes.
+        Delete a strategy context, cancel its running optimization
+        and release its shared market data.
+
+        Optimizer checkpoints of the context are kept until the next
+        restart, so adding the same context again resumes its
+        optimization.
         
         Args:
             context_id: Unique context identifier
@@ -160,22 +248,16 @@ class OptimizationService:
 
         try:
             with self._contexts_lock:
-                del self._contexts[context_id]
+                context = self._contexts.pop(context_id)
 
             with self._statuses_lock:
                 self._context_statuses.pop(context_id, None)
+                self._context_stats.pop(context_id, None)
 
-            with self._active_lock:
-                proc = self._active_procs.pop(context_id, None)
-            
-            if proc is not None and proc.is_alive():
-                try:
-                    proc.terminate()
-                    proc.join(timeout=1.0)
-                except Exception:
-                    logger.exception(
-                        f'Failed to terminate process for {context_id}', 
-                    )
+            checkpoint_store.delete(CONTEXT_NAMESPACE, context_id)
+            self._cancel_folds(context_id)
+            self._release_shared_data(context_id)
+            self._context_builder.release(context)
         except Exception as e:
             logger.error(
                 f'Failed to delete context {context_id}: '
@@ -204,11 +286,147 @@ class OptimizationService:
                 raise KeyError(f'Context status for {context_id} not found')
             
             return status
+
+    def get_context_stats(self, context_id: str) -> CacheStats | None:
+        """
+        Get fitness cache counters for a specific strategy context.
+
+        Args:
+            context_id: Unique context identifier
+
+        Returns:
+            CacheStats | None:
+                Cache counters, or None if optimization hasn't finished
+
+        Raises:
+            KeyError: If the context status doesn't exist
+        """
+
+        with self._statuses_lock:
+            if context_id not in self._context_statuses:
+                raise KeyError(f'Context status for {context_id} not found')
+
+            return self._context_stats.get(context_id)
     
+    def get_context_progress(
+        self,
+        context_id: str
+    ) -> ContextProgress | None:
+        """
+        Get live progress of a running optimization.
+
+        Completion is the share of finished evaluations over all runs
+        of all folds, throughput and evaluation counts are summed over
+        folds, the cache hit rate is averaged over reporting folds.
+
+        Args:
+            context_id: Unique context identifier
+
+        Returns:
+            ContextProgress | None:
+                Aggregated progress, or None if no fold is running
+
+        Raises:
+            KeyError: If the context status doesn't exist
+        """
+
+        with self._statuses_lock:
+            if context_id not in self._context_statuses:
+                raise KeyError(f'Context status for {context_id} not found')
+
+        with self._active_lock:
+            folds = self._fold_progress.get(context_id)
+
+            if folds is None:
+                return None
+
+            folds = list(folds)
+
+        reported = [item for item in folds if item is not None]
+
+        if not reported:
+            return None
+
+        best = [
+            item['best_train_fitness'] for item in reported
+            if item['best_train_fitness'] is not None
+        ]
+        completion = sum(
+            (
+                (item['run'] - 1) * item['iterations'] + item['iteration']
+            ) / max(item['runs'] * item['iterations'], 1)
+            for item in reported
+        ) / len(folds)
+
+        return {
+            'completion': min(completion, 1.0),
+            'evaluations': sum(item['evaluations'] for item in reported),
+            'evaluations_per_sec': sum(
+                item['evaluations_per_sec'] for item in reported
+            ),
+            'cache_hit_rate': sum(
+                item['cache_hit_rate'] for item in reported
+            ) / len(reported),
+            'best_train_fitness': max(best) if best else None,
+            'folds': folds,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stop the service threads, workers and context builders.
+
+        Running optimizations are dropped and their shared memory
+        is released. Configs of unfinished contexts stay persisted,
+        so they are resumed by the next service instance.
+        """
+
+        self._stop_event.set()
+        self._config_event.set()
+        self._opt_event.set()
+
+        # Closing the pool unblocks a fold waiting for a worker
+        self._worker_pool.close()
+        self._config_thread.join(timeout=5.0)
+        self._opt_thread.join(timeout=5.0)
+        self._builder_executor.shutdown(cancel_futures=True)
+
+        with self._active_lock:
+            context_ids = list(self._shared_data)
+            self._fold_results.clear()
+            self._fold_progress.clear()
+
+        for context_id in context_ids:
+            self._release_shared_data(context_id)
+
+    def _resume_contexts(self) -> None:
+        """
+        Queue contexts left unfinished by a previous run of the service
+        and drop optimizer checkpoints that no context can resume.
+        """
+
+        configs: dict[str, ContextConfig] = {}
+        for context_id in checkpoint_store.keys(CONTEXT_NAMESPACE):
+            config = checkpoint_store.load(CONTEXT_NAMESPACE, context_id)
+
+            if config is not None:
+                configs[context_id] = config
+
+        for task_id in checkpoint_store.keys(CHECKPOINT_NAMESPACE):
+            if task_id.rsplit('/', 1)[0] not in configs:
+                checkpoint_store.delete(CHECKPOINT_NAMESPACE, task_id)
+
+        if configs:
+            logger.info(f'Resuming {len(configs)} optimization contexts')
+            self.add_contexts(configs)
+
     def _run_monitor_config_queue(self) -> None:
-        while True:
+        while not self._stop_event.is_set():
             if self._config_queue.empty():
                 self._config_event.clear()
+
+                if self._stop_event.is_set():
+                    break
+
                 self._config_event.wait()
 
             try:
@@ -217,22 +435,36 @@ class OptimizationService:
                 continue
 
             self._set_status(context_id, ContextStatus.CREATING)
+            self._builder_executor.submit(
+                self._create_context, context_id, config
+            )
 
-            try:
-                context = self._context_builder.create(config)
-                with self._contexts_lock:
-                    self._contexts[context_id] = context
+    def _create_context(
+        self,
+        context_id: str,
+        config: ContextConfig
+    ) -> None:
+        """Build a context and queue it for optimization."""
 
-                self._optimization_queue.put((context_id, context))
-                self._opt_event.set()
-            except Exception:
-                self._set_status(context_id, ContextStatus.FAILED)
-                logger.exception(f'Failed to create context {context_id}')
+        try:
+            context = self._context_builder.create(config)
+            with self._contexts_lock:
+                self._contexts[context_id] = context
+
+            self._optimization_queue.put((context_id, context))
+            self._opt_event.set()
+        except Exception:
+            self._set_status(context_id, ContextStatus.FAILED)
+            logger.exception(f'Failed to create context {context_id}')
 
     def _run_monitor_optimization_queue(self) -> None:
-        while True:
+        while not self._stop_event.is_set():
             if self._optimization_queue.empty():
                 self._opt_event.clear()
+
+                if self._stop_event.is_set():
+                    break
+
                 self._opt_event.wait()
 
             try:
@@ -242,63 +474,200 @@ class OptimizationService:
             except Empty:
                 continue
 
-            while True:
-                with self._active_lock:
-                    active_count = len(self._active_procs)
-                
-                if active_count < self._max_processes:
-                    break
-
-                self._proc_event.clear()
-                self._proc_event.wait(timeout=1.0)
-
-            proc = Process(
-                target=optimize_worker,
-                args=(context_id, context, self._mp_results_queue),
-                daemon=True
-            )
-            proc.start()
+            with self._contexts_lock:
+                if context_id not in self._contexts:
+                    continue
 
-            with self._active_lock:
-                self._active_procs[context_id] = proc
+            markets = context.get('markets', [context['market_data']])
+            shared_data: list[SharedMarketData] = []
 
-    def _listen_results(self) -> None:
-        while True:
             try:
-                context_id, params, error = self._mp_results_queue.get()
+                for market_data in markets:
+                    shared_data.append(
+                        self._shared_memory.publish_market_data(market_data)
+                    )
             except Exception:
+                for shared in shared_data:
+                    self._shared_memory.release_market_data(shared)
+
+                self._set_status(context_id, ContextStatus.FAILED)
+                logger.exception(
+                    f'Failed to share market data for {context_id}'
+                )
                 continue
 
-            with self._contexts_lock:
-                if context_id not in self._contexts:
-                    context = None
-                else:
-                    context = self._contexts[context_id]
-                    if params is not None:
-                        context['optimized_params'] = params
-
-            if context is not None:
-                if error is None:
-                    self._set_status(context_id, ContextStatus.READY)
-                else:
-                    self._set_status(context_id, ContextStatus.FAILED)
-                    logger.error(
-                        f'Optimization failed for {context_id}: {error}'
-                    )
+            folds = context.get('folds', 1)
 
             with self._active_lock:
-                proc = self._active_procs.pop(context_id, None)
+                self._shared_data[context_id] = shared_data
+                self._fold_results[context_id] = [None] * folds
+                self._fold_progress[context_id] = [None] * folds
+
+            for fold in range(folds):
+                # Blocks until a local pool worker is idle
+                # (the remote coordinator queues tasks instead)
+                task = {
+                    **context,
+                    'market_data': shared_data[0],
+                    'fold': fold,
+                }
+
+                if 'markets' in context:
+                    task['markets'] = shared_data
+
+                task_id = _fold_task_id(context_id, fold)
 
-            if proc is not None:
                 try:
-                    proc.join(timeout=1.0)
-                except Exception:
-                    logger.exception(f'Join failed for {context_id}')
+                    self._worker_pool.submit(task_id, task)
+                except RuntimeError:
+                    # The service was shut down while waiting
+                    # for a worker
+                    return
+
+                # The context may have been deleted or failed
+                # while waiting for a worker
+                with self._active_lock:
+                    cancelled = context_id not in self._fold_results
+
+                if cancelled:
+                    self._worker_pool.cancel(task_id)
+                    break
+
+    def _handle_result(
+        self,
+        task_id: str,
+        result: OptimizationResult | None,
+        error: str | None
+    ) -> None:
+        """
+        Store fold results reported by the worker pool and finalize
+        the context once all of its folds have finished.
+        """
+
+        context_id, fold = task_id.rsplit('/', 1)
+
+        with self._active_lock:
+            results = self._fold_results.get(context_id)
+
+            if results is None:
+                return
+
+            if error is None:
+                results[int(fold)] = result
+
+                if any(item is None for item in results):
+                    return
+
+            del self._fold_results[context_id]
+            self._fold_progress.pop(context_id, None)
+
+        if error is not None:
+            self._cancel_folds(context_id, results)
+
+            with self._contexts_lock:
+                exists = context_id in self._contexts
+
+            if exists:
+                self._set_status(context_id, ContextStatus.FAILED)
+                logger.error(f'Optimization failed for {task_id}: {error}')
+        else:
+            self._store_results(context_id, results)
+
+        self._release_shared_data(context_id)
+
+    def _handle_progress(
+        self,
+        task_id: str,
+        progress: OptimizationProgress
+    ) -> None:
+        """Record the latest progress of a running fold."""
+
+        context_id, fold = task_id.rsplit('/', 1)
+
+        with self._active_lock:
+            folds = self._fold_progress.get(context_id)
 
-            self._proc_event.set()
+            if folds is not None:
+                folds[int(fold)] = progress
+
+    def _store_results(
+        self,
+        context_id: str,
+        results: list[OptimizationResult]
+    ) -> None:
+        """Aggregate fold results into the context and mark it READY."""
+
+        with self._contexts_lock:
+            context = self._contexts.get(context_id)
+
+            if context is None:
+                return
+
+            context['optimized_params'] = [
+                params for result in results for params in result['params']
+            ]
+            context['stop_reasons'] = [
+                reason
+                for result in results
+                for reason in result['stop_reasons']
+            ]
+
+            if len(results) > 1:
+                context['fold_results'] = [
+                    {
+                        'window': result['window'],
+                        'params': result['params'],
+                        'test_fitness': result['test_fitness'],
+                        'stop_reasons': result['stop_reasons'],
+                    }
+                    for result in results
+                ]
+
+        with self._statuses_lock:
+            self._context_stats[context_id] = FitnessCache.merge_stats(
+                [result['cache'] for result in results]
+            )
+
+        self._set_status(context_id, ContextStatus.READY)
+
+    def _cancel_folds(
+        self,
+        context_id: str,
+        results: list[OptimizationResult | None] | None = None
+    ) -> None:
+        """Cancel unfinished fold tasks of a context."""
+
+        with self._active_lock:
+            self._fold_progress.pop(context_id, None)
+
+            if results is None:
+                results = self._fold_results.pop(context_id, None)
+
+        for fold, result in enumerate(results or []):
+            if result is None:
+                self._worker_pool.cancel(_fold_task_id(context_id, fold))
+
+    def _release_shared_data(self, context_id: str) -> None:
+        """Release shared memory segments published for a context."""
+
+        with self._active_lock:
+            shared_data = self._shared_data.pop(context_id, [])
+
+        for shared in shared_data:
+            self._shared_memory.release_market_data(shared)
 
     def _set_status(self, context_id: str, status: ContextStatus) -> None:
         """Update context status."""
 
         with self._statuses_lock:
-            self._context_statuses[context_id] = status
\ No newline at end of file
+            self._context_statuses[context_id] = status
+
+        # Finished contexts are not resumed after a restart
+        if status in (ContextStatus.READY, ContextStatus.FAILED):
+            checkpoint_store.delete(CONTEXT_NAMESPACE, context_id)
+
+
+def _fold_task_id(context_id: str, fold: int) -> str:
+    """Build the worker pool task identifier of a context fold."""
+
+    return f'{context_id}/{fold}'
@@ -0,0 +1,235 @@
+from __future__ import annotations
+from logging import getLogger
+from mmap import ACCESS_COPY, mmap
+from multiprocessing.shared_memory import SharedMemory
+from os import name as os_name
+from threading import RLock
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.core.providers import MarketData
+    from .models import SharedArray, SharedMarketData
+
+
+logger = getLogger(__name__)
+
+
+class SharedMemoryRegistry:
+    """
+    Reference-counted registry of market data arrays
+    published to shared memory.
+
+    Every array is copied into a shared memory segment once,
+    no matter how many contexts publish it. Worker processes attach
+    zero-copy views by segment name. A segment is unlinked when
+    the last context holding it releases it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+
+        self._segments: dict[str, SharedMemory] = {}
+        self._refcounts: dict[str, int] = {}
+        self._names_by_array: dict[int, str] = {}
+        self._arrays: dict[str, np.ndarray] = {}
+        self._lock = RLock()
+
+    def publish_market_data(
+        self,
+        market_data: MarketData
+    ) -> SharedMarketData:
+        """
+        Publish klines and feed arrays of a market data package.
+
+        Args:
+            market_data: Market data package
+
+        Returns:
+            SharedMarketData:
+                Market data package with arrays replaced by segment handles
+        """
+
+        feeds = market_data.get('feeds') or {}
+        shared_feeds = {
+            'klines': {
+                feed_name: self.publish(feed_data)
+                for feed_name, feed_data in feeds.get('klines', {}).items()
+            }
+        }
+
+        return {
+            **market_data,
+            'klines': self.publish(market_data['klines']),
+            'feeds': shared_feeds if feeds else {},
+        }
+
+    def release_market_data(self, shared_data: SharedMarketData) -> None:
+        """
+        Release all segments referenced by a shared market data package.
+
+        Args:
+            shared_data: Package returned by publish_market_data()
+        """
+
+        self.release(shared_data['klines'])
+
+        if shared_data['feeds']:
+            for handle in shared_data['feeds']['klines'].values():
+                self.release(handle)
+
+    def publish(self, array: np.ndarray) -> SharedArray:
+        """
+        Copy an array into shared memory or reuse its existing segment.
+
+        Args:
+            array: Array to publish
+
+        Returns:
+            SharedArray: Handle describing the shared segment
+        """
+
+        with self._lock:
+            name = self._names_by_array.get(id(array))
+
+            if name is None:
+                segment = SharedMemory(create=True, size=max(array.nbytes, 1))
+                view = np.ndarray(
+                    array.shape, dtype=array.dtype, buffer=segment.buf
+                )
+                view[...] = array
+                del view
+
+                name = segment.name
+                self._segments[name] = segment
+                self._refcounts[name] = 0
+                self._names_by_array[id(array)] = name
+                self._arrays[name] = array
+
+            self._refcounts[name] += 1
+
+            return {
+                'name': name,
+                'shape': array.shape,
+                'dtype': array.dtype.str,
+            }
+
+    def release(self, handle: SharedArray) -> None:
+        """
+        Drop one reference to a segment and unlink it when unused.
+
+        Args:
+            handle: Handle returned by publish()
+        """
+
+        with self._lock:
+            name = handle['name']
+
+            if name not in self._refcounts:
+                return
+
+            self._refcounts[name] -= 1
+
+            if self._refcounts[name] > 0:
+                return
+
+            segment = self._segments.pop(name)
+            array = self._arrays.pop(name)
+            self._names_by_array.pop(id(array), None)
+            del self._refcounts[name]
+
+        try:
+            segment.close()
+            segment.unlink()
+        except Exception:
+            logger.exception(f'Failed to unlink shared segment {name}')
+
+
+def attach_market_data(
+    shared_data: SharedMarketData
+) -> tuple[MarketData, list[mmap]]:
+    """
+    Build a market data package from views of shared memory segments.
+
+    Segments are mapped copy-on-write: the views are writeable
+    (so they pass to compiled kernels unchanged), but a write only
+    ever touches a private copy of the page, never the segment
+    other processes read. The returned maps must stay referenced
+    while the arrays are in use and be passed to detach_segments()
+    afterwards.
+
+    Args:
+        shared_data: Package produced by SharedMemoryRegistry
+
+    Returns:
+        tuple: (market_data, segments) where market_data arrays
+               are zero-copy views into the mapped segments
+    """
+
+    segments: list[mmap] = []
+
+    def attach(handle: SharedArray) -> np.ndarray:
+        segment = SharedMemory(name=handle['name'], track=False)
+
+        try:
+            buffer = _map_private(segment)
+        finally:
+            segment.close()
+
+        segments.append(buffer)
+        dtype = np.dtype(handle['dtype'])
+        count = int(np.prod(handle['shape']))
+
+        # frombuffer() holds the map's buffer,
+        # so it can't be closed under live views
+        return np.frombuffer(buffer, dtype=dtype, count=count).reshape(
+            handle['shape']
+        )
+
+    feeds = {}
+    if shared_data['feeds']:
+        feeds = {
+            'klines': {
+                feed_name: attach(handle)
+                for feed_name, handle in (
+                    shared_data['feeds']['klines'].items()
+                )
+            }
+        }
+
+    market_data = {
+        **shared_data,
+        'klines': attach(shared_data['klines']),
+        'feeds': feeds,
+    }
+    return market_data, segments
+
+
+def detach_segments(segments: list[mmap]) -> None:
+    """
+    Close mapped segments without unlinking them.
+
+    Maps whose buffers are still exported by live arrays
+    are left open and get closed when the process exits.
+
+    Args:
+        segments: Maps returned by attach_market_data()
+    """
+
+    for segment in segments:
+        try:
+            segment.close()
+        except BufferError:
+            pass
+
+
+def _map_private(segment: SharedMemory) -> mmap:
+    """Map an open segment copy-on-write."""
+
+    if os_name == 'nt':
+        return mmap(
+            -1, segment.size, tagname=segment.name, access=ACCESS_COPY
+        )
+
+    return mmap(segment._fd, segment.size, access=ACCESS_COPY)
@@ -41,6 +41,69 @@ def create_train_test_windows(
     }
 
 
+def create_walk_forward_windows(
+    market_data: MarketData,
+    config: OptimizationConfig,
+    folds: int,
+    anchored: bool = False
+) -> list[dict[str, int]]:
+    """
+    Create indices for walk-forward train and test datasets.
+
+    Test windows of all folds are consecutive and of equal size,
+    train windows keep the configured train/test ratio.
+    Rolling folds slide the train window along with the test window,
+    anchored folds extend it from the start of the data.
+    A single fold is the plain train/test split.
+
+    Args:
+        market_data: Market data package
+        config: Configuration for optimization
+        folds: Number of folds
+        anchored: Whether train windows start at the first kline
+
+    Returns:
+        list[dict[str, int]]:
+            Index boundaries for train and test sets of every fold
+
+    Raises:
+        ValueError: If there is not enough data for the folds
+    """
+
+    if folds < 1:
+        raise ValueError(f'Invalid number of folds: {folds}')
+
+    if folds == 1:
+        return [create_train_test_windows(market_data, config)]
+
+    total_klines = len(market_data['klines'])
+    span = min(
+        int(total_klines * (config.train_window + config.test_window)),
+        total_klines
+    )
+
+    test_size = int(
+        span * config.test_window
+        / (config.train_window + folds * config.test_window)
+    )
+    train_size = int(test_size * config.train_window / config.test_window)
+
+    if test_size <= 0 or train_size <= 0:
+        raise ValueError(f'Not enough klines for {folds} folds')
+
+    windows: list[dict[str, int]] = []
+    for fold in range(folds):
+        test_start = train_size + fold * test_size
+        windows.append({
+            'train_start': 0 if anchored else fold * test_size,
+            'train_end': test_start,
+            'test_start': test_start,
+            'test_end': test_start + test_size
+        })
+
+    return windows
+
+
 def create_window_data(
     market_data: MarketData,
     window: dict[str, int],
@@ -80,6 +143,30 @@ def create_window_data(
     return window_data
 
 
+def max_drawdown(deals_log: np.ndarray, initial_capital: float) -> float:
+    """
+    Calculate the maximum drawdown of closed-deal equity.
+
+    Args:
+        deals_log: Completed deals log (P&L in column 8)
+        initial_capital: Starting capital (USDT)
+
+    Returns:
+        float: Maximum drawdown from peak equity (%)
+    """
+
+    if deals_log.shape[0] == 0:
+        return 0.0
+
+    # Accumulate in deal order, exactly like equity in strategy loops
+    equity = np.cumsum(np.concatenate(([initial_capital], deals_log[:, 8])))
+    equity = equity[1:]
+    peak = np.maximum(np.maximum.accumulate(equity), initial_capital)
+    peak = np.where(peak > 0, peak, np.nan)
+    drawdown = (peak - equity) / peak * 100
+    return float(np.nanmax(drawdown, initial=0.0))
+
+
 def latin_hypercube_sampling(
     param_space: OptParamDict,
     n_samples: int
@@ -1,11 +1,14 @@
 from __future__ import annotations
+from asyncio import gather
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from logging import getLogger
+from threading import Lock
 from time import time
 from typing import TYPE_CHECKING
 
 from src.infrastructure.exchanges.models import Interval
+from src.infrastructure.transport import AsyncHttpClient, RateLimiter
 from .base import BaseBinanceClient
 
 if TYPE_CHECKING:
@@ -48,6 +51,9 @@ class MarketClient(BaseBinanceClient):
         Interval.DAY_1: 86400000,
     }
     _MAX_WORKERS = 30
+    POOL_SIZE = _MAX_WORKERS
+    _async_http: AsyncHttpClient | None = None
+    _async_http_lock = Lock()
 
     def __init__(self, account: AccountClient) -> None:
         """Initialize market client with base client functionality."""
@@ -110,6 +116,66 @@ class MarketClient(BaseBinanceClient):
             )
             raise
 
+    async def get_historical_klines_async(
+        self,
+        symbol: str,
+        interval: Interval,
+        start: int,
+        end: int
+    ) -> list:
+        try:
+            interval_ms = self.get_interval_duration(interval)
+            step = interval_ms * 1000
+
+            time_ranges = [
+                (start, min(start + step - interval_ms, end))
+                for start in range(start, end, step)
+            ]
+            return await self._fetch_concurrently_async(
+                symbol, interval, time_ranges
+            )
+        except Exception as e:
+            logger.error(
+                f'Failed to request data | Binance | {symbol} | '
+                f'{interval.value} | {type(e).__name__} - {e}'
+            )
+            raise
+
+    async def get_last_klines_async(
+        self,
+        symbol: str,
+        interval: Interval,
+        limit: int = 1000
+    ) -> list:
+        try:
+            if limit <= 1000:
+                return await self._get_klines_async(
+                    symbol=symbol,
+                    interval=interval,
+                    limit=limit
+                )
+
+            interval_ms = self.get_interval_duration(interval)
+            end = int(time() * 1000)
+            end = end - (end % interval_ms)
+            start = end - interval_ms * limit
+            step = interval_ms * 1000
+
+            time_ranges = [
+                (start, min(start + step - interval_ms, end))
+                for start in range(start, end, step)
+            ]
+            klines = await self._fetch_concurrently_async(
+                symbol, interval, time_ranges
+            )
+            return klines[-limit:]
+        except Exception as e:
+            logger.error(
+                f'Failed to request data | Binance | {symbol} | '
+                f'{interval.value} | {type(e).__name__} - {e}'
+            )
+            raise
+
     @lru_cache
     def get_price_precision(self, symbol: str) -> float:
         try:
@@ -225,6 +291,131 @@ class MarketClient(BaseBinanceClient):
 
         return self.get(url, params, logging=False)
 
+    @classmethod
+    def _get_async_http(cls) -> AsyncHttpClient:
+        """
+        Get the asyncio HTTP client shared by all market clients.
+
+        The client and its rate limiter are created on first use,
+        so importing the module opens nothing.
+
+        Returns:
+            AsyncHttpClient: Shared client of the exchange
+        """
+
+        with cls._async_http_lock:
+            if cls._async_http is None:
+                cls._async_http = AsyncHttpClient(
+                    pool_size=cls._MAX_WORKERS,
+                    rate_limiter=RateLimiter(capacity=2400, period=60.0),
+                    weight_header='X-MBX-USED-WEIGHT-1M'
+                )
+
+            return cls._async_http
+
+    async def _fetch_concurrently_async(
+        self,
+        symbol: str,
+        interval: Interval,
+        time_ranges: list[tuple[int, int]]
+    ) -> list:
+        """
+        Internal method to fetch data concurrently on the event loop.
+
+        All ranges share one pooled session. Concurrency is bounded
+        by the connection pool and throttled by the rate limiter.
+        
+        Args:
+            symbol: Trading symbol (e.g., BTCUSDT)
+            interval: Kline interval from Interval enum
+            time_ranges: List of (start, end) tuples in milliseconds
+            
+        Returns:
+            list: Combined results from all concurrent requests
+        """
+
+        async with self._get_async_http().connect():
+            klines_grouped_by_range = await gather(*(
+                self._get_klines_async(
+                    symbol=symbol,
+                    interval=interval,
+                    start=time_range[0],
+                    end=time_range[1]
+                )
+                for time_range in time_ranges
+            ))
+
+        return [
+            kline
+            for kline_group in klines_grouped_by_range
+            for kline in kline_group
+        ]
+
+    async def _get_klines_async(
+        self,
+        symbol: str,
+        interval: Interval,
+        start: int = None,
+        end: int = None,
+        limit: int = 1000
+    ) -> list:
+        """
+        Internal async counterpart of _get_klines.
+        
+        Args:
+            symbol: Trading symbol (e.g., BTCUSDT)
+            interval: Kline interval from Interval enum
+            start: Start time in milliseconds
+            end: End time in milliseconds
+            limit: Maximum number of klines (default: 1000)
+            
+        Returns:
+            list: Raw kline data from API
+        """
+
+        url = f'{self.BASE_ENDPOINT}/fapi/v1/klines'
+        params = {
+            'symbol': symbol,
+            'interval': self.get_valid_interval(interval),
+            'limit': limit
+        }
+
+        if start:
+            params['startTime'] = start
+
+        if end:
+            params['endTime'] = end
+
+        return await self._get_async_http().get(
+            url,
+            params,
+            weight=self._get_klines_weight(limit),
+            logging=False
+        )
+
+    @staticmethod
+    def _get_klines_weight(limit: int) -> int:
+        """
+        Get request weight of the klines endpoint for a limit.
+
+        Args:
+            limit: Maximum number of klines
+
+        Returns:
+            int: Request weight in Binance units
+        """
+
+        if limit < 100:
+            return 1
+
+        if limit < 500:
+            return 2
+
+        if limit <= 1000:
+            return 5
+
+        return 10
+
     def _get_symbol_info(self, symbol: str) -> dict:
         """
         Get symbol information from exchange info.
@@ -55,6 +55,57 @@ class MarketClientInterface(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_historical_klines_async(
+        self,
+        symbol: str,
+        interval: Interval,
+        start: int,
+        end: int
+    ) -> list:
+        """
+        Retrieve historical kline data for specified time range
+        on the running event loop.
+        
+        Same chunking as get_historical_klines, but chunks are requested
+        as coroutines over one pooled session with bounded concurrency
+        and exchange rate limiting instead of a thread per request.
+        
+        Args:
+            symbol: Trading symbol (e.g., BTCUSDT)
+            interval: Kline interval from Interval enum
+            start: Start time in milliseconds
+            end: End time in milliseconds
+            
+        Returns:
+            list: Historical kline data with OHLCV information
+        """
+        pass
+
+    @abstractmethod
+    async def get_last_klines_async(
+        self,
+        symbol: str,
+        interval: Interval,
+        limit: int = 1000
+    ) -> list:
+        """
+        Retrieve recent kline data for specified symbol
+        on the running event loop.
+        
+        Async counterpart of get_last_klines; limits > 1000 are
+        chunked as in get_historical_klines_async.
+        
+        Args:
+            symbol: Trading symbol (e.g., BTCUSDT)
+            interval: Kline interval from Interval enum
+            limit: Number of klines to retrieve (default: 1000)
+            
+        Returns:
+            list: Recent kline data with OHLCV information
+        """
+        pass
+
     @abstractmethod
     def get_price_precision(self, symbol: str) -> float:
         """
@@ -1,4 +1,8 @@
+from .checkpoint_store import CheckpointStore
 from .db_manager import DBManager
+from .kline_store import KlineStore
 
 
-db_manager = DBManager()
\ No newline at end of file
+checkpoint_store = CheckpointStore()
+db_manager = DBManager()
+kline_store = KlineStore()
\ No newline at end of file
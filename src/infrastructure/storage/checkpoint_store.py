@@ -0,0 +1,134 @@
+from __future__ import annotations
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from logging import getLogger
+from os import listdir, makedirs, remove, replace
+from os.path import dirname, exists, join
+from pickle import HIGHEST_PROTOCOL, dump, load
+from threading import RLock
+from typing import Any
+
+
+logger = getLogger(__name__)
+
+
+class CheckpointStore():
+    """
+    File storage for pickled state snapshots.
+
+    Every snapshot is a single file inside a namespace directory,
+    its key is encoded into the file name, so arbitrary identifiers
+    (e.g. 'context/fold') are safe to use. Snapshots are written
+    next to the target and atomically swapped in, so a process
+    killed while saving leaves the previous snapshot intact.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the store rooted at the databases directory."""
+
+        self._root = join(dirname(__file__), 'databases', 'checkpoints')
+        self._lock = RLock()
+
+    def save(self, namespace: str, key: str, state: Any) -> None:
+        """
+        Save a snapshot, replacing the previous one.
+
+        Args:
+            namespace: Name of the snapshot group
+            key: Snapshot identifier inside the namespace
+            state: Picklable state
+        """
+
+        path = self._path(namespace, key)
+        tmp_path = f'{path}.tmp'
+
+        with self._lock:
+            makedirs(dirname(path), exist_ok=True)
+
+            try:
+                with open(tmp_path, 'wb') as file:
+                    dump(state, file, protocol=HIGHEST_PROTOCOL)
+
+                replace(tmp_path, path)
+            except Exception as e:
+                logger.error(
+                    f'Failed to save checkpoint {namespace}/{key}: '
+                    f'{type(e).__name__} - {e}'
+                )
+
+    def load(self, namespace: str, key: str) -> Any | None:
+        """
+        Load a snapshot.
+
+        Args:
+            namespace: Name of the snapshot group
+            key: Snapshot identifier inside the namespace
+
+        Returns:
+            Any | None: Saved state, or None if missing or unreadable
+        """
+
+        path = self._path(namespace, key)
+
+        with self._lock:
+            if not exists(path):
+                return None
+
+            try:
+                with open(path, 'rb') as file:
+                    return load(file)
+            except Exception as e:
+                logger.error(
+                    f'Failed to load checkpoint {namespace}/{key}: '
+                    f'{type(e).__name__} - {e}'
+                )
+                return None
+
+    def delete(self, namespace: str, key: str) -> None:
+        """
+        Delete a snapshot if it exists.
+
+        Args:
+            namespace: Name of the snapshot group
+            key: Snapshot identifier inside the namespace
+        """
+
+        path = self._path(namespace, key)
+
+        with self._lock:
+            try:
+                if exists(path):
+                    remove(path)
+            except Exception as e:
+                logger.error(
+                    f'Failed to delete checkpoint {namespace}/{key}: '
+                    f'{type(e).__name__} - {e}'
+                )
+
+    def keys(self, namespace: str) -> list[str]:
+        """
+        List identifiers of all snapshots in a namespace.
+
+        Args:
+            namespace: Name of the snapshot group
+
+        Returns:
+            list[str]: Snapshot identifiers
+        """
+
+        directory = join(self._root, namespace)
+
+        with self._lock:
+            if not exists(directory):
+                return []
+
+            return [
+                urlsafe_b64decode(name[:-len('.pkl')]).decode()
+                for name in sorted(listdir(directory))
+                if name.endswith('.pkl')
+            ]
+
+    def _path(self, namespace: str, key: str) -> str:
+        """Build the file path of a snapshot."""
+
+        name = urlsafe_b64encode(key.encode()).decode()
+        return join(self._root, namespace, f'{name}.pkl')
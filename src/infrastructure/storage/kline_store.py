@@ -0,0 +1,246 @@
+from __future__ import annotations
+from logging import getLogger
+from os import makedirs, replace
+from os.path import dirname, exists, getsize, join
+from threading import RLock
+
+import numpy as np
+
+
+logger = getLogger(__name__)
+
+
+class KlineStore():
+    """
+    Append-only columnar storage for klines.
+
+    Every table is a flat binary file of float64 rows
+    (time, open, high, low, close, volume) sorted by time.
+    The time column doubles as the index: range reads binary-search it
+    on a memory-mapped file and return zero-copy views, and appends
+    write only the new rows at the end of the file.
+    """
+
+    COLUMNS = 6
+
+    def __init__(self) -> None:
+        """Initialize the store rooted at the databases directory."""
+
+        self._root = join(dirname(__file__), 'databases', 'klines')
+        self._lock = RLock()
+        self._table_locks: dict[tuple[str, str], RLock] = {}
+
+    def lock(self, store_name: str, table_name: str) -> RLock:
+        """
+        Get the lock of a table.
+
+        Callers that update a table from its own contents
+        (read, fetch the missing klines, merge and write) hold it
+        across the whole sequence, so concurrent updates of the same
+        table don't overwrite each other.
+
+        Args:
+            store_name: Name of the store (exchange)
+            table_name: Name of the table (symbol and interval)
+
+        Returns:
+            RLock: Lock shared by all users of the table
+        """
+
+        with self._lock:
+            return self._table_locks.setdefault(
+                (store_name, table_name), RLock()
+            )
+
+    def read(
+        self,
+        store_name: str,
+        table_name: str,
+        start: int | None = None,
+        end: int | None = None
+    ) -> np.ndarray:
+        """
+        Read klines with time in [start, end] from the specified table.
+
+        The result is a copy-on-write view of the memory-mapped file,
+        so only the pages of the requested slice are ever loaded.
+        If the table does not exist, an empty array is returned.
+
+        Args:
+            store_name: Name of the store (exchange)
+            table_name: Name of the table (symbol and interval)
+            start: Inclusive start timestamp in milliseconds
+            end: Inclusive end timestamp in milliseconds
+
+        Returns:
+            np.ndarray: 2D array of klines
+        """
+
+        klines = self._map(store_name, table_name)
+
+        if klines.shape[0] == 0:
+            return klines
+
+        times = klines[:, 0]
+        lo = 0 if start is None else np.searchsorted(times, start, 'left')
+        hi = (
+            klines.shape[0] if end is None
+            else np.searchsorted(times, end, 'right')
+        )
+        return klines[lo:hi]
+
+    def bounds(
+        self,
+        store_name: str,
+        table_name: str
+    ) -> tuple[int, int] | None:
+        """
+        Get timestamps of the first and last stored klines.
+
+        Args:
+            store_name: Name of the store (exchange)
+            table_name: Name of the table (symbol and interval)
+
+        Returns:
+            tuple | None: (first_time, last_time), or None if empty
+        """
+
+        klines = self._map(store_name, table_name)
+
+        if klines.shape[0] == 0:
+            return None
+
+        return int(klines[0, 0]), int(klines[-1, 0])
+
+    def append(
+        self,
+        store_name: str,
+        table_name: str,
+        rows: np.ndarray
+    ) -> int:
+        """
+        Append klines newer than the last stored one.
+
+        Rows at or before the last stored timestamp are skipped,
+        so appending overlapping data is safe.
+
+        Args:
+            store_name: Name of the store (exchange)
+            table_name: Name of the table (symbol and interval)
+            rows: 2D array of klines sorted by time
+
+        Returns:
+            int: Number of appended rows
+        """
+
+        rows = self._prepare(rows)
+
+        with self._lock:
+            bounds = self.bounds(store_name, table_name)
+
+            if bounds is not None:
+                rows = rows[rows[:, 0] > bounds[1]]
+
+            if rows.shape[0] == 0:
+                return 0
+
+            path = self._path(store_name, table_name)
+            makedirs(dirname(path), exist_ok=True)
+
+            try:
+                with open(path, 'ab') as file:
+                    file.write(rows.tobytes())
+            except Exception as e:
+                logger.error(
+                    f'Failed to append klines to {table_name}: '
+                    f'{type(e).__name__} - {e}'
+                )
+                return 0
+
+            return rows.shape[0]
+
+    def write(
+        self,
+        store_name: str,
+        table_name: str,
+        rows: np.ndarray
+    ) -> None:
+        """
+        Replace the table contents with the given klines.
+
+        The file is written next to the table and atomically swapped in,
+        so concurrent readers keep seeing a consistent table.
+
+        Args:
+            store_name: Name of the store (exchange)
+            table_name: Name of the table (symbol and interval)
+            rows: 2D array of klines
+        """
+
+        rows = self._prepare(rows)
+
+        if rows.shape[0] > 1:
+            order = np.argsort(rows[:, 0], kind='stable')
+            rows = rows[order]
+            keep = np.ones(rows.shape[0], dtype=np.bool_)
+            keep[:-1] = rows[1:, 0] != rows[:-1, 0]
+            rows = rows[keep]
+
+        with self._lock:
+            path = self._path(store_name, table_name)
+            tmp_path = f'{path}.tmp'
+            makedirs(dirname(path), exist_ok=True)
+
+            try:
+                with open(tmp_path, 'wb') as file:
+                    file.write(rows.tobytes())
+
+                replace(tmp_path, path)
+            except Exception as e:
+                logger.error(
+                    f'Failed to save klines into {table_name}: '
+                    f'{type(e).__name__} - {e}'
+                )
+
+    def _map(self, store_name: str, table_name: str) -> np.ndarray:
+        """Memory-map the whole table as a 2D float64 array."""
+
+        path = self._path(store_name, table_name)
+        row_size = self.COLUMNS * np.dtype(np.float64).itemsize
+
+        with self._lock:
+            n_rows = getsize(path) // row_size if exists(path) else 0
+
+            if n_rows == 0:
+                return np.empty((0, self.COLUMNS), dtype=np.float64)
+
+            try:
+                klines = np.memmap(
+                    path,
+                    dtype=np.float64,
+                    mode='c',
+                    shape=(n_rows, self.COLUMNS)
+                )
+            except Exception as e:
+                logger.error(
+                    f'Failed to load klines from {table_name}: '
+                    f'{type(e).__name__} - {e}'
+                )
+                return np.empty((0, self.COLUMNS), dtype=np.float64)
+
+        return np.asarray(klines)
+
+    def _path(self, store_name: str, table_name: str) -> str:
+        """Build the file path of a table."""
+
+        return join(self._root, store_name, f'{table_name}.bin')
+
+    def _prepare(self, rows: np.ndarray) -> np.ndarray:
+        """Convert rows to a C-contiguous 2D float64 array."""
+
+        rows = np.asarray(rows, dtype=np.float64)
+
+        if rows.size == 0:
+            return np.empty((0, self.COLUMNS), dtype=np.float64)
+
+        return np.ascontiguousarray(rows[:, :self.COLUMNS])
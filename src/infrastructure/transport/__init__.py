@@ -1 +1,3 @@
-from .client import HttpClient
\ No newline at end of file
+from .async_client import AsyncHttpClient
+from .client import HttpClient
+from .rate_limit import RateLimiter
\ No newline at end of file
@@ -0,0 +1,290 @@
+from __future__ import annotations
+from codecs import getincrementaldecoder
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from json import JSONDecodeError, JSONDecoder, loads
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+import aiohttp
+
+from .base import BaseAsyncHttpClient
+from .config import CONFIG
+from .retry import async_retry_on_failure
+
+if TYPE_CHECKING:
+    from .rate_limit import RateLimiter
+
+
+class AsyncHttpClient(BaseAsyncHttpClient):
+    """
+    Asyncio HTTP client with retry logic and error handling.
+
+    Concurrency is bounded by the connection pool size, request weight
+    is throttled by an optional exchange rate limiter and JSON arrays
+    are decoded element by element while the body is still streaming.
+
+    Requests made inside connect() share one keep-alive session,
+    requests outside of it open a short-lived session each.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = CONFIG.pool_size,
+        rate_limiter: RateLimiter | None = None,
+        weight_header: str | None = None,
+        timeout: float = 30.0
+    ) -> None:
+        """
+        Initialize the client without opening any connections.
+
+        Args:
+            pool_size: Maximum number of concurrent connections
+            rate_limiter: Limiter shared by all clients of an exchange
+            weight_header: Response header with the used weight,
+                           used to keep the limiter in sync
+            timeout: Total timeout of a single request in seconds
+        """
+
+        self._pool_size = pool_size
+        self._rate_limiter = rate_limiter
+        self._weight_header = weight_header
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._session_var: ContextVar[aiohttp.ClientSession | None] = (
+            ContextVar(f'async_http_session_{id(self)}', default=None)
+        )
+
+    @asynccontextmanager
+    async def connect(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Open a pooled session shared by all requests in this scope.
+
+        Nested scopes and tasks created inside the scope
+        reuse the outermost session.
+
+        Yields:
+            aiohttp.ClientSession: Active session
+        """
+
+        session = self._session_var.get()
+
+        if session is not None and not session.closed:
+            yield session
+            return
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_size
+            ),
+            timeout=self._timeout
+        )
+        token = self._session_var.set(session)
+
+        try:
+            yield session
+        finally:
+            self._session_var.reset(token)
+            await session.close()
+
+    @async_retry_on_failure
+    async def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | list[Any] | None:
+        return await self._request(
+            'GET', url, weight, params=params, headers=headers, **kwargs
+        )
+
+    @async_retry_on_failure
+    async def post(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        return await self._request(
+            'POST', url, weight,
+            json=json, params=params, headers=headers, **kwargs
+        )
+
+    @async_retry_on_failure
+    async def delete(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        return await self._request(
+            'DELETE', url, weight,
+            json=json, params=params, headers=headers, **kwargs
+        )
+
+    @async_retry_on_failure
+    async def put(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        return await self._request(
+            'PUT', url, weight,
+            json=json, params=params, headers=headers, **kwargs
+        )
+
+    @async_retry_on_failure
+    async def patch(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        return await self._request(
+            'PATCH', url, weight,
+            json=json, params=params, headers=headers, **kwargs
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        weight: float,
+        **kwargs
+    ) -> Any:
+        """
+        Send a request and decode its JSON body while it streams in.
+
+        Args:
+            method: HTTP method
+            url: Target URL
+            weight: Request weight for the rate limiter
+            **kwargs: Extra aiohttp request options
+
+        Returns:
+            Decoded JSON body
+        """
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(weight)
+
+        async with self.connect() as session:
+            async with session.request(method, url, **kwargs) as response:
+                if self._rate_limiter is not None and self._weight_header:
+                    used_weight = response.headers.get(self._weight_header)
+
+                    if used_weight and used_weight.isdigit():
+                        self._rate_limiter.sync(float(used_weight))
+
+                response.raise_for_status()
+                decoder = _JsonStreamDecoder()
+
+                async for chunk in response.content.iter_any():
+                    decoder.feed(chunk)
+
+                return decoder.result()
+
+
+class _JsonStreamDecoder:
+    """
+    Incremental JSON decoder for HTTP bodies.
+
+    Top-level arrays are decoded element by element as soon as
+    each element is complete, other documents are decoded at the end.
+    """
+
+    def __init__(self) -> None:
+        self._text_decoder = getincrementaldecoder('utf-8')()
+        self._json_decoder = JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._items: list[Any] | None = None
+        self._closed = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Append a chunk of the body and decode completed elements."""
+
+        self._buffer += self._text_decoder.decode(chunk)
+
+        if self._items is None:
+            stripped = self._buffer.lstrip()
+
+            if not stripped.startswith('['):
+                return
+
+            self._buffer = stripped
+            self._pos = 1
+            self._items = []
+
+        self._decode_items()
+
+    def result(self) -> Any:
+        """Return the decoded document once the body is complete."""
+
+        self._buffer += self._text_decoder.decode(b'', final=True)
+
+        if self._items is None:
+            return loads(self._buffer) if self._buffer.strip() else None
+
+        self._decode_items()
+
+        if not self._closed:
+            raise JSONDecodeError(
+                'Unterminated array', self._buffer, self._pos
+            )
+
+        return self._items
+
+    def _decode_items(self) -> None:
+        """Decode every array element followed by ',' or ']'."""
+
+        buffer = self._buffer
+        pos = self._pos
+        size = len(buffer)
+
+        while not self._closed:
+            while pos < size and buffer[pos] in ' \t\r\n,':
+                pos += 1
+
+            if pos >= size:
+                break
+
+            if buffer[pos] == ']':
+                self._closed = True
+                pos += 1
+                break
+
+            try:
+                item, end = self._json_decoder.raw_decode(buffer, pos)
+            except JSONDecodeError:
+                break
+
+            # A number split by a chunk boundary decodes as its prefix
+            # ("-4." as -4), an element is complete once ',' or ']'
+            # follows it
+            terminator = end
+            while terminator < size and buffer[terminator] in ' \t\r\n':
+                terminator += 1
+
+            if terminator >= size or buffer[terminator] not in ',]':
+                break
+
+            self._items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        self._pos = 0
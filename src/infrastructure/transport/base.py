@@ -125,4 +125,139 @@ class BaseHttpClient(ABC):
         Returns:
             Response data on success, or None on error
         """
-        pass
\ No newline at end of file
+        pass
+
+
+class BaseAsyncHttpClient(ABC):
+    """
+    Abstract base class for asyncio HTTP clients.
+    Defines the awaitable counterparts of the BaseHttpClient methods.
+    """
+
+    @abstractmethod
+    async def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | list[Any] | None:
+        """
+        Make a GET request with retry logic.
+        
+        Args:
+            url: Target URL
+            params: Query parameters
+            headers: Request headers
+            weight: Request weight for the rate limiter
+            **kwargs: Extra request options
+        
+        Returns:
+            Response data on success, or None on error
+        """
+        pass
+    
+    @abstractmethod
+    async def post(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        """
+        Make a POST request with retry logic.
+        
+        Args:
+            url: Target URL
+            json: JSON payload
+            params: Query parameters
+            headers: Request headers
+            weight: Request weight for the rate limiter
+            **kwargs: Extra request options
+            
+        Returns:
+            Response data on success, or None on error
+        """
+        pass
+    
+    @abstractmethod
+    async def delete(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        """
+        Make a DELETE request with retry logic.
+        
+        Args:
+            url: Target URL
+            json: JSON payload
+            params: Query parameters
+            headers: Request headers
+            weight: Request weight for the rate limiter
+            **kwargs: Extra request options
+            
+        Returns:
+            Response data on success, or None on error
+        """
+        pass
+
+    @abstractmethod
+    async def put(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        """
+        Make a PUT request with retry logic.
+        
+        Args:
+            url: Target URL
+            json: JSON payload
+            params: Query parameters
+            headers: Request headers
+            weight: Request weight for the rate limiter
+            **kwargs: Extra request options
+            
+        Returns:
+            Response data on success, or None on error
+        """
+        pass
+    
+    @abstractmethod
+    async def patch(
+        self,
+        url: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        weight: float = 1,
+        **kwargs
+    ) -> dict[str, Any] | None:
+        """
+        Make a PATCH request with retry logic.
+        
+        Args:
+            url: Target URL
+            json: JSON payload
+            params: Query parameters
+            headers: Request headers
+            weight: Request weight for the rate limiter
+            **kwargs: Extra request options
+            
+        Returns:
+            Response data on success, or None on error
+        """
+        pass
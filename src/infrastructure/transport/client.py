@@ -1,10 +1,14 @@
 from __future__ import annotations
-from typing import Any
-
-import requests
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseHttpClient
+from .config import CONFIG
 from .retry import retry_on_failure
+from .session import sessions
+
+if TYPE_CHECKING:
+    from requests import Session
+    from .models import SessionStats
 
 
 class HttpClient(BaseHttpClient):
@@ -13,8 +17,23 @@ class HttpClient(BaseHttpClient):
     
     Inherits from BaseHttpClient and provides concrete implementation
     using decorators for error handling and retry attempts.
+    Requests go through a keep-alive session shared by all clients
+    of the same base endpoint, so connections are reused.
     """
 
+    POOL_SIZE = CONFIG.pool_size
+
+    @staticmethod
+    def connection_stats() -> dict[str, SessionStats]:
+        """Return connection reuse counters for every endpoint."""
+
+        return sessions.stats()
+
+    def reset_connections(self, url: str) -> None:
+        """Drop pooled connections of the endpoint of a URL."""
+
+        sessions.reset(url)
+
     @retry_on_failure
     def get(
         self,
@@ -23,7 +42,7 @@ class HttpClient(BaseHttpClient):
         headers: dict[str, str] | None = None,
         **kwargs
     ) -> dict[str, Any] | list[Any] | None:
-        response = requests.get(
+        response = self._session(url).get(
             url=url,
             params=params,
             headers=headers,
@@ -41,7 +60,7 @@ class HttpClient(BaseHttpClient):
         headers: dict[str, str] | None = None,
         **kwargs
     ) -> dict[str, Any] | None:
-        response = requests.post(
+        response = self._session(url).post(
             url=url,
             json=json,
             params=params,
@@ -60,7 +79,7 @@ class HttpClient(BaseHttpClient):
         headers: dict[str, str] | None = None,
         **kwargs
     ) -> dict[str, Any] | None:
-        response = requests.delete(
+        response = self._session(url).delete(
             url=url,
             json=json,
             params=params,
@@ -79,7 +98,7 @@ class HttpClient(BaseHttpClient):
         headers: dict[str, str] | None = None,
         **kwargs
     ) -> dict[str, Any] | None:
-        response = requests.put(
+        response = self._session(url).put(
             url=url,
             json=json,
             params=params,
@@ -98,7 +117,7 @@ class HttpClient(BaseHttpClient):
         headers: dict[str, str] | None = None,
         **kwargs
     ) -> dict[str, Any] | None:
-        response = requests.patch(
+        response = self._session(url).patch(
             url=url,
             json=json,
             params=params,
@@ -106,4 +125,9 @@ class HttpClient(BaseHttpClient):
             **kwargs
         )
         response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return response.json()
+
+    def _session(self, url: str) -> Session:
+        """Get the pooled session for the endpoint of a URL."""
+
+        return sessions.get(url, self.POOL_SIZE)
\ No newline at end of file
@@ -9,6 +9,7 @@ class TransportConfig:
     retry_delay: float = 1.0
     retry_attempts: int = 3
     logging: bool = True
+    pool_size: int = 10
 
 
 CONFIG = TransportConfig()
\ No newline at end of file
@@ -1,5 +1,7 @@
 from __future__ import annotations
+from asyncio import TimeoutError as AsyncTimeoutError
 
+import aiohttp
 import requests
 
 
@@ -29,11 +31,13 @@ class HttpError(TransportError):
         message: str, 
         status_code: int, 
         url: str | None = None,
-        response_text: str | None = None
+        response_text: str | None = None,
+        headers: dict[str, str] | None = None
     ):
         super().__init__(message, url)
         self.status_code = status_code
         self.response_text = response_text
+        self.headers = headers
 
 
 def map_requests_exception(
@@ -67,4 +71,33 @@ def map_requests_exception(
             headers=dict(response.headers)
         )
     
+    return TransportError(f'Request failed for {url}: {exc}', url=url)
+
+
+def map_aiohttp_exception(exc: Exception, url: str) -> TransportError:
+    """
+    Map aiohttp exceptions to our custom transport exceptions.
+
+    Args:
+        exc: Original aiohttp or asyncio exception
+        url: URL that caused the exception
+        
+    Returns:
+        Appropriate custom transport exception
+    """
+
+    if isinstance(exc, AsyncTimeoutError):
+        return TimeoutError(f'Request timeout for {url}', url=url)
+
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return HttpError(
+            f'HTTP {exc.status} error for {url}: {exc.message}',
+            status_code=exc.status,
+            url=url,
+            headers=dict(exc.headers or {})
+        )
+
+    if isinstance(exc, aiohttp.ClientConnectionError):
+        return ConnectionError(f'Connection error for {url}: {exc}', url=url)
+
     return TransportError(f'Request failed for {url}: {exc}', url=url)
\ No newline at end of file
@@ -0,0 +1,12 @@
+from __future__ import annotations
+from typing import TypedDict
+
+
+class SessionStats(TypedDict):
+    """Connection reuse counters of a pooled session."""
+
+    requests: int
+    connections: int
+    reused: int
+    reuse_rate: float
+    pool_size: int
\ No newline at end of file
@@ -0,0 +1,69 @@
+from __future__ import annotations
+from asyncio import sleep
+from threading import Lock
+from time import monotonic
+
+
+class RateLimiter:
+    """
+    Weight-aware token bucket for exchange request limits.
+
+    The bucket holds up to `capacity` weight units and refills
+    continuously over `period` seconds. Callers reserve the weight
+    of a request before sending it and wait if the bucket is in debt,
+    so concurrent coroutines are spaced out instead of being rejected
+    by the exchange.
+    """
+
+    def __init__(self, capacity: float, period: float) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum weight allowed per period
+            period: Length of the limit window in seconds
+        """
+
+        self._capacity = capacity
+        self._rate = capacity / period
+        self._tokens = capacity
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    async def acquire(self, weight: float = 1) -> None:
+        """
+        Reserve weight for a request, waiting until it is available.
+
+        Args:
+            weight: Weight of the request in exchange units
+        """
+
+        with self._lock:
+            self._refill()
+            self._tokens -= weight
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if delay > 0:
+            await sleep(delay)
+
+    def sync(self, used_weight: float) -> None:
+        """
+        Align the bucket with the weight reported by the exchange.
+
+        Args:
+            used_weight: Weight already used in the current window
+        """
+
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, self._capacity - used_weight)
+
+    def _refill(self) -> None:
+        """Add tokens accumulated since the last update."""
+
+        now = monotonic()
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
\ No newline at end of file
@@ -1,13 +1,18 @@
 from __future__ import annotations
+from asyncio import TimeoutError as AsyncTimeoutError, sleep as async_sleep
 from functools import wraps
 from logging import getLogger
 from time import sleep
 from typing import Callable, Any
 
-from requests import RequestException
+from aiohttp import ClientError, ClientResponseError
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    RequestException
+)
 
 from .config import CONFIG
-from .exceptions import map_requests_exception
+from .exceptions import map_aiohttp_exception, map_requests_exception
 
 
 logger = getLogger(__name__)
@@ -26,6 +31,10 @@ def retry_on_failure(func: Callable) -> Callable:
             try:
                 return func(self, url, *args, **kwargs)
             except RequestException as e:
+                if isinstance(e, RequestsConnectionError):
+                    # Retry on fresh connections, pooled ones may be dead
+                    self.reset_connections(url)
+
                 if attempt == retry_attempts - 1:
                     if logging:
                         transport_exc = map_requests_exception(e, url)
@@ -51,4 +60,59 @@ def retry_on_failure(func: Callable) -> Callable:
         
         return None
     
+    return wrapper
+
+
+def async_retry_on_failure(func: Callable) -> Callable:
+    """
+    Decorator for async HTTP methods with retry logic and error handling.
+
+    Mirrors retry_on_failure. Rate limit responses (429/418)
+    wait for the Retry-After delay when the exchange provides one.
+    """
+
+    @wraps(func)
+    async def wrapper(self, url: str, *args, **kwargs) -> Any:
+        retry_attempts = kwargs.pop('retry_attempts', CONFIG.retry_attempts)
+        retry_delay = kwargs.pop('retry_delay', CONFIG.retry_delay)
+        logging = kwargs.pop('logging', CONFIG.logging)
+
+        for attempt in range(retry_attempts):
+            try:
+                return await func(self, url, *args, **kwargs)
+            except (ClientError, AsyncTimeoutError) as e:
+                if attempt == retry_attempts - 1:
+                    if logging:
+                        transport_exc = map_aiohttp_exception(e, url)
+                        logger.error(
+                            f'All {retry_attempts} attempts failed '
+                            f'for {url}: {transport_exc}'
+                        )
+
+                    return None
+
+                if logging:
+                    logger.warning(
+                        f'Attempt {attempt + 1} failed '
+                        f'for {url}, retrying...'
+                    )
+
+                delay = retry_delay
+                if (
+                    isinstance(e, ClientResponseError)
+                    and e.status in (418, 429)
+                    and e.headers
+                    and e.headers.get('Retry-After', '').isdigit()
+                ):
+                    delay = max(delay, float(e.headers['Retry-After']))
+
+                await async_sleep(delay)
+            except Exception as e:
+                if logging:
+                    logger.error(f'Unexpected error for {url}: {e}')
+
+                return None
+
+        return None
+
     return wrapper
\ No newline at end of file
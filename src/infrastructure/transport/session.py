@@ -0,0 +1,160 @@
+from __future__ import annotations
+from threading import RLock, local
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from .models import SessionStats
+
+
+class SessionPool:
+    """
+    Thread-safe registry of pooled HTTP sessions.
+
+    Keeps one keep-alive connection pool per base endpoint (scheme
+    and host), shared by every client talking to that endpoint.
+    Sessions themselves aren't thread-safe, so every thread gets
+    its own session per endpoint, all mounting the shared pool.
+    The connection pool is sized for the largest concurrency
+    requested by its clients.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._pool_sizes: dict[str, int] = {}
+        self._retired: dict[str, tuple[int, int]] = {}
+        self._local = local()
+        self._lock = RLock()
+
+    def get(self, url: str, pool_size: int) -> Session:
+        """
+        Get the session for the endpoint of a URL.
+
+        Args:
+            url: Request URL
+            pool_size: Number of concurrent connections the caller needs
+
+        Returns:
+            Session: Session of the calling thread for the endpoint
+        """
+
+        endpoint = self._endpoint(url)
+
+        with self._lock:
+            adapter = self._adapters.get(endpoint)
+
+            if adapter is None or self._pool_sizes[endpoint] < pool_size:
+                if adapter is not None:
+                    self._retire(endpoint)
+
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=pool_size
+                )
+                self._adapters[endpoint] = adapter
+                self._pool_sizes[endpoint] = pool_size
+
+        if not hasattr(self._local, 'sessions'):
+            self._local.sessions = {}
+
+        session, mounted = self._local.sessions.get(endpoint, (None, None))
+
+        if session is None:
+            session = Session()
+
+        if mounted is not adapter:
+            session.mount(f'{endpoint}/', adapter)
+            self._local.sessions[endpoint] = (session, adapter)
+
+        return session
+
+    def reset(self, url: str) -> None:
+        """
+        Drop pooled connections of the endpoint of a URL.
+
+        New connections are opened on the next request.
+
+        Args:
+            url: Request URL
+        """
+
+        endpoint = self._endpoint(url)
+
+        with self._lock:
+            if endpoint not in self._adapters:
+                return
+
+            self._retire(endpoint)
+            self._adapters[endpoint].close()
+
+    def stats(self) -> dict[str, SessionStats]:
+        """
+        Get connection reuse counters for every endpoint.
+
+        Returns:
+            dict: Mapping from base endpoint to its counters
+        """
+
+        with self._lock:
+            stats: dict[str, SessionStats] = {}
+
+            for endpoint in self._adapters:
+                requests, connections = self._count(endpoint)
+                retired_requests, retired_connections = (
+                    self._retired.get(endpoint, (0, 0))
+                )
+                requests += retired_requests
+                connections += retired_connections
+                reused = max(requests - connections, 0)
+
+                stats[endpoint] = {
+                    'requests': requests,
+                    'connections': connections,
+                    'reused': reused,
+                    'reuse_rate': reused / requests if requests else 0.0,
+                    'pool_size': self._pool_sizes[endpoint],
+                }
+
+            return stats
+
+    def _count(self, endpoint: str) -> tuple[int, int]:
+        """Count requests and opened connections of live pools."""
+
+        pools = self._adapters[endpoint].poolmanager.pools
+        requests = connections = 0
+
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+
+            if pool is not None:
+                requests += pool.num_requests
+                connections += pool.num_connections
+
+        return requests, connections
+
+    def _retire(self, endpoint: str) -> None:
+        """Keep counters of pools that are about to be discarded."""
+
+        requests, connections = self._count(endpoint)
+        retired_requests, retired_connections = (
+            self._retired.get(endpoint, (0, 0))
+        )
+        self._retired[endpoint] = (
+            retired_requests + requests,
+            retired_connections + connections
+        )
+
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        """Extract the base endpoint (scheme://host) of a URL."""
+
+        parts = urlsplit(url)
+        return f'{parts.scheme}://{parts.netloc}'
+
+
+sessions = SessionPool()
\ No newline at end of file
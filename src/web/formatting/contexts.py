@@ -1,4 +1,5 @@
 from __future__ import annotations
+from math import isnan
 from typing import TYPE_CHECKING
 
 from src.core.strategies import strategy_registry
@@ -92,6 +93,34 @@ def format_optimization_contexts(
             'params': params,
         }
 
+        if context.get('markets'):
+            result[context_id]['symbols'] = [
+                item['symbol'] for item in context['markets']
+            ]
+
+        if context.get('stop_reasons'):
+            result[context_id]['stopReasons'] = context['stop_reasons']
+
+        if context.get('fold_results'):
+            result[context_id]['folds'] = [
+                {
+                    'trainStart': fold['window']['train_start'],
+                    'trainEnd': fold['window']['train_end'],
+                    'testStart': fold['window']['test_start'],
+                    'testEnd': fold['window']['test_end'],
+                    'params': [
+                        {**base_params, **opt}
+                        for opt in fold['params'] if opt
+                    ],
+                    'testFitness': [
+                        None if isnan(value) else value
+                        for value in fold['test_fitness']
+                    ],
+                    'stopReasons': fold['stop_reasons'],
+                }
+                for fold in context['fold_results']
+            ]
+
     return result
 
 
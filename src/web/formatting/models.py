@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class ExecutionContextResponse(TypedDict):
@@ -15,6 +15,18 @@ class ExecutionContextResponse(TypedDict):
     params: dict[str, bool | int | float]
 
 
+class FoldResponse(TypedDict):
+    """Response format for a walk-forward fold of optimization."""
+
+    trainStart: int
+    trainEnd: int
+    testStart: int
+    testEnd: int
+    params: list[dict[str, bool | int | float]]
+    testFitness: list[float | None]
+    stopReasons: list[str]
+
+
 class OptimizationContextResponse(TypedDict):
     """Response format for optimization context data."""
     
@@ -24,4 +36,9 @@ class OptimizationContextResponse(TypedDict):
     exchange: str
     start: str
     end: str
-    params: list[dict[str, bool | int | float]]
\ No newline at end of file
+    params: list[dict[str, bool | int | float]]
+
+    symbols: NotRequired[list[str]]
+    stopReasons: NotRequired[list[str]]
+    folds: NotRequired[list[FoldResponse]]
+
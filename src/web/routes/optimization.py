@@ -71,14 +71,35 @@ def add_contexts() -> Response:
             "context_id_1": {
                 "strategy": "strategy_name",
                 "symbol": "BTCUSDT",
+                "symbols": ["ETHUSDT", "SOLUSDT"],
                 "interval": "1h",
                 "exchange": "BINANCE",
                 "start": "2020-01-01",
-                "end": "2024-12-31"
+                "end": "2024-12-31",
+                "folds": 4,
+                "anchored": false,
+                "engine": "genetic",
+                "stall_iterations": 300,
+                "time_budget": 600
             },
             "context_id_2": {...}
         }
 
+        "folds" (default 1) enables walk-forward optimization with
+        the given number of folds, "anchored" (default false) makes
+        every fold train from the first kline instead of a rolling
+        window. "engine" selects the search engine: "genetic"
+        (default) or "tpe", which needs far fewer backtests.
+        "symbols" (optional) adds markets to a multi-market context:
+        every candidate is backtested on "symbol" and all of
+        "symbols" and scored by the aggregate fitness
+        (MARKET_AGGREGATION), so one population searches for
+        parameters that are robust across the markets.
+        "stall_iterations", "min_diversity", "time_budget" (seconds)
+        and "evaluation_budget" (optional) override the stopping
+        criteria of the context's optimization runs; the reason every
+        run stopped is reported in "stopReasons".
+
     Returns:
         Response: JSON response containing list of successfully
                   queued context identifiers
@@ -145,13 +166,25 @@ def get_context_status(context_id: str) -> Response:
         context_id: Unique identifier of the strategy context
 
     Returns:
-        Response: JSON response containing context status.
+        Response: JSON response containing context status,
+                  fitness cache counters (null until optimization
+                  has finished) and live progress of the running
+                  optimization (null if it isn't running): completion
+                  share, evaluations, evaluations per second, cache
+                  hit rate, best train fitness and per-fold reports
+                  (run, iteration, throughput, elapsed seconds).
                   Returns null if context doesn't exist.
     """
 
     status = optimization_service.get_context_status(context_id)
+    cache_stats = optimization_service.get_context_stats(context_id)
+    progress = optimization_service.get_context_progress(context_id)
     return Response(
-        response=dumps({'status': status.value}),
+        response=dumps({
+            'status': status.value,
+            'cache': cache_stats,
+            'progress': progress,
+        }),
         status=200,
         mimetype='application/json'
     )
\ No newline at end of file
@@ -1,12 +1,16 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Callable, Iterator
 
+import numpy as np
 from dotenv import load_dotenv
 from pytest import fixture
 
 from src.core.strategies import strategy_registry
 from src.features.execution import ExecutionService
 from src.features.optimization import OptimizationService
+from src.features.optimization.optimizer import StrategyOptimizer
 
 from .enums import Mode
 from .templates import (
@@ -15,14 +19,56 @@ from .templates import (
 )
 
 if TYPE_CHECKING:
+    from src.core.providers import MarketData
     from src.features.execution.models import (
         ContextConfig as ExecutionContextConfig
     )
     from src.features.optimization.models import (
-        ContextConfig as OptimizationContextConfig
+        ContextConfig as OptimizationContextConfig,
+        StrategyContext
     )
 
 
+RUN_CONFIG = {
+    'iterations': 10,
+    'batch_size': 4,
+    'population_size': 10,
+    'max_population_size': 12,
+    'optimization_runs': 1,
+    'threads': 2,
+    'checkpoint_interval': 0,
+}
+"""Optimizer settings of short test runs."""
+
+
+class Results:
+    """Thread-safe collector of task results reported by callbacks."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, tuple] = {}
+        self._lock = Lock()
+        self._changed = Event()
+
+    def __call__(self, task_id: str, result, error: str | None) -> None:
+        with self._lock:
+            self.items[task_id] = (result, error)
+
+        self._changed.set()
+
+    def wait(self, count: int, timeout: float = 60.0) -> bool:
+        """Wait until count results arrived, False on timeout."""
+
+        for _ in range(int(timeout * 10)):
+            with self._lock:
+                if len(self.items) >= count:
+                    return True
+
+            self._changed.wait(0.1)
+            self._changed.clear()
+
+        return False
+
+
 def pytest_addoption(parser):
     """Add custom command-line options for pytest."""
 
@@ -158,12 +204,138 @@ def execution_service() -> ExecutionService:
 
 
 @fixture(scope='session')
-def optimization_service() -> OptimizationService:
+def optimization_service() -> Iterator[OptimizationService]:
     """
     Create optimization service instance for testing.
     
-    Returns:
+    Yields:
         OptimizationService: Service for strategy parameter optimization
     """
 
-    return OptimizationService()
\ No newline at end of file
+    service = OptimizationService()
+    yield service
+    service.shutdown()
+
+
+@fixture(scope='session')
+def make_klines() -> Callable[..., np.ndarray]:
+    """
+    Provide a builder of hourly random-walk klines.
+
+    Returns:
+        Callable: Function building n klines from a random seed
+    """
+
+    def make(n: int, seed: int = 1) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        time = 1514764800000 + np.arange(n) * 3600000.0
+        close = 10000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        open_ = np.concatenate(([close[0]], close[:-1]))
+        high = np.maximum(open_, close) * (
+            1 + np.abs(rng.normal(0, 0.004, n))
+        )
+        low = np.minimum(open_, close) * (
+            1 - np.abs(rng.normal(0, 0.004, n))
+        )
+        volume = rng.uniform(10, 100, n)
+        return np.column_stack([time, open_, high, low, close, volume])
+
+    return make
+
+
+@fixture(scope='session')
+def make_market_data(make_klines) -> Callable[..., MarketData]:
+    """
+    Provide a builder of market data packages.
+
+    Args:
+        make_klines: Builder of random-walk klines
+
+    Returns:
+        Callable: Function building a package of n random-walk klines,
+                  with fields overridden by keyword arguments
+    """
+
+    def make(n: int = 3000, seed: int = 1, **fields) -> MarketData:
+        return {
+            'symbol': 'TEST',
+            'interval': None,
+            'p_precision': 0.1,
+            'q_precision': 0.001,
+            'klines': make_klines(n, seed),
+            'feeds': {},
+            **fields,
+        }
+
+    return make
+
+
+@fixture(scope='session')
+def make_context(make_market_data) -> Callable[..., StrategyContext]:
+    """
+    Provide a builder of optimization contexts.
+
+    Args:
+        make_market_data: Builder of market data packages
+
+    Returns:
+        Callable: Function building a context of a registered
+                  strategy, with fields overridden by keyword arguments
+    """
+
+    def make(name: str = 'ExampleV1', **context) -> StrategyContext:
+        return {
+            'strategy_class': strategy_registry[name],
+            'market_data': make_market_data(),
+            **context,
+        }
+
+    return make
+
+
+@fixture
+def make_optimizer() -> Iterator[Callable[..., StrategyOptimizer]]:
+    """
+    Provide a builder of optimizers configured for short runs.
+
+    Yields:
+        Callable: Function building an optimizer with RUN_CONFIG
+                  overridden by keyword arguments, initialized
+                  for the context if one is passed
+    """
+
+    executors: list[ThreadPoolExecutor] = []
+
+    def make(
+        context: StrategyContext | None = None,
+        **config
+    ) -> StrategyOptimizer:
+        optimizer = StrategyOptimizer()
+
+        for name, value in {**RUN_CONFIG, **config}.items():
+            setattr(optimizer.config, name, value)
+
+        if context is not None:
+            optimizer._init_optimization(context)
+            optimizer._executor = ThreadPoolExecutor(max_workers=2)
+            executors.append(optimizer._executor)
+
+        return optimizer
+
+    yield make
+
+    for executor in executors:
+        executor.shutdown()
+
+
+@fixture(scope='session')
+def make_results() -> Callable[[], Results]:
+    """
+    Provide a builder of result collectors.
+
+    Returns:
+        Callable: Function building an empty collector usable
+                  as an on_result(task_id, result, error) callback
+    """
+
+    return Results
@@ -0,0 +1,8 @@
+from .series import (
+    SERIES,
+    SMOOTHED_SERIES,
+    UNSUPPORTED,
+    assert_bit_identical,
+    make_bars,
+    make_series
+)
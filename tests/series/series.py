@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def make_series(kind: str, n: int = 1500, seed: int = 0) -> np.ndarray:
+    """Build a test series exercising a particular edge case."""
+
+    rng = np.random.default_rng(seed)
+    series = 10000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+
+    if kind == 'leading_nan':
+        series[:37] = np.nan
+    elif kind == 'sparse_nan':
+        series[rng.random(n) < 0.03] = np.nan
+    elif kind == 'nan_runs':
+        for start in rng.integers(0, n, 8):
+            series[start:start + rng.integers(1, 60)] = np.nan
+    elif kind == 'ties':
+        series = np.round(series / 50) * 50
+    elif kind == 'signed_zeros':
+        series = rng.choice([0.0, -0.0, 1.0, -1.0], n)
+    elif kind == 'infinite':
+        series[rng.random(n) < 0.02] = np.inf
+        series[rng.random(n) < 0.02] = -np.inf
+    elif kind == 'constant':
+        series[:] = 12345.678
+    elif kind == 'all_nan':
+        series[:] = np.nan
+
+    return series
+
+
+SERIES = [
+    'random_walk',
+    'leading_nan',
+    'sparse_nan',
+    'nan_runs',
+    'ties',
+    'signed_zeros',
+    'infinite',
+    'constant',
+    'all_nan',
+]
+
+# Series the EMA-seeded batch kernels can't handle: they read past
+# the end when no `length` values follow leading NaNs, which is also
+# the case for the ADX of DMI once its DX is NaN throughout (flat
+# series, or a NaN that sticks in the smoothed true range)
+SMOOTHED_SERIES = [kind for kind in SERIES if kind != 'all_nan']
+UNSUPPORTED = {
+    ('dmi', kind)
+    for kind in ('sparse_nan', 'nan_runs', 'infinite', 'constant')
+}
+
+
+def make_bars(kind: str, n: int = 1500, seed: int = 0) -> dict:
+    """Build OHLCV-like series around a test close series."""
+
+    rng = np.random.default_rng(seed + 1)
+    close = make_series(kind, n, seed)
+    spread = np.abs(close) * rng.uniform(0, 0.01, n)
+
+    return {
+        'time': np.arange(n) * 3600000.0 + 1700000000000.0,
+        'high': close + spread,
+        'low': close - spread,
+        'close': close,
+        'volume': rng.uniform(0, 100, n),
+    }
+
+
+def assert_bit_identical(actual: np.ndarray, expected: np.ndarray) -> None:
+    """Compare float arrays bit by bit (NaN positions, signed zeros)."""
+
+    assert actual.shape == expected.shape
+    assert np.array_equal(actual.view(np.int64), expected.view(np.int64))
@@ -0,0 +1,174 @@
+import random
+from typing import Callable
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from src.features.optimization.optimizer import CHECKPOINT_NAMESPACE
+from src.infrastructure.storage import checkpoint_store
+from src.infrastructure.storage.checkpoint_store import CheckpointStore
+
+
+class Interrupted(Exception):
+    """Raised to kill an optimization between batches."""
+
+
+class TestCheckpointStore:
+    """Test the file storage of state snapshots."""
+
+    @fixture
+    def store(self, tmp_path) -> CheckpointStore:
+        store = CheckpointStore()
+        store._root = str(tmp_path)
+        return store
+
+    def test_round_trip(self, store: CheckpointStore) -> None:
+        """Validates that a saved snapshot loads back equal."""
+
+        state = {'genes': np.arange(6).reshape(2, 3), 'run': 1}
+        store.save('optimization', 'context/0', state)
+        loaded = store.load('optimization', 'context/0')
+
+        assert loaded['run'] == 1
+        assert np.array_equal(loaded['genes'], state['genes'])
+        assert store.keys('optimization') == ['context/0']
+        assert store.keys('contexts') == []
+
+    def test_save_replaces_snapshot(self, store: CheckpointStore) -> None:
+        """
+        Validates that a save replaces the snapshot and that
+        a failed save keeps the previous one.
+        """
+
+        store.save('optimization', 'a', 1)
+        store.save('optimization', 'a', 2)
+        store.save('optimization', 'a', lambda: None)
+
+        assert store.load('optimization', 'a') == 2
+
+    def test_missing_and_corrupted(self, store: CheckpointStore) -> None:
+        """Validates that unreadable snapshots load as None."""
+
+        store.save('optimization', 'a', 1)
+
+        with open(store._path('optimization', 'a'), 'wb') as file:
+            file.write(b'not a pickle')
+
+        assert store.load('optimization', 'a') is None
+        assert store.load('optimization', 'b') is None
+
+    def test_delete(self, store: CheckpointStore) -> None:
+        """Validates that deleted snapshots are gone."""
+
+        store.save('optimization', 'a', 1)
+        store.delete('optimization', 'a')
+        store.delete('optimization', 'a')
+
+        assert store.load('optimization', 'a') is None
+        assert store.keys('optimization') == []
+
+
+class TestOptimizerCheckpoint:
+    """Test resuming optimizations from checkpoints."""
+
+    CONFIG = {'optimization_runs': 2, 'checkpoint_interval': 1e-9}
+
+    @fixture(autouse=True)
+    def storage(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(checkpoint_store, '_root', str(tmp_path))
+
+    @fixture
+    def optimize(self, make_optimizer) -> Callable:
+        def optimize(
+            context: dict,
+            checkpoint_id: str,
+            interrupt_after: int | None = None,
+            **config
+        ):
+            """Optimize a context, killing it after some batches."""
+
+            optimizer = make_optimizer(**config)
+            save_checkpoint = optimizer.save_checkpoint
+            batches = []
+
+            def interrupting_save_checkpoint(engine_state, force=False):
+                save_checkpoint(engine_state, force)
+
+                if engine_state is None:
+                    return
+
+                batches.append(engine_state)
+
+                if len(batches) == interrupt_after:
+                    raise Interrupted
+
+            optimizer.save_checkpoint = interrupting_save_checkpoint
+            best_params = optimizer.optimize(context, checkpoint_id)
+            return optimizer, best_params, len(batches)
+
+        return optimize
+
+    @staticmethod
+    def seed() -> None:
+        random.seed(11)
+        np.random.seed(11)
+
+    @mark.parametrize('interrupt_after', [2, 4])
+    def test_resumed_run_matches_uninterrupted(
+        self,
+        optimize,
+        make_context,
+        interrupt_after: int
+    ) -> None:
+        """
+        Validates that an optimization killed between batches
+        resumes to the result of an uninterrupted one
+        and deletes its checkpoint once it finishes.
+        """
+
+        context = make_context()
+
+        self.seed()
+        expected, expected_params, _ = optimize(
+            context, 'reference', **self.CONFIG
+        )
+
+        self.seed()
+        with raises(Interrupted):
+            optimize(context, 'task', interrupt_after, **self.CONFIG)
+
+        assert checkpoint_store.keys(CHECKPOINT_NAMESPACE) == ['task']
+
+        random.seed(0)
+        np.random.seed(0)
+        resumed, resumed_params, batches = optimize(
+            context, 'task', **self.CONFIG
+        )
+
+        assert resumed_params == expected_params
+        assert resumed.best_test_fitness == expected.best_test_fitness
+        assert resumed.cache.misses == expected.cache.misses
+        assert batches == 6 - interrupt_after
+        assert checkpoint_store.keys(CHECKPOINT_NAMESPACE) == []
+
+    def test_other_configuration_starts_over(
+        self,
+        optimize,
+        make_context
+    ) -> None:
+        """
+        Validates that a checkpoint of a different configuration
+        is ignored.
+        """
+
+        context = make_context()
+
+        with raises(Interrupted):
+            optimize(context, 'task', 4, **self.CONFIG)
+
+        _, best_params, batches = optimize(
+            context, 'task', **{**self.CONFIG, 'iterations': 8}
+        )
+
+        assert batches == 4
+        assert len(best_params) == 2
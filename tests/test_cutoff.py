@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import fixture, mark
+
+from src.core.strategies import strategy_registry
+from src.core.strategies.core.utils import cutoff
+from src.features.optimization.utils import max_drawdown
+
+
+STRATEGIES = ['ExampleV1', 'ExampleV2']
+
+
+class TestCutoff:
+    """Test early termination of backtests."""
+
+    @fixture
+    def market_data(self, make_market_data) -> dict:
+        market_data = make_market_data(5000, seed=5)
+        klines = market_data['klines']
+
+        # Bar-aligned daily closes of the previous day for ExampleV2
+        htf = klines.copy()
+        htf[:, 4] = np.concatenate((np.full(24, np.nan), klines[:-24, 4]))
+        market_data['feeds'] = {'klines': {'HTF': htf}}
+
+        return market_data
+
+    @staticmethod
+    def backtest(name: str, market_data: dict, bounds=None):
+        strategy = strategy_registry[name]()
+        strategy.__calculate__(market_data, bounds)
+        return strategy
+
+    def test_exceeded(self) -> None:
+        """Validates the equity floor and the drawdown bound."""
+
+        assert cutoff.exceeded(0.0, 100.0, 0.0, np.inf)
+        assert cutoff.exceeded(79.0, 100.0, 0.0, 20.0)
+        assert not cutoff.exceeded(80.0, 100.0, 0.0, 20.0)
+        assert not cutoff.exceeded(1.0, 100.0, 0.0, np.inf)
+        assert not cutoff.exceeded(50.0, 0.0, -np.inf, 20.0)
+
+    def test_max_drawdown(self) -> None:
+        """
+        Validates that the drawdown is measured on closed-deal equity
+        from the initial capital on.
+        """
+
+        deals = np.zeros((4, 13))
+        deals[:, 8] = [-10.0, 30.0, -48.0, 10.0]
+
+        assert max_drawdown(deals[:0], 100.0) == 0.0
+        assert max_drawdown(deals[:1], 100.0) == 10.0
+        assert max_drawdown(deals, 100.0) == 40.0
+
+    @mark.parametrize('name', STRATEGIES)
+    def test_run_over_bounds_is_aborted(
+        self,
+        name: str,
+        market_data: dict
+    ) -> None:
+        """
+        Validates that a run whose drawdown exceeds the bound
+        is aborted.
+        """
+
+        full = self.backtest(name, market_data)
+        capital = full.params['initial_capital']
+
+        # Every run with a losing deal after its peak exceeds it
+        bounds = {'min_equity': 0.0, 'max_drawdown': 0.0}
+        aborted = self.backtest(name, market_data, bounds)
+        ruined = self.backtest(name, market_data, {'min_equity': capital})
+
+        assert max_drawdown(full.completed_deals_log, capital) > 0
+        assert not full.aborted
+        assert aborted.aborted
+        assert ruined.aborted
+
+    @mark.parametrize('name', STRATEGIES)
+    def test_run_under_bounds_is_unchanged(
+        self,
+        name: str,
+        market_data: dict
+    ) -> None:
+        """
+        Validates that a run within the bounds produces the same
+        deals as an uncapped one.
+        """
+
+        full = self.backtest(name, market_data)
+        drawdown = max_drawdown(
+            full.completed_deals_log, full.params['initial_capital']
+        )
+        bounds = {'min_equity': 0.0, 'max_drawdown': drawdown + 1.0}
+        capped = self.backtest(name, market_data, bounds)
+
+        assert not capped.aborted
+        assert full.completed_deals_log.shape[0] > 0
+        assert np.array_equal(
+            capped.completed_deals_log,
+            full.completed_deals_log,
+            equal_nan=True
+        )
@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import sleep
+
+from pytest import raises
+
+from src.features.optimization.datasets import DatasetRegistry
+
+
+class TestDatasetRegistry:
+    """Test sharing of loaded market data between contexts."""
+
+    def test_datasets_are_shared(self) -> None:
+        """
+        Validates that contexts on the same dataset get one package
+        and that it's dropped with the last reference.
+        """
+
+        registry = DatasetRegistry()
+        loads = []
+
+        def loader() -> dict:
+            loads.append(1)
+            return {'symbol': 'TEST'}
+
+        first = registry.acquire('a', loader)
+        second = registry.acquire('a', loader)
+        other = registry.acquire('b', loader)
+
+        assert second is first
+        assert other is not first
+        assert len(loads) == 2
+        assert len(registry) == 2
+
+        registry.release(first)
+        assert len(registry) == 2
+
+        registry.release(second)
+        registry.release(second)
+        assert len(registry) == 1
+
+        assert registry.acquire('a', loader) is not first
+        assert len(loads) == 3
+
+    def test_concurrent_loads_run_once(self) -> None:
+        """
+        Validates that requests for a dataset that is still loading
+        wait for that load and hold their own references.
+        """
+
+        registry = DatasetRegistry()
+        started, finish = Event(), Event()
+        loads = []
+
+        def loader() -> dict:
+            loads.append(1)
+            started.set()
+            finish.wait(5)
+            return {'symbol': 'TEST'}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first = executor.submit(registry.acquire, 'a', loader)
+            started.wait(5)
+            waiting = [
+                executor.submit(registry.acquire, 'a', loader)
+                for _ in range(3)
+            ]
+
+            while registry._loading['a'][1][0] < 3:
+                sleep(0.001)
+
+            finish.set()
+            results = [future.result() for future in [first, *waiting]]
+
+        assert len(loads) == 1
+        assert all(result is results[0] for result in results)
+
+        for result in results[:-1]:
+            registry.release(result)
+
+        assert len(registry) == 1
+
+        registry.release(results[-1])
+        assert len(registry) == 0
+
+    def test_failed_load_is_raised_to_waiters(self) -> None:
+        """
+        Validates that a failed load is raised in every waiting
+        request and that the next request loads again.
+        """
+
+        registry = DatasetRegistry()
+        started, finish = Event(), Event()
+
+        def failing_loader() -> dict:
+            started.set()
+            finish.wait(5)
+            raise ConnectionError('exchange is down')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(registry.acquire, 'a', failing_loader)
+            started.wait(5)
+            waiting = executor.submit(registry.acquire, 'a', failing_loader)
+
+            while registry._loading['a'][1][0] < 1:
+                sleep(0.001)
+
+            finish.set()
+
+            for future in (first, waiting):
+                with raises(ConnectionError):
+                    future.result()
+
+        assert len(registry) == 0
+        assert registry.acquire('a', lambda: {'symbol': 'TEST'}) == {
+            'symbol': 'TEST'
+        }
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import mark
+
+from src.core.strategies.core.utils import log
+
+
+class TestDealLog:
+    """Test buffered deal logs against the growing ones."""
+
+    @mark.parametrize('seed', range(5))
+    def test_buffered_logs_match(self, seed: int) -> None:
+        """
+        Validates that open_buffered()/close_buffered() followed by
+        trim() build the same logs and PnL as open()/close().
+        """
+
+        rng = np.random.default_rng(seed)
+        open_log = np.full((1, 5), np.nan)
+        open_buffer = np.full((1, 5), np.nan)
+        deals_log = np.empty((0, 13))
+        deals_buffer = np.empty((0, 13))
+
+        for step in range(500):
+            date = 1514764800000.0 + step * 60000.0
+            price = float(rng.uniform(90.0, 110.0))
+            active = np.flatnonzero(~np.isnan(open_log[:, 0]))
+
+            if active.size == 0 or rng.random() < 0.5:
+                deal = (
+                    float(rng.integers(0, 2)),
+                    float(rng.integers(100, 110)),
+                    date,
+                    price,
+                    float(rng.choice([0.0, 0.5, 1.25]))
+                )
+                open_log = log.open(open_log, *deal)
+                open_buffer = log.open_buffered(open_buffer, *deal)
+                continue
+
+            index = int(rng.choice(active))
+            position_type, signal, order_date, order_price, size = (
+                open_log[index]
+            )
+            deal = (
+                0.05, position_type, signal, 200.0, order_date, date,
+                order_price, price, size, 10000.0
+            )
+            deals_log, pnl = log.close(deals_log, *deal)
+            deals_buffer, buffered_pnl = log.close_buffered(
+                deals_buffer, *deal
+            )
+            open_log = log.remove(open_log, index)
+            open_buffer = log.remove(open_buffer, index)
+
+            assert buffered_pnl == pnl
+
+        count = open_log.shape[0]
+
+        assert deals_log.shape[0] > 100
+        assert np.array_equal(log.trim(deals_buffer), deals_log)
+        assert np.array_equal(log.trim(deals_log), deals_log)
+        assert np.array_equal(open_buffer[:count], open_log, equal_nan=True)
+        assert np.isnan(open_buffer[count:]).all()
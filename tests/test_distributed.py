@@ -0,0 +1,295 @@
+from __future__ import annotations
+from os import getpid
+from pickle import dumps
+from socket import create_connection
+from threading import Thread
+from time import sleep
+
+import numpy as np
+from pytest import fixture, raises
+
+from src.features.optimization.distributed import Coordinator, RemoteWorker
+from src.features.optimization.distributed import protocol
+from src.features.optimization.distributed.protocol import (
+    HEADER,
+    AuthenticationError,
+    Channel
+)
+from src.features.optimization.shared_memory import (
+    SharedMemoryRegistry,
+    attach_market_data,
+    detach_segments
+)
+
+
+TOKEN = 'secret'
+
+
+def close_sum_handler(task_id: str, task: dict) -> dict:
+    """Sum close prices of the task's market data in a pool process."""
+
+    market_data, segments = attach_market_data(task['market_data'])
+
+    try:
+        sleep(task.get('delay', 0.0))
+        return {
+            'sum': float(market_data['klines'][:, 4].sum()),
+            'pid': getpid(),
+        }
+    finally:
+        market_data = None
+        detach_segments(segments)
+
+
+class TestDistributed:
+    """Test the coordinator/worker protocol with localhost workers."""
+
+    @fixture
+    def shared_memory(self):
+        registry = SharedMemoryRegistry()
+        published = []
+
+        def publish(seed: int):
+            klines = np.random.default_rng(seed).random((500, 6))
+            shared_data = registry.publish_market_data({
+                'symbol': 'TEST',
+                'interval': None,
+                'p_precision': 0.01,
+                'q_precision': 0.001,
+                'klines': klines,
+            })
+            published.append(shared_data)
+            return shared_data, float(klines[:, 4].sum())
+
+        yield publish
+
+        for shared_data in published:
+            registry.release_market_data(shared_data)
+
+    @fixture
+    def cluster(self, make_results):
+        coordinators: list[Coordinator] = []
+        workers: list[RemoteWorker] = []
+
+        def create_coordinator(**kwargs) -> tuple:
+            results = make_results()
+            coordinator = Coordinator(
+                host='127.0.0.1', port=0, on_result=results,
+                **{'token': TOKEN, **kwargs}
+            )
+            coordinators.append(coordinator)
+            return coordinator, results
+
+        def start_worker(coordinator, **kwargs) -> RemoteWorker:
+            host, port = coordinator.address
+            worker = RemoteWorker(
+                host, port, handler=close_sum_handler,
+                **{'token': TOKEN, **kwargs}
+            )
+            Thread(target=worker.run, daemon=True).start()
+            workers.append(worker)
+            return worker
+
+        yield create_coordinator, start_worker
+
+        for worker in workers:
+            worker.close()
+
+        for coordinator in coordinators:
+            coordinator.close()
+
+    def test_tasks_are_distributed(self, cluster, shared_memory) -> None:
+        """
+        Validates that tasks of several workers all complete with
+        correct results and that every dataset is shipped to
+        a worker at most once.
+        """
+
+        create_coordinator, start_worker = cluster
+        coordinator, results = create_coordinator()
+        workers = [start_worker(coordinator, slots=2) for _ in range(3)]
+
+        shipped: list[tuple] = []
+        for worker in workers:
+            publish = worker._publish
+
+            def counting_publish(key, market_data, publish=publish, w=worker):
+                shipped.append((id(w), key))
+                publish(key, market_data)
+
+            worker._publish = counting_publish
+
+        datasets = [shared_memory(seed) for seed in range(2)]
+        for i in range(12):
+            shared_data, _ = datasets[i % 2]
+            coordinator.submit(
+                f'task/{i}', {'market_data': shared_data, 'delay': 0.2}
+            )
+
+        assert results.wait(12)
+
+        for i in range(12):
+            result, error = results.items[f'task/{i}']
+            assert error is None
+            assert result['sum'] == datasets[i % 2][1]
+
+        assert len(shipped) == len(set(shipped))
+        assert coordinator.stats()['pending'] == 0
+
+    def test_lost_worker_tasks_are_requeued(
+        self,
+        cluster,
+        shared_memory
+    ) -> None:
+        """
+        Validates that tasks of a disconnected worker are re-queued
+        and completed by the remaining worker.
+        """
+
+        create_coordinator, start_worker = cluster
+        coordinator, results = create_coordinator()
+        lost = start_worker(coordinator, slots=2)
+
+        shared_data, expected = shared_memory(0)
+        for i in range(4):
+            coordinator.submit(
+                f'task/{i}', {'market_data': shared_data, 'delay': 1.0}
+            )
+
+        sleep(0.5)
+        start_worker(coordinator, slots=2)
+        lost.stop()
+
+        assert results.wait(4)
+        assert all(
+            error is None and result['sum'] == expected
+            for result, error in results.items.values()
+        )
+
+    def test_silent_worker_is_dropped(self, cluster, shared_memory) -> None:
+        """
+        Validates that a worker without heartbeats is dropped and
+        its task is completed by a healthy worker.
+        """
+
+        create_coordinator, start_worker = cluster
+        coordinator, results = create_coordinator(heartbeat_timeout=1.0)
+        silent = start_worker(coordinator, slots=1, heartbeat_interval=60)
+
+        shared_data, expected = shared_memory(0)
+        coordinator.submit(
+            'task/0', {'market_data': shared_data, 'delay': 3.0}
+        )
+
+        sleep(0.2)
+        healthy = start_worker(
+            coordinator, slots=1, heartbeat_interval=0.2
+        )
+
+        assert results.wait(1)
+        result, error = results.items['task/0']
+        assert error is None and result['sum'] == expected
+
+        healthy_pids = {proc.pid for proc in healthy._pool._procs if proc}
+        assert result['pid'] in healthy_pids
+        assert silent._channel is None
+
+    def test_idle_worker_steals_tasks(self, cluster, shared_memory) -> None:
+        """
+        Validates that a worker joining late steals prefetched tasks
+        that a busy worker hasn't started.
+        """
+
+        create_coordinator, start_worker = cluster
+        coordinator, results = create_coordinator(prefetch=3)
+        busy = start_worker(coordinator, slots=1)
+
+        shared_data, _ = shared_memory(0)
+        for i in range(4):
+            coordinator.submit(
+                f'task/{i}', {'market_data': shared_data, 'delay': 1.0}
+            )
+
+        sleep(0.5)
+        thief = start_worker(coordinator, slots=2)
+
+        assert results.wait(4)
+
+        thief_pids = {proc.pid for proc in thief._pool._procs if proc}
+        busy_pids = {proc.pid for proc in busy._pool._procs if proc}
+        pids = [result['pid'] for result, _ in results.items.values()]
+        assert sum(pid in thief_pids for pid in pids) >= 2
+        assert sum(pid in busy_pids for pid in pids) >= 1
+
+    def test_cancelled_task_is_not_reported(
+        self,
+        cluster,
+        shared_memory
+    ) -> None:
+        """Validates that cancelled tasks never report a result."""
+
+        create_coordinator, start_worker = cluster
+        coordinator, results = create_coordinator()
+        start_worker(coordinator, slots=1)
+
+        shared_data, _ = shared_memory(0)
+        coordinator.submit(
+            'task/0', {'market_data': shared_data, 'delay': 1.0}
+        )
+        coordinator.submit(
+            'task/1', {'market_data': shared_data, 'delay': 0.0}
+        )
+
+        sleep(0.5)
+        assert coordinator.cancel('task/0')
+        assert not coordinator.cancel('task/0')
+
+        assert results.wait(1)
+        sleep(1.5)
+        assert list(results.items) == ['task/1']
+
+    def test_empty_token_is_refused(self, make_results) -> None:
+        """Validates that coordinators and workers require a token."""
+
+        with raises(ValueError):
+            Coordinator(host='127.0.0.1', port=0, on_result=make_results())
+
+        with raises(ValueError):
+            RemoteWorker('127.0.0.1', 9100, token='')
+
+    def test_unauthenticated_peers_are_not_unpickled(
+        self,
+        cluster,
+        monkeypatch
+    ) -> None:
+        """
+        Validates that peers with a wrong token or without
+        a handshake are rejected before any frame is unpickled.
+        """
+
+        loaded = []
+        monkeypatch.setattr(protocol, 'loads', loaded.append)
+
+        create_coordinator, _ = cluster
+        coordinator, _ = create_coordinator()
+
+        channel = Channel(create_connection(coordinator.address))
+        with raises(AuthenticationError):
+            channel.authenticate('wrong', server=False)
+        channel.close()
+
+        # A pickled message in place of the challenge response
+        sock = create_connection(coordinator.address)
+        payload = dumps(('hello', {'slots': 1}))
+        sock.sendall(HEADER.pack(len(payload)) + payload)
+
+        while sock.recv(1024):
+            pass
+
+        sock.close()
+
+        with raises(AuthenticationError):
+            Channel(create_connection(coordinator.address)).recv()
+
+        assert loaded == []
+        assert coordinator.size == 0
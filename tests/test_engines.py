@@ -0,0 +1,139 @@
+import random
+from typing import Callable
+
+import numpy as np
+from pytest import fixture, mark
+
+from src.core.strategies import strategy_registry
+from src.features.optimization.engines import TPEEngine
+
+
+class SmallGrid(strategy_registry['ExampleV1']):
+    """ExampleV1 with a parameter grid of four samples."""
+
+    opt_params = {'stop_type': [1, 2], 'trail_stop': [1, 2]}
+
+
+class TestTPEEngine:
+    """Test the Tree-structured Parzen Estimator engine."""
+
+    @fixture(autouse=True)
+    def seed(self) -> None:
+        random.seed(3)
+        np.random.seed(3)
+
+    @fixture
+    def run(self, make_optimizer) -> Callable[..., tuple[list, list]]:
+        def run(context: dict, **config) -> tuple[list, list]:
+            """
+            Optimize a context with a synthetic fitness peaking
+            at the middle of every parameter's values.
+
+            Returns:
+                tuple: (startup scores, scores of TPE batches)
+            """
+
+            startup, batches = [], []
+            optimizer = make_optimizer(**config)
+
+            def backtest(genes, window, market, cutoff=None):
+                middle = np.array([
+                    (len(values) - 1) / 2 for values in optimizer.param_values
+                ])
+                sizes = np.array([
+                    len(values) for values in optimizer.param_values
+                ])
+                return 1.0 / (1.0 + (((genes - middle) / sizes) ** 2).sum())
+
+            evaluate_many = optimizer.evaluate_many
+
+            def recording_evaluate_many(individuals, window, cached=True):
+                scores = evaluate_many(individuals, window, cached)
+
+                if window == 'train':
+                    (batches if cached else startup).append(
+                        list(zip(map(tuple, individuals), scores))
+                    )
+
+                return scores
+
+            optimizer._backtest = backtest
+            optimizer.evaluate_many = recording_evaluate_many
+            optimizer.optimize(context)
+            return startup, batches
+
+        return run
+
+    def test_density_keeps_values_reachable(self) -> None:
+        """
+        Validates that densities are normalized, peak at observed
+        values and keep unobserved values reachable.
+        """
+
+        numeric = TPEEngine._density(np.array([5, 5, 6]), 20, False)
+        categorical = TPEEngine._density(np.array([1, 1]), 3, True)
+        prior = TPEEngine._density(np.array([], dtype=np.int64), 4, False)
+
+        for density in (numeric, categorical, prior):
+            assert np.isclose(density.sum(), 1.0)
+            assert (density > 0).all()
+
+        assert numeric.argmax() == 5
+        assert numeric[4] > numeric[0]
+        assert categorical.argmax() == 1
+        assert np.allclose(prior, 0.25)
+
+    def test_suggestions_are_new(self, run, make_context) -> None:
+        """
+        Validates that a run backtests the configured number
+        of distinct samples after startup.
+        """
+
+        startup, batches = run(
+            make_context(engine='tpe'),
+            tpe_startup=8, tpe_iterations=20, batch_size=6
+        )
+        samples = [
+            sample for batch in startup + batches for sample, _ in batch
+        ]
+
+        assert [len(batch) for batch in batches] == [6, 6, 6, 2]
+        assert len(set(samples)) == len(samples) == 28
+
+    def test_run_ends_on_exhausted_grid(self, run, make_context) -> None:
+        """Validates that a run ends once every sample is evaluated."""
+
+        startup, batches = run(
+            make_context(engine='tpe', strategy_class=SmallGrid),
+            tpe_startup=2, tpe_iterations=10
+        )
+        samples = {
+            sample for batch in startup + batches for sample, _ in batch
+        }
+
+        assert len(samples) == 4
+
+    @mark.parametrize('seed', [0, 1, 2])
+    def test_search_improves_on_startup(
+        self,
+        run,
+        make_context,
+        seed: int
+    ) -> None:
+        """
+        Validates that TPE batches find better samples than
+        the random startup.
+        """
+
+        random.seed(seed)
+        np.random.seed(seed)
+        startup, batches = run(
+            make_context(engine='tpe'),
+            tpe_startup=10, tpe_iterations=60, batch_size=10
+        )
+        best_startup = max(score for _, score in startup[0])
+        best_search = max(
+            score for batch in batches for _, score in batch
+        )
+
+        assert best_search > best_startup
@@ -0,0 +1,180 @@
+from __future__ import annotations
+from asyncio import sleep
+from importlib import import_module
+from threading import Thread
+
+import numpy as np
+from pytest import fixture
+
+from src.core.providers.core.history_provider import HistoryProvider
+from src.infrastructure.exchanges.models import Interval
+from src.infrastructure.storage import kline_store
+
+
+HOUR = 3600000
+JAN_1 = 1577836800000
+DAY = 24 * HOUR
+
+
+class FakeMarket:
+    """Hourly klines of a fake exchange, recording every download."""
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        listed: int = 0,
+        holes: tuple[tuple[int, int], ...] = ()
+    ) -> None:
+        self.delay = delay
+        self.listed = listed
+        self.holes = holes
+        self.calls: list[tuple[int, int]] = []
+
+    def get_interval_duration(self, interval: Interval) -> int:
+        return HOUR
+
+    async def get_historical_klines_async(
+        self,
+        symbol: str,
+        interval: Interval,
+        start: int,
+        end: int
+    ) -> list:
+        self.calls.append((start, end))
+        await sleep(self.delay)
+        first = max(-(-start // HOUR) * HOUR, self.listed)
+        return [
+            [time, 1.0, 2.0, 0.5, 1.5, 10.0, 0]
+            for time in range(first, end + 1, HOUR)
+            if not any(lo < time < hi for lo, hi in self.holes)
+        ]
+
+
+class FakeClient:
+    """Exchange client exposing only the market API."""
+
+    exchange_name = 'FAKE'
+
+    def __init__(self, market: FakeMarket) -> None:
+        self.market = market
+
+
+@fixture
+def storage(tmp_path, monkeypatch):
+    """Redirect the kline store and SQLite databases to tmp_path."""
+
+    (tmp_path / 'databases').mkdir()
+    monkeypatch.setattr(kline_store, '_root', str(tmp_path / 'klines'))
+    monkeypatch.setattr(
+        import_module('src.infrastructure.storage.db_manager'),
+        'dirname',
+        lambda path: str(tmp_path)
+    )
+    return tmp_path
+
+
+def load(market: FakeMarket, start: str, end: str) -> np.ndarray:
+    """Load hourly klines of the fake exchange."""
+
+    return HistoryProvider()._get_klines(
+        FakeClient(market), 'TEST', Interval.HOUR_1, start, end
+    )
+
+
+class TestHistoryProvider:
+    """Test incremental kline downloads into the kline store."""
+
+    def test_only_missing_ranges_are_downloaded(self, storage) -> None:
+        """
+        Validates that a wider request downloads only the head and
+        the tail missing from the store, and a repeated one nothing.
+        """
+
+        market = FakeMarket()
+        load(market, '2020-01-10', '2020-01-20')
+        market.calls.clear()
+
+        klines = load(market, '2020-01-01', '2020-01-31')
+        calls = list(market.calls)
+        repeated = load(market, '2020-01-01', '2020-01-31')
+
+        assert calls == [
+            (JAN_1, JAN_1 + 9 * DAY),
+            (JAN_1 + 19 * DAY, JAN_1 + 30 * DAY),
+        ]
+        assert market.calls == calls
+        assert klines.shape[0] == 30 * 24 + 1
+        assert np.array_equal(klines, repeated)
+
+    def test_interior_holes_are_downloaded(self, storage) -> None:
+        """
+        Validates that a hole inside the stored klines is downloaded
+        between the klines bounding it.
+        """
+
+        market = FakeMarket()
+        klines = load(market, '2020-01-01', '2020-01-11')
+        kline_store.write(
+            'fake', 'test_hour_1',
+            np.concatenate((klines[:100], klines[150:]))
+        )
+        market.calls.clear()
+
+        filled = load(market, '2020-01-01', '2020-01-11')
+
+        assert market.calls == [(JAN_1 + 99 * HOUR, JAN_1 + 150 * HOUR)]
+        assert np.array_equal(filled, klines)
+
+    def test_empty_holes_are_remembered(self, storage) -> None:
+        """
+        Validates that a hole the exchange has no klines for
+        is downloaded once.
+        """
+
+        hole = (JAN_1 + 99 * HOUR, JAN_1 + 150 * HOUR)
+        market = FakeMarket(holes=(hole,))
+        load(market, '2020-01-01', '2020-01-11')
+        load(market, '2020-01-01', '2020-01-11')
+        klines = load(market, '2020-01-01', '2020-01-11')
+
+        assert market.calls == [(JAN_1, JAN_1 + 10 * DAY), hole]
+        assert klines.shape[0] == 10 * 24 + 1 - 50
+
+    def test_listing_start_is_remembered(self, storage) -> None:
+        """
+        Validates that klines before the first exchange kline
+        aren't requested again.
+        """
+
+        market = FakeMarket(listed=JAN_1 + 9 * DAY)
+        load(market, '2020-01-01', '2020-01-20')
+        klines = load(market, '2019-12-01', '2020-01-20')
+
+        assert market.calls == [(JAN_1, JAN_1 + 19 * DAY)]
+        assert klines[0, 0] == JAN_1 + 9 * DAY
+
+    def test_concurrent_fills_download_once(self, storage) -> None:
+        """
+        Validates that providers filling the same table concurrently
+        download the missing klines once and all read them whole.
+        """
+
+        market = FakeMarket(delay=0.2)
+        shapes = []
+
+        def fill() -> None:
+            shapes.append(load(market, '2020-01-01', '2020-02-01').shape)
+
+        threads = [Thread(target=fill) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        stored = kline_store.read('fake', 'test_hour_1')
+
+        assert market.calls == [(JAN_1, JAN_1 + 31 * DAY)]
+        assert shapes == [(745, 6)] * 4
+        assert np.array_equal(np.diff(stored[:, 0]), np.full(744, HOUR))
@@ -0,0 +1,122 @@
+import numpy as np
+from pytest import fixture
+
+from src.core.strategies.core import quanta
+from src.features.optimization.indicator_cache import IndicatorCache
+
+
+class TestIndicatorCache:
+    """Test memoization of quanta indicators."""
+
+    @fixture
+    def series(self) -> np.ndarray:
+        return np.random.default_rng(3).random((500, 6)) + 1.0
+
+    @fixture
+    def cache(self) -> IndicatorCache:
+        return IndicatorCache(1024 * 1024)
+
+    def test_repeated_calls_hit(self, cache, series) -> None:
+        """
+        Validates that a repeated call returns the memoized series
+        and that its result equals the uncached one.
+        """
+
+        close = series[:, 4]
+
+        with cache.install(quanta):
+            first = quanta.sma(close, 10)
+            second = quanta.sma(close, length=10)
+            other = quanta.sma(close, 11)
+
+        assert second is first
+        assert other is not first
+        assert np.array_equal(first, quanta.sma(close, 10), equal_nan=True)
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 2
+
+    def test_keys_follow_series_identity(self, cache, series) -> None:
+        """
+        Validates that equal values in other buffers or views
+        are different keys.
+        """
+
+        with cache.install(quanta):
+            column = quanta.sma(series[:, 4], 10)
+            copied = quanta.sma(series[:, 4].copy(), 10)
+            sliced = quanta.sma(series[1:, 4], 10)
+
+        assert copied is not column
+        assert np.array_equal(copied, column, equal_nan=True)
+        assert sliced.shape[0] == 499
+        assert cache.stats()['hits'] == 0
+
+    def test_scalar_types_are_keyed(self, cache) -> None:
+        """Validates that scalars of different types aren't equal keys."""
+
+        assert (
+            cache._make_key('f', {'x': 1})[0]
+            != cache._make_key('f', {'x': 1.0})[0]
+        )
+        assert cache._make_key('f', {'x': [1]}) == (None, ())
+
+    def test_unkeyable_calls_bypass(self, cache) -> None:
+        """Validates that calls with unhashable arguments aren't cached."""
+
+        calls = []
+
+        def total(values, scale=1):
+            calls.append(values)
+            return np.array([sum(values) * scale], dtype=np.float64)
+
+        wrapped = cache.wrap('total', total)
+
+        assert wrapped([1, 2])[0] == 3.0
+        assert wrapped([1, 2])[0] == 3.0
+        assert len(calls) == 2
+        assert cache.stats()['size'] == 0
+
+    def test_least_recently_used_is_evicted(self, series) -> None:
+        """
+        Validates that entries are evicted in LRU order
+        once the memory cap is exceeded.
+        """
+
+        close = series[:, 4]
+        cache = IndicatorCache(2 * close.nbytes)
+
+        with cache.install(quanta):
+            first = quanta.sma(close, 5)
+            quanta.sma(close, 6)
+            quanta.sma(close, 5)
+            quanta.sma(close, 7)
+
+            assert quanta.sma(close, 5) is first
+            assert cache.stats()['hits'] == 2
+            quanta.sma(close, 6)
+
+        assert cache.stats()['misses'] == 4
+        assert cache.stats()['size'] == 2
+        assert cache.stats()['nbytes'] <= 2 * close.nbytes
+
+    def test_install_restores_functions(self, cache) -> None:
+        """Validates that install() restores the module on exit."""
+
+        original = quanta.sma
+
+        with cache.install(quanta):
+            assert quanta.sma is not original
+
+        assert quanta.sma is original
+
+    def test_disabled_cache_leaves_module(self, series) -> None:
+        """Validates that a cache of 0 bytes doesn't wrap anything."""
+
+        cache = IndicatorCache(0)
+        original = quanta.sma
+
+        with cache.install(quanta):
+            assert quanta.sma is original
+            quanta.sma(series[:, 4], 10)
+
+        assert cache.stats()['size'] == 0
@@ -0,0 +1,108 @@
+import numpy as np
+from pytest import fixture
+
+from src.infrastructure.storage.kline_store import KlineStore
+
+
+HOUR = 3600000
+
+
+def make_rows(start: int, count: int) -> np.ndarray:
+    """Build hourly klines whose prices equal their index."""
+
+    index = np.arange(start, start + count, dtype=np.float64)
+    rows = np.repeat(index[:, None], 6, axis=1)
+    rows[:, 0] = index * HOUR
+    return rows
+
+
+class TestKlineStore:
+    """Test the columnar kline store."""
+
+    @fixture
+    def store(self, tmp_path) -> KlineStore:
+        store = KlineStore()
+        store._root = str(tmp_path)
+        return store
+
+    def test_missing_table_is_empty(self, store: KlineStore) -> None:
+        """Validates that a missing table reads as an empty array."""
+
+        assert store.read('TEST', 'BTCUSDT_1h').shape == (0, 6)
+        assert store.bounds('TEST', 'BTCUSDT_1h') is None
+
+    def test_read_range(self, store: KlineStore) -> None:
+        """Validates that reads return klines within inclusive bounds."""
+
+        store.write('TEST', 'BTCUSDT_1h', make_rows(0, 10))
+        klines = store.read('TEST', 'BTCUSDT_1h', 2 * HOUR, 5 * HOUR)
+
+        assert np.array_equal(klines, make_rows(2, 4))
+        assert store.read('TEST', 'BTCUSDT_1h', 3 * HOUR + 1).shape[0] == 6
+        assert store.read('TEST', 'BTCUSDT_1h', end=-1).shape[0] == 0
+        assert store.bounds('TEST', 'BTCUSDT_1h') == (0, 9 * HOUR)
+
+    def test_append_skips_stored_klines(self, store: KlineStore) -> None:
+        """Validates that appending only adds klines newer than stored."""
+
+        assert store.append('TEST', 'BTCUSDT_1h', make_rows(0, 5)) == 5
+        assert store.append('TEST', 'BTCUSDT_1h', make_rows(3, 5)) == 3
+        assert store.append('TEST', 'BTCUSDT_1h', make_rows(0, 2)) == 0
+
+        assert np.array_equal(
+            store.read('TEST', 'BTCUSDT_1h'), make_rows(0, 8)
+        )
+
+    def test_write_sorts_and_deduplicates(self, store: KlineStore) -> None:
+        """
+        Validates that written klines are sorted by time without
+        duplicate timestamps.
+        """
+
+        rows = np.concatenate((make_rows(5, 5), make_rows(0, 7)))
+        store.write('TEST', 'BTCUSDT_1h', rows)
+
+        assert np.array_equal(
+            store.read('TEST', 'BTCUSDT_1h'), make_rows(0, 10)
+        )
+
+    def test_write_replaces_table(self, store: KlineStore) -> None:
+        """Validates that a write replaces the table contents."""
+
+        store.write('TEST', 'BTCUSDT_1h', make_rows(0, 10))
+        klines = store.read('TEST', 'BTCUSDT_1h')
+        store.write('TEST', 'BTCUSDT_1h', make_rows(20, 2))
+
+        assert np.array_equal(klines, make_rows(0, 10))
+        assert np.array_equal(
+            store.read('TEST', 'BTCUSDT_1h'), make_rows(20, 2)
+        )
+
+    def test_reads_are_copy_on_write(self, store: KlineStore) -> None:
+        """Validates that changing read klines leaves the table intact."""
+
+        store.write('TEST', 'BTCUSDT_1h', make_rows(0, 3))
+        store.read('TEST', 'BTCUSDT_1h')[:, 4] = -1.0
+
+        assert np.array_equal(
+            store.read('TEST', 'BTCUSDT_1h'), make_rows(0, 3)
+        )
+
+    def test_extra_columns_are_dropped(self, store: KlineStore) -> None:
+        """Validates that only the kline columns are stored."""
+
+        rows = np.column_stack((make_rows(0, 3), np.ones(3)))
+        store.write('TEST', 'BTCUSDT_1h', rows)
+
+        assert np.array_equal(
+            store.read('TEST', 'BTCUSDT_1h'), make_rows(0, 3)
+        )
+
+    def test_tables_have_own_locks(self, store: KlineStore) -> None:
+        """Validates that every table has one shared lock."""
+
+        lock = store.lock('TEST', 'BTCUSDT_1h')
+
+        assert store.lock('TEST', 'BTCUSDT_1h') is lock
+        assert store.lock('TEST', 'ETHUSDT_1h') is not lock
+        assert store.lock('OTHER', 'BTCUSDT_1h') is not lock
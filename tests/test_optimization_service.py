@@ -0,0 +1,124 @@
+from __future__ import annotations
+from threading import Event
+from time import sleep
+
+from pytest import fixture, raises
+
+from src.features.optimization import OptimizationService
+from src.features.optimization.builder import OptimizationContextBuilder
+from src.features.optimization.models import ContextStatus
+from src.infrastructure.storage import checkpoint_store
+
+
+def wait_for(condition, timeout: float = 10.0) -> bool:
+    """Poll a condition until it holds or the timeout expires."""
+
+    for _ in range(int(timeout * 20)):
+        if condition():
+            return True
+
+        sleep(0.05)
+
+    return False
+
+
+class TestOptimizationService:
+    """Test context bookkeeping of the optimization service."""
+
+    @fixture
+    def service(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(checkpoint_store, '_root', str(tmp_path))
+        monkeypatch.setenv('MAX_PROCESSES', '1')
+        monkeypatch.delenv('COORDINATOR_ADDRESS', raising=False)
+
+        release = Event()
+
+        def create(builder, config):
+            release.wait(10.0)
+            raise ValueError('Invalid config')
+
+        monkeypatch.setattr(OptimizationContextBuilder, 'create', create)
+        service = OptimizationService()
+        yield service, release
+        release.set()
+        service.shutdown()
+
+    def test_pending_contexts_are_not_queued_twice(self, service) -> None:
+        """
+        Validates that contexts still queued or being built are
+        skipped and that contexts whose creation failed are retried.
+        """
+
+        service, release = service
+
+        def failed() -> bool:
+            return service.statuses.get('ctx') == ContextStatus.FAILED
+
+        assert service.add_contexts({'ctx': {}}) == ['ctx']
+        assert service.add_contexts({'ctx': {}}) == []
+
+        release.set()
+
+        assert wait_for(failed)
+        assert service.add_contexts({'ctx': {}}) == ['ctx']
+        assert wait_for(failed)
+
+    def test_progress_is_aggregated_over_folds(self, service) -> None:
+        """
+        Validates that the progress of a context combines the latest
+        reports of its folds.
+        """
+
+        service, _ = service
+
+        def report(run: int, iteration: int, best: float | None) -> dict:
+            return {
+                'run': run,
+                'runs': 2,
+                'iteration': iteration,
+                'iterations': 10,
+                'evaluations': 10 * run + iteration,
+                'evaluations_per_sec': 5.0,
+                'cache_hit_rate': 0.5 * run,
+                'best_train_fitness': best,
+                'elapsed': 1.0,
+            }
+
+        service._set_status('ctx', ContextStatus.CREATING)
+        service._fold_progress['ctx'] = [None, None, None]
+
+        assert service.get_context_progress('ctx') is None
+
+        service._handle_progress('ctx/0', report(1, 5, None))
+        service._handle_progress('ctx/1', report(1, 10, 2.0))
+        service._handle_progress('ctx/1', report(2, 5, 3.0))
+        service._handle_progress('other/0', report(2, 10, 9.0))
+        progress = service.get_context_progress('ctx')
+
+        assert progress['completion'] == (0.25 + 0.75) / 3
+        assert progress['evaluations'] == 15 + 25
+        assert progress['evaluations_per_sec'] == 10.0
+        assert progress['cache_hit_rate'] == 0.75
+        assert progress['best_train_fitness'] == 3.0
+        assert progress['folds'][2] is None
+
+        with raises(KeyError):
+            service.get_context_progress('other')
+
+    def test_shutdown_stops_threads_and_workers(self, service) -> None:
+        """
+        Validates that a shut down service stops its threads
+        and its worker pool.
+        """
+
+        service, _ = service
+        service._worker_pool._ensure_started()
+        procs = list(service._worker_pool._procs)
+
+        service.shutdown()
+
+        assert not service._config_thread.is_alive()
+        assert not service._opt_thread.is_alive()
+        assert not any(proc.is_alive() for proc in procs)
+
+        service.shutdown()
@@ -0,0 +1,469 @@
+from __future__ import annotations
+from typing import Callable
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from src.features.optimization.builder import OptimizationContextBuilder
+from src.features.optimization.cache import FitnessCache
+from src.features.optimization.models import StopReason
+from src.features.optimization.optimizer import (
+    ABORTED_FITNESS,
+    StrategyOptimizer
+)
+
+
+class TestFitnessCache:
+    """Test the fitness cache and its use by the optimizer."""
+
+    def test_hits_and_misses(self) -> None:
+        """Validates that lookups are counted as hits or misses."""
+
+        cache = FitnessCache(10)
+        key = FitnessCache.make_key('train', (1, 2))
+
+        assert cache.get(key) is None
+        cache.put(key, 5.0)
+
+        assert cache.get(key) == 5.0
+        assert cache.get(FitnessCache.make_key('test', (1, 2))) is None
+        assert cache.stats() == {
+            'hits': 1, 'misses': 2, 'size': 1, 'hit_rate': 1 / 3,
+        }
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """Validates that the least recently used score is evicted."""
+
+        cache = FitnessCache(2)
+        cache.put('a', 1.0)
+        cache.put('b', 2.0)
+        cache.get('a')
+        cache.put('c', 3.0)
+
+        assert cache.get('a') == 1.0
+        assert cache.get('b') is None
+        assert cache.get('c') == 3.0
+
+    def test_zero_size_disables_caching(self) -> None:
+        """Validates that a cache of size 0 stores nothing."""
+
+        cache = FitnessCache(0)
+        cache.put('a', 1.0)
+
+        assert cache.get('a') is None
+        assert cache.stats()['size'] == 0
+
+    def test_bypass_counts_a_miss(self) -> None:
+        """Validates that a bypassed lookup misses a stored score."""
+
+        cache = FitnessCache(10)
+        cache.put('a', 1.0)
+
+        assert cache.get('a', bypass=True) is None
+        assert cache.stats()['misses'] == 1
+
+    def test_state_round_trip(self) -> None:
+        """Validates that a restored cache keeps scores and counters."""
+
+        cache = FitnessCache(10)
+        for index in range(5):
+            cache.put(index, float(index))
+        cache.get(0)
+        cache.get(99)
+
+        restored = FitnessCache(3)
+        restored.restore(cache.state())
+
+        assert restored.hits == 1
+        assert restored.misses == 1
+        assert restored.stats()['size'] == 3
+        assert restored.get(0) == 0.0
+        assert restored.get(1) is None
+
+    def test_clear_resets_counters(self) -> None:
+        """Validates that a cleared cache forgets scores and counters."""
+
+        cache = FitnessCache(10)
+        cache.put('a', 1.0)
+        cache.get('a')
+        cache.clear()
+
+        assert cache.stats() == {
+            'hits': 0, 'misses': 0, 'size': 0, 'hit_rate': 0.0,
+        }
+
+    def test_merge_stats(self) -> None:
+        """Validates that merged counters sum those of every cache."""
+
+        merged = FitnessCache.merge_stats([
+            {'hits': 3, 'misses': 1, 'size': 4, 'hit_rate': 0.75},
+            {'hits': 0, 'misses': 4, 'size': 4, 'hit_rate': 0.0},
+        ])
+
+        assert merged == {
+            'hits': 3, 'misses': 5, 'size': 8, 'hit_rate': 0.375,
+        }
+
+    @fixture
+    def optimizer(self, make_context, make_optimizer) -> StrategyOptimizer:
+        return make_optimizer(make_context())
+
+    def test_repeated_samples_are_backtested_once(
+        self,
+        optimizer: StrategyOptimizer
+    ) -> None:
+        """
+        Validates that a parameter set is backtested once per window
+        and later evaluations return the cached score.
+        """
+
+        calls = []
+        backtest = optimizer._backtest
+
+        def counting_backtest(genes, window, market, cutoff=None):
+            calls.append((tuple(genes.tolist()), window))
+            return backtest(genes, window, market, cutoff)
+
+        optimizer._backtest = counting_backtest
+        genes = optimizer.encode(optimizer.strategy_class.params)
+        other = genes.copy()
+        other[0] = 1 - other[0]
+
+        first = optimizer.evaluate_many([genes, genes, other], 'train')
+        second = optimizer.evaluate_many([other, genes], 'train')
+        optimizer.evaluate_many([genes], 'test')
+
+        assert len(calls) == 3
+        assert first[0] == first[1] == second[1]
+        assert first[2] == second[0]
+        assert optimizer.cache.stats()['hits'] == 2
+
+    def test_aborted_scores_are_not_cached(
+        self,
+        optimizer: StrategyOptimizer
+    ) -> None:
+        """
+        Validates that a sample aborted under a cutoff is backtested
+        again instead of returning a cached ABORTED_FITNESS.
+        """
+
+        calls = []
+
+        def aborting_backtest(genes, window, market, cutoff=None):
+            calls.append(market)
+            return ABORTED_FITNESS
+
+        optimizer._backtest = aborting_backtest
+        genes = optimizer.encode(optimizer.strategy_class.params)
+        first = optimizer.evaluate_many([genes], 'train')
+        second = optimizer.evaluate_many([genes], 'train')
+
+        assert first == second == [ABORTED_FITNESS]
+        assert len(calls) == 2
+        assert optimizer.cache.stats()['size'] == 0
+
+
+def random_genes(optimizer: StrategyOptimizer, count: int) -> list:
+    """Draw encoded parameter sets of an optimizer's strategy."""
+
+    rng = np.random.default_rng(7)
+    return [
+        np.array([
+            rng.integers(len(values)) for values in optimizer.param_values
+        ], dtype=np.int64)
+        for _ in range(count)
+    ]
+
+
+class TestBatchEvaluation:
+    """Test concurrent evaluation of sample batches."""
+
+    def test_scores_match_sequential_backtests(
+        self,
+        make_context,
+        make_optimizer
+    ) -> None:
+        """
+        Validates that a concurrently evaluated batch scores every
+        sample as a sequential backtest, in the order of the batch.
+        """
+
+        optimizer = make_optimizer(make_context(), abort_drawdown_factor=0)
+        individuals = random_genes(optimizer, 12)
+        individuals.append(individuals[3])
+
+        scores = optimizer.evaluate_many(individuals, 'train')
+        expected = [
+            optimizer._backtest(genes, 'train', 0)
+            for genes in individuals
+        ]
+
+        assert scores == expected
+        assert ABORTED_FITNESS not in scores
+
+    def test_run_breeds_configured_offspring(
+        self,
+        make_context,
+        make_optimizer
+    ) -> None:
+        """
+        Validates that a genetic run evaluates as many offspring as
+        configured iterations, whatever the batch size.
+        """
+
+        batches = []
+        optimizer = make_optimizer()
+        evaluate_many = optimizer.evaluate_many
+
+        def recording_evaluate_many(individuals, window, cached=True):
+            if window == 'train' and cached:
+                batches.append(len(individuals))
+            return evaluate_many(individuals, window, cached)
+
+        optimizer.evaluate_many = recording_evaluate_many
+        best_params = optimizer.optimize(make_context())
+
+        assert batches == [4, 4, 2]
+        assert len(best_params) == 1
+        assert optimizer.stop_reasons == [StopReason.COMPLETED.value]
+
+
+class TestMultiMarket:
+    """Test contexts scoring samples on several markets."""
+
+    @fixture
+    def make_markets_optimizer(
+        self,
+        make_market_data,
+        make_context,
+        make_optimizer
+    ) -> Callable[..., StrategyOptimizer]:
+        def make(**config) -> StrategyOptimizer:
+            markets = [
+                make_market_data(size, seed)
+                for seed, size in enumerate([3000, 2000, 2500], start=1)
+            ]
+            context = make_context(market_data=markets[0], markets=markets)
+            return make_optimizer(
+                context, abort_drawdown_factor=0, **config
+            )
+
+        return make
+
+    @mark.parametrize('aggregation', ['mean', 'median', 'min'])
+    def test_scores_aggregate_markets(
+        self,
+        make_markets_optimizer,
+        aggregation: str
+    ) -> None:
+        """
+        Validates that a sample's fitness is the configured aggregate
+        of its scores on every market.
+        """
+
+        optimizer = make_markets_optimizer(market_aggregation=aggregation)
+        individuals = random_genes(optimizer, 6)
+        scores = optimizer.evaluate_many(individuals, 'train')
+        aggregate = {'mean': np.mean, 'median': np.median, 'min': min}
+
+        assert len(optimizer.train_data) == 3
+        assert len(optimizer.train_data[1]['klines']) < len(
+            optimizer.train_data[0]['klines']
+        )
+
+        for genes, score in zip(individuals, scores):
+            assert score == aggregate[aggregation]([
+                optimizer._backtest(genes, 'train', market)
+                for market in range(3)
+            ])
+
+    def test_abort_on_any_market_aborts_sample(
+        self,
+        make_markets_optimizer
+    ) -> None:
+        """
+        Validates that a sample aborted on one market scores
+        ABORTED_FITNESS and isn't cached.
+        """
+
+        optimizer = make_markets_optimizer()
+        genes = random_genes(optimizer, 1)
+        optimizer._backtest = lambda genes, window, market, cutoff: (
+            ABORTED_FITNESS if market == 1 else 1.0
+        )
+        scores = optimizer.evaluate_many(genes, 'train')
+
+        assert scores == [ABORTED_FITNESS]
+        assert optimizer.cache.stats()['size'] == 0
+
+    def test_unknown_aggregation_raises(self, make_markets_optimizer) -> None:
+        """Validates that an unknown market aggregation is rejected."""
+
+        with raises(ValueError):
+            make_markets_optimizer(market_aggregation='max')
+
+
+class TestStoppingCriteria:
+    """Test early stops of optimization runs."""
+
+    @fixture
+    def optimize(self, make_optimizer) -> Callable:
+        def optimize(
+            context: dict,
+            fitness=lambda genes: 1.0 + genes.sum(),
+            **config
+        ) -> tuple[StrategyOptimizer, list[int]]:
+            """
+            Optimize a context with a synthetic fitness.
+
+            Returns:
+                tuple: (optimizer, sizes of training batches)
+            """
+
+            batches = []
+            optimizer = make_optimizer(**config)
+            evaluate_many = optimizer.evaluate_many
+
+            def recording_evaluate_many(individuals, window, cached=True):
+                if window == 'train' and cached:
+                    batches.append(len(individuals))
+                return evaluate_many(individuals, window, cached)
+
+            optimizer._backtest = (
+                lambda genes, window, market, cutoff=None: fitness(genes)
+            )
+            optimizer.evaluate_many = recording_evaluate_many
+            optimizer.optimize(context)
+            return optimizer, batches
+
+        return optimize
+
+    def test_stalled_run_stops(self, optimize, make_context) -> None:
+        """
+        Validates that a run stops once the best fitness hasn't
+        improved for the configured iterations.
+        """
+
+        optimizer, batches = optimize(
+            make_context(stopping={'stall_iterations': 4}),
+            fitness=lambda genes: 1.0,
+            iterations=40
+        )
+
+        assert batches == [4, 4]
+        assert optimizer.stop_reasons == [StopReason.STALLED.value]
+
+    def test_converged_run_stops(self, optimize, make_context) -> None:
+        """
+        Validates that a run stops once the population
+        is less diverse than the threshold.
+        """
+
+        optimizer, batches = optimize(
+            make_context(), min_diversity=1.1, iterations=40
+        )
+
+        assert batches == [4]
+        assert optimizer.stop_reasons == [StopReason.CONVERGED.value]
+
+    def test_time_budget_stops_every_run(self, optimize, make_context) -> None:
+        """
+        Validates that runs over the time budget stop
+        and still select their best sample.
+        """
+
+        optimizer, batches = optimize(
+            make_context(),
+            time_budget=1e-9, iterations=40, optimization_runs=2
+        )
+
+        assert batches == [4, 4]
+        assert len(optimizer.best_params) == 2
+        assert optimizer.stop_reasons == [
+            StopReason.TIME_BUDGET.value
+        ] * 2
+
+    def test_evaluation_budget_is_shared_by_runs(
+        self,
+        optimize,
+        make_context
+    ) -> None:
+        """
+        Validates that the first run stops at its half of
+        the evaluation budget and the second one at what is left.
+        """
+
+        optimizer, batches = optimize(
+            make_context(),
+            evaluation_budget=40, iterations=100, optimization_runs=2
+        )
+
+        assert optimizer.stop_reasons == [
+            StopReason.EVALUATION_BUDGET.value
+        ] * 2
+        assert batches == [4, 4, 4, 4]
+
+    def test_runs_without_criteria_complete(
+        self,
+        optimize,
+        make_context
+    ) -> None:
+        """Validates that runs without criteria use every iteration."""
+
+        optimizer, batches = optimize(make_context(), iterations=12)
+
+        assert batches == [4, 4, 4]
+        assert optimizer.stop_reasons == [StopReason.COMPLETED.value]
+
+    def test_context_overrides_are_validated(self) -> None:
+        """Validates that criteria of context configs are converted."""
+
+        builder = OptimizationContextBuilder()
+
+        assert builder._get_stopping_criteria(
+            {'symbol': 'BTCUSDT', 'stall_iterations': '5', 'time_budget': 9}
+        ) == {'stall_iterations': 5, 'time_budget': 9.0}
+
+        with raises(ValueError):
+            builder._get_stopping_criteria({'min_diversity': -0.5})
+
+
+class TestProgress:
+    """Test progress reports of running optimizations."""
+
+    @fixture
+    def optimize(self, make_context, make_optimizer) -> Callable:
+        def optimize(**config) -> list[dict]:
+            reports = []
+            optimizer = make_optimizer(**config)
+            optimizer.optimize(make_context(), on_progress=reports.append)
+            return reports
+
+        return optimize
+
+    def test_reports_follow_batches(self, optimize) -> None:
+        """
+        Validates that a report is sent after every batch of every
+        run once the progress interval has passed.
+        """
+
+        reports = optimize(optimization_runs=2, progress_interval=0)
+
+        assert [report['run'] for report in reports] == [1] * 3 + [2] * 3
+        assert [report['iteration'] for report in reports] == [4, 8, 10] * 2
+        assert {report['runs'] for report in reports} == {2}
+        assert {report['iterations'] for report in reports} == {10}
+
+        for previous, report in zip(reports, reports[1:]):
+            assert report['evaluations'] >= previous['evaluations']
+            assert report['elapsed'] >= previous['elapsed']
+
+        for report in reports:
+            assert report['best_train_fitness'] is not None
+            assert report['evaluations_per_sec'] >= 0.0
+            assert 0.0 <= report['cache_hit_rate'] <= 1.0
+
+    def test_reports_are_throttled(self, optimize) -> None:
+        """Validates that no report is sent before the interval passes."""
+
+        assert optimize(progress_interval=3600) == []
@@ -0,0 +1,171 @@
+from __future__ import annotations
+from os import _exit, getpid
+from threading import Lock, Thread
+from time import sleep
+
+from pytest import fixture, raises
+
+from src.features.optimization.pool import WorkerPool, report_progress
+
+
+def sleep_handler(task_id: str, task: dict) -> dict:
+    """Report progress, sleep and return the task value."""
+
+    report_progress(task['value'])
+    sleep(task.get('delay', 0.0))
+
+    if task.get('exit'):
+        _exit(3)
+
+    if task.get('unpicklable'):
+        return {'value': Lock()}
+
+    return {'value': task['value'], 'pid': getpid()}
+
+
+class TestWorkerPool:
+    """Test dispatch, respawn and cancellation of pool workers."""
+
+    @fixture
+    def pool(self, make_results):
+        pools: list[WorkerPool] = []
+
+        def create(size: int) -> tuple:
+            results = make_results()
+            progress = []
+            pool = WorkerPool(
+                size=size,
+                handler=sleep_handler,
+                on_result=results,
+                on_progress=lambda task_id, value: progress.append(value)
+            )
+            pools.append(pool)
+            return pool, results, progress
+
+        yield create
+
+        for pool in pools:
+            pool.close()
+
+    def test_results_and_progress(self, pool) -> None:
+        """
+        Validates that every task reports its result
+        and its progress while running.
+        """
+
+        pool, results, progress = pool(2)
+
+        for i in range(6):
+            pool.submit(f'task/{i}', {'value': i, 'delay': 0.1})
+
+        assert results.wait(6)
+
+        for i in range(6):
+            result, error = results.items[f'task/{i}']
+            assert error is None and result['value'] == i
+
+        assert sorted(progress) == list(range(6))
+
+    def test_dead_worker_is_respawned(self, pool) -> None:
+        """
+        Validates that the task of a dying worker fails and that
+        later tasks run in a fresh worker.
+        """
+
+        pool, results, _ = pool(1)
+        pool.submit('task/0', {'value': 0, 'exit': True})
+        pool.submit('task/1', {'value': 1})
+
+        assert results.wait(2)
+        assert results.items['task/0'] == (
+            None, 'Worker process exited with code 3'
+        )
+        assert results.items['task/1'][0]['value'] == 1
+
+    def test_unpicklable_result_is_reported(self, pool) -> None:
+        """Validates that results that can't be sent fail the task."""
+
+        pool, results, _ = pool(1)
+        pool.submit('task/0', {'value': 0, 'unpicklable': True})
+        pool.submit('task/1', {'value': 1})
+
+        assert results.wait(2)
+        assert results.items['task/0'][0] is None
+        assert 'TypeError' in results.items['task/0'][1]
+        assert results.items['task/1'][0]['value'] == 1
+
+    def test_cancelled_task_is_not_reported(self, pool) -> None:
+        """Validates that cancelled tasks never report a result."""
+
+        pool, results, _ = pool(1)
+        pool.submit('task/0', {'value': 0, 'delay': 5.0})
+
+        sleep(0.5)
+        assert pool.cancel('task/0')
+        assert not pool.cancel('task/0')
+
+        pool.submit('task/1', {'value': 1})
+
+        assert results.wait(1)
+        sleep(0.5)
+        assert list(results.items) == ['task/1']
+
+    def test_idle_worker_death_is_dispatched_once(self, pool) -> None:
+        """
+        Validates that the slot of a worker that died while idle
+        receives one task at a time after the respawn.
+        """
+
+        pool, results, _ = pool(1)
+        pool.submit('task/0', {'value': 0})
+        assert results.wait(1)
+
+        pool._procs[0].kill()
+        sleep(1.0)
+
+        pool.submit('task/1', {'value': 1, 'delay': 1.0})
+        blocked = Thread(
+            target=pool.submit, args=('task/2', {'value': 2}), daemon=True
+        )
+        blocked.start()
+
+        sleep(0.5)
+        assert blocked.is_alive()
+        assert results.wait(3)
+        assert results.items['task/1'][1] is None
+        assert results.items['task/2'][1] is None
+
+    def test_closed_pool_stops_workers(self, pool) -> None:
+        """
+        Validates that closing a pool stops its workers without
+        respawning them or reporting running tasks, and that
+        blocked and later submissions fail.
+        """
+
+        pool, results, _ = pool(1)
+        pool.submit('task/0', {'value': 0, 'delay': 10.0})
+        procs = list(pool._procs)
+
+        errors = []
+
+        def submit() -> None:
+            try:
+                pool.submit('task/1', {'value': 1})
+            except RuntimeError as e:
+                errors.append(e)
+
+        blocked = Thread(target=submit, daemon=True)
+        blocked.start()
+        sleep(0.5)
+
+        pool.close(timeout=0.5)
+        blocked.join(timeout=5.0)
+        sleep(0.5)
+
+        assert len(errors) == 1
+        assert not any(proc.is_alive() for proc in procs)
+        assert pool._procs == procs
+        assert results.items == {}
+
+        with raises(RuntimeError):
+            pool.submit('task/2', {'value': 2})
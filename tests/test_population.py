@@ -0,0 +1,89 @@
+import numpy as np
+
+from src.features.optimization.population import Population
+
+
+class TestPopulation:
+    """Test the array-backed GA population."""
+
+    def test_add_grows_storage(self) -> None:
+        """Validates that adding past the capacity keeps every row."""
+
+        population = Population(n_params=2, capacity=2)
+
+        for index in range(5):
+            population.add(float(index), np.array([index, -index]))
+
+        assert len(population) == 5
+        assert population.fitness.shape[0] >= 5
+        assert population.fitness[:5].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert population.genes[4].tolist() == [4, -4]
+
+    def test_cull_keeps_fittest(self) -> None:
+        """Validates that culling keeps the fittest individuals."""
+
+        population = Population(n_params=1)
+        scores = [3.0, np.nan, 7.0, float('-inf'), 5.0, 1.0]
+
+        for index, fitness in enumerate(scores):
+            population.add(fitness, np.array([index]))
+
+        population.cull(3)
+
+        assert len(population) == 3
+        assert sorted(population.fitness[:3].tolist()) == [3.0, 5.0, 7.0]
+        assert sorted(population.genes[:3, 0].tolist()) == [0, 2, 4]
+
+    def test_cull_keeps_equal_scores(self) -> None:
+        """Validates that individuals with equal fitness coexist."""
+
+        population = Population(n_params=1)
+
+        for index in range(4):
+            population.add(1.0, np.array([index]))
+
+        population.cull(3)
+        population.cull(10)
+
+        assert len(population) == 3
+        assert population.fitness[:3].tolist() == [1.0, 1.0, 1.0]
+
+    def test_cull_to_zero_empties(self) -> None:
+        """Validates that culling to zero removes every individual."""
+
+        population = Population(n_params=1)
+        population.add(1.0, np.array([0]))
+        population.cull(0)
+
+        assert len(population) == 0
+        assert population.diversity() == 0.0
+
+    def test_diversity(self) -> None:
+        """Validates the share of unique parameter sets."""
+
+        population = Population(n_params=2)
+        population.add(1.0, np.array([0, 1]))
+        population.add(2.0, np.array([0, 1]))
+        population.add(3.0, np.array([1, 0]))
+        population.add(4.0, np.array([1, 1]))
+
+        assert population.diversity() == 0.75
+
+    def test_state_round_trip(self) -> None:
+        """Validates that a restored population equals the saved one."""
+
+        population = Population(n_params=2, capacity=1)
+
+        for index in range(3):
+            population.add(float(index), np.array([index, index + 1]))
+
+        state = population.state()
+        restored = Population(n_params=2)
+        restored.add(9.0, np.array([9, 9]))
+        restored.restore(state)
+
+        population.add(5.0, np.array([5, 5]))
+
+        assert len(restored) == 3
+        assert restored.fitness[:3].tolist() == [0.0, 1.0, 2.0]
+        assert np.array_equal(restored.genes[:3], state['genes'])
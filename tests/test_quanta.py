@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numba as nb
+import numpy as np
+from pytest import mark
+
+from src.core.strategies.core import quanta
+from .series import SERIES, assert_bit_identical, make_series
+
+
+# Reference O(n * length) kernels: the window-scanning implementations
+# that the sliding-window kernels replaced.
+
+@nb.njit
+def reference_highest(source: np.ndarray, length: int) -> np.ndarray:
+    n = source.shape[0]
+    result = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        if i < length - 1:
+            result[i] = np.nan
+        else:
+            max_val = -np.inf
+            has_valid = False
+
+            for j in range(i - length + 1, i + 1):
+                val = source[j]
+
+                if not np.isnan(val):
+                    has_valid = True
+
+                    if val > max_val:
+                        max_val = val
+
+            result[i] = max_val if has_valid else np.nan
+
+    return result
+
+
+@nb.njit
+def reference_lowest(source: np.ndarray, length: int) -> np.ndarray:
+    n = source.shape[0]
+    result = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        if i < length - 1:
+            result[i] = np.nan
+        else:
+            min_val = np.inf
+            has_valid = False
+
+            for j in range(i - length + 1, i + 1):
+                val = source[j]
+
+                if not np.isnan(val):
+                    has_valid = True
+
+                    if val < min_val:
+                        min_val = val
+
+            result[i] = min_val if has_valid else np.nan
+
+    return result
+
+
+@nb.njit
+def reference_stdev(source: np.ndarray, length: int) -> np.ndarray:
+    n = source.shape[0]
+    result = np.full(n, np.nan, dtype=np.float64)
+
+    for i in range(length - 1, n):
+        sum_ = 0.0
+        sum_sq = 0.0
+        count = 0
+
+        for j in range(i - length + 1, i + 1):
+            val = source[j]
+
+            if not np.isnan(val):
+                sum_ += val
+                sum_sq += val * val
+                count += 1
+            else:
+                count = -1
+
+        if count == length:
+            mean = sum_ / length
+            var = (sum_sq / length) - (mean * mean)
+            result[i] = np.sqrt(var) if var > 0 else 0.0
+        else:
+            result[i] = np.nan
+
+    return result
+
+
+@nb.njit
+def reference_pivot(
+    source: np.ndarray,
+    leftbars: int,
+    rightbars: int,
+    high: bool
+) -> np.ndarray:
+    n = source.shape[0]
+    result = np.full(n, np.nan, dtype=np.float64)
+
+    for i in range(leftbars, n - rightbars):
+        center = source[i]
+
+        if np.isnan(center):
+            continue
+
+        is_pivot = True
+
+        for j in range(i - leftbars, i):
+            if np.isnan(source[j]):
+                continue
+
+            if (high and source[j] >= center) or (
+                not high and source[j] <= center
+            ):
+                is_pivot = False
+                break
+
+        if not is_pivot:
+            continue
+
+        for j in range(i + 1, i + rightbars + 1):
+            if np.isnan(source[j]):
+                continue
+
+            if (high and source[j] > center) or (
+                not high and source[j] < center
+            ):
+                is_pivot = False
+                break
+
+        if is_pivot:
+            result[i + rightbars] = center
+
+    return result
+
+
+LENGTHS = [0, 1, 2, 3, 14, 50, 200, 1499, 1500, 2000]
+PIVOT_BARS = [(0, 0), (0, 3), (3, 0), (1, 1), (5, 5), (10, 2), (2, 25)]
+
+
+class TestQuanta:
+    """Test sliding-window quanta kernels against window scans."""
+
+    @mark.parametrize('kind', SERIES)
+    @mark.parametrize('length', LENGTHS)
+    def test_highest(self, kind: str, length: int) -> None:
+        """Validates that highest() matches a full window scan."""
+
+        source = make_series(kind)
+        assert_bit_identical(
+            quanta.highest(source, length),
+            reference_highest(source, length)
+        )
+
+    @mark.parametrize('kind', SERIES)
+    @mark.parametrize('length', LENGTHS)
+    def test_lowest(self, kind: str, length: int) -> None:
+        """Validates that lowest() matches a full window scan."""
+
+        source = make_series(kind)
+        assert_bit_identical(
+            quanta.lowest(source, length),
+            reference_lowest(source, length)
+        )
+
+    @mark.parametrize('kind', SERIES)
+    @mark.parametrize('length', [length for length in LENGTHS if length])
+    def test_stdev(self, kind: str, length: int) -> None:
+        """
+        Validates that stdev() yields NaN exactly where a full window
+        scan does and matches its values within the rounding error
+        of the scan's sum-of-squares formula, which cancels
+        catastrophically for flat windows (an absolute stdev error
+        of about sqrt(length * eps) times the price scale).
+        """
+
+        source = make_series(kind)
+        actual = quanta.stdev(source, length)
+        expected = reference_stdev(source, length)
+
+        assert np.array_equal(np.isnan(actual), np.isnan(expected))
+
+        valid = ~np.isnan(expected)
+        scale = np.abs(source[np.isfinite(source)]).max(initial=1.0)
+        np.testing.assert_allclose(
+            actual[valid],
+            expected[valid],
+            rtol=1e-9,
+            atol=scale * np.sqrt(length * np.finfo(np.float64).eps)
+        )
+
+    @mark.parametrize('kind', SERIES)
+    @mark.parametrize('bars', PIVOT_BARS)
+    def test_pivothigh(self, kind: str, bars: tuple[int, int]) -> None:
+        """Validates that pivothigh() matches full window scans."""
+
+        source = make_series(kind)
+        assert_bit_identical(
+            quanta.pivothigh(source, *bars),
+            reference_pivot(source, *bars, True)
+        )
+
+    @mark.parametrize('kind', SERIES)
+    @mark.parametrize('bars', PIVOT_BARS)
+    def test_pivotlow(self, kind: str, bars: tuple[int, int]) -> None:
+        """Validates that pivotlow() matches full window scans."""
+
+        source = make_series(kind)
+        assert_bit_identical(
+            quanta.pivotlow(source, *bars),
+            reference_pivot(source, *bars, False)
+        )
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import mark, skip
+
+from src.core.strategies.core import quanta
+from src.core.strategies.core.utils import scratch
+from src.features.optimization.indicator_cache import IndicatorCache
+from .series import (
+    SMOOTHED_SERIES,
+    UNSUPPORTED,
+    assert_bit_identical,
+    make_bars,
+    make_series
+)
+
+
+LENGTHS = [2, 3, 14, 200]
+
+# name: (input series, parameters, output buffers, work rows)
+CASES = {
+    'cross': (('close', 'other'), (), 1, 0),
+    'crossover': (('close', 'other'), (), 1, 0),
+    'crossunder': (('close', 'other'), (), 1, 0),
+    'change': (('close',), ('length',), 1, 0),
+    'cum': (('close',), (), 1, 0),
+    'ema': (('close',), ('length',), 1, 0),
+    'hma': (('close',), ('length',), 1, 1),
+    'rma': (('close',), ('length',), 1, 0),
+    'sma': (('close',), ('length',), 1, 0),
+    'stdev': (('close',), ('length',), 1, 0),
+    'vwap': (('time', 'high', 'low', 'close', 'volume'), (), 1, 0),
+    'wma': (('close',), ('length',), 1, 0),
+    'rsi': (('close',), ('length',), 1, 1),
+    'stoch': (('close', 'high', 'low'), ('length',), 1, 1),
+    'wpr': (('close', 'high', 'low'), ('length',), 1, 1),
+    'dmi': (('high', 'low', 'close'), ('length', 'length'), 3, 0),
+    'donchian': (('high', 'low'), ('length',), 3, 0),
+    'dst': (('high', 'low', 'close'), ('factor', 'length'), 2, 1),
+    'supertrend': (('high', 'low', 'close'), ('factor', 'length'), 2, 2),
+    'highest': (('close',), ('length',), 1, 0),
+    'lowest': (('close',), ('length',), 1, 0),
+    'pivothigh': (('close',), ('length', 'length'), 1, 1),
+    'pivotlow': (('close',), ('length', 'length'), 1, 1),
+    'atr': (('high', 'low', 'close'), ('length',), 1, 0),
+    'bb': (('close',), ('length', 'factor'), 3, 0),
+    'bbw': (('close',), ('length', 'factor'), 1, 1),
+    'tr': (('high', 'low', 'close'), ('handle_nan',), 1, 0),
+}
+
+
+def garbage_like(array: np.ndarray) -> np.ndarray:
+    """Build a buffer of the same shape filled with stale values."""
+
+    if array.dtype == np.bool_:
+        return np.ones(array.shape, dtype=np.bool_)
+
+    return np.full(array.shape, -7.25)
+
+
+class TestQuantaInto:
+    """Test buffer-writing quanta kernels against allocating ones."""
+
+    @mark.parametrize('name', CASES)
+    @mark.parametrize('kind', SMOOTHED_SERIES)
+    @mark.parametrize('length', LENGTHS)
+    def test_into(self, name: str, kind: str, length: int) -> None:
+        """
+        Validates that every kernel overwrites stale buffers with
+        the values of the allocating function.
+        """
+
+        if (name, kind) in UNSUPPORTED:
+            skip('Undefined for the allocating function')
+
+        inputs, params, outputs, rows = CASES[name]
+        bars = {**make_bars(kind), 'other': make_series(kind, seed=1)}
+        scalars = {'length': length, 'factor': 2.5, 'handle_nan': False}
+        args = [bars[key] for key in inputs]
+        args += [scalars[param] for param in params]
+
+        expected = getattr(quanta, name)(*args)
+        expected = expected if outputs > 1 else (expected,)
+        buffers = [garbage_like(array) for array in expected]
+
+        if rows:
+            buffers.append(np.full((rows, bars['close'].shape[0]), -7.25))
+
+        result = getattr(quanta.into, name)(*args, *buffers)
+        result = result if outputs > 1 else (result,)
+
+        for actual, buffer, values in zip(result, buffers, expected):
+            assert actual is buffer
+
+            if values.dtype == np.bool_:
+                assert np.array_equal(buffer, values)
+            else:
+                assert_bit_identical(buffer, values)
+
+    @mark.parametrize('name', ['ema', 'rma'])
+    @mark.parametrize('kind', SMOOTHED_SERIES)
+    def test_in_place(self, name: str, kind: str) -> None:
+        """Validates that ema()/rma() may smooth their source in place."""
+
+        source = make_series(kind)
+        expected = getattr(quanta, name)(source, 14)
+        getattr(quanta.into, name)(source, 14, source)
+
+        assert_bit_identical(source, expected)
+
+
+class TestScratch:
+    """Test the per-thread scratch arena."""
+
+    def test_scope(self) -> None:
+        """
+        Validates that buffers are reused by later scopes
+        and that borrowing outside of a scope allocates.
+        """
+
+        with scratch.scope():
+            first = scratch.empty(100)
+
+            with scratch.scope():
+                second = scratch.full((2, 100), np.nan)
+
+            assert scratch.empty(100) is not first
+            assert scratch.owns(second[1])
+
+        with scratch.scope():
+            assert scratch.full((2, 100), 1.0) is second
+            assert (second == 1.0).all()
+
+        outside = scratch.empty(100)
+
+        assert outside is not first
+        assert not scratch.owns(outside)
+
+
+class TestIntoCache:
+    """Test memoization of buffer-writing quanta kernels."""
+
+    def test_into_hits(self) -> None:
+        """
+        Validates that buffer-writing calls share entries with
+        the allocating function and fill their outputs on hits.
+        """
+
+        bars = make_bars('random_walk')
+        high, low, close = bars['high'], bars['low'], bars['close']
+        cache = IndicatorCache(64 * 1024 * 1024)
+        expected = quanta.dst(high, low, close, 2.5, 14)
+
+        with cache.install(quanta):
+            quanta.dst(high, low, close, 2.5, 14)
+            upper, lower = quanta.into.dst(
+                high, low, close, 2.5, 14,
+                np.empty_like(high), np.empty_like(high),
+                np.empty((1, high.shape[0]))
+            )
+
+        assert cache.stats()['hits'] == 1
+        assert_bit_identical(upper, expected[0])
+        assert_bit_identical(lower, expected[1])
+
+    def test_scratch_bypass(self) -> None:
+        """Validates that calls on arena buffers bypass the cache."""
+
+        source = make_series('random_walk')
+        cache = IndicatorCache(64 * 1024 * 1024)
+
+        with cache.install(quanta), scratch.scope():
+            buffer = scratch.empty(source.shape[0])
+            buffer[:] = source
+            result = quanta.sma(buffer, 14)
+
+        assert cache.stats()['size'] == 0
+        assert_bit_identical(result, quanta.sma(source, 14))
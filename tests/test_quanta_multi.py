@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import mark, skip
+
+from src.core.strategies.core import quanta
+from src.features.optimization.indicator_cache import IndicatorCache
+from .series import (
+    SERIES,
+    SMOOTHED_SERIES,
+    UNSUPPORTED,
+    assert_bit_identical,
+    make_bars,
+    make_series
+)
+
+
+LENGTHS = np.array([14, 1, 2, 3, 14, 50, 200, 1499], dtype=np.int16)
+FACTORS = np.array([2.1, 2.1, 0.5, 24.6, 3.0], dtype=np.float32)
+ATR_LENGTHS = np.array([10, 10, 1, 14, 200], dtype=np.int16)
+DI_LENGTHS = np.array([14, 14, 3, 1, 20, 14], dtype=np.int16)
+ADX_LENGTHS = np.array([6, 14, 6, 20, 1, 6], dtype=np.int16)
+
+
+def leading_nans(source: np.ndarray) -> int:
+    """Count the NaNs before the first value of a series."""
+
+    valid = np.flatnonzero(~np.isnan(source))
+    return int(valid[0]) if valid.shape[0] else source.shape[0]
+
+
+class TestQuantaMulti:
+    """Test multi-length quanta kernels against single-length calls."""
+
+    @mark.parametrize('name', ['ema', 'rma'])
+    @mark.parametrize('kind', SERIES)
+    def test_smoothing(self, name: str, kind: str) -> None:
+        """
+        Validates that every ema()/rma() row matches the single-length
+        function and that rows without a complete seed window are NaN.
+        """
+
+        source = make_series(kind)
+        result = getattr(quanta.multi, name)(source, LENGTHS)
+        fits = LENGTHS + leading_nans(source) <= source.shape[0]
+
+        assert result.shape == (LENGTHS.shape[0], source.shape[0])
+
+        for row, length, fit in zip(result, LENGTHS, fits):
+            if fit:
+                expected = getattr(quanta, name)(source, length)
+                assert_bit_identical(row, expected)
+            else:
+                assert np.isnan(row).all()
+
+    @mark.parametrize('kind', SERIES)
+    def test_sma(self, kind: str) -> None:
+        """Validates that every sma() row matches the single-length one."""
+
+        source = make_series(kind)
+        result = quanta.multi.sma(source, LENGTHS)
+
+        for row, length in zip(result, LENGTHS):
+            assert_bit_identical(row, quanta.sma(source, length))
+
+    @mark.parametrize('kind', SMOOTHED_SERIES)
+    def test_atr(self, kind: str) -> None:
+        """Validates that every atr() row matches the single-length one."""
+
+        bars = make_bars(kind)
+        result = quanta.multi.atr(
+            bars['high'], bars['low'], bars['close'], ATR_LENGTHS
+        )
+
+        for row, length in zip(result, ATR_LENGTHS):
+            assert_bit_identical(
+                row,
+                quanta.atr(bars['high'], bars['low'], bars['close'], length)
+            )
+
+    @mark.parametrize('kind', SMOOTHED_SERIES)
+    def test_dmi(self, kind: str) -> None:
+        """
+        Validates that every dmi() row matches the single-length
+        function for its (DI, ADX) length pair.
+        """
+
+        if ('dmi', kind) in UNSUPPORTED:
+            skip('Undefined for the single-length function')
+
+        bars = make_bars(kind)
+        result = quanta.multi.dmi(
+            bars['high'], bars['low'], bars['close'],
+            DI_LENGTHS, ADX_LENGTHS
+        )
+
+        for k, lengths in enumerate(zip(DI_LENGTHS, ADX_LENGTHS)):
+            expected = quanta.dmi(
+                bars['high'], bars['low'], bars['close'], *lengths
+            )
+
+            for rows, values in zip(result, expected):
+                assert_bit_identical(rows[k], values)
+
+    @mark.parametrize('name', ['dst', 'supertrend'])
+    @mark.parametrize('kind', SMOOTHED_SERIES)
+    def test_bands(self, name: str, kind: str) -> None:
+        """
+        Validates that every dst()/supertrend() row matches
+        the single-length function for its (factor, ATR length) pair.
+        """
+
+        bars = make_bars(kind)
+        result = getattr(quanta.multi, name)(
+            bars['high'], bars['low'], bars['close'],
+            FACTORS, ATR_LENGTHS
+        )
+
+        for k, params in enumerate(zip(FACTORS, ATR_LENGTHS)):
+            expected = getattr(quanta, name)(
+                bars['high'], bars['low'], bars['close'], *params
+            )
+
+            for rows, values in zip(result, expected):
+                assert_bit_identical(rows[k], values)
+
+
+class TestIndicatorTables:
+    """Test prefilling the indicator cache with multi-length tables."""
+
+    def test_prefill(self) -> None:
+        """
+        Validates that calls with prefilled parameters are cache hits
+        returning the single-length results.
+        """
+
+        bars = make_bars('random_walk')
+        series = {name: bars[name] for name in ('high', 'low', 'close')}
+        cache = IndicatorCache(64 * 1024 * 1024)
+
+        stored = cache.prefill(quanta, 'dmi', series, {
+            'di_length': [3, 14],
+            'adx_length': [6, 14, 20],
+        })
+        assert stored == 6
+
+        with cache.install(quanta):
+            result = quanta.dmi(**series, di_length=14, adx_length=20)
+
+        assert cache.stats()['hits'] == 1
+
+        expected = quanta.dmi(**series, di_length=14, adx_length=20)
+        for values, expected_values in zip(result, expected):
+            assert_bit_identical(values, expected_values)
+
+    def test_prefill_over_cap(self) -> None:
+        """Validates that tables exceeding the memory cap are skipped."""
+
+        source = make_series('random_walk')
+        cache = IndicatorCache(source.nbytes * 2)
+
+        assert cache.prefill(quanta, 'ema', {'source': source}, {
+            'length': [5, 10, 20]
+        }) == 0
+        assert cache.stats()['size'] == 0
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import mark, raises, skip
+
+from src.core.strategies.core import quanta
+from src.core.strategies.core.quanta import streaming
+from .series import (
+    SERIES,
+    SMOOTHED_SERIES,
+    UNSUPPORTED,
+    assert_bit_identical,
+    make_bars,
+    make_series
+)
+
+
+def run_stream(
+    indicator: streaming.StreamingIndicator,
+    *series: np.ndarray,
+    seeded: int = 1000
+) -> list[np.ndarray]:
+    """
+    Seed an indicator with the first bars, then update it bar by
+    bar, collecting outputs of the remaining bars per output.
+    """
+
+    last = indicator.seed(*(s[:seeded] for s in series))
+    outputs = [last] if seeded else []
+
+    for values in zip(*(s[seeded:].tolist() for s in series)):
+        outputs.append(indicator.update(*values))
+
+    if isinstance(outputs[0], tuple):
+        return [np.array(output) for output in zip(*outputs)]
+
+    return [np.array(outputs)]
+
+
+def expected_tail(
+    result: np.ndarray | tuple,
+    seeded: int = 1000
+) -> list[np.ndarray]:
+    """Cut batch results down to the bars reported by run_stream()."""
+
+    if not isinstance(result, tuple):
+        result = (result,)
+
+    start = max(seeded - 1, 0)
+    return [np.ascontiguousarray(r[start:], dtype=np.float64) for r in result]
+
+
+LENGTHS = [1, 2, 3, 14, 200]
+
+SOURCE_CASES = {
+    'change': (
+        lambda length: streaming.Change(length),
+        lambda s, length: quanta.change(s, length)
+    ),
+    'cum': (
+        lambda length: streaming.Cum(),
+        lambda s, length: quanta.cum(s)
+    ),
+    'hma': (
+        lambda length: streaming.Hma(length + 1),
+        lambda s, length: quanta.hma(s, length + 1)
+    ),
+    'sma': (
+        lambda length: streaming.Sma(length),
+        lambda s, length: quanta.sma(s, length)
+    ),
+    'stdev': (
+        lambda length: streaming.Stdev(length),
+        lambda s, length: quanta.stdev(s, length)
+    ),
+    'wma': (
+        lambda length: streaming.Wma(length),
+        lambda s, length: quanta.wma(s, length)
+    ),
+    'highest': (
+        lambda length: streaming.Highest(length),
+        lambda s, length: quanta.highest(s, length)
+    ),
+    'lowest': (
+        lambda length: streaming.Lowest(length),
+        lambda s, length: quanta.lowest(s, length)
+    ),
+    'pivothigh': (
+        lambda length: streaming.Pivothigh(length, length // 2),
+        lambda s, length: quanta.pivothigh(s, length, length // 2)
+    ),
+    'pivotlow': (
+        lambda length: streaming.Pivotlow(length // 2, length),
+        lambda s, length: quanta.pivotlow(s, length // 2, length)
+    ),
+    'bb': (
+        lambda length: streaming.Bb(length, 2.1),
+        lambda s, length: quanta.bb(s, length, 2.1)
+    ),
+    'bbw': (
+        lambda length: streaming.Bbw(length, 2.1),
+        lambda s, length: quanta.bbw(s, length, 2.1)
+    ),
+}
+SMOOTHED_CASES = {
+    'ema': (
+        lambda length: streaming.Ema(length),
+        lambda b, length: quanta.ema(b['close'], length),
+        ('close',)
+    ),
+    'rma': (
+        lambda length: streaming.Rma(length),
+        lambda b, length: quanta.rma(b['close'], length),
+        ('close',)
+    ),
+    'rsi': (
+        lambda length: streaming.Rsi(length),
+        lambda b, length: quanta.rsi(b['close'], length),
+        ('close',)
+    ),
+    'atr': (
+        lambda length: streaming.Atr(length),
+        lambda b, length: quanta.atr(
+            b['high'], b['low'], b['close'], length
+        ),
+        ('high', 'low', 'close')
+    ),
+    'dmi': (
+        lambda length: streaming.Dmi(length, length + 3),
+        lambda b, length: quanta.dmi(
+            b['high'], b['low'], b['close'], length, length + 3
+        ),
+        ('high', 'low', 'close')
+    ),
+    'dst': (
+        lambda length: streaming.Dst(1.7, length),
+        lambda b, length: quanta.dst(
+            b['high'], b['low'], b['close'], 1.7, length
+        ),
+        ('high', 'low', 'close')
+    ),
+    'supertrend': (
+        lambda length: streaming.Supertrend(2.3, length),
+        lambda b, length: quanta.supertrend(
+            b['high'], b['low'], b['close'], 2.3, length
+        ),
+        ('high', 'low', 'close')
+    ),
+}
+BAR_CASES = {
+    'tr': (
+        lambda length: streaming.Tr(length % 2 == 0),
+        lambda b, length: quanta.tr(
+            b['high'], b['low'], b['close'], length % 2 == 0
+        ),
+        ('high', 'low', 'close')
+    ),
+    'stoch': (
+        lambda length: streaming.Stoch(length),
+        lambda b, length: quanta.stoch(
+            b['close'], b['high'], b['low'], length
+        ),
+        ('close', 'high', 'low')
+    ),
+    'wpr': (
+        lambda length: streaming.Wpr(length),
+        lambda b, length: quanta.wpr(
+            b['close'], b['high'], b['low'], length
+        ),
+        ('close', 'high', 'low')
+    ),
+    'donchian': (
+        lambda length: streaming.Donchian(length),
+        lambda b, length: quanta.donchian(b['high'], b['low'], length),
+        ('high', 'low')
+    ),
+    'vwap': (
+        lambda length: streaming.Vwap(),
+        lambda b, length: quanta.vwap(
+            b['time'], b['high'], b['low'], b['close'], b['volume']
+        ),
+        ('time', 'high', 'low', 'close', 'volume')
+    ),
+}
+FILTER_CASES = {
+    'cross': (streaming.Cross, quanta.cross),
+    'crossover': (streaming.Crossover, quanta.crossover),
+    'crossunder': (streaming.Crossunder, quanta.crossunder),
+}
+
+
+class TestQuantaStreaming:
+    """Test streaming indicators against the batch quanta functions."""
+
+    @mark.parametrize('kind', SERIES)
+    @mark.parametrize('length', LENGTHS)
+    @mark.parametrize('name', SOURCE_CASES)
+    def test_source_indicators(
+        self,
+        name: str,
+        kind: str,
+        length: int
+    ) -> None:
+        """
+        Validates that seeded single-series indicators reproduce
+        the batch function bit for bit on every new bar.
+        """
+
+        create, batch = SOURCE_CASES[name]
+        source = make_series(kind)
+
+        for actual, expected in zip(
+            run_stream(create(length), source),
+            expected_tail(batch(source, length))
+        ):
+            assert_bit_identical(actual, expected)
+
+    @mark.parametrize('kind', SMOOTHED_SERIES)
+    @mark.parametrize('length', LENGTHS)
+    @mark.parametrize('name', [*SMOOTHED_CASES, *BAR_CASES])
+    def test_bar_indicators(self, name: str, kind: str, length: int) -> None:
+        """
+        Validates that seeded multi-series indicators reproduce
+        the batch function bit for bit on every new bar.
+        """
+
+        if (name, kind) in UNSUPPORTED:
+            skip('Undefined for the batch function')
+
+        create, batch, inputs = {**SMOOTHED_CASES, **BAR_CASES}[name]
+        bars = make_bars(kind)
+
+        for actual, expected in zip(
+            run_stream(create(length), *(bars[key] for key in inputs)),
+            expected_tail(batch(bars, length))
+        ):
+            assert_bit_identical(actual, expected)
+
+    @mark.parametrize('kind', SERIES)
+    @mark.parametrize('name', FILTER_CASES)
+    def test_filters(self, name: str, kind: str) -> None:
+        """Validates that streaming filters match the batch signals."""
+
+        create, batch = FILTER_CASES[name]
+        source1 = make_series(kind, seed=1)
+        source2 = make_series(kind, seed=2)
+        actual = run_stream(create(), source1, source2)[0]
+
+        assert np.array_equal(actual, batch(source1, source2)[999:])
+
+    @mark.parametrize('name', [*SMOOTHED_CASES, *BAR_CASES])
+    def test_unseeded_updates(self, name: str) -> None:
+        """
+        Validates that updating from the first bar without seeding
+        matches the batch function too.
+        """
+
+        create, batch, inputs = {**SMOOTHED_CASES, **BAR_CASES}[name]
+        bars = make_bars('leading_nan', n=300)
+
+        for actual, expected in zip(
+            run_stream(create(14), *(bars[key] for key in inputs), seeded=0),
+            expected_tail(batch(bars, 14), seeded=0)
+        ):
+            assert_bit_identical(actual, expected)
+
+    def test_invalid_length(self) -> None:
+        """Validates that lengths the batch would divide by are rejected."""
+
+        for create in (
+            streaming.Sma, streaming.Ema, streaming.Rma, streaming.Wma
+        ):
+            with raises(ValueError):
+                create(0)
+
+        with raises(ValueError):
+            streaming.Hma(1)
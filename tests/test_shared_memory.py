@@ -0,0 +1,116 @@
+import numpy as np
+from pytest import fixture, raises
+
+from src.features.optimization.shared_memory import (
+    SharedMemoryRegistry,
+    attach_market_data,
+    detach_segments
+)
+
+
+class TestSharedMemory:
+    """Test publishing and attaching market data in shared memory."""
+
+    @fixture
+    def registry(self):
+        registry = SharedMemoryRegistry()
+        yield registry
+
+        for name in list(registry._refcounts):
+            while name in registry._refcounts:
+                registry.release({'name': name})
+
+    def test_attached_arrays_match(
+        self,
+        registry,
+        make_market_data,
+        make_klines
+    ) -> None:
+        """Validates that attached views hold the published arrays."""
+
+        market_data = make_market_data(
+            300, feeds={'klines': {'HTF': make_klines(300, seed=2)}}
+        )
+        shared_data = registry.publish_market_data(market_data)
+        attached, segments = attach_market_data(shared_data)
+
+        try:
+            assert attached['symbol'] == 'TEST'
+            assert np.array_equal(attached['klines'], market_data['klines'])
+            assert np.array_equal(
+                attached['feeds']['klines']['HTF'],
+                market_data['feeds']['klines']['HTF']
+            )
+            assert len(segments) == 2
+        finally:
+            attached = None
+            detach_segments(segments)
+
+    def test_writes_stay_private(self, registry, make_market_data) -> None:
+        """Validates that writes to a view never reach the segment."""
+
+        market_data = make_market_data(300)
+        shared_data = registry.publish_market_data(market_data)
+        first, first_segments = attach_market_data(shared_data)
+        second, second_segments = attach_market_data(shared_data)
+
+        try:
+            assert first['klines'].flags.writeable
+
+            first['klines'][:, 4] = -1.0
+
+            assert np.array_equal(second['klines'], market_data['klines'])
+
+            third, third_segments = attach_market_data(shared_data)
+            assert np.array_equal(third['klines'], market_data['klines'])
+
+            third = None
+            detach_segments(third_segments)
+        finally:
+            first = second = None
+            detach_segments(first_segments + second_segments)
+
+    def test_array_is_published_once(self, registry, make_market_data) -> None:
+        """Validates that republishing an array reuses its segment."""
+
+        market_data = make_market_data(300)
+        first = registry.publish_market_data(market_data)
+        second = registry.publish_market_data(market_data)
+        other = registry.publish_market_data(make_market_data(300, seed=2))
+
+        assert first['klines']['name'] == second['klines']['name']
+        assert first['klines']['name'] != other['klines']['name']
+        assert registry._refcounts[first['klines']['name']] == 2
+
+    def test_segment_is_unlinked_on_last_release(
+        self,
+        registry,
+        make_market_data
+    ) -> None:
+        """Validates that a segment lives until its last release."""
+
+        market_data = make_market_data(300)
+        first = registry.publish_market_data(market_data)
+        second = registry.publish_market_data(market_data)
+
+        registry.release_market_data(first)
+        attached, segments = attach_market_data(second)
+        attached = None
+        detach_segments(segments)
+
+        registry.release_market_data(second)
+
+        assert first['klines']['name'] not in registry._refcounts
+        with raises(FileNotFoundError):
+            attach_market_data(second)
+
+    def test_detach_with_live_views(self, registry, make_market_data) -> None:
+        """Validates that detaching tolerates views still in use."""
+
+        market_data = make_market_data(300)
+        shared_data = registry.publish_market_data(market_data)
+        attached, segments = attach_market_data(shared_data)
+
+        detach_segments(segments)
+
+        assert np.array_equal(attached['klines'], market_data['klines'])
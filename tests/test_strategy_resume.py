@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import numpy as np
+from pytest import fixture
+
+from src.core.strategies import BaseStrategy, strategy_registry
+
+
+STATE = [
+    'completed_deals_log',
+    'open_deals_log',
+    'stop_price',
+    'take_prices',
+    'dst',
+    'dmi',
+    'equity',
+    'position_type',
+    'order_price',
+    'order_size',
+    'alert_cancel',
+    'alert_open_long',
+    'alert_open_short',
+    'alert_long_new_stop',
+    'alert_short_new_stop',
+]
+
+
+def assert_same_state(actual, expected) -> None:
+    """Compare loop state and per-bar outputs of two strategies."""
+
+    for name in STATE:
+        assert np.array_equal(
+            np.asarray(getattr(actual, name)),
+            np.asarray(getattr(expected, name)),
+            equal_nan=True
+        ), name
+
+
+class TestStrategyResume:
+    """Test resumed live calculations against full recalculations."""
+
+    @fixture
+    def market_data(self, make_klines, make_market_data):
+        klines = make_klines(3000)
+
+        def window(start: int, end: int) -> dict:
+            return make_market_data(end - start, klines=klines[start:end])
+
+        return window
+
+    def test_appended_bars_match_full_calculation(
+        self,
+        market_data
+    ) -> None:
+        """
+        Validates that a strategy resumed bar by bar ends in the same
+        state as one calculated over all bars at once.
+        """
+
+        strategy_class = strategy_registry['ExampleV1']
+        expected = strategy_class()
+        expected.__calculate__(market_data(0, 3000))
+
+        live = strategy_class()
+        live.__calculate__(market_data(0, 2000))
+
+        for end in range(2001, 3001, 7):
+            live.__calculate__(market_data(0, end), resume=True)
+
+        live.__calculate__(market_data(0, 3000), resume=True)
+
+        assert live.streams is not None
+        assert expected.completed_deals_log.shape[0] > 0
+        assert_same_state(live, expected)
+
+    def test_trimmed_window_is_recalculated(self, market_data) -> None:
+        """
+        Validates that a window trimmed at its start falls back to
+        a full calculation.
+        """
+
+        strategy_class = strategy_registry['ExampleV1']
+        expected = strategy_class()
+        expected.__calculate__(market_data(100, 2100))
+
+        live = strategy_class()
+        live.__calculate__(market_data(0, 2000))
+        live.__calculate__(market_data(0, 2050), resume=True)
+        live.__calculate__(market_data(100, 2100), resume=True)
+
+        assert live.streams is None
+        assert_same_state(live, expected)
+
+    def test_unsupported_strategy_is_recalculated(
+        self,
+        make_klines,
+        make_market_data
+    ) -> None:
+        """
+        Validates that strategies without a resume() override are
+        calculated in full when asked to resume.
+        """
+
+        klines = make_klines(2100)
+        htf = klines.copy()
+        htf[:, 4] = np.concatenate((np.full(24, np.nan), klines[:-24, 4]))
+
+        def market_data(end: int) -> dict:
+            return make_market_data(
+                end,
+                klines=klines[:end],
+                feeds={'klines': {'HTF': htf[:end]}}
+            )
+
+        strategy_class = strategy_registry['ExampleV2']
+        expected = strategy_class()
+        expected.__calculate__(market_data(2100))
+
+        live = strategy_class()
+        live.__calculate__(market_data(2000))
+        live.__calculate__(market_data(2100), resume=True)
+
+        assert strategy_class.resume is BaseStrategy.resume
+        assert np.array_equal(
+            live.completed_deals_log,
+            expected.completed_deals_log,
+            equal_nan=True
+        )
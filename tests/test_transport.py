@@ -0,0 +1,371 @@
+from __future__ import annotations
+from asyncio import gather, run
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import JSONDecodeError, dumps
+from threading import Thread
+from time import monotonic, time
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+from pytest import fixture, mark, raises
+
+from src.infrastructure.exchanges.binance.api.market import (
+    MarketClient as BinanceMarketClient
+)
+from src.infrastructure.exchanges.bybit.api.market import (
+    MarketClient as BybitMarketClient
+)
+from src.infrastructure.exchanges.models import Interval
+from src.infrastructure.transport import HttpClient, client
+from src.infrastructure.transport.async_client import (
+    AsyncHttpClient,
+    _JsonStreamDecoder
+)
+from src.infrastructure.transport.rate_limit import RateLimiter
+from src.infrastructure.transport.session import SessionPool
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+    """
+    Keep-alive handler answering every GET with a JSON array,
+    recording the client port of every request.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        self.server.ports.append(self.client_address[1])
+
+        if self.path.startswith('/missing'):
+            self.send_error(404)
+            return
+
+        body = b'[1, 2, 3]'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-Used-Weight', '10')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class KlineHandler(BaseHTTPRequestHandler):
+    """
+    Handler serving hourly klines in the response formats
+    of the Binance and Bybit kline endpoints.
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        step = 3600000
+        limit = int(query['limit'][0])
+        start = query.get('startTime', query.get('start'))
+        end = query.get('endTime', query.get('end'))
+
+        if end:
+            end = int(end[0])
+        else:
+            now = int(time() * 1000)
+            end = now - now % step
+
+        first = int(start[0]) if start else end - (limit - 1) * step
+        klines = [
+            [t, '1.0', '2.0', '0.5', '1.5', '10.0']
+            for t in range(first, end + 1, step)
+        ][:limit]
+
+        if url.path == '/v5/market/kline':
+            document = {'result': {'list': klines[::-1]}}
+        else:
+            document = klines
+
+        body = dumps(document).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def serve(handler: type[BaseHTTPRequestHandler]):
+    """Run a local HTTP server until the generator is closed."""
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    server.ports = []
+    Thread(target=server.serve_forever, daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+@fixture
+def http_server():
+    yield from serve(JsonHandler)
+
+
+@fixture
+def kline_http_server():
+    yield from serve(KlineHandler)
+
+
+@fixture
+def kline_server(kline_http_server) -> str:
+    host, port = kline_http_server.server_address
+    return f'http://{host}:{port}'
+
+
+@fixture
+def server(http_server) -> str:
+    host, port = http_server.server_address
+    return f'http://{host}:{port}'
+
+
+@fixture
+def pool(monkeypatch) -> SessionPool:
+    pool = SessionPool()
+    monkeypatch.setattr(client, 'sessions', pool)
+    return pool
+
+
+class TestSessionPool:
+    """Test sharing of keep-alive connections between threads."""
+
+    def test_sessions_are_per_thread(self, pool) -> None:
+        """
+        Validates that every thread gets its own session
+        and that all of them share the connection pool.
+        """
+
+        url = 'http://127.0.0.1:1/path'
+        main = pool.get(url, 4)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(pool.get, url, 4).result()
+
+        assert main is pool.get(url, 4)
+        assert other is not main
+        assert other.get_adapter(url) is main.get_adapter(url)
+
+    def test_connections_are_reused(self, pool, server) -> None:
+        """
+        Validates that requests of short-lived threads reuse
+        connections of the shared pool.
+        """
+
+        http = HttpClient()
+
+        for _ in range(3):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                responses = list(executor.map(
+                    lambda i: http.get(f'{server}/klines/{i}'), range(20)
+                ))
+
+            assert responses == [[1, 2, 3]] * 20
+
+        stats = pool.stats()[server]
+
+        assert stats['requests'] == 60
+        assert stats['connections'] <= HttpClient.POOL_SIZE
+        assert stats['reused'] == 60 - stats['connections']
+
+    def test_pool_growth_keeps_counters(self, pool, server) -> None:
+        """
+        Validates that a larger pool replaces the adapter of every
+        thread without losing connection counters.
+        """
+
+        session = pool.get(server, 2)
+        session.get(f'{server}/a').raise_for_status()
+        adapter = session.get_adapter(f'{server}/a')
+
+        grown = pool.get(server, 8)
+        grown.get(f'{server}/b').raise_for_status()
+
+        assert grown is session
+        assert grown.get_adapter(f'{server}/b') is not adapter
+        assert pool.stats()[server]['requests'] == 2
+        assert pool.stats()[server]['pool_size'] == 8
+
+    def test_reset_opens_new_connections(self, pool, server) -> None:
+        """Validates that reset() drops pooled connections."""
+
+        session = pool.get(server, 2)
+        session.get(f'{server}/a').raise_for_status()
+        pool.reset(server)
+        session.get(f'{server}/b').raise_for_status()
+
+        stats = pool.stats()[server]
+        assert stats['requests'] == 2
+        assert stats['connections'] == 2
+
+    def test_failed_requests_return_none(self, pool, server) -> None:
+        """
+        Validates that failing requests are retried and
+        return None once every attempt failed.
+        """
+
+        http = HttpClient()
+
+        assert http.get(
+            f'{server}/missing', retry_attempts=2, retry_delay=0.0,
+            logging=False
+        ) is None
+        assert pool.stats()[server]['requests'] == 2
+
+
+class TestAsyncHttpClient:
+    """Test the asyncio transport and its rate limiter."""
+
+    DOCUMENT = b'[1, {"a": [2, 3]}, "x]", -4.5e1, null, true]'
+
+    @mark.parametrize('chunk_size', [1, 2, 7, 1000])
+    def test_arrays_decode_in_chunks(self, chunk_size: int) -> None:
+        """
+        Validates that arrays split at any byte decode
+        to the whole document.
+        """
+
+        decoder = _JsonStreamDecoder()
+
+        for pos in range(0, len(self.DOCUMENT), chunk_size):
+            decoder.feed(self.DOCUMENT[pos:pos + chunk_size])
+
+        assert decoder.result() == [1, {'a': [2, 3]}, 'x]', -45.0, None, True]
+
+    def test_other_documents_decode_at_end(self) -> None:
+        """Validates decoding of objects, empty and truncated bodies."""
+
+        decoder = _JsonStreamDecoder()
+        decoder.feed(b'{"a": ')
+        decoder.feed(b'1}')
+        truncated = _JsonStreamDecoder()
+        truncated.feed(b'[1, 2')
+
+        assert decoder.result() == {'a': 1}
+        assert _JsonStreamDecoder().result() is None
+        with raises(JSONDecodeError):
+            truncated.result()
+
+    def test_rate_limiter_spaces_requests(self) -> None:
+        """
+        Validates that requests over the capacity wait
+        for the bucket to refill.
+        """
+
+        async def acquire_all(limiter: RateLimiter, count: int) -> float:
+            start = monotonic()
+            await gather(*(limiter.acquire() for _ in range(count)))
+            return monotonic() - start
+
+        within = run(acquire_all(RateLimiter(capacity=5, period=0.5), 5))
+        over = run(acquire_all(RateLimiter(capacity=5, period=0.5), 8))
+
+        assert within < 0.05
+        assert 0.25 <= over < 1.0
+
+    def test_requests_decode_json(self, server) -> None:
+        """Validates that responses are decoded from JSON."""
+
+        http = AsyncHttpClient()
+
+        assert run(http.get(f'{server}/a')) == [1, 2, 3]
+
+    def test_connect_shares_connections(self, http_server, server) -> None:
+        """
+        Validates that requests inside connect() reuse
+        one keep-alive connection.
+        """
+
+        http = AsyncHttpClient()
+
+        async def fetch(count: int) -> list:
+            return [await http.get(f'{server}/{i}') for i in range(count)]
+
+        async def fetch_connected(count: int) -> list:
+            async with http.connect():
+                return await fetch(count)
+
+        assert run(fetch_connected(5)) == [[1, 2, 3]] * 5
+        assert len(set(http_server.ports)) == 1
+
+        http_server.ports.clear()
+        run(fetch(3))
+
+        assert len(set(http_server.ports)) == 3
+
+    def test_failed_requests_return_none(self, http_server, server) -> None:
+        """
+        Validates that failing requests are retried and
+        return None once every attempt failed.
+        """
+
+        http = AsyncHttpClient()
+
+        assert run(http.get(
+            f'{server}/missing', retry_attempts=2, retry_delay=0.0,
+            logging=False
+        )) is None
+        assert len(http_server.ports) == 2
+
+    def test_weight_header_syncs_limiter(self, server) -> None:
+        """
+        Validates that the weight reported by the exchange
+        drains the rate limiter.
+        """
+
+        limiter = RateLimiter(capacity=10, period=1.0)
+        http = AsyncHttpClient(
+            rate_limiter=limiter, weight_header='X-Used-Weight'
+        )
+
+        async def fetch_twice() -> float:
+            await http.get(f'{server}/a')
+            start = monotonic()
+            await http.get(f'{server}/b')
+            return monotonic() - start
+
+        assert run(fetch_twice()) >= 0.05
+
+
+class TestAsyncMarketClients:
+    """Test async kline downloads of the exchange market clients."""
+
+    @fixture(params=[BinanceMarketClient, BybitMarketClient])
+    def market(self, request, kline_server, monkeypatch):
+        client_class = request.param
+        monkeypatch.setattr(client_class, 'BASE_ENDPOINT', kline_server)
+        monkeypatch.setattr(client_class, '_async_http', None)
+        return client_class(SimpleNamespace(api_key='', api_secret=''))
+
+    @mark.parametrize('limit', [10, 1000, 2500])
+    def test_last_klines_async(self, market, limit: int) -> None:
+        """
+        Validates that the latest klines are downloaded
+        in order, without gaps, up to the limit.
+        """
+
+        klines = run(market.get_last_klines_async(
+            'BTCUSDT', Interval.HOUR_1, limit
+        ))
+        times = [kline[0] for kline in klines]
+        now = int(time() * 1000)
+
+        assert len(klines) == limit
+        assert all(
+            later - earlier == 3600000
+            for earlier, later in zip(times, times[1:])
+        )
+        assert now - 3600000 < times[-1] <= now
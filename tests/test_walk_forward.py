@@ -0,0 +1,145 @@
+from typing import Callable
+
+import numpy as np
+from pytest import fixture, mark, raises
+
+from src.features.optimization.config import OptimizationConfig
+from src.features.optimization.utils import (
+    create_train_test_windows,
+    create_walk_forward_windows,
+    create_window_data
+)
+
+
+class TestWalkForward:
+    """Test walk-forward train/test windows."""
+
+    @fixture
+    def indexed_market_data(self, make_market_data) -> Callable:
+        def make(n: int) -> dict:
+            klines = np.repeat(
+                np.arange(n, dtype=np.float64)[:, None], 6, axis=1
+            )
+            return make_market_data(
+                n, klines=klines, feeds={'klines': {'HTF': klines * 2}}
+            )
+
+        return make
+
+    def test_single_fold_is_plain_split(self, indexed_market_data) -> None:
+        """Validates that one fold is the plain train/test split."""
+
+        market_data = indexed_market_data(1000)
+        config = OptimizationConfig()
+
+        assert create_walk_forward_windows(market_data, config, 1) == [
+            create_train_test_windows(market_data, config)
+        ]
+
+    @mark.parametrize('anchored', [False, True])
+    def test_test_windows_are_consecutive(
+        self,
+        indexed_market_data,
+        anchored: bool
+    ) -> None:
+        """
+        Validates that test windows follow each other with equal
+        sizes and that every train window ends where its test
+        window starts.
+        """
+
+        config = OptimizationConfig()
+        windows = create_walk_forward_windows(
+            indexed_market_data(1000), config, 4, anchored
+        )
+        test_size = windows[0]['test_end'] - windows[0]['test_start']
+
+        assert len(windows) == 4
+        assert windows[-1]['test_end'] <= 1000
+
+        for previous, window in zip(windows, windows[1:]):
+            assert window['test_start'] == previous['test_end']
+
+        for window in windows:
+            assert window['train_end'] == window['test_start']
+            assert window['test_end'] - window['test_start'] == test_size
+
+    def test_rolling_train_windows_slide(self, indexed_market_data) -> None:
+        """
+        Validates that rolling train windows keep their size
+        and the configured train/test ratio.
+        """
+
+        config = OptimizationConfig()
+        windows = create_walk_forward_windows(
+            indexed_market_data(1000), config, 4
+        )
+        test_size = windows[0]['test_end'] - windows[0]['test_start']
+        train_size = windows[0]['train_end'] - windows[0]['train_start']
+
+        assert train_size == int(test_size * 0.7 / 0.3)
+
+        for fold, window in enumerate(windows):
+            assert window['train_start'] == fold * test_size
+            assert window['train_end'] - window['train_start'] == train_size
+
+    def test_anchored_train_windows_grow(self, indexed_market_data) -> None:
+        """Validates that anchored train windows start at the first kline."""
+
+        windows = create_walk_forward_windows(
+            indexed_market_data(1000), OptimizationConfig(), 4, anchored=True
+        )
+
+        assert [window['train_start'] for window in windows] == [0] * 4
+        assert windows[-1]['train_end'] > windows[0]['train_end']
+
+    def test_invalid_folds_raise(self, indexed_market_data) -> None:
+        """Validates that impossible fold counts are rejected."""
+
+        config = OptimizationConfig()
+
+        with raises(ValueError):
+            create_walk_forward_windows(indexed_market_data(1000), config, 0)
+
+        with raises(ValueError):
+            create_walk_forward_windows(indexed_market_data(5), config, 10)
+
+    def test_window_data_slices_feeds(self, indexed_market_data) -> None:
+        """Validates that window data slices klines and feeds alike."""
+
+        market_data = indexed_market_data(100)
+        window = {
+            'train_start': 10, 'train_end': 40,
+            'test_start': 40, 'test_end': 60,
+        }
+        train = create_window_data(market_data, window, 'train')
+        test = create_window_data(market_data, window, 'test')
+
+        assert train['klines'][[0, -1], 0].tolist() == [10.0, 39.0]
+        assert test['klines'][[0, -1], 0].tolist() == [40.0, 59.0]
+        assert test['feeds']['klines']['HTF'][0, 0] == 80.0
+        assert test['symbol'] == 'TEST'
+
+    def test_optimizer_uses_fold_window(
+        self,
+        make_context,
+        make_optimizer
+    ) -> None:
+        """Validates that an optimizer of a fold uses that fold's data."""
+
+        context = make_context(folds=3, fold=2, anchored=True)
+        optimizer = make_optimizer(context)
+        windows = create_walk_forward_windows(
+            context['market_data'], optimizer.config, 3, anchored=True
+        )
+        klines = context['market_data']['klines']
+
+        assert optimizer.window == windows[2]
+        assert np.array_equal(
+            optimizer.train_data[0]['klines'],
+            klines[:windows[2]['train_end']]
+        )
+        assert np.array_equal(
+            optimizer.test_data[0]['klines'],
+            klines[windows[2]['test_start']:windows[2]['test_end']]
+        )
@@ -0,0 +1,27 @@
+from logging import getLogger
+from os import getenv
+
+from dotenv import load_dotenv
+
+
+logger = getLogger(__name__)
+load_dotenv()
+
+if __name__ == '__main__':
+    from src.features.optimization.distributed import (
+        parse_address,
+        run_worker
+    )
+
+    address = getenv('COORDINATOR_ADDRESS') or '127.0.0.1:9100'
+    slots = getenv('WORKER_SLOTS')
+    host, port = parse_address(address)
+
+    logger.info(f'👉 Connecting to coordinator {host}:{port}')
+
+    run_worker(
+        host=host,
+        port=port,
+        slots=int(slots) if slots and slots.strip() else None,
+        token=getenv('COORDINATOR_TOKEN', '')
+    )
\ No newline at end of file